@@ -0,0 +1,97 @@
+"""
+Plays a campaign of headless all-bot games and streams their results to a trace store.
+
+Each game is played on a `GameHost` with its own seed and recorded with a `TraceWriter`: one row per
+game, per player per turn, per payment for a property, per change of owner, per bankruptcy and per
+auction. With --workers, the games are split between processes that each write a shard of the
+campaign to `<out>/shard-<n>`. Running the script again on the same directory adds to the
+campaign. Pass --board to play on another board data CSV, e.g. to try other prices, and read the
+results with `GameElements.traces.open_campaign` or `Benchmarks.roi_report`.
+
+Every process also summarises its games in a `GameElements.streaming.TournamentStats`, which it
+sends back to be merged and printed instead of any per-game results. With --stats-only, nothing is
+written to disk, so the memory and storage used stay the same however many games are played.
+
+Usage (from the repository root):
+    python -m Benchmarks.campaign --games 100000 --workers 8 --turns 500 --out campaign
+    python -m Benchmarks.campaign --games 10000000 --workers 8 --stats-only
+"""
+import argparse
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import random
+import time
+
+from GameElements.board import BOARD_PATH, load_board
+from GameElements.host import GameHost
+from GameElements.streaming import TournamentStats
+from GameElements.traces import TraceWriter
+
+
+async def play_campaign(writer, games, players, turns, seed, board=BOARD_PATH, stats=None):
+    """Plays `games` games of `players` bots and at most `turns` turns each, recording each with `writer`
+    (if any) and adding each to `stats` (if any)."""
+    host = GameHost()
+    names = [f"Bot {i + 1}" for i in range(players)]
+    tokens = ["Boot", "Cat", "Hatstand", "Iron", "Smartphone", "Ship"][:players]
+    model = load_board(board)
+    for i in range(games):
+        random.seed(seed + i)
+        table = host.create_table(names, tokens, ["Basic Bot"] * players, seed=seed + i, board=model)
+        await table.run(turns)
+        if writer is not None:
+            writer.record_game(table.game, seed + i)
+        if stats is not None:
+            stats.add_game(table.game)
+    await host.close()
+
+
+def play_shard(out, games, players, turns, seed, board, stats_only=False):
+    """Plays one process's share of a campaign into its own directory (unless `stats_only`) and returns the
+    games recorded there with the statistics of the games played."""
+    stats = TournamentStats()
+    with TraceWriter(out, board=board) if not stats_only else contextlib.nullcontext() as writer:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            asyncio.run(play_campaign(writer, games, players, turns, seed, board, stats))
+    return (writer.games if writer is not None else 0), stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=4, choices=range(2, 7))
+    parser.add_argument("--turns", type=int, default=500, help="most turns per game")
+    parser.add_argument("--out", default="campaign", help="directory of the trace store")
+    parser.add_argument("--board", default=BOARD_PATH, help="board data CSV to play on")
+    parser.add_argument("--workers", type=int, default=1, help="processes, each writing a shard")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--stats-only", action="store_true", help="only print statistics; write no traces")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.workers == 1:
+        shards = [(args.out, args.games, args.players, args.turns, args.seed, args.board,
+                   args.stats_only)]
+    else:
+        share, extra = divmod(args.games, args.workers)
+        shards, seed = [], args.seed
+        for n in range(args.workers):
+            games = share + (n < extra)
+            shards.append((os.path.join(args.out, f"shard-{n:02d}"), games, args.players, args.turns, seed, args.board,
+                           args.stats_only))
+            seed += games
+    with multiprocessing.Pool(len(shards)) as pool:
+        results = pool.starmap(play_shard, shards)
+    elapsed = time.perf_counter() - start
+    stats = TournamentStats()
+    for _, shard_stats in results:
+        stats.merge(shard_stats)
+    print("\n".join(stats.report()))
+    print(f"Played {args.games} games in {elapsed:.1f}s ({args.games / elapsed:.1f} games/s)", end="")
+    print("" if args.stats_only else f"; {sum(recorded for recorded, _ in results)} games recorded in {args.out}")
+
+
+if __name__ == "__main__":
+    main()
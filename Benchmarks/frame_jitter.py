@@ -0,0 +1,131 @@
+"""
+Compares frame-time jitter of the blocking `clock.tick` main loop with the asyncio `FrameScheduler`.
+
+Each mode draws the board and both sidebars at the target frame rate for a few seconds:
+    - clock: `while running: update(); clock.tick(fps)`, the loop of `PropertyTycoon.run`;
+    - asyncio: `FrameScheduler.run`, the loop of `PropertyTycoon.run_async`;
+    - asyncio+background: the same, with bot tables on a `GameHost` and a JSON autosave running as
+      background coroutines between frames.
+Reports the mean frame interval, its standard deviation, the 99th percentile and worst deviation
+from the frame period, and how many turns the background tables played.
+
+Usage (from the repository root):
+    python -m Benchmarks.frame_jitter --seconds 5 --fps 30 --tables 8
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from GameElements.game_logic import Game
+from GameElements.host import GameHost
+from GuiElements.board_gui import BoardGUI
+from GuiElements.frame_scheduler_gui import FrameScheduler
+from GuiElements.left_sidebar_gui import LeftSidebar
+from GuiElements.right_sidebar_gui import RightSidebar
+
+
+NAMES, TOKENS = ["Bot 1", "Bot 2", "Bot 3", "Bot 4"], ["Boot", "Cat", "Hatstand", "Iron"]
+IDENTITIES = ["Basic Bot"] * 4
+
+
+def frame_function(screen, game, stamps):
+    """Returns a function drawing one frame of `game` and recording when each frame starts."""
+    board = BoardGUI(board_size=750, window_width=screen.get_width(), window_height=screen.get_height())
+    left, right = LeftSidebar(screen, game), RightSidebar(screen, game, None)
+
+    def frame():
+        stamps.append(time.perf_counter())
+        pygame.event.pump()
+        screen.fill((200, 200, 200))
+        board.draw(screen, game.bank.properties.items())
+        left.draw()
+        right.draw()
+        pygame.display.flip()
+
+    return frame
+
+
+def summarise(mode, stamps, fps, turns=0):
+    """Returns the jitter measurements of one mode."""
+    intervals = [b - a for a, b in zip(stamps, stamps[1:])]
+    deviations = sorted(abs(interval - 1 / fps) for interval in intervals)
+    return {
+        "mode": mode,
+        "frames": len(stamps),
+        "mean_ms": round(statistics.mean(intervals) * 1000, 2),
+        "stdev_ms": round(statistics.stdev(intervals) * 1000, 2),
+        "p99_dev_ms": round(deviations[int(len(deviations) * 0.99) - 1] * 1000, 2),
+        "max_dev_ms": round(deviations[-1] * 1000, 2),
+        "background_turns": turns,
+    }
+
+
+def run_clock(screen, game, seconds, fps):
+    """Runs the blocking loop."""
+    stamps = []
+    frame = frame_function(screen, game, stamps)
+    clock = pygame.time.Clock()
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        frame()
+        clock.tick(fps)
+    return summarise("clock", stamps, fps)
+
+
+async def run_scheduler(screen, game, seconds, fps, tables):
+    """Runs the asyncio loop, with `tables` bot tables and an autosave in the background."""
+    stamps = []
+    frame = frame_function(screen, game, stamps)
+    scheduler = FrameScheduler(fps)
+    host = GameHost()
+    running = [host.create_table(NAMES, TOKENS, IDENTITIES, seed=i) for i in range(tables)]
+    for table in running:
+        scheduler.spawn(table.run(turn_delay=0.02))
+
+    async def autosave():
+        while True:
+            await asyncio.sleep(1)
+            json.dumps([[p.name, p.balance, p.position] for p in game.players])
+
+    if tables:
+        scheduler.spawn(autosave())
+    end = time.perf_counter() + seconds
+    await scheduler.run(frame, lambda: time.perf_counter() < end)
+    await scheduler.close()
+    mode = "asyncio+background" if tables else "asyncio"
+    return summarise(mode, stamps, fps, sum(table.turns for table in running))
+
+
+def main():
+    """Runs every mode and prints the results."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--tables", type=int, default=8)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((1200, 750))
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        game = Game(NAMES, TOKENS, IDENTITIES)
+        results = [
+            run_clock(screen, game, args.seconds, args.fps),
+            asyncio.run(run_scheduler(screen, game, args.seconds, args.fps, 0)),
+            asyncio.run(run_scheduler(screen, game, args.seconds, args.fps, args.tables)),
+        ]
+    pygame.quit()
+    for result in results:
+        print(", ".join(f"{key}={value}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Load generator for the asyncio game host.
+
+Runs a batch of active tables, each with one remote human seat answered by simulated clients and
+three bots, next to a batch of idle tables whose human seat never answers. Reports throughput,
+decision latency and the memory an idle table costs.
+
+Usage (from the repository root):
+    python -m Benchmarks.host_load --tables 200 --idle 2000 --turns 100 --clients 50
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import random
+import statistics
+import time
+import tracemalloc
+
+from GameElements.host import BotAgent, GameHost
+
+
+async def run_load(tables, idle, turns, clients, think_ms, seed):
+    """
+    Runs the load test and returns its measurements.
+
+    Args:
+        tables (int): Number of active tables.
+        idle (int): Number of idle tables.
+        turns (int): Turns played by each active table.
+        clients (int): Number of simulated client connections answering requests.
+        think_ms (float): Mean client think time in milliseconds.
+        seed (int): Seed for dice and think times.
+
+    Returns:
+        dict: The measurements.
+    """
+    requests = asyncio.Queue()
+    host = GameHost(on_request=lambda request: requests.put_nowait((time.perf_counter(), request)))
+    bot = BotAgent()
+    rng = random.Random(seed)
+    latencies = []
+
+    async def client():
+        while True:
+            sent, request = await requests.get()
+            latencies.append(time.perf_counter() - sent)
+            if think_ms:
+                await asyncio.sleep(rng.expovariate(1000 / think_ms))
+            if request.player.name != "Idle":
+                host.submit(request.table_id, request.player.name, await bot(request))
+
+    names, tokens = ["Human", "Bot 1", "Bot 2", "Bot 3"], ["Boot", "Cat", "Hatstand", "Iron"]
+    identities = ["Human", "Basic Bot", "Basic Bot", "Basic Bot"]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(idle):
+        host.start(host.create_table(["Idle"] + names[1:], tokens, identities, seed=seed + i))
+    await asyncio.sleep(0)
+    idle_bytes = (tracemalloc.get_traced_memory()[0] - before) / max(idle, 1)
+    tracemalloc.stop()
+    while not requests.empty():
+        requests.get_nowait()
+
+    workers = [asyncio.create_task(client()) for _ in range(clients)]
+    active = [host.create_table(names, tokens, identities, seed=seed + idle + i) for i in range(tables)]
+    start = time.perf_counter()
+    await asyncio.gather(*(host.start(table, turns) for table in active))
+    elapsed = time.perf_counter() - start
+
+    for worker in workers:
+        worker.cancel()
+    await host.close()
+
+    played = sum(table.turns for table in active)
+    return {
+        "active_tables": tables,
+        "idle_tables": idle,
+        "turns": played,
+        "seconds": elapsed,
+        "turns_per_second": played / elapsed,
+        "decisions": len(latencies),
+        "decision_latency_p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "decision_latency_p99_ms": statistics.quantiles(latencies, n=100)[98] * 1000 if len(latencies) > 1 else 0.0,
+        "idle_table_kib": idle_bytes / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tables", type=int, default=200, help="active tables")
+    parser.add_argument("--idle", type=int, default=2000, help="idle tables waiting on a client")
+    parser.add_argument("--turns", type=int, default=100, help="turns per active table")
+    parser.add_argument("--clients", type=int, default=50, help="simulated client connections")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="mean client think time")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        result = asyncio.run(run_load(args.tables, args.idle, args.turns, args.clients, args.think_ms, args.seed))
+    for key, value in result.items():
+        print(f"{key:>26}: {value:.2f}" if isinstance(value, float) else f"{key:>26}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Measures how well the render loop holds its frame rate while the game logic is busy.
+
+Draws the board and both sidebars at a target frame rate for a bots-only game, in two modes:
+    - inline: the game is played in the render loop, a fixed number of turns per frame, the way
+      `PropertyTycoon.run` plays it;
+    - process: the game runs in a `GameProcess` worker paced to the same number of turns per
+      second, and the render loop only calls `sync`.
+Reports the frame rate reached, frame time percentiles, the share of frames over budget, the CPU
+time the render process spends on each frame and the turns the game logic played per second. On a
+single core the worker still competes with the render process for CPU (and a new worker is spawned
+for every game), so the frame CPU time is the figure that shows what the render loop is spared.
+
+Usage (from the repository root):
+    python -m Benchmarks.render_split --seconds 5 --fps 30 --turns-per-frame 40
+"""
+import argparse
+import contextlib
+import os
+import random
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from GameElements.game_logic import Game
+from GameElements.game_process import GameProcess
+from GuiElements.board_gui import BoardGUI
+from GuiElements.left_sidebar_gui import LeftSidebar
+from GuiElements.right_sidebar_gui import RightSidebar
+
+
+NAMES, TOKENS = ["Bot 1", "Bot 2", "Bot 3", "Bot 4"], ["Boot", "Cat", "Hatstand", "Iron"]
+IDENTITIES = ["Basic Bot"] * 4
+
+
+def render_loop(screen, seconds, fps, step):
+    """
+    Draws a game for a number of seconds. `step` is called once per frame and returns the game to draw.
+
+    Returns:
+        tuple[list[float], list[float]]: The duration of each frame in seconds, including the wait for
+        the next frame, and the CPU time the render process spent on each frame.
+    """
+    board = BoardGUI(board_size=750, window_width=screen.get_width(), window_height=screen.get_height())
+    left, right = LeftSidebar(screen, None), RightSidebar(screen, None, None)
+    clock = pygame.time.Clock()
+    frames, work = [], []
+    end = time.perf_counter() + seconds
+    last, cpu = time.perf_counter(), time.process_time()
+    while time.perf_counter() < end:
+        pygame.event.pump()
+        game = step()
+        left.game = right.game = game
+        screen.fill((200, 200, 200))
+        board.draw(screen, game.bank.properties.items())
+        left.draw()
+        right.draw()
+        pygame.display.flip()
+        work.append(time.process_time() - cpu)
+        clock.tick(fps)
+        cpu = time.process_time()
+        now = time.perf_counter()
+        frames.append(now - last)
+        last = now
+    return frames, work
+
+
+def summarise(mode, frames, work, turns, seconds, fps):
+    """Returns the measurements of one mode."""
+    budget = 1.5 / fps
+    ordered = sorted(frames)
+    work = sorted(work)
+    return {
+        "mode": mode,
+        "fps": round(len(frames) / seconds, 1),
+        "frame_p50_ms": round(statistics.median(ordered) * 1000, 1),
+        "frame_p99_ms": round(ordered[int(len(ordered) * 0.99) - 1] * 1000, 1),
+        "over_budget_pct": round(100 * sum(f > budget for f in frames) / len(frames), 1),
+        "work_p50_ms": round(statistics.median(work) * 1000, 1),
+        "work_p99_ms": round(work[int(len(work) * 0.99) - 1] * 1000, 1),
+        "logic_turns_per_s": round(turns / seconds),
+    }
+
+
+def run_inline(screen, seconds, fps, turns_per_frame, seed):
+    """Plays the game in the render loop."""
+    game = Game(NAMES, TOKENS, IDENTITIES)
+    rng = random.Random(seed)
+    turns = 0
+
+    def step():
+        nonlocal game, turns
+        for _ in range(turns_per_frame):
+            if len(game.players) < 2:
+                game = Game(NAMES, TOKENS, IDENTITIES)
+            player = game.players[game.current_player_index]
+            game.play_turn(rng.randint(1, 6), rng.randint(1, 6))
+            if player in game.players and player.consecutive_doubles == 0:
+                game.current_player_index = (game.players.index(player) + 1) % len(game.players)
+            turns += 1
+        return game
+
+    frames, work = render_loop(screen, seconds, fps, step)
+    return summarise("inline", frames, work, turns, seconds, fps)
+
+
+def run_process(screen, seconds, fps, turns_per_frame, seed):
+    """Plays games in worker processes, starting a new one whenever a game ends."""
+    turn_delay = 1 / (turns_per_frame * fps) if turns_per_frame else 0
+    games = iter(range(seed, seed + 10 ** 6))
+    process = GameProcess(NAMES, TOKENS, IDENTITIES, seed=next(games), turn_delay=turn_delay)
+    turns = 0
+
+    def step():
+        nonlocal process, turns
+        process.sync()
+        if process.finished:
+            turns += max(p.turns_taken for p in process.seats)
+            process.stop()
+            process = GameProcess(NAMES, TOKENS, IDENTITIES, seed=next(games), turn_delay=turn_delay)
+        return process.game
+
+    frames, work = render_loop(screen, seconds, fps, step)
+    process.stop()
+    turns += max(p.turns_taken for p in process.seats)
+    return summarise("process", frames, work, turns, seconds, fps)
+
+
+def main():
+    """Runs both modes and prints the results."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--turns-per-frame", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((1200, 750))
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = [
+            run_inline(screen, args.seconds, args.fps, args.turns_per_frame, args.seed),
+            run_process(screen, args.seconds, args.fps, args.turns_per_frame, args.seed),
+        ]
+    pygame.quit()
+    for result in results:
+        print(", ".join(f"{key}={value}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
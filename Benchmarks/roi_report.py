@@ -0,0 +1,43 @@
+"""
+Reports the return on investment of every property and colour group over a simulated campaign.
+
+Reads one or more trace stores written by `Benchmarks.campaign` (or directories of their shards),
+summarises them chunk by chunk with `GameElements.roi` and writes a table per property and per
+colour group, for each game phase, as CSV or Parquet. Prints the group table.
+
+Usage (from the repository root):
+    python -m Benchmarks.roi_report campaign --out roi --phases 0 80 200
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from GameElements.roi import PHASES, analyse, write_tables
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("campaigns", nargs="+", help="campaign directories or directories of shards")
+    parser.add_argument("--out", default="roi", help="directory for the tables")
+    parser.add_argument("--format", default="csv", choices=("csv", "parquet"))
+    parser.add_argument("--phases", type=int, nargs="+", default=[start for _, start in PHASES],
+                        help="first turn of each game phase")
+    parser.add_argument("--chunk-games", type=int, default=100_000, help="games summarised at a time")
+    args = parser.parse_args()
+
+    if len(args.phases) == len(PHASES):
+        phases = tuple((name, start) for (name, _), start in zip(PHASES, args.phases))
+    else:
+        phases = tuple((f"from turn {start}", start) for start in args.phases)
+
+    start = time.perf_counter()
+    properties, groups = analyse(args.campaigns, phases, args.chunk_games)
+    paths = write_tables(properties, groups, args.out, args.format)
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(groups.round(3).to_string(index=False))
+    print(f"Analysed in {time.perf_counter() - start:.1f}s; wrote {', '.join(paths)}")
+
+
+if __name__ == "__main__":
+    main()
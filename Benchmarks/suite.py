@@ -0,0 +1,339 @@
+"""
+Runs the benchmark suite for the game logic and rendering hot paths and writes the results as JSON.
+
+Every workload is seeded and fixed, so results from different commits can be compared:
+    - turns_2_bots, turns_4_bots, turns_8_bots: headless all-bot games played on a `GameHost`;
+    - rent_large_portfolio: `Property.calculate_rent` over every property of a player who owns the whole board;
+    - completion_large_portfolio: `Property.check_completion` for the same portfolio;
+    - build_sell_cycle: `Bank.build` up to a hotel and `Bank.sell_houses_to_the_bank` back down, over every colour set;
+    - card_draws: Pot Luck and Opportunity Knocks draws, including the cards' effects;
+    - auction_resolution: all-bot auctions through `Bank.bid_property`;
+    - render_frame: `PropertyTycoon.draw` for a game in progress under the SDL dummy video driver.
+Each workload is repeated and the best time is reported, with the median, as operations per second.
+With --compare, the results are checked against an earlier run and the command fails if a workload
+got slower by more than --threshold.
+
+Usage (from the repository root):
+    python -m Benchmarks.suite --output bench.json
+    python -m Benchmarks.suite --output new.json --compare bench.json --threshold 0.1
+    python -m Benchmarks.suite --only turns_4_bots render_frame
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from GameElements.bank import Bank
+from GameElements.game_logic import Game
+from GameElements.host import GameHost
+
+
+TOKENS = ["boot", "cat", "hatstand", "iron", "smartphone"]
+WORKLOADS = {}
+
+
+def workload(name, unit):
+    """
+    Registers a workload.
+
+    A workload is a function taking a seed and returning a function that runs the workload once and
+    returns the number of operations it performed, so that setting up is not timed.
+
+    Args:
+        name (str): The workload's name in the results.
+        unit (str): What one operation is.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def register(function):
+        WORKLOADS[name] = (unit, function)
+        return function
+    return register
+
+
+def bot_game(bots, seed):
+    """Returns a game between `bots` Basic Bots."""
+    names = [f"Bot {i}" for i in range(1, bots + 1)]
+    tokens = [TOKENS[i % len(TOKENS)] for i in range(bots)]
+    return names, tokens, ["Basic Bot"] * bots
+
+
+def turns_workload(bots, games=4, turns=150):
+    """Returns a workload playing `games` games of at most `turns` turns between `bots` bots."""
+    def setup(seed):
+        random.seed(seed)  # the card decks are shuffled with the global generator
+        host = GameHost()
+        tables = [host.create_table(*bot_game(bots, seed), seed=seed + i) for i in range(games)]
+
+        def run():
+            async def play():
+                for table in tables:
+                    await table.run(turns)
+
+            asyncio.run(play())
+            return sum(table.turns for table in tables)
+        return run
+    return setup
+
+
+for _bots in (2, 4, 8):
+    workload(f"turns_{_bots}_bots", "turn")(turns_workload(_bots))
+
+
+def tycoon(seed):
+    """Returns a player owning every property on the board, with some of it built on and mortgaged."""
+    random.seed(seed)
+    game = Game(*bot_game(2, seed))
+    player = game.players[0]
+    for prop in game.bank.properties.values():
+        prop.transfer_property(player)
+    for prop in player.owned_properties:
+        if prop.group not in ("Station", "Utilities"):
+            prop.houses = random.randint(0, 5)
+        prop.mortgaged = random.random() < 0.1
+    return game, player
+
+
+@workload("rent_large_portfolio", "rent")
+def rent_large_portfolio(seed, rounds=2000):
+    game, player = tycoon(seed)
+    properties = player.owned_properties
+
+    def run():
+        for roll in range(rounds):
+            for prop in properties:
+                prop.calculate_rent(roll % 11 + 2)
+        return rounds * len(properties)
+    return run
+
+
+@workload("completion_large_portfolio", "check")
+def completion_large_portfolio(seed, rounds=2000):
+    game, player = tycoon(seed)
+    properties = player.owned_properties
+
+    def run():
+        for _ in range(rounds):
+            for prop in properties:
+                prop.check_completion()
+        return rounds * len(properties)
+    return run
+
+
+@workload("build_sell_cycle", "house")
+def build_sell_cycle(seed, cycles=40):
+    game, player = tycoon(seed)
+    bank = game.bank
+    sets = {}
+    for prop in player.owned_properties:
+        if prop.group not in ("Station", "Utilities"):
+            prop.houses, prop.mortgaged = 0, False
+            sets.setdefault(prop.group, []).append(prop)
+
+    def run():
+        moved = 0
+        for _ in range(cycles):
+            for group in sets.values():
+                player.balance = 1_000_000
+                for _ in range(5):
+                    for prop in group:
+                        bank.build(1, prop, player)
+                for _ in range(5):
+                    for prop in reversed(group):
+                        bank.sell_houses_to_the_bank(player, prop)
+                moved += 10 * len(group)
+        return moved
+    return run
+
+
+@workload("card_draws", "draw")
+def card_draws(seed, draws=2000):
+    random.seed(seed)
+    game = Game(*bot_game(2, seed))
+    player = game.players[0]
+
+    def run():
+        for i in range(draws):
+            player.balance, player.position, player.in_jail = 10_000, 3, False
+            if i % 2:
+                game.cards.draw_pot_luck_card(player, game)
+            else:
+                game.cards.draw_opportunity_knocks_card(player, game)
+            while player.get_out_of_jail_cards:  # keep the decks full
+                player.get_out_of_jail_cards -= 1
+                game.cards.return_jail_card_to_bottom()
+        return draws
+    return run
+
+
+@workload("auction_resolution", "auction")
+def auction_resolution(seed, auctions=5000):
+    random.seed(seed)
+    game = Game(*bot_game(4, seed))
+    bank = Bank()
+    properties = list(bank.properties.values())
+    for player in game.players:
+        player.passed = True
+
+    def run():
+        for i in range(auctions):
+            for player in game.players:
+                player.balance = 500 + 300 * ((i + game.players.index(player)) % 4)
+            bank.bid_property(game.players, properties[i % len(properties)])
+        return auctions
+    return run
+
+
+@workload("render_frame", "frame")
+def render_frame(seed, frames=200):
+    from property_tycoon import PropertyTycoon
+    from GuiElements.board_gui import BoardGUI
+    from GameElements.board_elements import BoardElementsGUI
+
+    names, tokens, identities = bot_game(4, seed)
+    random.seed(seed)
+    ui = PropertyTycoon(stall_budget=None)
+    host = GameHost()
+    table = host.create_table(names, tokens, identities, seed=seed)
+    asyncio.run(table.run(60))  # headless first, so the board shows owned and built-on properties
+    game = table.game
+    for player in game.players:
+        player.token_image = pygame.transform.scale(pygame.image.load(f"assets/{player.token}.png").convert_alpha(), (40, 40))
+    game.ui = ui
+    game.log_event = ui.right_sidebar.get_event_logger()
+    ui.game = game
+    ui.board = BoardGUI(csv_path="data/PropertyTycoonBoardData.csv", board_size=750,
+                        window_width=ui.width, window_height=ui.height)
+    ui.board.watch(game.changes)
+    ui.elements = BoardElementsGUI(ui.screen)
+    ui.state = "board"
+
+    def run():
+        for _ in range(frames):
+            pygame.event.pump()
+            ui.draw()
+        return frames
+    return run
+
+
+def measure(name, seed, repeats):
+    """
+    Runs one workload `repeats` times.
+
+    Args:
+        name (str): The workload.
+        seed (int): The seed its setup and runs use.
+        repeats (int): Number of timed runs.
+
+    Returns:
+        dict: The operation count and the best and median times, or the reason the workload was skipped.
+    """
+    unit, setup = WORKLOADS[name]
+    try:
+        times, ops = [], 0
+        for _ in range(repeats):
+            run = setup(seed)
+            start = time.perf_counter()
+            ops = run()
+            times.append(time.perf_counter() - start)
+    except (pygame.error, FileNotFoundError) as e:  # e.g. the assets cannot be loaded on this machine
+        return {"unit": unit, "skipped": str(e)}
+    best = min(times)
+    return {"unit": unit, "ops": ops, "best_s": best, "median_s": statistics.median(times), "per_second": ops / best}
+
+
+def commit():
+    """Returns the commit being benchmarked, or None outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """
+    Compares results with an earlier run.
+
+    Args:
+        results (dict): This run's results by workload.
+        baseline (dict): The earlier run's results by workload.
+        threshold (float): Fraction by which a workload may get slower before it counts as a regression.
+
+    Returns:
+        tuple[list[str], list[str]]: One line per workload found in both runs, and the regressed workloads.
+    """
+    lines, regressions = [], []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if not old or "per_second" not in old or "per_second" not in result:
+            continue
+        change = result["per_second"] / old["per_second"] - 1
+        flag = ""
+        if change < -threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        lines.append(f"{name:<28}{old['per_second']:12.1f} -> {result['per_second']:12.1f} {result['unit']}/s "
+                     f"({change:+.1%}){flag}")
+    return lines, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="bench.json", help="where to write the results")
+    parser.add_argument("--compare", help="results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown counted as a regression")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--only", nargs="+", choices=sorted(WORKLOADS), help="run only these workloads")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.only or WORKLOADS:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            results[name] = measure(name, args.seed, args.repeats)
+        result = results[name]
+        if "skipped" in result:
+            print(f"{name:<28}skipped: {result['skipped']}")
+        else:
+            print(f"{name:<28}{result['per_second']:12.1f} {result['unit']}/s  (best {result['best_s'] * 1000:.1f} ms "
+                  f"for {result['ops']}, median {result['median_s'] * 1000:.1f} ms)")
+    pygame.quit()
+
+    report = {
+        "commit": commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeats": args.repeats,
+        "results": results,
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        lines, regressions = compare(results, baseline["results"], args.threshold)
+        print(f"\nCompared with {baseline.get('commit') or args.compare}:")
+        print("\n".join(lines))
+        if regressions:
+            sys.exit(f"{len(regressions)} workload(s) regressed: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
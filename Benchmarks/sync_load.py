@@ -0,0 +1,100 @@
+"""
+Measures the network state sync between a `SyncServer` and its clients over localhost TCP.
+
+Each table has one remote human seat, played by a `SyncClient` answering with the Basic Bot rules,
+and three bots. Reports the bytes sent per turn (compared with sending the full state every
+turn), the messages per turn after coalescing, and the end-to-end latency from a message being
+built on the server to it being applied on the client's replica.
+
+Usage (from the repository root):
+    python -m Benchmarks.sync_load --tables 20 --turns 200
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import statistics
+
+from GameElements.host import BotAgent, GameHost
+from GameElements.sync import SyncClient, SyncServer, diff, encode, snapshot
+
+
+async def run_sync(tables, turns, frame_rate, seed):
+    """
+    Runs the sync benchmark and returns its measurements.
+
+    Args:
+        tables (int): Number of tables.
+        turns (int): Turns played by each table.
+        frame_rate (float): Server flushes per second.
+        seed (int): Seed for the tables' dice.
+
+    Returns:
+        dict: The measurements.
+    """
+    host = GameHost()
+    server = SyncServer(host, frame_rate)
+    port = await server.start()
+    names, tokens = ["Human", "Bot 1", "Bot 2", "Bot 3"], ["Boot", "Cat", "Hatstand", "Iron"]
+    identities = ["Human", "Basic Bot", "Basic Bot", "Basic Bot"]
+
+    running, clients, full_sizes = [], [], []
+    for i in range(tables):
+        table = host.create_table(names, tokens, identities, seed=seed + i)
+        feed = server.feed(table)
+        client = SyncClient("Human", BotAgent())
+        clients.append(client)
+        connection = asyncio.create_task(client.connect(table.table_id, port=port))
+        while "Human" not in feed.clients:
+            await asyncio.sleep(0.001)
+
+        def measure_full(message, table=table, feed=feed):
+            if message.startswith("Human") or message.startswith("Bot"):
+                full_sizes.append(len(encode({"t": 0.0, "d": diff(None, snapshot(table.game, feed.seats))})))
+
+        table.game.event_listeners.append(measure_full)
+        running.append((table, host.start(table, turns), connection))
+
+    await asyncio.gather(*(task for _, task, _ in running))
+    feeds = list(server.feeds.values())
+    for table, _, _ in running:
+        server.finish(table)
+    await asyncio.gather(*(connection for _, _, connection in running))
+    await server.close()
+
+    played = sum(table.turns for table, _, _ in running)
+    sent = sum(feed.bytes_sent for feed in feeds)
+    messages = sum(feed.messages_sent for feed in feeds)
+    latencies = sorted(latency for client in clients for latency in client.latencies)
+    in_sync = all(
+        snapshot(client.game, client.seats)[:3] == snapshot(table.game, feed.seats)[:3]
+        for client, (table, _, _), feed in zip(clients, running, feeds)
+    )
+    return {
+        "tables": tables,
+        "turns": played,
+        "bytes_per_turn": sent / played,
+        "full_state_bytes": statistics.mean(full_sizes),
+        "messages_per_turn": messages / played,
+        "latency_p50_ms": statistics.median(latencies) * 1000,
+        "latency_p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+        "replicas_in_sync": in_sync,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tables", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--frame-rate", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        result = asyncio.run(run_sync(args.tables, args.turns, args.frame_rate, args.seed))
+    for key, value in result.items():
+        print(f"{key:>20}: {value:.2f}" if isinstance(value, float) else f"{key:>20}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Profiles the game's hot paths over a batch of headless all-bot games.
+
+Plays the games on a `GameHost` under a `TurnProfiler` and prints the time spent per phase (turns,
+position handling, property handling, card draws, auctions, debt handling, bot trades and bot
+building), then writes the profile to JSON. With --sample-every, allocations are also measured on every n-th call
+of each phase; tracemalloc then runs for the whole profile and inflates the times.
+
+Usage (from the repository root):
+    python -m Benchmarks.turn_profile --games 50 --turns 300 --sample-every 10 --json turn_profile.json
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+
+from GameElements.host import GameHost
+from GameElements.profiling import TurnProfiler
+
+
+async def play_games(games, turns, seed):
+    """Plays `games` four-bot games of at most `turns` turns each, one after another."""
+    host = GameHost()
+    names, tokens = ["Bot 1", "Bot 2", "Bot 3", "Bot 4"], ["Boot", "Cat", "Hatstand", "Iron"]
+    for i in range(games):
+        await host.create_table(names, tokens, ["Basic Bot"] * 4, seed=seed + i).run(turns)
+    await host.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=300, help="most turns per game")
+    parser.add_argument("--sample-every", type=int, default=0, help="measure allocations on every n-th call")
+    parser.add_argument("--json", default="turn_profile.json", help="where to write the profile")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        with TurnProfiler(args.sample_every) as profiler:
+            asyncio.run(play_games(args.games, args.turns, args.seed))
+    print("\n".join(profiler.report()))
+    profiler.dump_json(args.json)
+    print(f"Profile written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+import asyncio
+import time
+from bisect import bisect_right
+from collections import deque
+from functools import lru_cache
+
+from GameElements.player import Player
+
+
+@lru_cache(maxsize=4096)
+def bid_ladder(price, start_bid=0):
+    """
+    Builds the sequence of bids a "Basic Bot" auction climbs through for a property.
+
+    Every Basic Bot raises the current highest bid with the same rule (see `Player.basic_bot_raise`),
+    so the bids placed in an all-bot auction always walk the same ladder no matter who places them.
+    The ladder stops at the highest bid any Basic Bot is willing to make (1.5x the property price).
+    Results are cached per (price, start bid) pair.
+
+    Args:
+        price (int): The purchase price of the property being auctioned.
+        start_bid (int): The current highest bid the ladder starts from. Defaults to 0.
+
+    Returns:
+        tuple[int]: The ladder of bids, starting with `start_bid`.
+    """
+    ceiling = price * 1.5
+    ladder = [start_bid]
+    while True:
+        next_bid = Player.basic_bot_raise(ladder[-1], price)
+        if next_bid > ceiling or next_bid <= ladder[-1]:
+            break
+        ladder.append(next_bid)
+    return tuple(ladder)
+
+
+class AuctionResolver:
+    """
+    Computes the outcome of an auction between bots without playing it out bid by bid.
+
+    Bots bid from a fixed policy: each raise follows the shared bid ladder and a bot drops out
+    as soon as the next rung is above its reservation price. Knowing each bidder's highest
+    acceptable rung is enough to jump over whole bidding rounds, so an all-bot auction costs
+    a handful of operations instead of dozens of logged iterations.
+
+    Human bidders have no known reservation price, so auctions that still contain humans must
+    be played interactively until only bots remain.
+    """
+
+    def can_resolve(self, bidders):
+        """
+        Checks whether the remaining bidders can be resolved without any interaction.
+
+        Args:
+            bidders (Iterable[Player]): The players still in the auction.
+
+        Returns:
+            bool: True if no remaining bidder is a human, False otherwise.
+        """
+        return all(p.identity != "Human" for p in bidders)
+
+    def resolve(self, bidders, property, highest_bid=0, highest_bidder=None):
+        """
+        Resolves an all-bot auction in closed form.
+
+        The bidders are processed in the same round-robin order as `Bank.bid_property`: the first
+        bidder in the list is the next one to act, a bidder who raises goes to the back of the queue
+        and a bidder who cannot raise leaves the auction. Rounds in which every bidder can still raise
+        are skipped in one step.
+
+        Args:
+            bidders (list[Player]): The remaining bidders, in bidding order. Must all be bots.
+            property (Property): The property being auctioned.
+            highest_bid (int): The current highest bid. Defaults to 0.
+            highest_bidder (Player | None): The player holding the current highest bid, if any.
+
+        Returns:
+            tuple: A tuple containing four elements:
+                - survivor (Player | None): The last player left in the auction.
+                - highest_bid (int): The final highest bid.
+                - highest_bidder (Player | None): The player who placed the final highest bid.
+                - bids (int): The number of bids the fast-forward skipped over.
+        """
+        ladder = bid_ladder(property.price, highest_bid)
+        limits = {}
+        for player in bidders:
+            reservation = player.bot_reservation_price(property)
+            limits[player] = bisect_right(ladder, reservation) - 1 if reservation is not None else -1
+
+        queue = deque(bidders)
+        step = 0
+        bids = 0
+
+        while len(queue) > 1:
+            q = len(queue)
+            full_rounds = min((limits[p] - step - i - 1) // q + 1 for i, p in enumerate(queue))
+            if full_rounds > 0:
+                step += full_rounds * q
+                bids += full_rounds * q
+                highest_bidder = queue[-1]
+                continue
+
+            player = queue.popleft()
+            if limits[player] >= step + 1:
+                step += 1
+                bids += 1
+                highest_bidder = player
+                queue.append(player)
+
+        survivor = queue[0] if queue else None
+        return survivor, ladder[step], highest_bidder, bids
+
+
+class Auction:
+    """
+    A single property auction, run as a non-blocking state machine.
+
+    The auction never waits for input itself. Whoever drives it (the console loop in
+    `Bank.bid_property`, the GUI popup, a headless simulation or a network session) reports
+    what the current bidder did through three operations: `submit_bid`, `pass_turn` and
+    `timeout`. Each operation validates the move, updates the state and returns immediately.
+    Bots never need a driver: their moves are played as soon as it is their turn, and once
+    only bots are left the rest of the auction is settled by the `AuctionResolver`.
+
+    Every bidder gets `turn_timeout` seconds to act. Drivers that poll (such as the GUI) call
+    `check_timeout` once per frame, while asyncio drivers can use `run`, which enforces the
+    deadline itself.
+
+    Attributes:
+        bank (Bank): The bank collecting the winning bid.
+        property (Property): The property being auctioned.
+        queue (deque[Player]): The remaining bidders, the first one being the current bidder.
+        highest_bid (int): The highest bid placed so far.
+        highest_bidder (Player | None): The player holding the highest bid.
+        exited (list[Player]): Players who passed, timed out or could not afford to continue, in order.
+        state (str): "open" while bidding is in progress, "finished" once the auction is over.
+        winner (Player | None): The player who won the auction, set once it is finished.
+        survivor (Player | None): The last player left in the auction, set once it is finished.
+        turn_timeout (float | None): Seconds each bidder has to act, or None for no limit.
+        deadline (float | None): Clock time at which the current bidder's turn expires.
+        default_winner (bool): If True, the last bidder left wins even if nobody placed a bid.
+        settle (bool): If True, the winner pays the bank and receives the property when the auction ends.
+        listeners (list[Callable]): Callbacks invoked as `listener(auction, event)` after every change.
+    """
+    OPEN = "open"
+    FINISHED = "finished"
+
+    def __init__(self, bank, property, bidders, highest_bid=0, turn_timeout=None, default_winner=False,
+                 settle=True, log=print, clock=time.monotonic):
+        """
+        Opens the auction and plays any bot turns that come before the first human's turn.
+
+        Args:
+            bank (Bank): The bank running the auction.
+            property (Property): The property being auctioned.
+            bidders (list[Player]): The players taking part, in bidding order.
+            highest_bid (int): The starting highest bid. Defaults to 0.
+            turn_timeout (float | None): Seconds each bidder has to act. Defaults to no limit.
+            default_winner (bool): Whether the last bidder left wins without having to bid. Defaults to False.
+            settle (bool): Whether to transfer the property and payment when the auction ends. Defaults to True.
+            log (Callable[[str], None]): Where auction messages are reported. Defaults to print.
+            clock (Callable[[], float]): Time source used for the turn deadlines. Defaults to time.monotonic.
+        """
+        self.bank = bank
+        self.property = property
+        self.queue = deque(bidders)
+        self.highest_bid = highest_bid
+        self.highest_bidder = None
+        self.exited = []
+        self.state = self.OPEN
+        self.winner = None
+        self.survivor = None
+        self.turn_timeout = turn_timeout
+        self.deadline = None
+        self.default_winner = default_winner
+        self.settle = settle
+        self.listeners = []
+        self.log = log
+        self.clock = clock
+        self._waiters = []
+        self._advance()
+
+    @property
+    def is_open(self):
+        """bool: True while bidding is still in progress."""
+        return self.state == self.OPEN
+
+    @property
+    def finished(self):
+        """bool: True once the auction is over."""
+        return self.state == self.FINISHED
+
+    @property
+    def current_bidder(self):
+        """Player | None: The player whose turn it is, or None once the auction is over."""
+        return self.queue[0] if self.is_open else None
+
+    def time_left(self, now=None):
+        """
+        Returns the number of seconds the current bidder has left to act.
+
+        Args:
+            now (float | None): The current clock time. Defaults to the auction's clock.
+
+        Returns:
+            float | None: Seconds left (never negative), or None if there is no time limit.
+        """
+        if self.deadline is None:
+            return None
+        now = self.clock() if now is None else now
+        return max(0.0, self.deadline - now)
+
+    def submit_bid(self, player, amount):
+        """
+        Places a bid for the current bidder.
+
+        A valid bid is a whole number higher than the current highest bid and no more than the
+        player's balance. A valid bid sends the player to the back of the queue. An invalid bid
+        from a human leaves the turn with them so they can try again.
+
+        Args:
+            player (Player): The player placing the bid. Must be the current bidder.
+            amount (int | str): The amount bid.
+
+        Returns:
+            str: A message indicating the result of the bid.
+        """
+        if player is not self.current_bidder:
+            return f"It is not {player.name}'s turn to bid."
+        try:
+            amount = int(amount)
+        except (TypeError, ValueError):
+            return self._reject("Invalid input, try again.")
+        if amount > player.balance:
+            return self._reject("You can't bid more than your balance!")
+        if amount <= self.highest_bid:
+            return self._reject("You must bid higher than the current highest bid!")
+
+        self.highest_bid = amount
+        self.highest_bidder = player
+        self.queue.rotate(-1)
+        message = f"{player.name} bids £{amount} for {self.property.name}."
+        self.log(message)
+        self._notify("bid")
+        self._advance()
+        return message
+
+    def pass_turn(self, player):
+        """
+        Removes the current bidder from the auction.
+
+        Args:
+            player (Player): The player leaving the auction. Must be the current bidder.
+
+        Returns:
+            str: A message indicating the result.
+        """
+        if player is not self.current_bidder:
+            return f"It is not {player.name}'s turn to bid."
+        message = f"{player.name} has exited the auction."
+        self._drop(message, "pass")
+        return message
+
+    def timeout(self, player):
+        """
+        Ends the current bidder's turn because they ran out of time. They leave the auction.
+
+        Args:
+            player (Player): The player whose turn expired. Must be the current bidder.
+
+        Returns:
+            str: A message indicating the result.
+        """
+        if player is not self.current_bidder:
+            return f"It is not {player.name}'s turn to bid."
+        message = f"{player.name} ran out of time and has exited the auction."
+        self._drop(message, "timeout")
+        return message
+
+    def check_timeout(self, now=None):
+        """
+        Times out the current bidder if their deadline has passed. Meant to be polled by drivers.
+
+        Args:
+            now (float | None): The current clock time. Defaults to the auction's clock.
+
+        Returns:
+            bool: True if a bidder was timed out, False otherwise.
+        """
+        if not self.is_open or self.deadline is None:
+            return False
+        now = self.clock() if now is None else now
+        if now < self.deadline:
+            return False
+        self.timeout(self.current_bidder)
+        return True
+
+    async def run(self, get_bid):
+        """
+        Drives the auction from asyncio, enforcing each bidder's deadline.
+
+        Args:
+            get_bid (Callable[[Player, Auction], Awaitable[int | str | None]]): Coroutine function
+                returning the current bidder's move: an amount to bid, or None / "exit" to pass.
+
+        Returns:
+            tuple: The winner (Player | None) and the final highest bid.
+        """
+        while self.is_open:
+            player = self.current_bidder
+            try:
+                move = await asyncio.wait_for(get_bid(player, self), self.time_left())
+            except asyncio.TimeoutError:
+                self.timeout(player)
+                continue
+            if player is not self.current_bidder:
+                continue
+            if move is None or str(move).lower() == "exit":
+                self.pass_turn(player)
+            else:
+                self.submit_bid(player, move)
+        return self.winner, self.highest_bid
+
+    async def wait(self):
+        """
+        Waits until the auction is finished without blocking the event loop.
+
+        Returns:
+            tuple: The winner (Player | None) and the final highest bid.
+        """
+        if self.is_open:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+            await future
+        return self.winner, self.highest_bid
+
+    def _reject(self, message):
+        """Reports an invalid bid. Bots only get one attempt, so an invalid bot bid is a pass."""
+        player = self.current_bidder
+        self.log(message)
+        if player.identity != "Human":
+            self._drop(f"{player.name} tried to bid an invalid amount. Since {player.name} is a bot, it will pass.", "pass")
+        return message
+
+    def _drop(self, message, event):
+        """Removes the current bidder from the queue and moves the auction on."""
+        self.exited.append(self.queue.popleft())
+        self.log(message)
+        self._notify(event)
+        self._advance()
+
+    def _advance(self):
+        """
+        Moves the auction to the next bidder who needs to act.
+
+        Bidders who cannot beat the highest bid are dropped, bot turns are played, an all-bot
+        queue is settled by the resolver and the auction is finished when nobody is left to bid.
+        """
+        while self.is_open:
+            if not self.queue or (len(self.queue) == 1 and (self.default_winner or self.highest_bidder is not None)):
+                self._finish()
+                return
+
+            player = self.queue[0]
+            if self.highest_bid > player.balance:
+                self._drop(f"{player.name} only has £{player.balance} and the current highest bid is £{self.highest_bid}.", "pass")
+                return
+
+            if player.identity == "Human":
+                self.deadline = None if self.turn_timeout is None else self.clock() + self.turn_timeout
+                self._notify("turn")
+                return
+
+            resolver = self.bank.auction_resolver
+            if len(self.queue) > 1 and resolver.can_resolve(self.queue):
+                survivor, self.highest_bid, highest_bidder, bids = resolver.resolve(
+                    list(self.queue), self.property, self.highest_bid, self.highest_bidder)
+                self.highest_bidder = highest_bidder
+                self.exited.extend(p for p in self.queue if p is not survivor)
+                self.queue = deque([survivor])
+                self.log(f"Only bots are left bidding on {self.property.name}: settled {bids} bid(s) at £{self.highest_bid}.")
+                continue
+
+            bid = player.bot_bid(self.highest_bid, self.property)
+            if bid == "exit":
+                self.pass_turn(player)
+            else:
+                self.submit_bid(player, bid)
+            return
+
+    def _finish(self):
+        """Closes the auction, settles it if requested and wakes up anyone waiting on it."""
+        self.state = self.FINISHED
+        self.deadline = None
+        self.survivor = self.queue[0] if self.queue else (self.exited[-1] if self.exited else None)
+        self.winner = self.highest_bidder if self.highest_bidder is not None else (
+            self.survivor if self.default_winner and self.queue else None)
+
+        if self.settle:
+            if self.winner is not None:
+                self.bank.ledger.transfer(self.winner, self.bank, self.highest_bid, "auction", self.property.position)
+                self.property.transfer_property(self.winner)
+                self.log(f"{self.winner.name} won {self.property.name} for £{self.highest_bid}")
+            else:
+                self.log(f"No one bid on {self.property.name}. It remains unowned.")
+
+        self._notify("finished")
+        for future in self._waiters:
+            if not future.done():
+                future.set_result(None)
+        self._waiters.clear()
+
+    def _notify(self, event):
+        """Calls every listener with the event that just happened."""
+        for listener in list(self.listeners):
+            listener(self, event)
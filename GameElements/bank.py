@@ -1,5 +1,6 @@
-from GameElements.property import Property
-from collections import deque
+from GameElements.board import load_board
+from GameElements.auction import Auction, AuctionResolver
+from GameElements.ledger import Ledger
 
 
 class Bank: 
@@ -18,62 +19,51 @@ class Bank:
     Attributes: 
     
             balance (int): The bank's current balance.
+            board (BoardModel): The shared board model the properties are created from.
             properties (dict[int, property]): A dictionary mapping of board positions to properties available in the game.
+            auction_resolver (AuctionResolver): Settles auctions in closed form once only bots are bidding.
+            ledger (Ledger): Moves the money of every payment to or from the bank and keeps its journal.
+                A game shares it with its players and points its Free Parking pool at the game.
     """
 
-    def __init__(self):
+    def __init__(self, board=None):
         """
         Initialises the instance of the Bank. 
 
-        Sets balance to £50,000 and initialises the properties available in the game.
-        Each property is represented by a tuple containing its position, name, price, rent, house cost, and group.
+        Sets balance to £50,000 and initialises the properties available in the game from the board model.
         The properties are stored in a dictionary with the position as the key and a Property object as the value.
+
+        Args:
+            board (BoardModel | None): The board model to use. Defaults to the shared model of the board data CSV.
         """ 
         self.balance = 50000
+        self.board = board or load_board()
         self.properties = {}
+        self.auction_resolver = AuctionResolver()
+        self.ledger = Ledger(self)
         self.initialize_properties()
 
 
     def initialize_properties(self):
         """
-        Initializes the properties available in the game. Each property is represented by a tuple containing its position, name, price, rent, house cost, and group.
+        Initializes the properties available in the game from the board model.
         The properties are stored in a dictionary with the position as the key and a Property object as the value.
-        The properties are initialized with their respective prices, rents, house costs, and groups.
+        Each game gets its own unowned copies, while names, prices, rents, house costs and groups are shared with the board model.
+        """
+        self.properties = self.board.new_properties()
+
+    def attach(self, changes):
+        """
+        Publishes the changes to the bank's properties to a game's change feed.
+
+        Args:
+            changes (ChangeFeed): The game's change feed.
+
+        Returns:
+            None
         """
-        property_data = [
-            (2, "The Old Creek", 60, [2, 10, 30, 90, 160, 250], 50, "Brown"),
-            (4, "Gangsters Paradise", 60, [4, 20, 60, 180, 320, 450], 50, "Brown"),
-            (6, "Brighton Station", 200, [25, 50, 100, 200], 0, "Station"),
-            (7, "The Angels Delight", 100, [6, 30, 90, 270, 400, 550], 50, "Light Blue"),
-            (9, "Potter Avenue", 100, [6, 30, 90, 270, 400, 550], 50, "Light Blue"),
-            (10, "Granger Drive", 120, [8, 40, 100, 300, 450, 600], 50, "Light Blue"),
-            (12, "Skywalker Drive", 140, [10, 50, 150, 450, 625, 750], 100, "Pink"),
-            (13, "Tesla Power Co", 150, [4, 10], 0, "Utilities"),
-            (14, "Wookie Hole", 140, [10, 50, 150, 450, 625, 750], 100, "Pink"),
-            (15, "Rey Lane", 160, [12, 60, 180, 500, 700, 900], 100, "Pink"),
-            (16, "Hove Station", 200, [25, 50, 100, 200], 0, "Station"),
-            (17, "Bishop Drive", 180, [14, 70, 200, 550, 750, 950], 100, "Orange"),
-            (19, "Dunham Street", 180, [14, 70, 200, 550, 750, 950], 100, "Orange"),
-            (20, "Broyles Lane", 200, [16, 80, 220, 600, 800, 1000], 100, "Orange"),
-            (22, "Yue Fei Square", 220, [18, 90, 250, 700, 875, 1050], 150, "Red"),
-            (24, "Mulan Rouge", 220, [18, 90, 250, 700, 875, 1050], 150, "Red"),
-            (25, "Han Xin Gardens", 240, [20, 100, 300, 750, 925, 1100], 150, "Red"),
-            (26, "Falmer Station", 200, [25, 50, 100, 200], 0, "Station"),
-            (27, "Shatner Close", 260, [22, 110, 330, 800, 975, 1150], 150, "Yellow"),
-            (28, "Picard Avenue", 260, [22, 110, 330, 800, 975, 1150], 150, "Yellow"),
-            (29, "Edison Water", 150, [4, 10], 0, "Utilities"),
-            (30, "Crusher Creek", 280, [24, 120, 360, 850, 1025, 1200], 150, "Yellow"),
-            (32, "Sirat Mews", 300, [26, 130, 390, 900, 1100, 1275], 200, "Green"),
-            (33, "Ghengis Crescent", 300, [26, 130, 390, 900, 1100, 1275], 200, "Green"),
-            (35, "Ibis Close", 320, [28, 150, 450, 1000, 1200, 1400], 200, "Green"),
-            (36, "Portslade Station", 200, [25, 50, 100, 200], 0, "Station"),
-            (38, "James Webb Way", 350, [35, 175, 500, 1100, 1300, 1500], 200, "Deep blue"),
-            (40, "Turing Heights", 400, [50, 200, 600, 1400, 1700, 2000], 200, "Deep lbue"),
-        ]
-
-        for data in property_data:
-            position = data[0]
-            self.properties[position] = Property(*data)
+        for prop in self.properties.values():
+            prop.changes = changes
 
     def auction_property(self, auction_property, players):
         """"
@@ -100,17 +90,39 @@ class Bank:
 
         highest_bidder, highest_bid = self.bid_property(active_bidders, auction_property)
 
-        highest_bidder.balance -= highest_bid
-        self.balance += highest_bid
+        self.ledger.transfer(highest_bidder, self, highest_bid, "auction", auction_property.position)
         auction_property.transfer_property(highest_bidder)
         print(f"🎉 {highest_bidder.name} won {auction_property.name} for £{highest_bid}")
 
+    def open_auction(self, property, bidders, highest_bid=0, turn_timeout=None, log=print):
+        """
+        Opens a non-blocking auction for a property.
+
+        The returned auction is driven by calling its `submit_bid`, `pass_turn` and `timeout`
+        operations as bidders act, so the GUI, headless games and remote clients can all run an
+        auction without blocking. Bots act on their own. When the auction ends the winner pays
+        the bank and receives the property; if nobody bids the property stays with the bank.
+
+        Args:
+            property (Property): The property being auctioned.
+            bidders (list[Player]): The players taking part, in bidding order.
+            highest_bid (int): The starting highest bid. Defaults to 0.
+            turn_timeout (float | None): Seconds each bidder has to act. Defaults to no limit.
+            log (Callable[[str], None]): Where auction messages are reported. Defaults to print.
+
+        Returns:
+            Auction: The running auction.
+        """
+        return Auction(self, property, bidders, highest_bid, turn_timeout=turn_timeout, log=log)
+
     def bid_property(self, active_bidders, property, highest_bid=0):
         """
-        Conducts the bidding process for a property auction. Players take turns to bid until only one player remains.
+        Conducts the bidding process for a property auction from the console. Players take turns to bid until only one player remains.
 
         Players take turns bidding, a player may place a bid higher than the current highest bid or exit the auction. 
-        The bidding continues until one player remains. Bot generate bids automatically, while human players input is prompted. 
+        The bidding continues until one player remains. Bots generate bids automatically, while human players input is prompted. 
+        The bidding itself is handled by an `Auction` state machine; this method only feeds it console input, so
+        once no human is left in the bidding queue the remaining rounds are settled in one step by the auction resolver.
         The function returns the final winning player and their bid. 
 
         Args: 
@@ -121,70 +133,18 @@ class Bank:
         Returns: 
             tuple: The winning player and their bid amount.
         """
-        def valid_bid(bid, player):
-            """
-            Determines if the bid is valid. 
-            
-            Function checks if a bid is valid if it is a number, greater than the current highest bid, and less than or equal to the player's balance.
-            If the bid is the string "exit", the player exits the auction.
-
-            Args: 
-                bid (str): The bid input from the player.
-                player (Player): The player making the bid.
-                highest_bid (int): The current highest bid.
-
-            Returns: 
-                bool: True if the bid is valid, False otherwise.
-            """
-            if bid.lower() == "exit":
-                return True
-            try:
-                if int(bid) > player.balance:
-                    print("You can't bid more than your balance!")
-                    return False
-                elif int(bid) <= highest_bid:
-                    print("You must bid higher than the current highest bid!")
-                    return False
-                return True
-            except ValueError:
-                print("Invalid input, try again.")
-                return False
-            
-        bidding_queue = deque(active_bidders)
-
-        while len(bidding_queue) > 1:
-
-            player = bidding_queue.popleft()
+        auction = Auction(self, property, active_bidders, highest_bid, default_winner=True, settle=False)
 
+        while auction.is_open:
+            player = auction.current_bidder
             print(f"{player.name}'s current balance: £{player.balance}")
-
-            if highest_bid > player.balance:
-                print(f"{player.name} only has £{player.balance} and the current highest bid is £{highest_bid}.")
-                continue
-            
-            if player.identity == "Human":
-                while True:
-                    bid = input(f"{player.name}, enter your bid (or 'exit' to exit): ")
-                    if valid_bid(bid, player):
-                        if bid != "exit":
-                            bid = int(bid)
-                        break
+            bid = input(f"{player.name}, enter your bid (or 'exit' to exit): ")
+            if bid.lower() == "exit":
+                auction.pass_turn(player)
             else:
-                bid = player.bot_bid(highest_bid, property)
-                # The bot only gets one chance to submit a valid bid. Otherwise, it will pass. This is to prevent the bot from getting stuck in an infinite loop.
-                print(f"{player.name} bids {bid}.")
-                if not valid_bid(bid, player):
-                    print(f"{player.name} tried to bid an invalid amount. Since {player.name} is a bot, it will pass.")
-                    bid = "exit"
-
-            if bid == 'exit':
-                print(f"{player.name} has exited the auction.")
-                continue
-
-            highest_bid = int(bid)
-            bidding_queue.append(player)
+                auction.submit_bid(player, bid)
 
-        return bidding_queue[0], highest_bid
+        return auction.survivor, auction.highest_bid
 
 
     def sell_property_to_the_bank(self, plr, sold_property):
@@ -210,14 +170,12 @@ class Bank:
 
         if sold_property.mortgaged:
             value = sold_property.price // 2
-            plr.balance += value
-            self.balance -= value
+            self.ledger.transfer(self, plr, value, "sale", sold_property.position)
             sold_property.mortgaged = False
             msg = f"{plr.name} sold mortgaged {sold_property.name} to the bank for £{value}."
         else:
             value = sold_property.price
-            plr.balance += value
-            self.balance -= value
+            self.ledger.transfer(self, plr, value, "sale", sold_property.position)
             msg = f"{plr.name} sold {sold_property.name} to the bank for £{value}."
 
         plr.owned_properties.remove(sold_property)
@@ -256,7 +214,7 @@ class Bank:
         sale_value = (selected_property.house_cost // 2) * num
 
         selected_property.houses -= num
-        plr.balance += sale_value
+        self.ledger.transfer(self, plr, sale_value, "sale", selected_property.position)
 
         message = f"{plr.name} sold {num} house(s) from {selected_property.name} for £{sale_value}."
         print(message)
@@ -290,8 +248,7 @@ class Bank:
 
         selected_property.mortgaged = True
         mortgage_value = selected_property.price // 2
-        plr.balance += mortgage_value
-        self.balance -= mortgage_value
+        self.ledger.transfer(self, plr, mortgage_value, "mortgage", selected_property.position)
         print(f"{plr.name} mortgaged {selected_property.name} .")
 
     def unmortgage_property(self, plr, selected_property):
@@ -307,8 +264,7 @@ class Bank:
                 f"{plr.name} tried to unmortgage {selected_property.name} from the bank but he doesn't have the sufficient balance.")
 
         selected_property.mortgaged = False
-        plr.balance -= mortgage_value
-        self.balance += mortgage_value
+        self.ledger.transfer(plr, self, mortgage_value, "mortgage", selected_property.position)
         print(f"{plr.name} unmortgaged {selected_property.name} .")
         return (f"{plr.name} unmortgaged {selected_property.name} .")
 
@@ -351,11 +307,61 @@ class Bank:
             return (f"{selected_property.owner.name} is attempting to build houses on {selected_property.name}, but the number of houses in the group must be symmetrical (difference of at most 1).")
         else :
             selected_property.houses += number_of_houses
-            plr.balance -= total_cost
-            self.balance += total_cost
+            self.ledger.transfer(plr, self, total_cost, "build", selected_property.position)
             print(f"{selected_property.owner.name} built {number_of_houses} house(s) on {selected_property.name}")
             return (f"{selected_property.owner.name} built {number_of_houses} house(s) on {selected_property.name}")
 
+    def build_houses(self, plr, allocation):
+        """
+        Builds houses on several properties in a single transaction.
+
+        The whole allocation is checked before anything is built: every property must belong to a completed
+        colour set owned by the player, no property may end up with more than 5 houses, the houses in each group
+        must stay symmetrical (difference of at most 1) once the allocation is applied, and the player must be
+        able to pay for all of it. Either every house is built or none is.
+
+        Args:
+            plr (Player): The player building the houses.
+            allocation (dict[Property, int]): The number of houses to add to each property.
+
+        Returns:
+            str: A message indicating the result of the building attempt, either success or an explanation for failure.
+        """
+        if not allocation:
+            return f"{plr.name} has nothing to build."
+
+        total_houses = sum(allocation.values())
+        total_cost = sum(prop.house_cost * houses for prop, houses in allocation.items())
+        if plr.balance < total_cost:
+            message = f"{plr.name} doesn't have enough money to build {total_houses} house(s) for £{total_cost}."
+            print(message)
+            return message
+
+        for group in {prop.group for prop in allocation}:
+            group_properties = [prop for prop in plr.owned_properties if prop.group == group]
+            if not group_properties or not group_properties[0].check_completion():
+                message = f"{plr.name} is attempting to build on the {group} group which has not completed."
+                print(message)
+                return message
+            houses = [prop.houses + allocation.get(prop, 0) for prop in group_properties]
+            if max(houses) > 5:
+                message = f"{plr.name} is attempting to build more than the maximum number of houses on the {group} group which is 5 for any given property."
+                print(message)
+                return message
+            if max(houses) - min(houses) > 1:
+                message = f"{plr.name} is attempting to build houses on the {group} group, but the number of houses in the group must be symmetrical (difference of at most 1)."
+                print(message)
+                return message
+
+        for prop, houses in allocation.items():
+            prop.houses += houses
+        self.ledger.post([(plr, self, prop.house_cost * houses, prop.position) for prop, houses in allocation.items()], "build")
+
+        built = ", ".join(f"{houses} on {prop.name}" for prop, houses in allocation.items())
+        message = f"{plr.name} built {total_houses} house(s) for £{total_cost}: {built}"
+        print(message)
+        return message
+
     def pay_player(self, player, amount):
         """
         Pays a player a specified amount from the bank’s balance.
@@ -370,8 +376,7 @@ class Bank:
 
         """
         if self.balance >= amount:
-            self.balance -= amount
-            player.balance += amount
+            self.ledger.transfer(self, player, amount, "other")
             print(f"{player.name} received £{amount}.")
         else:
             print(f"{self.name} doesn’t have enough money to pay £{amount}! Selling assets...")
@@ -390,8 +395,7 @@ class Bank:
             amount (int): The amount of money the player needs to pay.
         """
         if player.balance >= amount:
-            self.balance += amount
-            player.balance -= amount
+            self.ledger.transfer(player, self, amount, "other")
             print(f"{player.name} paid £{amount}.")
         else:
             print(f"{player.name} doesn’t have enough money to pay £{amount}! Selling assets...")
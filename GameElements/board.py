@@ -0,0 +1,220 @@
+import csv
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+
+
+BOARD_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "PropertyTycoonBoardData.csv")
+
+
+class BoardModel:
+    """
+    Immutable description of the board, compiled once from the board data CSV.
+
+    Every per-tile table is a read-only numpy array indexed by board position (1–40, index 0 is
+    unused), so the bank, the board GUI, the trade engine and simulations can all share one model.
+    Games get their own `Property` objects from `new_properties`, which copies prebuilt templates
+    instead of rebuilding each property from the raw data.
+
+    Attributes:
+        size (int): Number of tiles on the board.
+        names (tuple[str]): Name of each tile.
+        labels (tuple[str]): Group column of each tile as written in the CSV (also set for some special tiles).
+        kinds (numpy.ndarray): Index into `KINDS` of each tile.
+        prices (numpy.ndarray): Purchase price of each tile (0 if it cannot be bought).
+        rents (numpy.ndarray): (tiles x 6) rent tiers: unimproved, 1–4 houses and hotel for colour groups,
+            1–4 owned for stations and the dice multipliers for 1–2 owned utilities.
+        rent_tiers (numpy.ndarray): Number of rent tiers used by each tile.
+        house_costs (numpy.ndarray): Cost of one house on each tile.
+        group_ids (numpy.ndarray): Index into `groups` of each tile (-1 if it has no group).
+        groups (tuple[str]): Names of the property groups, in board order.
+        group_sizes (numpy.ndarray): Number of tiles in each group.
+        taxes (numpy.ndarray): Tax charged on each tile.
+        property_positions (tuple[int]): Positions of the tiles that can be bought.
+    """
+    KINDS = ("go", "property", "station", "utility", "pot_luck", "opportunity_knocks",
+             "tax", "jail", "free_parking", "go_to_jail")
+    SPECIAL_TILES = {
+        "Go": "go", "Pot Luck": "pot_luck", "Opportunity Knocks": "opportunity_knocks",
+        "Jail/Just visiting": "jail", "Free Parking": "free_parking", "Go to Jail": "go_to_jail",
+    }
+    RENT_TIERS = 6
+
+    def __init__(self, path=BOARD_PATH):
+        """
+        Compiles the board model from a board data CSV.
+
+        Args:
+            path (str): Path to the CSV file. Defaults to `data/PropertyTycoonBoardData.csv`.
+
+        Raises:
+            FileNotFoundError: If the CSV file does not exist.
+            ValueError: If a tile or note in the CSV cannot be parsed.
+        """
+        with open(path, encoding="ISO-8859-1", newline="") as file:
+            rows = [row + [""] * (15 - len(row)) for row in csv.reader(file)]
+
+        tiles = [row for row in rows if row[0].strip().isdigit()]
+        notes = rows[rows.index(next(row for row in rows if row[0] == "Notes")):]
+        house_costs, station_rent, utility_multiplier = self._parse_notes(notes)
+
+        self.size = len(tiles)
+        shape = self.size + 1
+        self.names = ("",) + tuple(row[1].strip() for row in tiles)
+        self.labels = ("",) + tuple(row[3].strip() for row in tiles)
+        kinds = np.zeros(shape, dtype=np.int8)
+        prices = np.zeros(shape, dtype=np.int32)
+        rents = np.zeros((shape, self.RENT_TIERS), dtype=np.int32)
+        rent_tiers = np.zeros(shape, dtype=np.int8)
+        costs = np.zeros(shape, dtype=np.int32)
+        group_ids = np.full(shape, -1, dtype=np.int8)
+        taxes = np.zeros(shape, dtype=np.int32)
+        groups = []
+
+        for row in tiles:
+            position, name, group, action = int(row[0]), row[1].strip(), row[3].strip(), row[4].strip()
+            if row[5].strip() == "Yes":
+                if group == "Station":
+                    kind, tiers = "station", station_rent
+                elif group == "Utilities":
+                    kind, tiers = "utility", utility_multiplier
+                else:
+                    kind, tiers = "property", [int(value) for value in row[8:9] + row[10:15]]
+                    costs[position] = house_costs[group]
+                if group not in groups:
+                    groups.append(group)
+                group_ids[position] = groups.index(group)
+                prices[position] = int(row[7])
+                rents[position, :len(tiers)] = tiers
+                rent_tiers[position] = len(tiers)
+            elif name in self.SPECIAL_TILES:
+                kind = self.SPECIAL_TILES[name]
+            elif action.startswith("Pay"):
+                kind = "tax"
+                taxes[position] = self._pounds(action)
+            else:
+                raise ValueError(f"Unknown board tile at position {position}: {name!r}")
+            kinds[position] = self.KINDS.index(kind)
+
+        self.kinds, self.prices, self.rents, self.rent_tiers = kinds, prices, rents, rent_tiers
+        self.house_costs, self.group_ids, self.taxes = costs, group_ids, taxes
+        self.groups = tuple(groups)
+        self.group_sizes = np.bincount(group_ids[group_ids >= 0], minlength=len(groups))
+        self.property_positions = tuple(np.flatnonzero(prices).tolist())
+        for array in (kinds, prices, rents, rent_tiers, costs, group_ids, taxes, self.group_sizes):
+            array.setflags(write=False)
+        self._templates = None
+
+    @staticmethod
+    def _pounds(text):
+        """Returns the first amount of money in a piece of CSV text."""
+        match = re.search(r"(\d+)", text)
+        if not match:
+            raise ValueError(f"No amount found in {text!r}")
+        return int(match.group(1))
+
+    def _parse_notes(self, notes):
+        """
+        Reads the house costs, station rents and utility multipliers from the notes under the board table.
+
+        Returns:
+            tuple: (house cost by colour group, station rents by count owned, utility multipliers by count owned).
+        """
+        house_costs, station_rent, utility_multiplier = {}, {}, []
+        in_costs = False
+        for row in notes:
+            text = row[0]
+            owned = re.search(r"owns (\d+) stations?, rent is \D*(\d+)", text)
+            if owned:
+                station_rent[int(owned.group(1))] = int(owned.group(2))
+            elif "utilit" in text:
+                utility_multiplier.append(self._pounds(text))
+
+            if row[7].strip() == "Set":
+                in_costs = True
+            elif in_costs and row[7].strip():
+                for group in row[7].split(","):
+                    house_costs[group.strip()] = self._pounds(row[9])
+        return house_costs, [station_rent[count] for count in sorted(station_rent)], utility_multiplier
+
+    def _build_property(self, position):
+        """Builds the template `Property` for a position."""
+        from GameElements.property import Property  # property.py reads its group sizes from this module
+
+        return Property(
+            position, self.names[position], int(self.prices[position]),
+            tuple(self.rents[position, :self.rent_tiers[position]].tolist()),
+            int(self.house_costs[position]), self.groups[self.group_ids[position]],
+        )
+
+    def kind(self, position):
+        """
+        Returns the kind of a tile.
+
+        Args:
+            position (int): The board position (1–40).
+
+        Returns:
+            str: One of `KINDS`.
+        """
+        return self.KINDS[self.kinds[position]]
+
+    def group_size_map(self):
+        """
+        Returns the number of properties in each group.
+
+        Returns:
+            dict[str, int]: Group name to number of properties.
+        """
+        return dict(zip(self.groups, self.group_sizes.tolist()))
+
+    def new_properties(self):
+        """
+        Creates a fresh, unowned set of properties for a game.
+
+        Returns:
+            dict[int, Property]: Board position to property. The rent tiers are shared, immutable tuples.
+        """
+        if self._templates is None:
+            self._templates = {position: self._build_property(position) for position in self.property_positions}
+        properties = {}
+        for position, template in self._templates.items():
+            prop = properties[position] = object.__new__(type(template))
+            prop.__dict__.update(template.__dict__)
+        return properties
+
+    def tiles(self):
+        """
+        Returns one record per tile for the board GUI.
+
+        Returns:
+            list[dict]: Records with "Position", "Name", "Group" (the CSV group column, or None) and
+                "Price" (NaN if the tile cannot be bought).
+        """
+        return [
+            {
+                "Position": position,
+                "Name": self.names[position],
+                "Group": self.labels[position] or None,
+                "Price": int(self.prices[position]) if self.prices[position] else float("nan"),
+            }
+            for position in range(1, self.size + 1)
+        ]
+
+
+_compile_board = lru_cache(maxsize=None)(BoardModel)
+
+
+def load_board(path=BOARD_PATH):
+    """
+    Returns the board model for a CSV file, compiling it on first use in the process.
+
+    Args:
+        path (str): Path to the CSV file. Defaults to `data/PropertyTycoonBoardData.csv`.
+
+    Returns:
+        BoardModel: The shared board model.
+    """
+    return _compile_board(os.path.abspath(path))
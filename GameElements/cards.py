@@ -1,4 +1,151 @@
+import json
+import os
 import random
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from GameElements.ledger import Ledger
+
+
+CARDS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cards.json")
+
+
+def reward_player(player, game, amount, reason):
+    """
+    Gives the player a reward (adds money to their balance).
+
+    Args:
+        player (Player): The player to reward.
+        game (Game): The current game instance.
+        amount (int): The amount to reward the player.
+        reason (str): Reason for the reward.
+
+    Side Effects:
+        Pays the amount from the bank to the player.
+        Logs event in the game log.
+    """
+    Ledger.of(game).transfer(game.bank, player, amount, "card")
+    game.log_event(f"{player.name} received £{amount} for {reason}.")
+
+
+def charge_player(player, game, amount, reason):
+    """
+    Charges the player a specific amount. If the player cannot afford it, triggers bankruptcy.
+
+    Args:
+        player (Player): The player to charge.
+        game (Game): The current game instance.
+        amount (int): The amount to charge the player.
+        reason (str): Reason for the charge.
+
+    Side Effects:
+        Pays the amount from the player to the bank.
+        Logs event in the game log.
+        Triggers bankruptcy if player cannot afford the charge.
+    """
+    if player.balance >= amount:
+        Ledger.of(game).transfer(player, game.bank, amount, "card")
+        game.log_event(f"{player.name} paid £{amount} for {reason}.")
+    else:
+        game.log_event(f"{player.name} cannot afford £{amount} for {reason}.")
+        player.avoid_bankruptcy(amount, None)
+
+
+def move_player_to(player, game, position):
+    """Moves the player to a board position, collecting £200 if they pass GO."""
+    player.move_player_to(position)
+
+
+def move_player_back(player, game, spaces):
+    """Moves the player back a number of spaces without passing GO."""
+    player.position = max(1, player.position - spaces)
+
+
+def send_to_jail(player, game):
+    """Sends the player to jail."""
+    player.go_to_jail()
+
+
+def assess_repairs(player, game, house, hotel):
+    """Charges the player for repairs on their houses and hotels."""
+    player.assess_property_repair(game, house, hotel)
+
+
+def give_jail_free_card(player, game):
+    """Gives the player a 'Get Out of Jail Free' card."""
+    player.get_out_of_jail_cards += 1
+
+
+# Effect name -> (handler, fields read from the card record)
+EFFECTS = {
+    "reward": (reward_player, ("amount", "reason")),
+    "charge": (charge_player, ("amount", "reason")),
+    "move_to": (move_player_to, ("position",)),
+    "move_back": (move_player_back, ("spaces",)),
+    "jail": (send_to_jail, ()),
+    "repairs": (assess_repairs, ("house", "hotel")),
+    "jail_free": (give_jail_free_card, ()),
+}
+
+
+class Effect(namedtuple("Effect", ["kind", "handler", "args"])):
+    """
+    A compiled card effect: the handler from `EFFECTS` and the arguments taken from the card record.
+
+    Effects hold only module-level functions and plain values, so cards built from them can be
+    pickled and sent to other processes, unlike cards whose actions are lambdas.
+    """
+    __slots__ = ()
+
+    def __call__(self, player, game):
+        self.handler(player, game, *self.args)
+
+
+def compile_effect(record):
+    """
+    Compiles a card record into an `Effect`.
+
+    Args:
+        record (dict): The card record, with an "effect" name and the fields that effect needs.
+
+    Returns:
+        Effect: The compiled effect.
+
+    Raises:
+        ValueError: If the effect is unknown or the record is missing one of its fields.
+    """
+    kind = record.get("effect")
+    if kind not in EFFECTS:
+        raise ValueError(f"Unknown card effect: {kind!r}")
+    handler, fields = EFFECTS[kind]
+    missing = [field for field in fields if field not in record]
+    if missing:
+        raise ValueError(f"Card {record.get('description')!r} is missing {', '.join(missing)}")
+    return Effect(kind, handler, tuple(record[field] for field in fields))
+
+
+@lru_cache(maxsize=None)
+def load_card_data(path=CARDS_PATH):
+    """
+    Loads and compiles the card definitions from a JSON file.
+
+    The file maps each deck name to a list of card records. The compiled cards are cached, so
+    every game shares the same immutable card objects and only keeps its own deck order.
+
+    Args:
+        path (str): Path to the JSON file. Defaults to `data/cards.json`.
+
+    Returns:
+        dict[str, tuple[Card]]: The cards of each deck.
+    """
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    return {
+        name: tuple(Card(record["description"], compile_effect(record)) for record in records)
+        for name, records in data.items()
+    }
 
 
 class Card:
@@ -6,7 +153,8 @@ class Card:
     Represents an individual action card (Pot Luck / Opportunity Knocks).
     
     Each card contains description and associated action, which is a function that 
-    modifies the player or game state when executed. 
+    modifies the player or game state when executed. Cards loaded from the card data file
+    use a compiled `Effect` as their action.
     """
 
     def __init__(self, description, action):
@@ -20,6 +168,11 @@ class Card:
         self.description = description
         self.action = action  # Function that modifies player/game state
 
+    @property
+    def kept_by_player(self):
+        """bool: Whether the player keeps the card after drawing it instead of returning it to the deck."""
+        return isinstance(self.action, Effect) and self.action.kind == "jail_free"
+
     def execute(self, player, game):
         """
         Executes the card's associated action and logs the effect.
@@ -45,8 +198,6 @@ class Card:
             print(f"{player.name} moved to position {player.position}.")
             game.handle_position(player)  # Handle the new position
 
-    
-
 
 class CardDeck:
     """
@@ -54,6 +205,11 @@ class CardDeck:
 
     The deck is initialised with a list of card objects, which are shuffled once. 
     Cards are drawn from the top and placed at the bottom after execution, ensuring cycling behaviour. 
+
+    The cards themselves are never moved. The deck order is a ring buffer of indices into them
+    with a head pointer, so drawing a card and returning it to the bottom are O(1), and the
+    deck's state (order, head and size) can be snapshotted and restored cheaply.
+    A card the player keeps ("Get out of jail free") leaves the ring until it is returned.
     """
 
     def __init__(self, cards):
@@ -64,7 +220,28 @@ class CardDeck:
             cards (list): List of Card objects to be included in the deck. 
         """
         self.cards = cards
-        random.shuffle(self.cards)
+        order = self.order.tolist()
+        random.shuffle(order)
+        self.order[:] = order
+
+    @property
+    def cards(self):
+        """list[Card]: The cards currently in the deck, from top to bottom."""
+        if not self.size:
+            return []
+        slots = (self.head + np.arange(self.size)) % len(self.pool)
+        return [self.pool[i] for i in self.order[slots].tolist()]
+
+    @cards.setter
+    def cards(self, cards):
+        self.pool = list(cards)
+        self.kept = [isinstance(card, Card) and card.kept_by_player for card in self.pool]
+        self.order = np.arange(len(self.pool), dtype=np.int16)
+        self.head = 0
+        self.size = len(self.pool)
+
+    def __len__(self):
+        return self.size
 
     def draw_card(self, player, game):
         """
@@ -79,17 +256,66 @@ class CardDeck:
 
         Side Effects:
             Executes the card's effect (may change player or game state).
-            Appends the used card to the bottom of the deck.
+            Moves the used card to the bottom of the deck, unless the player keeps it.
             Logs event in the game log
          
          """
-        if not self.cards:
+        if not self.size:
             print("No cards left in the deck.")
             return None
 
-        card = self.cards.pop(0)  # FIFO removal
+        index = int(self.order[self.head])
+        self.head = (self.head + 1) % len(self.pool)
+        self.size -= 1
+        card = self.pool[index]
         card.execute(player, game)
-        self.cards.append(card)  # Move to the bottom
+        if not self.kept[index]:
+            self.return_card(index)
+        return card
+
+    def return_card(self, index):
+        """
+        Places a card at the bottom of the deck.
+
+        Args:
+            index (int): Position of the card in `pool`.
+
+        Side Effects:
+            Writes the card into the slot after the last card in the deck.
+        """
+        self.order[(self.head + self.size) % len(self.pool)] = index
+        self.size += 1
+
+    def held_cards(self):
+        """
+        Returns the pool indices of the cards that are currently out of the deck.
+
+        Returns:
+            list[int]: Indices into `pool`.
+        """
+        if not self.pool:
+            return []
+        slots = (self.head + np.arange(self.size)) % len(self.pool)
+        return sorted(set(range(len(self.pool))) - set(self.order[slots].tolist()))
+
+    def snapshot(self):
+        """
+        Captures the deck's order so it can be restored later or copied into another game.
+
+        Returns:
+            tuple: (order, head, size).
+        """
+        return self.order.copy(), self.head, self.size
+
+    def restore(self, state):
+        """
+        Restores the deck's order from a snapshot.
+
+        Args:
+            state (tuple): A value returned by `snapshot`.
+        """
+        order, self.head, self.size = state
+        self.order = order.copy()
 
 
 class Cards:
@@ -98,12 +324,17 @@ class Cards:
 
     This encapsulates card generation, drawing, reward / charge logic , and the handling of special 
     "Get out of jail free" cards. It serves as main interface for triggering card-related events during the game. 
+    The cards are defined in `data/cards.json`.
     """
 
-    def __init__(self):
+    def __init__(self, path=CARDS_PATH):
         """
         Initialises the card system by creating and shuffling both decks. 
+
+        Args:
+            path (str): Path to the card data file. Defaults to `data/cards.json`.
         """
+        self.card_data = load_card_data(path)
         self.pot_luck_deck = self.create_pot_luck_deck()
         self.opportunity_knocks_deck = self.create_opportunity_knocks_deck()
 
@@ -118,17 +349,11 @@ class Cards:
             reason (str): Reason for the charge.
         
         Side Effects:
-            Deducts amount from player's balance.
+            Pays the amount from the player to the bank.
             Logs event in the game log.
             Triggers bankruptcy if player cannot afford the charge.
         """
-
-        if player.balance >= amount:
-            player.balance -= amount
-            game.log_event(f"{player.name} paid £{amount} for {reason}.")
-        else:
-            game.log_event(f"{player.name} cannot afford £{amount} for {reason}.")
-            player.avoid_bankruptcy(amount, None)
+        charge_player(player, game, amount, reason)
 
     def reward_player(self, player, game, amount, reason):
         """
@@ -144,9 +369,7 @@ class Cards:
             Adds amount to player's balance.
             Logs event in the game log.
         """
-
-        player.balance += amount
-        game.log_event(f"{player.name} received £{amount} for {reason}.")
+        reward_player(player, game, amount, reason)
 
     def create_pot_luck_deck(self):
         """
@@ -155,19 +378,7 @@ class Cards:
         Returns: 
             CardDeck: Initialised deck of Pot Luck cards with effects.
         """
-
-        return CardDeck([
-            Card("You inherit £200", lambda p, g: self.reward_player(p, g, 200, "inheritance")),
-            Card("You have won 2nd prize in a beauty contest, collect £50",
-                 lambda p, g: self.reward_player(p, g, 50, "beauty contest")),
-            Card("Go back to the Old Creek", lambda p, g: p.move_player_to(2)),
-            Card("Student loan refund. Collect £20", lambda p, g: self.reward_player(p, g, 20, "student loan refund")),
-            Card("Bank error in your favour. Collect £200", lambda p, g: self.reward_player(p, g, 200, "bank error")),
-            Card("Pay bill for textbooks of £100", lambda p, g: self.charge_player(p, g, 100, "textbooks")),
-            Card("Advance to GO", lambda p, g: p.move_player_to(1)),
-            Card("Get out of jail free", lambda p, g: setattr(p, 'get_out_of_jail_cards', p.get_out_of_jail_cards + 1)),
-            Card("Go to jail. Do not pass GO, do not collect £200", lambda p, g: p.go_to_jail())
-        ])
+        return CardDeck(self.card_data["pot_luck"])
 
     def create_opportunity_knocks_deck(self):
         """
@@ -176,21 +387,7 @@ class Cards:
         Returns: 
             CardDeck: Initialised deck of Opportunity Knocks cards with effects.
         """
-        return CardDeck([
-            Card("Bank pays you a dividend of £50", lambda p, g: self.reward_player(p, g, 50, "dividend")),
-            Card("Advance to Turing Heights", lambda p, g: p.move_player_to(40)),
-            Card("Advance to Han Xin Gardens. If you pass GO, collect £200",
-                 lambda p, g: p.move_player_to(25)),
-            Card("Fined £15 for speeding", lambda p, g: self.charge_player(p, g, 15, "speeding")),
-            Card("Pay university fees of £150", lambda p, g: self.charge_player(p, g, 150, "university fees")),
-            Card("Take a trip to Hove station. If you pass GO collect £200", lambda p, g: p.move_player_to(16)),
-            Card("You are assessed for repairs, £40/house, £115/hotel",
-                 lambda p, g: p.assess_property_repair(g, 40, 115)),  # this is handled safely in Player
-            Card("Go back 3 spaces", lambda p, g: setattr(p, 'position', max(1, p.position - 3))),
-            Card("Drunk in charge of a hoverboard. Fine £30", lambda p, g: self.charge_player(p, g, 30, "hoverboard fine")),
-            Card("Get out of jail free", lambda p, g: setattr(p, 'get_out_of_jail_cards', p.get_out_of_jail_cards + 1)),
-            Card("Go to jail. Do not pass GO, do not collect £200", lambda p, g: p.go_to_jail())
-        ])
+        return CardDeck(self.card_data["opportunity_knocks"])
 
     def draw_pot_luck_card(self, player, game):
         """
@@ -220,21 +417,45 @@ class Cards:
         """
         self.opportunity_knocks_deck.draw_card(player, game)
 
-    def return_jail_card_to_bottom(self, deck="pot_luck"):
+    def return_jail_card_to_bottom(self, deck=None):
         """
-        Returns a 'Get Out of Jail Free' card to the bottom of the specified deck.
+        Returns a used 'Get Out of Jail Free' card to the bottom of the deck it was drawn from.
         
         Args: 
-            deck (str): The deck to return the card to ('pot_luck' or 'opportunity_knocks').
+            deck (str | None): The deck to return the card to ('pot_luck' or 'opportunity_knocks').
+                If None, or that deck's card is not out, the card goes back to whichever deck it is missing from.
 
         Side Effects: 
-            Appends a 'Get Out of Jail Free' card to the specified deck.
+            Moves the held card back into its deck.
             Prints a confirmation message. 
         """
-        
-        card = Card("Get out of jail free", lambda p, g: setattr(p, 'get_out_of_jail_cards', p.get_out_of_jail_cards + 1))
-        if deck == "pot_luck":
-            self.pot_luck_deck.cards.append(card)
-        elif deck == "opportunity_knocks":
-            self.opportunity_knocks_deck.cards.append(card)
-        print(f"'Get Out of Jail Free' card returned to {deck.replace('_', ' ').title()} deck.")
+        names = ["pot_luck", "opportunity_knocks"]
+        if deck in names:
+            names.remove(deck)
+            names.insert(0, deck)
+        for name in names:
+            card_deck = getattr(self, f"{name}_deck")
+            held = [i for i in card_deck.held_cards() if card_deck.kept[i]]
+            if held:
+                card_deck.return_card(held[0])
+                print(f"'Get Out of Jail Free' card returned to {name.replace('_', ' ').title()} deck.")
+                return
+
+    def snapshot(self):
+        """
+        Captures the order of both decks.
+
+        Returns:
+            tuple: The snapshots of the Pot Luck and Opportunity Knocks decks.
+        """
+        return self.pot_luck_deck.snapshot(), self.opportunity_knocks_deck.snapshot()
+
+    def restore(self, state):
+        """
+        Restores the order of both decks from a snapshot.
+
+        Args:
+            state (tuple): A value returned by `snapshot`.
+        """
+        self.pot_luck_deck.restore(state[0])
+        self.opportunity_knocks_deck.restore(state[1])
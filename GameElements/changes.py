@@ -0,0 +1,105 @@
+from collections import namedtuple
+
+
+Change = namedtuple("Change", ["version", "kind", "subject", "old", "new"])
+Change.__doc__ = """
+One change to the game model, as passed to the listeners of a `ChangeFeed`.
+
+`kind` is one of `ChangeFeed.KINDS`, `subject` is the `Player` or `Property` that changed and `old`
+and `new` are the field's values before and after. `version` is the game's version once the change
+was made, so a view that remembers the last version it drew can tell whether it missed anything.
+"""
+
+
+class ChangeFeed:
+    """
+    Numbers the changes to a game's players and properties and passes them to whoever listens.
+
+    Players and properties publish to the feed of their game from their setters, so nothing that
+    changes the model needs to know about the feed. Each change increases `version` by one, whether
+    or not anyone is listening, so a cache keyed on the version is invalidated by any change at all.
+    Listeners that only care about some fields subscribe to those kinds, and receive each `Change`
+    to invalidate exactly the part it affects, e.g. one tile of the board or one player's row.
+
+    Kinds of change:
+        - "balance": a player's balance.
+        - "position": a player's board position (one change per step while moving).
+        - "removed": a player left the game (`old` is True and `new` False).
+        - "owner": a property's owner (a `Player` or None).
+        - "houses": the number of houses on a property (5 for a hotel).
+        - "mortgaged": whether a property is mortgaged.
+
+    Attributes:
+        version (int): Number of changes published so far.
+    """
+    KINDS = ("balance", "position", "removed", "owner", "houses", "mortgaged")
+
+    def __init__(self):
+        """
+        Initializes a feed at version 0 with no listeners.
+
+        Returns:
+            None
+        """
+        self.version = 0
+        self._listeners = {kind: [] for kind in self.KINDS}
+
+    def subscribe(self, listener, kinds=None):
+        """
+        Calls `listener` with every later change of the given kinds.
+
+        Args:
+            listener (Callable[[Change], None]): Called with each change, after it was made.
+            kinds (Iterable[str] | None): The kinds of change to listen to; None for all of them.
+
+        Returns:
+            Callable[[Change], None]: The listener, so the method can be used as a decorator.
+
+        Raises:
+            ValueError: If a kind is not one of `KINDS`.
+        """
+        kinds = self.KINDS if kinds is None else tuple(kinds)
+        for kind in kinds:
+            if kind not in self._listeners:
+                raise ValueError(f"Unknown kind of change: {kind!r}")
+        for kind in kinds:
+            if listener not in self._listeners[kind]:
+                self._listeners[kind].append(listener)
+        return listener
+
+    def unsubscribe(self, listener):
+        """
+        Stops calling `listener`. Does nothing if it was not subscribed.
+
+        Args:
+            listener (Callable[[Change], None]): A subscribed listener.
+
+        Returns:
+            None
+        """
+        for listeners in self._listeners.values():
+            if listener in listeners:
+                listeners.remove(listener)
+
+    def publish(self, kind, subject, old, new):
+        """
+        Records a change and passes it to the listeners of its kind.
+
+        Args:
+            kind (str): One of `KINDS`.
+            subject (Player | Property): What changed.
+            old: The field's value before the change.
+            new: The field's value after the change.
+
+        Returns:
+            None
+
+        Side Effects:
+            - Increases `version` by one.
+        """
+        self.version += 1
+        listeners = self._listeners[kind]
+        if listeners:
+            change = Change(self.version, kind, subject, old, new)
+            for listener in tuple(listeners):  # a listener may unsubscribe itself
+                listener(change)
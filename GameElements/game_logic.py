@@ -1,6 +1,13 @@
 from GameElements.player import Player
 from GameElements.bank import Bank
 from GameElements.cards import Cards
+from GameElements.trade import TradeEngine
+from GameElements.liquidation import LiquidationPlanner
+from GameElements.building import BuildPlanner
+from GameElements.changes import ChangeFeed
+from GameElements.ledger import PARKING
+from GameElements.net_worth import NetWorthTracker
+from GameElements.history import TurnHistory
 from GuiElements.auction_popup_gui import AuctionPopup
 import GuiElements
 import json
@@ -21,7 +28,7 @@ class Game:
     - Handle turn progression, including doubles logic and jail rules.
     - Determine and execute effects based on player position on the board.
     - Manage property transactions including purchases, rent, auctions, and construction.
-    - Support trade proposals and execution (console only).
+    - Support trade proposals and execution (console only), and bot-to-bot trades via the trade engine.
     - Log events and manage game-end conditions.
 
     Attributes:
@@ -31,9 +38,21 @@ class Game:
         bank (Bank): The shared bank handling money, properties, mortgages, and buildings.
         fines (int): Amount of accumulated money to be collected at Free Parking.
         cards (Cards): Manages the Pot Luck and Opportunity Knocks card decks.
+        trade_engine (TradeEngine): Values trades and finds the trades bots propose.
+        liquidation_planner (LiquidationPlanner): Chooses the assets bots give up to pay their debts.
+        build_planner (BuildPlanner): Chooses where bots build houses.
+        event_listeners (list[Callable[[str], None]]): Called with every logged event (e.g. by the network sync server).
+        changes (ChangeFeed): Publishes every change to the players' balances and positions and to the
+            properties' owners, houses and mortgages; views subscribe to it to invalidate what changed.
+        version (int): Number of changes made to the game model so far; see `changes`.
+        net_worth (NetWorthTracker): Every player's net worth at face value and the standings, kept up to date from `changes`.
+        ledger (Ledger): The bank's ledger, which all money in the game moves through; its Free Parking pool is `fines`.
+        history (TurnHistory): Every player's balance, net worth, position, properties and houses after each turn.
+        deferred (list[tuple]): Decisions left for whoever drives a game without a UI: ("auction", property, players)
+            for auctions with human bidders and ("debt", player, amount, creditor) for human debts.
     """
 
-    def __init__(self, player_names, tokens, identities):
+    def __init__(self, player_names, tokens, identities, board=None):
         """
         Initializes the Game instance by setting up players, the bank, and card decks.
 
@@ -41,18 +60,39 @@ class Game:
             player_names (list[str]): List of player names.
             tokens (list[str]): List of player token identifiers (e.g., "Dog", "Boot").
             identities (list[str]): List of player identities ("Human" or "Bot").
+            board (BoardModel | None): The board to play on, e.g. with other prices. Defaults to the board data CSV.
 
         Side Effects:
-            - Creates Player instances and assigns them to the game.
-            - Initializes the Bank and sets the fine pool to zero.
+            - Creates the change feed and the Bank, attaches the bank's properties to the change feed and sets the fine pool to zero.
+            - Points the bank's ledger's Free Parking pool at the game.
+            - Creates Player instances that publish to the change feed and pay through the ledger, and opens their accounts.
             - Creates the Pot Luck and Opportunity Knocks card decks.
         """
+        self.changes = ChangeFeed()
+        self.bank = Bank(board)
+        self.bank.attach(self.changes)
+        self.fines = 0
+        self.ledger = self.bank.ledger
+        self.ledger.pool = self
         self.players = [Player(name, token, identity, self) for name, token, identity in zip(player_names, tokens, identities)]
+        for player in self.players:
+            self.ledger.register(player)
         self.current_player_index = 0
         self.running = True
-        self.bank = Bank()
-        self.fines = 0
+        self.net_worth = NetWorthTracker(self)
+        self.history = TurnHistory(self)
         self.cards = Cards() 
+        self.trade_engine = TradeEngine(self.bank)
+        self.liquidation_planner = LiquidationPlanner(self.trade_engine.table)
+        self.build_planner = BuildPlanner(self.trade_engine.table)
+        self.ui = None
+        self.event_listeners = []
+        self.deferred = []
+
+    @property
+    def version(self):
+        """int: Increases by one with every change to the game model, so it can key caches of anything drawn from it."""
+        return self.changes.version
 
     def play_turn(self, die1, die2):
         """
@@ -69,6 +109,7 @@ class Game:
             - Logs output to the console.
             - Resets consecutive doubles if player is in jail.
             - Increments the player's turn count.
+            - Records the players' state in `history`.
         """
         player = self.players[self.current_player_index]
         print(f"\n {player.name}'s turn!")
@@ -80,6 +121,7 @@ class Game:
             player.consecutive_doubles = 0
 
         player.turns_taken += 1
+        self.history.record(player)
         
 
 
@@ -98,52 +140,71 @@ class Game:
         Side Effects:
             - Updates player's balance if taxes are paid or Free Parking is collected.
             - Draws cards and applies their effects (Pot Luck / Opportunity Knocks).
-            - Sends the player to jail if on tile 31.
+            - Sends the player to jail on the Go to Jail tile.
             - Logs events via the UI if applicable.
             - May trigger rent payments or property purchase logic via `handle_property()`.
-            - Automatically builds houses for bot players who meet certain conditions.
+            - Builds houses for bot players via `bot_build_houses()`.
+            - Lets bot players propose a trade to the other bots.
         """
-        
-        if player.position in [5, 39]:  # Income Tax & Luxury Tax
-            tax_amount = 200 if player.position == 5 else 75
+        board = self.bank.board
+        kind = board.kind(player.position)
+
+        if kind == "tax":  # Income Tax & Super Tax
+            tax_amount = int(board.taxes[player.position])
             player.pay_tax(tax_amount)
-            self.fines += tax_amount
+            # The bank puts the tax into the pool; booked under "parking" so "tax" only counts what players paid
+            self.ledger.transfer(self.bank, PARKING, tax_amount, "parking")
 
-        elif player.position in [3, 18, 34]:
+        elif kind == "pot_luck":
             print("Pot luck")
             self.cards.draw_pot_luck_card(player, self)
 
-        elif player.position in [8, 23, 37]:
+        elif kind == "opportunity_knocks":
             print("Opportunity Knocks")
             self.cards.draw_opportunity_knocks_card(player, self)
 
-        elif player.position == 31:
+        elif kind == "go_to_jail":
             player.go_to_jail()
 
-        elif player.position == 21:
+        elif kind == "free_parking":
             if self.fines > 0:
-                player.balance += self.fines
-                self.log_event(f"{player.name} landed on Free Parking and collected £{self.fines}")
-                self.fines = 0
+                collected = self.fines
+                self.ledger.transfer(PARKING, player, collected, "parking")
+                self.log_event(f"{player.name} landed on Free Parking and collected £{collected}")
             else:
                 self.log_event(f"{player.name} landed on Free Parking, but there's nothing to collect.")
 
 
 
-        elif player.position == 1:
+        elif kind == "go":
             print(f" {player.name} has landed at Go!")
 
-        elif player.position == 11 and not player.in_jail:
+        elif kind == "jail" and not player.in_jail:
             print(f"{player.name} is visiting jail")
 
         else:
             self.handle_property(player)
 
         if player.identity != 'Human':
-            for prop in player.owned_properties:
-                if prop.check_completion() and player.balance > 200: 
-                    msg = self.bank.build(1, prop, player)
-                    self.log_event(msg)
+            self.bot_propose_trade(player)
+            self.bot_build_houses(player)
+
+    def bot_build_houses(self, player):
+        """
+        Builds houses for a bot in one transaction, following the build planner's plan.
+
+        Bots keep £200 in hand and spend the rest on the houses that raise their rent the most.
+
+        Args:
+            player (Player): The bot whose turn it is.
+
+        Side Effects:
+            - Buys houses from the bank and logs the purchase.
+        """
+        plan = self.build_planner.plan(player, player.balance - 200, max(len(self.players) - 1, 1))
+        if plan.allocation:
+            msg = self.bank.build_houses(player, plan.allocation)
+            self.log_event(msg)
 
 
 
@@ -286,20 +347,27 @@ class Game:
         Initiates an auction for the property the player has landed on.
 
         The auction is set up by rotating the player order starting from the current player,
-        and initializing an AuctionPopup UI element. The property is marked to indicate
+        and initializing an AuctionPopup UI element. Without a UI (headless simulation) an
+        all-bot auction is run directly by the bank, while an auction with human bidders is added to
+        `deferred` for the game's driver (e.g. the `GameHost`) to run. The property is marked to indicate
         that it has already been auctioned during this turn.
 
         Args:
             player (Player): The player who declined the property purchase, triggering the auction.
 
         Side Effects:
-            - Displays an auction popup in the GUI.
+            - Displays an auction popup in the GUI, or runs or defers the auction without one.
             - Sets the `already_auctioned` flag on the property to True.
         """
         auction_players = self.players.copy()
         auction_players = auction_players[self.current_player_index:] + auction_players[:self.current_player_index]
         prop = self.bank.properties.get(player.position, None)
-        self.ui.auction_popup = AuctionPopup(self.ui.screen, auction_players, prop, self)
+        if self.ui:
+            self.ui.auction_popup = AuctionPopup(self.ui.screen, auction_players, prop, self)
+        elif any(p.identity == "Human" for p in auction_players):
+            self.deferred.append(("auction", prop, auction_players))
+        else:
+            self.bank.auction_property(prop, auction_players)
         prop.already_auctioned = True # Assigned the property already auctioned for this turm
 
     # Removed terminal game play options after merged with UI.
@@ -430,6 +498,43 @@ class Game:
         #     print(" Trade declined.")
         #     return
 
+    def bot_propose_trade(self, player):
+        """
+        Lets a bot propose the best trade the trade engine can find with the other bots.
+
+        All candidate trades are scored in one pass by the trade engine. Only bots are approached,
+        since human players cannot answer a trade offer from the GUI, but every other player still
+        counts as an opponent, as it does when the receiving bot decides for itself with `bot_trade`.
+
+        Args:
+            player (Player): The bot proposing the trade.
+
+        Returns:
+            TradeOffer | None: The executed trade, or None if no trade was made.
+
+        Side Effects:
+            - Executes the trade if the other bot accepts it.
+            - Logs the trade.
+        """
+        bots = [p for p in self.players if p.identity != "Human"]
+        if player not in bots or len(bots) < 2:
+            return None
+
+        offer = self.trade_engine.best_trade(player, bots, max(len(self.players) - 1, 1))
+        if offer is None:
+            return None
+
+        answer = offer.receiver.bot_trade(offer.offer_properties, offer.request_properties, offer.offer_money, offer.request_money)
+        if answer != "yes":
+            return None
+
+        self.execute_trade(player, offer.receiver, offer.offer_properties, offer.request_properties,
+                           offer.offer_money, offer.request_money)
+        gives = ", ".join([p.name for p in offer.offer_properties] + ([f"£{offer.offer_money}"] if offer.offer_money else []))
+        gets = ", ".join([p.name for p in offer.request_properties] + ([f"£{offer.request_money}"] if offer.request_money else []))
+        self.log_event(f"{player.name} traded {gives} to {offer.receiver.name} for {gets}.")
+        return offer
+
     def execute_trade(self, current_player, other_player, offer_properties, request_properties, offer_money,
                       request_money):
         """
@@ -453,19 +558,11 @@ class Game:
         """       
         # Executes a trade between two players, updating ownerships and balance
 
-        # Transfer money
-        if offer_money > 0:
-            if current_player.balance < offer_money:
-                print("Insufficient funds to complete the trade.")
-                return
-            current_player.balance -= offer_money
-            other_player.balance += offer_money
-        if request_money > 0:
-            if other_player.balance < request_money:
-                print("Insufficient funds to complete the trade.")
-                return
-            other_player.balance -= request_money
-            current_player.balance += request_money
+        # Transfer money, both ways or not at all
+        payments = [(current_player, other_player, max(offer_money, 0)), (other_player, current_player, max(request_money, 0))]
+        if not self.ledger.post(payments, "trade", require_funds=True):
+            print("Insufficient funds to complete the trade.")
+            return
         for prop in offer_properties:
             prop.transfer_property(other_player)
         for prop in request_properties:
@@ -535,8 +632,7 @@ class Game:
         """
         if new_position < player.position:  
             player.passed_go = True
-            player.balance += 200
-            self.bank.balance -= 200
+            self.ledger.transfer(self.bank, player, 200, "go")
             print(f"{player.name} passed GO and collected £200!")
 
         player.position = new_position  
@@ -554,10 +650,13 @@ class Game:
 
         Side Effects:
             - Displays the message in the GUI sidebar if available.
+            - Passes the message to the event listeners.
             - Prints the message to the console.
         """
         if self.ui and hasattr(self.ui, "right_sidebar"):
             self.ui.right_sidebar.log_event(message)
+        for listener in self.event_listeners:
+            listener(message)
         print(message)  
 
     def get_eligible_auction_players(self):
@@ -596,10 +695,11 @@ class Game:
         """
         Determines the winner(s) of the game in abridged mode based on total net worth.
 
-        Calculates net worth for each player by summing:
+        Net worth for each player is the sum of:
         - Cash balance
         - Property values
         - Value of houses built
+        and is read from the running totals of `net_worth` rather than summed again.
 
         The player(s) with the highest net worth is declared the winner. 
         Handles ties and logs the result to the game log.
@@ -607,19 +707,9 @@ class Game:
         Returns:
             str: The name of the winner or a concatenated string of winners in case of a tie.
         """
-        highest_networth = -1
-        winners = []
-
-        for p in self.players:
-            property_value = sum(prop.price for prop in p.owned_properties)
-            house_value = sum(prop.house_cost * prop.houses for prop in p.owned_properties)
-            networth = p.balance + property_value + house_value
-
-            if networth > highest_networth:
-                highest_networth = networth
-                winners = [p.name]
-            elif networth == highest_networth:
-                winners.append(p.name)
+        standings = self.net_worth.leaderboard()
+        highest_networth = standings[0][1] if standings else -1
+        winners = [p.name for p in self.net_worth.leaders()]
 
         if len(winners) == 1:
             winner_str = winners[0]
@@ -637,6 +727,7 @@ class Game:
 
         This method:
         - Transfers ownership of all the player's properties back to the bank.
+        - Returns any kept 'Get Out of Jail Free' cards to the bottom of their decks.
         - Removes the player from the game’s active player list.
         - Resets the current player index if needed.
         - Logs the removal event to the UI log.
@@ -649,13 +740,17 @@ class Game:
             None
         """
         player.return_properties_to_bank()
+        for _ in range(player.get_out_of_jail_cards):
+            self.cards.return_jail_card_to_bottom()
+        player.get_out_of_jail_cards = 0
         if player in self.players:
             self.players.remove(player)
+            self.changes.publish("removed", player, True, False)
 
         if self.current_player_index >= len(self.players):
             self.current_player_index = 0
 
-        self.ui.right_sidebar.log_event(f"{player.name} has been removed from the game.")
+        self.log_event(f"{player.name} has been removed from the game.")
         self.check_end_game()
 
 
@@ -0,0 +1,322 @@
+import asyncio
+import multiprocessing
+import queue
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from GameElements.game_logic import Game
+from GameElements.host import GameHost
+from GameElements.sync import PLAYER_FIELDS, apply
+
+
+class SharedGameState:
+    """
+    The state of one game laid out as numpy arrays in a `multiprocessing.shared_memory` block.
+
+    The game process writes the block with `publish` and the render process reads it in place with
+    `read_into`, so no state is pickled or copied between the processes. The block is guarded by a
+    sequence counter (a seqlock): the writer makes it odd while writing and even again when done, so
+    a reader never waits on the writer. It either sees a stable version or keeps drawing the last one.
+
+    Attributes:
+        memory (SharedMemory): The shared block.
+        header (numpy.ndarray): Sequence counter, turns played, current seat, fines and whether the game is running.
+        players (numpy.ndarray): One `PLAYER_DTYPE` row per seat.
+        properties (numpy.ndarray): One `PROPERTY_DTYPE` row per board position (owner seat or -1).
+    """
+    HEADER = ("seq", "turns", "current", "fines", "running")
+    PLAYER_DTYPE = np.dtype([("balance", "<i4"), ("position", "i1"), ("in_jail", "i1"), ("cards", "i1"),
+                             ("active", "i1"), ("turns_taken", "<i2")])
+    PROPERTY_DTYPE = np.dtype([("owner", "i1"), ("houses", "i1"), ("mortgaged", "i1")])
+    POSITIONS = 41
+
+    def __init__(self, players, name=None):
+        """
+        Creates a new block, or attaches to an existing one.
+
+        Args:
+            players (int): Number of seats in the game.
+            name (str | None): The name of the block to attach to. Defaults to creating a new block.
+        """
+        header_size = len(self.HEADER) * 8
+        player_size = players * self.PLAYER_DTYPE.itemsize
+        size = header_size + player_size + self.POSITIONS * self.PROPERTY_DTYPE.itemsize
+        self.owner = name is None
+        self.memory = shared_memory.SharedMemory(name=name, create=self.owner, size=size)
+        buffer = self.memory.buf
+        self.header = np.ndarray(len(self.HEADER), np.int64, buffer)
+        self.players = np.ndarray(players, self.PLAYER_DTYPE, buffer, header_size)
+        self.properties = np.ndarray(self.POSITIONS, self.PROPERTY_DTYPE, buffer, header_size + player_size)
+        if self.owner:
+            self.header[:] = 0
+            self.properties["owner"] = -1
+
+    @property
+    def name(self):
+        """str: The name other processes attach with."""
+        return self.memory.name
+
+    @property
+    def version(self):
+        """int: The sequence counter; it changes every time the state is published."""
+        return int(self.header[0])
+
+    def publish(self, game, seats, turns=0):
+        """
+        Writes the current state of a game into the block.
+
+        Args:
+            game (Game): The game.
+            seats (list[Player]): The game's players in their original order.
+            turns (int): Number of turns played.
+
+        Side Effects:
+            - Increments the sequence counter twice, leaving it even.
+        """
+        header = self.header
+        header[0] += 1
+        seat_of = {id(player): seat for seat, player in enumerate(seats)}
+        for seat, p in enumerate(seats):
+            self.players[seat] = (p.balance, p.position, p.in_jail, p.get_out_of_jail_cards,
+                                  p in game.players, p.turns_taken)
+        for position, prop in game.bank.properties.items():
+            self.properties[position] = (seat_of.get(id(prop.owner), -1), prop.houses, prop.mortgaged)
+        current = seat_of.get(id(game.players[game.current_player_index]), -1) if game.players else -1
+        header[1:] = (turns, current, game.fines, game.running)
+        header[0] += 1
+
+    def read_into(self, game, seats, version=None):
+        """
+        Brings a replica game in line with the block, unless it already shows this version.
+
+        Args:
+            game (Game): The replica game.
+            seats (list[Player]): The replica's players in seat order.
+            version (int | None): The version the replica already shows.
+
+        Returns:
+            int | None: The version the replica now shows. It is unchanged if the writer was busy,
+            so the caller simply tries again on its next frame.
+        """
+        seq = int(self.header[0])
+        if seq & 1 or seq == version:
+            return version
+        players = self.players.tolist()
+        delta = {
+            "p": {seat: dict(zip(PLAYER_FIELDS, row)) for seat, row in enumerate(players)},
+            "o": {position: row for position, row in enumerate(self.properties.tolist()) if position in game.bank.properties},
+            "f": int(self.header[3]),
+            "c": int(self.header[2]),
+        }
+        if int(self.header[0]) != seq:
+            return version
+        apply(game, seats, delta)
+        for player, row in zip(seats, players):
+            player.turns_taken = row[-1]
+        game.running = bool(self.header[4])
+        return seq
+
+    def close(self):
+        """Releases the arrays and the block, removing it if this process created it."""
+        self.header = self.players = self.properties = None
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+
+def run_game_worker(memory_name, roster, commands, replies, seed=None, turn_delay=0.0):
+    """
+    Runs one game in a worker process, publishing its state into shared memory.
+
+    Bots play through the game's own logic on a `GameHost` table. Decisions of human seats are sent
+    to the render process as ("request", player name, kind, context) replies and answered by
+    ("answer", player name, answer) commands. Logged events are sent as ("event", message) and the
+    end of the game as ("done", names of the remaining players). A ("stop",) command ends the game.
+
+    Args:
+        memory_name (str): The name of the `SharedGameState` block.
+        roster (list[tuple]): (name, token, identity) of each player.
+        commands (multiprocessing.Queue): Commands from the render process.
+        replies (multiprocessing.Queue): Replies to the render process.
+        seed (int | None): Seed for the dice.
+        turn_delay (float): Seconds the game waits after each turn, so people can follow it.
+    """
+    asyncio.run(_serve_game(memory_name, roster, commands, replies, seed, turn_delay))
+
+
+async def _serve_game(memory_name, roster, commands, replies, seed, turn_delay):
+    """Runs the worker's game until it ends or is stopped."""
+    state = SharedGameState(len(roster), memory_name)
+    host = GameHost(bid_timeout=None)
+    table = host.create_table(*map(list, zip(*roster)), seed=seed)
+    game, seats = table.game, list(table.game.players)
+
+    def on_request(request):
+        state.publish(game, seats, table.turns)
+        replies.put(("request", request.player.name, request.kind, request.context))
+
+    def on_event(message):
+        replies.put(("event", message))
+
+    host.on_request = on_request
+    game.event_listeners.append(on_event)
+    loop = asyncio.get_running_loop()
+    stopped = loop.create_future()
+
+    def read_commands():
+        while True:
+            command = commands.get()
+            if command[0] == "stop":
+                loop.call_soon_threadsafe(lambda: stopped.done() or stopped.set_result(None))
+                return
+            loop.call_soon_threadsafe(host.submit, table.table_id, command[1], command[2])
+
+    threading.Thread(target=read_commands, daemon=True).start()
+    task = host.start(table, turn_delay=turn_delay)
+    while not task.done() and not stopped.done():
+        state.publish(game, seats, table.turns)
+        await asyncio.wait([task, stopped], timeout=0.01)
+
+    await host.close()
+    game.running = False
+    state.publish(game, seats, table.turns)
+    replies.put(("done", [p.name for p in game.players]))
+    state.close()
+
+
+class GameProcess:
+    """
+    Runs a game in a separate process and keeps a local replica of it for the GUI.
+
+    Game logic, bot decisions and auctions run in the worker, so however long they take, the render
+    loop only pays for `sync`, which reads the shared state in place and drains the reply queue
+    without blocking. The replica is a normal `Game`, so the board and sidebars draw it unchanged,
+    but it must not be played on: moves are made by answering `pending` with `answer`.
+
+    Attributes:
+        game (Game): The replica game.
+        seats (list[Player]): The replica's players in seat order.
+        state (SharedGameState): The shared state block.
+        pending (tuple | None): The (player name, kind, context) decision the game is waiting on.
+        finished (bool): Whether the game has ended.
+        winners (list[str]): The players left when the game ended.
+        process (multiprocessing.Process): The worker process.
+    """
+    DEFAULT_ANSWERS = {"roll": True, "buy": False, "jail": "roll", "bid": None, "debt": "auto"}
+
+    def __init__(self, player_names, tokens, identities, seed=None, turn_delay=1.0):
+        """
+        Starts the worker process.
+
+        Args:
+            player_names (list[str]): The players' names.
+            tokens (list[str]): The players' tokens.
+            identities (list[str]): "Human" or a bot identity for each player.
+            seed (int | None): Seed for the dice.
+            turn_delay (float): Seconds the game waits after each turn. Defaults to 1.
+        """
+        self.game = Game(list(player_names), list(tokens), list(identities))
+        self.seats = list(self.game.players)
+        self.state = SharedGameState(len(self.seats))
+        self.version = 0  # nothing has been published yet
+        self.pending = None
+        self.finished = False
+        self.winners = []
+
+        context = multiprocessing.get_context("spawn")  # the render process has pygame and a display open
+        self.commands, self.replies = context.Queue(), context.Queue()
+        roster = list(zip(player_names, tokens, identities))
+        self.process = context.Process(
+            target=run_game_worker, daemon=True,
+            args=(self.state.name, roster, self.commands, self.replies, seed, turn_delay),
+        )
+        self.process.start()
+
+    def sync(self):
+        """
+        Updates the replica from the shared state and handles the worker's replies. Never blocks.
+
+        Returns:
+            bool: True if anything changed since the last call.
+
+        Side Effects:
+            - Logs the worker's events and decision prompts on the replica.
+            - Sets `pending`, `finished` and `winners`.
+        """
+        if self.state.header is None:
+            return False
+        version = self.state.read_into(self.game, self.seats, self.version)
+        changed = version != self.version
+        self.version = version
+        while True:
+            try:
+                reply = self.replies.get_nowait()
+            except queue.Empty:
+                return changed
+            changed = True
+            if reply[0] == "event":
+                self.game.log_event(reply[1])
+            elif reply[0] == "request":
+                self.pending = reply[1:]
+                self.game.log_event(self.describe(*self.pending))
+            elif reply[0] == "done":
+                self.finished, self.winners = True, reply[1]
+
+    @staticmethod
+    def describe(name, kind, context):
+        """
+        Returns the prompt shown to a human seat for a decision.
+
+        Args:
+            name (str): The player's name.
+            kind (str): The kind of decision.
+            context (dict): What the player needs to know to decide.
+
+        Returns:
+            str: The prompt.
+        """
+        if kind == "buy":
+            return f"{name}: buy {context['property']} for £{context['price']}? (Buy Property / End Turn)"
+        if kind == "jail":
+            return f"{name} is in jail: P to pay £50, C to use a card, R to roll or W to wait."
+        if kind == "bid":
+            return (f"{name}: Buy Property to bid £{context['highest_bid'] + 10} on {context['property']}, "
+                    f"or End Turn to leave the auction.")
+        if kind == "debt":
+            return f"{name} owes £{context['amount']}: End Turn to raise it from your assets."
+        return f"{name}, it's your turn: End Turn to roll."
+
+    def answer(self, answer=None):
+        """
+        Answers the pending decision.
+
+        Args:
+            answer: The answer. Defaults to the kind's entry in `DEFAULT_ANSWERS`.
+
+        Returns:
+            bool: False if no decision was pending.
+        """
+        if self.pending is None:
+            return False
+        name, kind, _ = self.pending
+        self.commands.put(("answer", name, self.DEFAULT_ANSWERS[kind] if answer is None else answer))
+        self.pending = None
+        return True
+
+    def stop(self, timeout=2):
+        """
+        Stops the worker, applies its last state and replies, and frees the shared state.
+
+        Args:
+            timeout (float): Seconds to wait for the worker to exit before terminating it.
+        """
+        if self.process.is_alive():
+            self.commands.put(("stop",))
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+        if self.state.header is not None:
+            self.sync()
+            self.state.close()
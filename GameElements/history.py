@@ -0,0 +1,180 @@
+import numpy as np
+
+
+# What is recorded about each player at every turn
+FIELDS = ("balance", "net_worth", "position", "properties", "houses")
+
+
+class TurnHistory:
+    """
+    Records every player's balance, net worth, position, number of properties and number of houses
+    after each turn, for charts and post-game analysis.
+
+    The samples are kept in one preallocated numpy array of shape (turns, seats, fields), which
+    doubles in size when it is full, and a whole series is a strided view of it. Recording a turn
+    only appends the numbers to a pending list, which is copied into the array 256 turns at a time,
+    and the houses each player owns are counted from the game's change feed as they are built,
+    sold or change hands, so recording costs about as much as reading the players. Seats are the
+    players in the order the game started with; a player who has left the game is recorded as all
+    zeros from then on.
+
+    Args:
+        game (Game): The game to record.
+        capacity (int): Turns to allocate room for up front (default: 256).
+
+    Attributes:
+        seats (tuple[Player, ...]): The players, in the order of the array's last axis.
+        left (dict[Player, int]): The players who have left the game, with the number of turns recorded before they left.
+        owners (list[tuple[int, int, int]]): (turn, board position, seat) of every change of a property's owner, in
+            order, where turn is the number of turns recorded before the change and seat is -1 for the bank.
+    """
+
+    def __init__(self, game, capacity=256):
+        """
+        Allocates an empty history for the game's players.
+
+        Args:
+            game (Game): The game to record.
+            capacity (int): Turns to allocate room for up front (default: 256).
+
+        Returns:
+            None
+        """
+        self.game = game
+        self.seats = tuple(game.players)
+        self._samples = np.zeros((max(capacity, 1), len(self.seats), len(FIELDS)), np.int32)
+        self._movers = np.zeros(max(capacity, 1), np.int8)
+        self._marks = np.zeros(max(capacity, 1), np.int32)
+        self._count = 0
+        self._pending = []  # (mover, ledger mark, *samples) of turns not yet copied into the arrays
+        self._fields = {field: i for i, field in enumerate(FIELDS)}
+        self._blank = (0,) * len(FIELDS)
+        self._houses = {seat: sum(prop.houses for prop in seat.owned_properties) for seat in self.seats}
+        self.left = {}
+        self.owners = []
+        game.changes.subscribe(self.on_change, ("owner", "houses", "removed"))
+
+    def on_change(self, change):
+        """
+        Keeps count of the houses each player owns and notes when players leave and properties change hands.
+
+        Args:
+            change (Change): An "owner", "houses" or "removed" change from the game's change feed.
+
+        Returns:
+            None
+        """
+        houses = self._houses
+        if change.kind == "removed":
+            if change.subject in houses:
+                self.left.setdefault(change.subject, len(self))
+        elif change.kind == "houses":
+            owner = change.subject.owner
+            if owner in houses:
+                houses[owner] += change.new - change.old
+        else:
+            self.owners.append((len(self), change.subject.position, self.seats.index(change.new) if change.new in houses else -1))
+            if not change.subject.houses:
+                return
+            if change.old in houses:
+                houses[change.old] -= change.subject.houses
+            if change.new in houses:
+                houses[change.new] += change.subject.houses
+
+    def record(self, player=None):
+        """
+        Samples every player at the end of a turn.
+
+        Args:
+            player (Player | None): Whose turn it was, if known.
+
+        Returns:
+            None
+
+        Side Effects:
+            - Copies the last 256 turns into the arrays once that many are pending.
+        """
+        playing = self.game.players
+        worth, houses = self.game.net_worth.net_worth, self._houses
+        row = [self.seats.index(player) if player in self.seats else -1, len(self.game.ledger)]
+        for seat in self.seats:
+            if seat in playing:
+                row += (seat.balance, worth(seat), seat.position, len(seat.owned_properties), houses[seat])
+            else:
+                row += self._blank
+        pending = self._pending
+        pending.append(row)
+        if len(pending) == 256:
+            self._flush()
+
+    def _flush(self):
+        """Copies the pending turns into the arrays, doubling them until they fit."""
+        pending, count = self._pending, self._count
+        end = count + len(pending)
+        while end > len(self._samples):
+            self._samples = np.concatenate([self._samples, np.zeros_like(self._samples)])
+            self._movers = np.concatenate([self._movers, np.zeros_like(self._movers)])
+            self._marks = np.concatenate([self._marks, np.zeros_like(self._marks)])
+        rows = np.array(pending, np.int32)
+        self._movers[count:end] = rows[:, 0]
+        self._marks[count:end] = rows[:, 1]
+        self._samples[count:end] = rows[:, 2:].reshape(len(pending), len(self.seats), len(FIELDS))
+        self._count = end
+        pending.clear()
+
+    def series(self, field, player=None):
+        """
+        Returns one recorded field over the whole game.
+
+        Args:
+            field (str): One of `FIELDS`.
+            player (Player | None): Only this player's series; None for every player's.
+
+        Returns:
+            numpy.ndarray: A read-only (turns,) view for one player or (turns, seats) view for all of them.
+
+        Raises:
+            ValueError: If the field is not one of `FIELDS`.
+        """
+        column = self._fields.get(field)
+        if column is None:
+            raise ValueError(f"Unknown field: {field!r}")
+        if self._pending:
+            self._flush()
+        values = self._samples[:self._count, :, column]
+        if player is not None:
+            values = values[:, self.seats.index(player)]
+        values.flags.writeable = False
+        return values
+
+    def movers(self):
+        """
+        Returns whose turn each recorded turn was.
+
+        Returns:
+            numpy.ndarray: A read-only (turns,) view of seat numbers, -1 where it is not known.
+        """
+        if self._pending:
+            self._flush()
+        movers = self._movers[:self._count]
+        movers.flags.writeable = False
+        return movers
+
+    def ledger_marks(self):
+        """
+        Returns how many entries the game's ledger had after each recorded turn.
+
+        The turn a ledger entry was made in is the first turn whose mark is above the entry's index,
+        i.e. `np.searchsorted(marks, index, side="right")`.
+
+        Returns:
+            numpy.ndarray: A read-only (turns,) view of ledger lengths.
+        """
+        if self._pending:
+            self._flush()
+        marks = self._marks[:self._count]
+        marks.flags.writeable = False
+        return marks
+
+    def __len__(self):
+        return self._count + len(self._pending)
@@ -0,0 +1,397 @@
+import asyncio
+import random
+from collections import namedtuple
+
+from GameElements.game_logic import Game
+from GameElements.ledger import PARKING
+from GameElements.player import Player
+
+
+DecisionRequest = namedtuple("DecisionRequest", ["table_id", "player", "kind", "context"])
+DecisionRequest.__doc__ = """
+A decision a `GameTable` is waiting for from one of its human seats.
+
+`kind` is one of "roll", "jail", "buy", "bid" or "debt" and `context` holds what the seat needs to
+answer it (e.g. the property and the highest bid). The expected answers are listed on `GameTable`.
+"""
+
+
+class BotAgent:
+    """
+    A local agent answering a seat's decisions with the "Basic Bot" rules.
+
+    Used by load tests and to fill seats whose remote client has left.
+    """
+
+    async def __call__(self, request):
+        """
+        Answers a decision request.
+
+        Args:
+            request (DecisionRequest): The decision to make.
+
+        Returns:
+            The answer, in the form `GameTable` expects for the request's kind.
+        """
+        player, context = request.player, request.context
+        if request.kind == "jail":
+            return "pay" if player.balance >= 50 else "roll"
+        if request.kind == "buy":
+            return player.balance > context["price"]
+        if request.kind == "bid":
+            bid = Player.basic_bot_raise(context["highest_bid"], context["price"])
+            return bid if bid <= min(player.balance, context["price"] * 1.5) else None
+        if request.kind == "debt":
+            return "auto"
+        return True
+
+
+class GameTable:
+    """
+    One hosted game, driven turn by turn by an asyncio task.
+
+    Bots play through the game's own logic. Every decision of a human seat is awaited instead of
+    being read from `input()` or a popup: it is answered either by the seat's local agent or by a
+    remote client calling `GameHost.submit`. A table waiting for a decision is just a suspended
+    coroutine and a future, so idle tables cost no CPU.
+
+    Answers expected for each decision kind:
+        - "roll": anything, once the player is ready to roll.
+        - "jail": "pay", "card", "wait" or "roll".
+        - "buy": True to buy the property, False to send it to auction.
+        - "bid": an amount to bid, or None to leave the auction.
+        - "debt": ("mortgage" | "sell" | "sell_house", position), "pay", "bankrupt", or "auto" to let
+          the liquidation planner raise the money.
+
+    Attributes:
+        table_id (int): The table's id on its host.
+        game (Game): The hosted game.
+        agents (dict[str, Callable]): Local agents by player name; seats without one wait for `submit`.
+        pending (tuple | None): The (request, future) the table is waiting on for a remote seat.
+        turns (int): Number of turns played.
+        task (asyncio.Task | None): The task running the table.
+    """
+    __slots__ = ("host", "table_id", "game", "agents", "pending", "turns", "task", "rng")
+
+    def __init__(self, host, table_id, game, agents=None, seed=None):
+        """
+        Initialises a table.
+
+        Args:
+            host (GameHost): The host running the table.
+            table_id (int): The table's id on its host.
+            game (Game): The game to run.
+            agents (dict[str, Callable] | None): Local agents by player name.
+            seed (int | None): Seed for the table's dice.
+        """
+        self.host = host
+        self.table_id = table_id
+        self.game = game
+        self.agents = agents or {}
+        self.pending = None
+        self.turns = 0
+        self.task = None
+        self.rng = random.Random(seed)
+
+    async def decide(self, player, kind, **context):
+        """
+        Waits for a human seat's decision.
+
+        Args:
+            player (Player): The player deciding.
+            kind (str): The kind of decision.
+            **context: What the player needs to know to decide.
+
+        Returns:
+            The seat's answer.
+        """
+        request = DecisionRequest(self.table_id, player, kind, context)
+        agent = self.agents.get(player.name)
+        if agent is not None:
+            return await agent(request)
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending = (request, future)
+        self.host.notify(request)
+        try:
+            return await future
+        finally:
+            self.pending = None
+
+    def submit(self, player_name, answer):
+        """
+        Answers the decision the table is waiting on.
+
+        Args:
+            player_name (str): The name of the player answering.
+            answer: The answer.
+
+        Returns:
+            bool: True if the answer was accepted, False if the table was not waiting on this player.
+        """
+        if self.pending is None:
+            return False
+        request, future = self.pending
+        if request.player.name != player_name or future.done():
+            return False
+        future.set_result(answer)
+        return True
+
+    async def run(self, max_turns=None, turn_delay=0):
+        """
+        Plays the game until one player is left or `max_turns` turns have been played.
+
+        Args:
+            max_turns (int | None): The most turns to play. Defaults to no limit.
+            turn_delay (float): Seconds to wait after each turn, to pace games that are being watched. Defaults to 0.
+
+        Returns:
+            Game: The finished game.
+        """
+        game = self.game
+        while game.running and len(game.players) > 1 and (max_turns is None or self.turns < max_turns):
+            player = game.players[game.current_player_index]
+            if player.identity == "Human":
+                await self.decide(player, "roll")
+                if player.in_jail:
+                    await self.jail_turn(player)
+                else:
+                    game.play_turn(self.rng.randint(1, 6), self.rng.randint(1, 6))
+                    await self.after_move(player)
+            else:
+                game.play_turn(self.rng.randint(1, 6), self.rng.randint(1, 6))
+                await self.settle_deferred()
+
+            self.turns += 1
+            if player in game.players and player.consecutive_doubles == 0:
+                game.current_player_index = (game.players.index(player) + 1) % len(game.players)
+            await asyncio.sleep(turn_delay)  # let the other tables run between turns
+        game.running = False
+        return game
+
+    async def jail_turn(self, player):
+        """
+        Plays a human's turn in jail, following the choices of the jail popup.
+
+        Args:
+            player (Player): The jailed player.
+        """
+        game = self.game
+        choice = await self.decide(player, "jail", balance=player.balance, cards=player.get_out_of_jail_cards)
+        if choice == "pay" and player.balance >= 50:
+            game.ledger.transfer(player, PARKING, 50, "jail")
+            player.in_jail, player.jail_turns = False, 0
+            game.log_event(f"{player.name} paid £50 to get out of jail. They will resume next turn.")
+        elif choice == "card" and player.get_out_of_jail_cards > 0:
+            player.get_out_of_jail_cards -= 1
+            game.cards.return_jail_card_to_bottom()
+            player.in_jail, player.jail_turns = False, 0
+            game.log_event(f"{player.name} used a Get Out of Jail Free card.")
+        elif choice == "roll":
+            die1, die2 = self.rng.randint(1, 6), self.rng.randint(1, 6)
+            if die1 == die2:
+                player.in_jail, player.jail_turns = False, 0
+                game.log_event(f"{player.name} rolled a double and got out of jail!")
+                game.play_turn(die1, die2)
+                player.consecutive_doubles = 0
+                await self.after_move(player)
+                return
+            self.serve_jail_turn(player)
+        else:
+            self.serve_jail_turn(player)
+
+    def serve_jail_turn(self, player):
+        """Counts a turn served in jail, releasing the player after the third."""
+        player.jail_turns += 1
+        if player.jail_turns >= 3:
+            player.in_jail, player.jail_turns = False, 0
+            self.game.log_event(f"{player.name} has served their sentence and is now Just Visiting.")
+        else:
+            self.game.log_event(f"{player.name} stays in jail (Turn {player.jail_turns})")
+
+    async def after_move(self, player):
+        """
+        Offers a human the property they landed on, then settles the decisions the move deferred.
+
+        Args:
+            player (Player): The human who moved.
+        """
+        game = self.game
+        prop = game.bank.properties.get(player.position)
+        if player in game.players and prop is not None and prop.owner is None and player.passed:
+            if await self.decide(player, "buy", property=prop.name, price=prop.price) and player.balance >= prop.price:
+                game.prompt_property_purchase(player)
+            elif len(game.get_eligible_auction_players()) > 1:
+                game.start_auction(player)
+        await self.settle_deferred()
+
+    async def settle_deferred(self):
+        """Runs the auctions and settles the debts the game left for its driver."""
+        game = self.game
+        while game.deferred:
+            kind, *args = game.deferred.pop(0)
+            if kind == "auction":
+                await self.run_auction(*args)
+            else:
+                await self.settle_debt(*args)
+
+    async def run_auction(self, prop, players):
+        """
+        Auctions a property among the players who have passed GO, awaiting human bids.
+
+        Args:
+            prop (Property): The property being auctioned.
+            players (list[Player]): The players in bidding order.
+        """
+        bidders = [p for p in players if p.balance >= 0 and p.passed and p in self.game.players]
+        if len(bidders) <= 1:
+            return
+        auction = self.game.bank.open_auction(prop, bidders, turn_timeout=self.host.bid_timeout, log=self.game.log_event)
+
+        async def get_bid(player, auction):
+            return await self.decide(player, "bid", property=prop.name, price=prop.price, highest_bid=auction.highest_bid)
+
+        await auction.run(get_bid)
+
+    async def settle_debt(self, player, amount, creditor):
+        """
+        Lets a human raise money for a debt, one asset sale at a time, until they pay or go bankrupt.
+
+        Args:
+            player (Player): The player in debt.
+            amount (int): The amount owed.
+            creditor (Player | None): Who is owed, or None for the bank.
+        """
+        game, bank = self.game, self.game.bank
+        while player in game.players:
+            answer = await self.decide(player, "debt", amount=amount, balance=player.balance,
+                                       creditor=creditor.name if creditor else None)
+            if answer == "auto":
+                plan = game.liquidation_planner.plan(player, amount - player.balance, max(len(game.players) - 1, 1))
+                if plan is not None:
+                    game.liquidation_planner.execute(player, plan)
+                answer = "pay" if player.balance >= amount else "bankrupt"
+
+            if answer == "pay" and player.balance >= amount:
+                game.ledger.transfer(player, creditor or bank, amount, "debt")
+                game.log_event(f"{player.name} paid £{amount} to {creditor.name if creditor else 'the Bank'}.")
+                return
+            if answer == "bankrupt":
+                player.declare_bankruptcy(creditor, amount)
+                return
+            if isinstance(answer, (tuple, list)) and len(answer) == 2:
+                action, position = answer
+                prop = bank.properties.get(position)
+                if prop is None or prop.owner is not player:
+                    continue
+                if action == "mortgage":
+                    bank.mortgage_property(player, prop)
+                elif action == "sell":
+                    bank.sell_property_to_the_bank(player, prop)
+                elif action == "sell_house":
+                    bank.sell_houses_to_the_bank(player, prop)
+
+
+class GameHost:
+    """
+    Hosts many headless games in one asyncio event loop.
+
+    Each table runs in its own task, and the host routes remote answers to the table waiting for
+    them. Requests for remote seats are handed to the `on_request` callback, which is where a
+    network layer would forward them to the seat's client.
+
+    Attributes:
+        tables (dict[int, GameTable]): The hosted tables by id.
+        on_request (Callable[[DecisionRequest], None] | None): Called whenever a table waits on a remote seat.
+        bid_timeout (float | None): Seconds a human bidder has to act in an auction.
+    """
+
+    def __init__(self, on_request=None, bid_timeout=30):
+        """
+        Initialises an empty host.
+
+        Args:
+            on_request (Callable[[DecisionRequest], None] | None): Called whenever a table waits on a remote seat.
+            bid_timeout (float | None): Seconds a human bidder has to act in an auction. Defaults to 30.
+        """
+        self.tables = {}
+        self.on_request = on_request
+        self.bid_timeout = bid_timeout
+        self._next_id = 0
+
+    def create_table(self, player_names, tokens, identities, agents=None, seed=None, board=None):
+        """
+        Creates a table for a new game without starting it.
+
+        Args:
+            player_names (list[str]): The players' names.
+            tokens (list[str]): The players' tokens.
+            identities (list[str]): "Human" or a bot identity for each player.
+            agents (dict[str, Callable] | None): Local agents answering for human seats, by player name.
+            seed (int | None): Seed for the table's dice.
+            board (BoardModel | None): The board to play on. Defaults to the board data CSV.
+
+        Returns:
+            GameTable: The new table.
+        """
+        table = GameTable(self, self._next_id, Game(player_names, tokens, identities, board), agents, seed)
+        self.tables[table.table_id] = table
+        self._next_id += 1
+        return table
+
+    def start(self, table, max_turns=None, turn_delay=0):
+        """
+        Starts running a table in a new task. The table is removed from the host when its game ends.
+
+        Args:
+            table (GameTable): The table to start.
+            max_turns (int | None): The most turns to play. Defaults to no limit.
+            turn_delay (float): Seconds the table waits after each turn. Defaults to 0.
+
+        Returns:
+            asyncio.Task: The task running the table.
+        """
+        table.task = asyncio.get_running_loop().create_task(table.run(max_turns, turn_delay))
+        table.task.add_done_callback(lambda task: self.tables.pop(table.table_id, None))
+        return table.task
+
+    def notify(self, request):
+        """
+        Reports a request for a remote seat to `on_request`.
+
+        Args:
+            request (DecisionRequest): The request.
+        """
+        if self.on_request is not None:
+            self.on_request(request)
+
+    def submit(self, table_id, player_name, answer):
+        """
+        Delivers a remote client's answer to its table.
+
+        Args:
+            table_id (int): The table's id.
+            player_name (str): The answering player's name.
+            answer: The answer.
+
+        Returns:
+            bool: True if the answer was accepted.
+        """
+        table = self.tables.get(table_id)
+        return table is not None and table.submit(player_name, answer)
+
+    def waiting(self):
+        """
+        Lists the requests tables are waiting on from remote seats.
+
+        Returns:
+            list[DecisionRequest]: The pending requests.
+        """
+        return [table.pending[0] for table in self.tables.values() if table.pending is not None]
+
+    async def close(self):
+        """Cancels every running table and waits for them to stop."""
+        tasks = [table.task for table in self.tables.values() if table.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
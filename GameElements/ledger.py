@@ -0,0 +1,301 @@
+import numpy as np
+
+
+PARKING = "parking"  # the Free Parking pool, held as `Game.fines`
+
+# Why money moved, as recorded in the journal
+CATEGORIES = ("go", "rent", "purchase", "auction", "build", "sale", "mortgage", "tax", "parking", "card",
+              "repairs", "jail", "trade", "debt", "bankruptcy", "other")
+
+JOURNAL_DTYPE = np.dtype([("batch", "<u4"), ("payer", "<u2"), ("payee", "<u2"), ("category", "u1"), ("tile", "u1"),
+                          ("amount", "<i4")])
+
+
+class Ledger:
+    """
+    Moves all the money in a game and keeps a journal and running totals of every movement.
+
+    Accounts are the bank (`None` or the `Bank` itself), the Free Parking pool (`PARKING`) and
+    anything else with a `balance`, i.e. the players. Accounts are numbered in the order the
+    ledger first sees them, after the bank (0) and the pool (1); a game registers its players
+    up front, so a player's number is their seat plus 2.
+
+    Every transfer is applied to the accounts' balances and appended to a numpy journal with one
+    14-byte row per transfer: the batch it belonged to, payer, payee, category, the board position
+    of the property it was for (0 if none) and amount. Rows are written to the journal in blocks
+    of 256 and the journal grows by doubling. The ledger also keeps, per account, how much it
+    received and paid in each category and in total, how much moved in each category and the
+    money supply (the money outside the bank, counting each player's balance when they were first
+    seen), so all of these can be read at any time without going through the journal.
+
+    A batch of transfers is applied all together or not at all: every account and amount is
+    checked first and, if funds are required, every payer's total outflow is compared with their
+    balance before any money moves.
+
+    Args:
+        bank (Bank): The bank's account.
+        pool (Game | None): The game holding the Free Parking pool as `fines`, if there is one.
+
+    Attributes:
+        bank (Bank): The bank's account.
+        pool (Game | None): The holder of the Free Parking pool.
+        accounts (list): The accounts by number.
+        supply (int): Money held outside the bank.
+        batches (int): Number of batches posted.
+    """
+    BANK, POOL = 0, 1
+
+    def __init__(self, bank, pool=None):
+        """
+        Initializes an empty ledger.
+
+        Args:
+            bank (Bank): The bank's account.
+            pool (Game | None): The game holding the Free Parking pool as `fines`, if there is one.
+
+        Returns:
+            None
+        """
+        self.bank = bank
+        self.pool = pool
+        self.accounts = [bank, PARKING]
+        self._ids = {}
+        self.supply = 0
+        self.batches = 0
+        self._journal = np.zeros(256, JOURNAL_DTYPE)
+        self._count = 0
+        self._pending = []  # rows not yet written to the journal
+        self._received = [[0] * len(CATEGORIES) for _ in range(2)]
+        self._paid = [[0] * len(CATEGORIES) for _ in range(2)]
+        self._received_total = [0, 0]
+        self._paid_total = [0, 0]
+        self._volume = [0] * len(CATEGORIES)
+        self._categories = {category: i for i, category in enumerate(CATEGORIES)}
+
+    @classmethod
+    def of(cls, game):
+        """
+        Returns a game's ledger.
+
+        Args:
+            game (Game): The game, or a stand-in for one (e.g. in tests) that has a `bank` and `fines`.
+
+        Returns:
+            Ledger: `game.ledger`, or a new ledger over the game's bank and pool if it has none.
+        """
+        ledger = getattr(game, "ledger", None)
+        return ledger if isinstance(ledger, cls) else cls(getattr(game, "bank", None), game)
+
+    def register(self, account):
+        """
+        Returns an account's number, numbering it first if the ledger has not seen it yet.
+
+        Args:
+            account: The bank (`None` or the `Bank`), `PARKING`, or an object with a `balance`.
+
+        Returns:
+            int: The account's number.
+        """
+        if account is None or account is self.bank:
+            return self.BANK
+        if account is PARKING:
+            return self.POOL
+        number = self._ids.get(account)
+        if number is None:
+            number = self._ids[account] = len(self.accounts)
+            self.accounts.append(account)
+            self._received.append([0] * len(CATEGORIES))
+            self._paid.append([0] * len(CATEGORIES))
+            self._received_total.append(0)
+            self._paid_total.append(0)
+            self.supply += account.balance
+        return number
+
+    def balance(self, account):
+        """
+        Returns an account's balance.
+
+        Args:
+            account: The bank (`None` or the `Bank`), `PARKING`, or an object with a `balance`.
+
+        Returns:
+            int: The balance.
+        """
+        if account is None:
+            return self.bank.balance
+        if account is PARKING:
+            return self.pool.fines
+        return account.balance
+
+    def transfer(self, payer, payee, amount, category, tile=0):
+        """
+        Moves money from one account to another.
+
+        Args:
+            payer: The account paying.
+            payee: The account paid.
+            amount (int): The amount; nothing is recorded for 0.
+            category (str): Why the money moves, one of `CATEGORIES`.
+            tile (int): The board position of the property the money is for, if any (default: 0, none).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the amount is negative or the category is unknown.
+        """
+        column = self._categories.get(category)
+        if column is None or amount < 0:
+            self.post([(payer, payee, amount)], category)  # raises
+        elif amount:
+            self.batches += 1
+            self._apply(self.register(payer), self.register(payee), column, tile, amount)
+
+    def post(self, transfers, category, require_funds=False, tile=0):
+        """
+        Applies several transfers as one batch: all of them or, if any is invalid or unaffordable, none.
+
+        Args:
+            transfers (Iterable[tuple]): (payer, payee, amount) of each transfer, or (payer, payee, amount, tile)
+                for a transfer that is for a property of its own.
+            category (str): Why the money moves, one of `CATEGORIES`.
+            require_funds (bool): Refuse the batch if a payer other than the bank cannot cover
+                everything they pay in it (default: False, balances may go negative).
+            tile (int): The board position of the property the batch is for, if any (default: 0, none).
+
+        Returns:
+            bool: True if the batch was applied, False if it was refused for lack of funds.
+
+        Raises:
+            ValueError: If an amount is negative or the category is unknown.
+        """
+        column = self._categories.get(category)
+        if column is None:
+            raise ValueError(f"Unknown category: {category!r}")
+        rows = []
+        for payer, payee, amount, *own_tile in transfers:
+            if amount < 0:
+                raise ValueError(f"Cannot transfer a negative amount: {amount}")
+            if amount:
+                rows.append((self.register(payer), self.register(payee), amount, own_tile[0] if own_tile else tile))
+        if not rows:
+            return True
+        if require_funds:
+            owed = {}
+            for payer, _, amount, _ in rows:
+                owed[payer] = owed.get(payer, 0) + amount
+            if any(payer != self.BANK and self._balance(payer) < amount for payer, amount in owed.items()):
+                return False
+
+        self.batches += 1
+        for payer, payee, amount, row_tile in rows:
+            self._apply(payer, payee, column, row_tile, amount)
+        return True
+
+    def _apply(self, payer, payee, column, tile, amount):
+        """Moves money between two numbered accounts and records it in the current batch."""
+        accounts = self.accounts
+        if payer == self.POOL:
+            self.pool.fines -= amount
+        else:
+            accounts[payer].balance -= amount
+        if payee == self.POOL:
+            self.pool.fines += amount
+        else:
+            accounts[payee].balance += amount
+        pending = self._pending
+        pending.append((self.batches, payer, payee, column, tile, amount))
+        if len(pending) == 256:
+            self._flush()
+        self._paid[payer][column] += amount
+        self._paid_total[payer] += amount
+        self._received[payee][column] += amount
+        self._received_total[payee] += amount
+        self._volume[column] += amount
+        if payer == self.BANK:
+            self.supply += amount
+        elif payee == self.BANK:
+            self.supply -= amount
+
+    def _flush(self):
+        """Writes the pending rows to the journal, doubling its size if they do not fit."""
+        pending, count = self._pending, self._count
+        if count + len(pending) > len(self._journal):
+            self._journal = np.concatenate([self._journal, np.zeros(max(len(self._journal), len(pending)), JOURNAL_DTYPE)])
+        self._journal[count:count + len(pending)] = pending
+        self._count = count + len(pending)
+        pending.clear()
+
+    def _balance(self, number):
+        """Returns the balance of a numbered account."""
+        return self.pool.fines if number == self.POOL else self.accounts[number].balance
+
+    def received(self, account, category=None):
+        """
+        Returns how much an account has received.
+
+        Args:
+            account: The account.
+            category (str | None): Only count this category; None for all of them.
+
+        Returns:
+            int: The amount received.
+        """
+        number = self.register(account)
+        if category is None:
+            return self._received_total[number]
+        return self._received[number][self._categories[category]]
+
+    def paid(self, account, category=None):
+        """
+        Returns how much an account has paid.
+
+        Args:
+            account: The account.
+            category (str | None): Only count this category; None for all of them.
+
+        Returns:
+            int: The amount paid.
+        """
+        number = self.register(account)
+        if category is None:
+            return self._paid_total[number]
+        return self._paid[number][self._categories[category]]
+
+    def volume(self, category):
+        """
+        Returns how much money has moved in a category, between any accounts.
+
+        Args:
+            category (str): One of `CATEGORIES`.
+
+        Returns:
+            int: The amount moved.
+        """
+        return self._volume[self._categories[category]]
+
+    def totals(self):
+        """
+        Returns the received and paid amounts of every account by category.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: Two (accounts, categories) arrays, received and paid,
+            with rows in account order and columns in `CATEGORIES` order.
+        """
+        return np.array(self._received, np.int64), np.array(self._paid, np.int64)
+
+    def entries(self):
+        """
+        Returns the journal.
+
+        Returns:
+            numpy.ndarray: One `JOURNAL_DTYPE` row per transfer, oldest first, as a read-only view.
+        """
+        if self._pending:
+            self._flush()
+        entries = self._journal[:self._count]
+        entries.flags.writeable = False
+        return entries
+
+    def __len__(self):
+        return self._count + len(self._pending)
@@ -0,0 +1,237 @@
+from collections import namedtuple
+from itertools import product
+
+import numpy as np
+
+
+LiquidationPlan = namedtuple("LiquidationPlan", ["steps", "cash", "loss"])
+LiquidationPlan.__doc__ = """
+A set of asset sales chosen by the `LiquidationPlanner`.
+
+`steps` is a list of (action, property) pairs, where action is "sell_house", "mortgage" or "sell",
+in an order the bank accepts. `cash` is the money the plan raises and `loss` the asset value given up.
+"""
+
+
+class LiquidationPlanner:
+    """
+    Chooses which houses to sell and which properties to mortgage or sell when a player must raise cash.
+
+    The value given up by each step is its cash haircut (houses sell back for half their cost) plus
+    the rent equity the player forfeits, taken from the trade engine's `EquityTable`. Selling one
+    property of a complete set therefore also costs the set bonus on the rest of the group.
+    Mortgaged properties still collect rent in this game, so mortgaging costs nothing but the nominal
+    `STEP_COST` every step carries, which makes the planner prefer plans with fewer steps.
+
+    Options are built per colour group: houses are sold back one at a time from the most developed
+    property (the even-selling rule of `Bank.sell_houses_to_the_bank`) and, once the group has no
+    houses left, each property can be kept, mortgaged or sold. Dominated options are discarded and
+    the cheapest combination raising the amount due is found with a multiple-choice knapsack over
+    the groups, solved with numpy by merging the groups' options one group at a time and keeping only
+    the undominated combinations that can still reach the amount due (a few dozen to a few hundred,
+    even for the whole board). Group options are cached by group state, so repeated plans only pay
+    for the knapsack.
+
+    Attributes:
+        table (EquityTable): The equity table used to value rent.
+    """
+    CACHE_SIZE = 1024
+    STEP_COST = 1
+    ACTIONS = (None, "mortgage", "sell")
+
+    def __init__(self, table):
+        """
+        Initialises the planner.
+
+        Args:
+            table (EquityTable): The equity table used to value rent.
+        """
+        self.table = table
+        self._group_cache = {}
+
+    def group_equity(self, props, houses, kept, opponents):
+        """
+        Values the rent a player's holding in one group is expected to earn.
+
+        A developed property is worth at least what its complete set is worth without houses,
+        since houses that are sold can be built again later.
+
+        Args:
+            props (list[Property]): The player's properties in the group.
+            houses (list[int]): The number of houses on each property.
+            kept (list[bool]): Whether each property is still owned.
+            opponents (int): Number of opponents who can land on the properties.
+
+        Returns:
+            float: The rent equity of the holding.
+        """
+        table = self.table
+        count = sum(kept)
+        scale = table.horizon * opponents
+        equity = 0.0
+        for prop, h, keep in zip(props, houses, kept):
+            if not keep:
+                continue
+            i = table.index[prop.position]
+            rent = max(prop.rent[min(h, len(prop.rent) - 1)], table.rent_by_count[i, count]) if h > 0 else table.rent_by_count[i, count]
+            equity += table.landing[i] * rent * scale
+        return equity
+
+    def group_options(self, props, opponents):
+        """
+        Lists the undominated ways of raising cash from one group.
+
+        Args:
+            props (list[Property]): The player's properties in the group.
+            opponents (int): Number of opponents in the game.
+
+        Returns:
+            list[tuple]: (cash, loss, steps) options, sorted by increasing cash and loss.
+        """
+        return self._group_entry(props, opponents)[0]
+
+    def _group_entry(self, props, opponents):
+        """Returns the cached frontier of a group with its cash and loss arrays."""
+        key = (tuple((p, p.houses, p.mortgaged) for p in props), opponents)
+        cached = self._group_cache.get(key)
+        if cached is not None:
+            return cached
+
+        houses = [p.houses for p in props]
+        everything = [True] * len(props)
+        base = self.group_equity(props, houses, everything, opponents)
+        options = []
+
+        cash, haircut, steps = 0, 0, []
+        while any(houses):
+            loss = haircut + base - self.group_equity(props, houses, everything, opponents) + self.STEP_COST * len(steps)
+            options.append((cash, loss, list(steps)))
+            j = max(range(len(props)), key=lambda k: houses[k])
+            houses[j] -= 1
+            cash += props[j].house_cost // 2
+            haircut += props[j].house_cost - props[j].house_cost // 2
+            steps.append(("sell_house", props[j]))
+
+        combos, combo_cash, combo_loss = self._property_options(props, opponents)
+        all_cash = np.concatenate(([o[0] for o in options], cash + combo_cash))
+        all_loss = np.concatenate(([o[1] for o in options], haircut + base + self.STEP_COST * len(steps) + combo_loss))
+
+        frontier = []
+        best = np.inf
+        cash_list, loss_list = all_cash.tolist(), all_loss.tolist()
+        for k in np.lexsort((all_loss, -all_cash)).tolist():
+            if loss_list[k] < best:
+                best = loss_list[k]
+                if k < len(options):
+                    frontier.append(options[k])
+                else:
+                    combo = combos[k - len(options)].tolist()
+                    extra = [(self.ACTIONS[code], prop) for code, prop in zip(combo, props) if code]
+                    frontier.append((int(cash_list[k]), loss_list[k], steps + extra))
+        frontier.reverse()
+
+        cash = np.array([option[0] for option in frontier])
+        entry = (frontier, cash, np.array([option[1] for option in frontier]))
+        if len(self._group_cache) >= self.CACHE_SIZE:
+            self._group_cache.clear()
+        self._group_cache[key] = entry
+        return entry
+
+    def _property_options(self, props, opponents):
+        """
+        Scores every keep / mortgage / sell combination for a group without houses in one numpy pass.
+
+        Returns the combinations (one row per option, coded with `ACTIONS`), the cash each raises and
+        the loss each causes relative to keeping the whole group, including the step costs.
+        """
+        table = self.table
+        n = len(props)
+        rows = [table.index[p.position] for p in props]
+        codes = [(0, 2) if p.mortgaged else (0, 1, 2) for p in props]
+        combos = np.array(list(product(*codes)), dtype=int).reshape(-1, n)
+
+        cash_table = np.array([[0, p.price // 2, p.price // 2 if p.mortgaged else p.price] for p in props])
+        cash = cash_table[np.arange(n), combos].sum(axis=1)
+
+        kept = combos != 2
+        counts = kept.sum(axis=1)
+        equity_by_count = table.landing[rows, None] * table.rent_by_count[rows] * (table.horizon * opponents)
+        equity = (kept * equity_by_count[np.arange(n), counts[:, None]]).sum(axis=1)
+        loss = -equity + self.STEP_COST * (combos != 0).sum(axis=1)
+        return combos, cash, loss
+
+    def plan(self, player, amount, opponents):
+        """
+        Finds the cheapest set of steps raising at least `amount`.
+
+        Args:
+            player (Player): The player raising the money.
+            amount (int): The cash the player needs to raise.
+            opponents (int): Number of opponents in the game.
+
+        Returns:
+            LiquidationPlan | None: The plan, or None if selling everything would not raise enough.
+        """
+        if amount <= 0:
+            return LiquidationPlan([], 0, 0.0)
+
+        groups = {}
+        for prop in player.owned_properties:
+            if prop.position in self.table.index:
+                groups.setdefault(prop.group, []).append(prop)
+        entries = [self._group_entry(props, opponents) for props in groups.values()]
+        entries = [entry for entry in entries if len(entry[0]) > 1]
+        left = sum(int(entry[1][-1]) for entry in entries)
+        if left < amount:
+            return None
+
+        # The undominated (cash, loss) combinations of the groups so far, with any cash past the amount
+        # due counted as the amount due. Groups that can raise the most go first, so combinations the
+        # remaining groups could never top up to the amount due are dropped as early as possible.
+        entries.sort(key=lambda entry: -entry[1][-1])
+        cash, loss = np.zeros(1, dtype=int), np.zeros(1)
+        history = []
+        for frontier, option_cash, option_loss in entries:
+            left -= int(option_cash[-1])
+            # One row per option of this group, each a run sorted by cash for the stable sort to merge
+            total_cash = np.minimum(option_cash[:, None] + cash, amount).ravel()
+            total_loss = (option_loss[:, None] + loss).ravel()
+            rows = np.flatnonzero(total_cash >= amount - left)
+            rows = rows[np.argsort(-total_cash[rows], kind="stable")]
+            losses = total_loss[rows]
+            keep = rows[losses < np.minimum.accumulate(np.concatenate(([np.inf], losses[:-1])))]
+            history.append((keep, len(cash)))
+            cash, loss = total_cash[keep], total_loss[keep]
+
+        point = int(loss.argmin())
+        chosen = []
+        for (frontier, *_), (keep, points) in zip(reversed(entries), reversed(history)):
+            k, point = divmod(int(keep[point]), points)
+            chosen.append(frontier[k])
+
+        steps = [step for option in reversed(chosen) for step in option[2]]
+        steps.sort(key=lambda step: step[0] != "sell_house")
+        return LiquidationPlan(steps, sum(option[0] for option in chosen), float(loss.min()))
+
+    def execute(self, player, plan):
+        """
+        Carries out a liquidation plan through the bank.
+
+        Args:
+            player (Player): The player raising the money.
+            plan (LiquidationPlan): The plan to carry out.
+
+        Returns:
+            None
+
+        Side Effects:
+            - Sells houses, mortgages and sells properties through the bank, updating balances and ownership.
+        """
+        bank = player.game.bank
+        for action, prop in plan.steps:
+            if action == "sell_house":
+                bank.sell_houses_to_the_bank(player, prop)
+            elif action == "mortgage":
+                bank.mortgage_property(player, prop)
+            else:
+                bank.sell_property_to_the_bank(player, prop)
@@ -0,0 +1,215 @@
+VALUATIONS = ("face", "equity", "liquidation")
+
+
+def property_value(prop, valuation="face"):
+    """
+    Returns what a property and the houses on it are worth to its owner.
+
+    Valuations:
+        - "face": the price plus the cost of the houses, mortgaged or not (the abridged-mode rules).
+        - "equity": as "face", but a mortgaged property only counts for what is left once the
+          mortgage (half the price) is paid off.
+        - "liquidation": the cash the bank would pay for it now: half the cost of each house, and the
+          price, or half of it if the property is mortgaged.
+
+    Args:
+        prop (Property): The property.
+        valuation (str): One of `VALUATIONS` (default: "face").
+
+    Returns:
+        int: The property's value.
+    """
+    if valuation == "face":
+        return prop.price + prop.house_cost * prop.houses
+    if valuation == "equity":
+        land = prop.price - prop.price // 2 if prop.mortgaged else prop.price
+        return land + prop.house_cost * prop.houses
+    land = prop.price // 2 if prop.mortgaged else prop.price
+    return land + (prop.house_cost // 2) * prop.houses
+
+
+class NetWorthTracker:
+    """
+    Keeps every player's net worth and the standings up to date as the game changes.
+
+    Net worth is the player's balance plus the value of their properties (see `property_value`).
+    Rather than summing every portfolio again, the tracker listens to the game's change feed and
+    adjusts only the players a change affects: a balance change moves that player's worth by the
+    difference, and a change to a property's owner, houses or mortgage takes the property's old
+    value off its old owner and adds its new value to its current owner. A player whose worth
+    changed is moved up or down the standings to their new place, so the standings are always in
+    order and reading a player's worth, the ranking or the leaders takes no summing or sorting.
+
+    Args:
+        game (Game): The game whose players are tracked.
+        valuation (str): How properties are valued, one of `VALUATIONS` (default: "face").
+
+    Attributes:
+        valuation (str): How properties are valued.
+        version (int): Increases whenever a player's net worth or the standings change.
+
+    Raises:
+        ValueError: If the valuation is not one of `VALUATIONS`.
+    """
+
+    def __init__(self, game, valuation="face"):
+        """
+        Values the game's players and starts following its changes.
+
+        Args:
+            game (Game): The game whose players are tracked.
+            valuation (str): How properties are valued, one of `VALUATIONS` (default: "face").
+
+        Returns:
+            None
+        """
+        if valuation not in VALUATIONS:
+            raise ValueError(f"Unknown valuation: {valuation!r}")
+        self.game = game
+        self.valuation = valuation
+        self.version = 0
+        self.recompute()
+        game.changes.subscribe(self.on_change, ("balance", "owner", "houses", "mortgaged", "removed"))
+
+    def recompute(self):
+        """
+        Values every player from scratch.
+
+        Returns:
+            None
+        """
+        players = self.game.players
+        self._seats = {player: seat for seat, player in enumerate(players)}
+        self._worth = {player: player.balance for player in players}
+        self._values = {}  # property -> (owner it is counted for, value counted)
+        for prop in self.game.bank.properties.values():
+            if prop.owner in self._worth:
+                value = property_value(prop, self.valuation)
+                self._values[prop] = (prop.owner, value)
+                self._worth[prop.owner] += value
+        self._rank()
+
+    def close(self):
+        """
+        Stops following the game's changes.
+
+        Returns:
+            None
+        """
+        self.game.changes.unsubscribe(self.on_change)
+
+    def on_change(self, change):
+        """
+        Adjusts the net worth of the players a change affects.
+
+        Args:
+            change (Change): A change from the game's change feed.
+
+        Returns:
+            None
+        """
+        worth = self._worth
+        kind = change.kind
+        if kind == "balance":
+            player = change.subject
+            if player in worth:
+                worth[player] += change.new - change.old
+                self._moved(player)
+        elif kind == "removed":
+            if worth.pop(change.subject, None) is not None:
+                self._ranking.remove(change.subject)
+                self._changed()
+        else:
+            prop = change.subject
+            owner, old_value = self._values.pop(prop, (None, 0))
+            new_owner = prop.owner
+            value = property_value(prop, self.valuation) if new_owner in worth else 0
+            if value:
+                self._values[prop] = (new_owner, value)
+            if owner is new_owner:  # houses or mortgage
+                if owner in worth and value != old_value:
+                    worth[owner] += value - old_value
+                    self._moved(owner)
+                return
+            if owner in worth:
+                worth[owner] -= old_value
+                self._moved(owner)
+            if new_owner in worth:
+                worth[new_owner] += value
+                self._moved(new_owner)
+
+    def _rank(self):
+        """Sorts the standings from scratch, richest first and ties in seat order."""
+        worth, seats = self._worth, self._seats
+        self._ranking = sorted(worth, key=lambda player: (-worth[player], seats[player]))
+        self._changed()
+
+    def _moved(self, player):
+        """Moves a player whose net worth changed to their place in the otherwise sorted standings."""
+        ranking, worth, seats = self._ranking, self._worth, self._seats
+        mine, seat = worth[player], seats[player]
+        i = ranking.index(player)
+        while i > 0:
+            other = ranking[i - 1]
+            if worth[other] > mine or (worth[other] == mine and seats[other] < seat):
+                break
+            ranking[i] = other
+            i -= 1
+        last = len(ranking) - 1
+        while i < last:
+            other = ranking[i + 1]
+            if worth[other] < mine or (worth[other] == mine and seats[other] > seat):
+                break
+            ranking[i] = other
+            i += 1
+        ranking[i] = player
+        self._changed()
+
+    def _changed(self):
+        """Drops the cached leaderboard and increases `version`."""
+        self._standings = None
+        self.version += 1
+
+    def net_worth(self, player):
+        """
+        Returns a player's net worth.
+
+        Args:
+            player (Player): A player still in the game.
+
+        Returns:
+            int: The player's balance plus the value of their properties.
+        """
+        return self._worth[player]
+
+    def ranking(self):
+        """
+        Returns the players in order of net worth.
+
+        Returns:
+            list[Player]: Every player still in the game, richest first and ties in seat order. The list
+            is the tracker's own and must not be changed.
+        """
+        return self._ranking
+
+    def leaderboard(self):
+        """
+        Returns the standings with each player's net worth.
+
+        Returns:
+            tuple[tuple[Player, int], ...]: Every player still in the game with their net worth, richest first.
+        """
+        if self._standings is None:
+            worth = self._worth
+            self._standings = tuple((player, worth[player]) for player in self._ranking)
+        return self._standings
+
+    def leaders(self):
+        """
+        Returns the players sharing the highest net worth.
+
+        Returns:
+            list[Player]: The richest players in seat order; empty if no player is left.
+        """
+        ranking, worth = self._ranking, self._worth
+        return [player for player in ranking if worth[player] == worth[ranking[0]]]
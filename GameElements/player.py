@@ -1,6 +1,8 @@
 import random
 import pygame
 
+from GameElements.ledger import PARKING, Ledger
+
 
 
 class Player:
@@ -35,6 +37,10 @@ class Player:
         turns_taken (int): Number of turns the player has completed.
         turns_skipped (int): Turns the player had to skip (e.g., from jail).
         just_sent_to_jail (bool): If the player was just sent to jail.
+        version (int): Increases whenever the player's balance changes or one of their properties
+            changes owner, houses or mortgage, so views can cache what they draw of the player.
+        changes (ChangeFeed | None): The game's change feed, which balance and position changes are published to.
+        ledger (Ledger): The game's ledger, which every payment the player makes or receives goes through.
     """
     def __init__(self, name, token, identity, game):
         """
@@ -58,16 +64,22 @@ class Player:
             turns_taken (int): Total number of turns the player has taken.
             turns_skipped (int): Turns missed (e.g., due to jail).
             just_sent_to_jail (bool): True if the player was sent to jail this turn.
+            version (int): Change counter for the player's balance and properties (starts at 0).
+            changes (ChangeFeed | None): The game's change feed, if it has one.
+            ledger (Ledger): The game's ledger.
         """
         self.name = name
         self.token = token
         self.identity = identity
         self.game = game  #  Fix: Store game reference instead of creating a new game
-        self.balance = 1500
+        self.changes = getattr(game, "changes", None)
+        self.ledger = Ledger.of(game)
+        self.version = 0
+        self._balance = 1500
         self.owned_properties = []
         self.passed = False
         self.in_jail = False
-        self.position = 1
+        self._position = 1
         self.get_out_of_jail_cards = 0
         self.jail_turns = 0
         self.consecutive_doubles = 0
@@ -75,6 +87,30 @@ class Player:
         self.turns_skipped = 0  
         self.just_sent_to_jail = False
 
+    @property
+    def balance(self):
+        """int: The player's current money balance. Setting a different amount increases `version`."""
+        return self._balance
+
+    @balance.setter
+    def balance(self, value):
+        if value != self._balance:
+            old, self._balance = self._balance, value
+            self.version += 1
+            if self.changes is not None:
+                self.changes.publish("balance", self, old, value)
+
+    @property
+    def position(self):
+        """int: Current board position (1 to 40). Setting a different position publishes a "position" change."""
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        if value != self._position:
+            old, self._position = self._position, value
+            if self.changes is not None:
+                self.changes.publish("position", self, old, value)
 
     def roll_dice(self):
         """
@@ -150,8 +186,7 @@ class Player:
 
             if self.position == 1:
                 self.passed = True
-                self.balance += 200
-                self.game.bank.balance -= 200
+                self.ledger.transfer(self.game.bank, self, 200, "go")
                 self.game.log_event(f"🛤️ {self.name} passed GO and collected £200!")
 
             if hasattr(self.game, "ui") and self.game.ui:
@@ -196,9 +231,7 @@ class Player:
             - Transfers property ownership to the player.
             - Logs the event to the game log.
         """
-        self.balance -= property_at_position.price
-
-        self.game.bank.balance += property_at_position.price
+        self.ledger.transfer(self, self.game.bank, property_at_position.price, "purchase", property_at_position.position)
 
         property_at_position.owner = self
         self.owned_properties.append(property_at_position)
@@ -244,6 +277,7 @@ class Player:
 
         Side Effects:
             - Updates player status (`in_jail`, `jail_turns`, `balance`).
+            - Returns a used "Get Out of Jail Free" card to its deck.
             - Logs the outcome to the game event log.
             - Plays jail release sound (if available).
         """
@@ -256,6 +290,7 @@ class Player:
 
         if self.get_out_of_jail_cards > 0:
             self.get_out_of_jail_cards -= 1
+            self.game.cards.return_jail_card_to_bottom()
             self.jail_turns = 0
             self.in_jail = False
             print(f"{self.name} used a Get Out of Jail Free card!")
@@ -264,7 +299,7 @@ class Player:
 
         if self.identity != "Human":
             if self.balance >= 50:
-                self.balance -= 50
+                self.ledger.transfer(self, self.game.bank, 50, "jail")
                 self.jail_turns = 0
                 self.in_jail = False
                 print(f"{self.name} paid £50 to get out of jail!")
@@ -289,7 +324,7 @@ class Player:
             - Calls bankruptcy handling if the balance is insufficient.
         """
         if self.balance >= amount:
-            self.balance -= amount
+            self.ledger.transfer(self, self.game.bank, amount, "tax")
             self.game.log_event(f"{self.name} paid tax of £{amount}!")
         else:
             self.game.log_event(f"{self.name} cannot afford tax of £{amount}!")
@@ -321,8 +356,7 @@ class Player:
         amount_due = property_at_position.calculate_rent(roll)
 
         if self.balance >= amount_due:
-            self.balance -= amount_due
-            creditor.balance += amount_due
+            self.ledger.transfer(self, creditor, amount_due, "rent", property_at_position.position)
 
             message = f"{self.name} paid £{amount_due} rent to {creditor.name}."
             print(message)
@@ -380,35 +414,33 @@ class Player:
             None
 
         Side Effects:
-            - For bots, triggers automatic property sales, mortgages, or bankruptcy.
-            - For humans, displays a bankruptcy popup via the UI.
+            - For bots, carries out the game's liquidation plan (house sales, mortgages and property sales
+              giving up the least asset value), or declares bankruptcy if no plan can cover the debt.
+            - For humans, displays a bankruptcy popup via the UI, or without a UI adds the debt to the game's
+              `deferred` decisions for the game's driver to settle.
             - Adjusts balances, ownerships, and logs relevant events.
         """
         if self.identity != "Human":
-            # Bot automatically tries to sell/mortgage properties to raise funds
-            for prop in sorted(self.owned_properties, key=lambda p: p.price):
-                if self.balance >= amount_due:
-                    break
-
-                if prop.houses > 0:
-                    self.game.bank.sell_houses_to_the_bank(self, prop)
-
-                if not prop.mortgaged and self.balance < amount_due:
-                    self.game.bank.mortgage_property(self, prop)
-
-                if prop.houses == 0 and self.balance < amount_due:
-                    self.game.bank.sell_property_to_the_bank(self, prop)
+            # Bot raises the shortfall with the cheapest mix of house sales, mortgages and property sales
+            if self.balance < amount_due:
+                planner = self.game.liquidation_planner
+                plan = planner.plan(self, amount_due - self.balance, max(len(self.game.players) - 1, 1))
+                if plan is not None:
+                    planner.execute(self, plan)
 
             if self.balance >= amount_due:
-                self.balance -= amount_due
+                self.ledger.transfer(self, creditor or self.game.bank, amount_due, "debt")
                 if creditor:
-                    creditor.balance += amount_due
                     self.game.log_event(f"{self.name} paid £{amount_due} to {creditor.name}.")
             else:
                 self.declare_bankruptcy(creditor, amount_due)
             return
 
-        self.game.ui.bankruptcy_popup = self.game.ui.create_bankruptcy_popup(self, amount_due, creditor)
+        if self.game.ui:
+            self.game.ui.bankruptcy_popup = self.game.ui.create_bankruptcy_popup(self, amount_due, creditor)
+        else:
+            self.game.deferred.append(("debt", self, amount_due, creditor))
+            self.game.log_event(f"{self.name} must raise £{amount_due}. Awaiting decision...")
 
 
     def declare_bankruptcy(self, creditor, debt):
@@ -440,7 +472,10 @@ class Player:
             self.return_properties_to_bank()
 
         self.owned_properties.clear()
-        self.balance = 0
+        if self.balance > 0:  # whatever is left goes to the bank, and the bank writes off what is owed
+            self.ledger.transfer(self, self.game.bank, self.balance, "bankruptcy")
+        elif self.balance < 0:
+            self.ledger.transfer(self.game.bank, self, -self.balance, "bankruptcy")
 
         message = f"{self.name} has gone bankrupt and is out of the game."
         print(message)
@@ -589,7 +624,7 @@ class Player:
                 pass
 
         if new_position < self.position:
-            self.balance += 200
+            self.ledger.transfer(self.game.bank, self, 200, "go")
             self.passed = True
             message = f"{self.name} passes GO and collects £200!"
             print(message)
@@ -630,8 +665,7 @@ class Player:
             print(f"{self.name} must pay £{total_cost} for property repairs.")
             
             if self.balance >= total_cost:
-                self.balance -= total_cost
-                game.fines += total_cost
+                self.ledger.transfer(self, PARKING, total_cost, "repairs")
                 game.log_event(f"{self.name} paid £{total_cost} for property repairs.")
             else:
                 game.log_event(f"{self.name} cannot afford £{total_cost} for property repairs.")
@@ -659,16 +693,52 @@ class Player:
         """
         #The intermediate bot will bid 10% of the difference between the highest bid and the property value, up to 1.5x the property value.
         if self.identity == "Basic Bot":
-            if highest_bid < property.price:
-                bid = (highest_bid + (property.price - highest_bid) * 0.1) + 1
-            else:
-                bid = highest_bid + (property.price * 0.1)
-            bid = int(bid)
+            bid = Player.basic_bot_raise(highest_bid, property.price)
             if bid > self.balance or bid > property.price * 1.5:
                 return "exit"
         else:
             bid = "exit"
         return str(bid)
+
+    @staticmethod
+    def basic_bot_raise(highest_bid, price):
+        """
+        Computes the next bid a "Basic Bot" places over the current highest bid.
+
+        Below the property price the bot closes 10% of the gap (plus £1); at or above the price
+        it raises by 10% of the price. The limits on the bid are applied separately.
+
+        Args:
+            highest_bid (int): The current highest bid in the auction.
+            price (int): The purchase price of the property being auctioned.
+
+        Returns:
+            int: The bid the bot would place.
+        """
+        if highest_bid < price:
+            bid = (highest_bid + (price - highest_bid) * 0.1) + 1
+        else:
+            bid = highest_bid + (price * 0.1)
+        return int(bid)
+
+    def bot_reservation_price(self, property):
+        """
+        Returns the highest bid the bot is willing to place for a property.
+
+        Used by the auction resolver to settle all-bot auctions without bidding round by round.
+
+        Args:
+            property (Property): The property being auctioned.
+
+        Returns:
+            float | None: The bot's reservation price, -1 for bots that never bid,
+            or None for human players (whose limit is unknown).
+        """
+        if self.identity == "Human":
+            return None
+        if self.identity == "Basic Bot":
+            return min(self.balance, property.price * 1.5)
+        return -1
     
     def bot_buy_property(self, property):
         """
@@ -732,6 +802,9 @@ class Player:
         """
         Determines whether the bot accepts a proposed trade.
 
+        The trade is valued with the game's trade engine: the bot accepts if the properties and
+        money it receives are worth more to it than what it gives away.
+
         Args:
             offer_properties (list): Properties offered by the current player.
             request_properties (list): Properties requested from the bot.
@@ -739,11 +812,20 @@ class Player:
             request_money (int): Money requested from the bot.
 
         Returns:
-            str: "no" to decline the trade (always).
+            str: "yes" to accept the trade, "no" to decline it.
 
         Behavior:
-            - "Basic Bot" currently declines all trade offers.
+            - "Basic Bot" accepts trades that increase its equity and that it can afford.
+            - Other bot types decline all trade offers.
         """
-        if self.identity == "Basic Bot":
+        if self.identity != "Basic Bot":
+            return "no"
+        if not offer_properties and not request_properties and not offer_money and not request_money:
             return "no"
-        return "no"
\ No newline at end of file
+        if request_money > self.balance:
+            return "no"
+
+        opponents = max(len(self.game.players) - 1, 1)
+        gain = self.game.trade_engine.trade_gain(self, offer_properties, request_properties,
+                                                 offer_money - request_money, opponents)
+        return "yes" if gain > 0 else "no"
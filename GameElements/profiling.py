@@ -0,0 +1,243 @@
+import functools
+import json
+import time
+import tracemalloc
+
+from GameElements.bank import Bank
+from GameElements.cards import CardDeck
+from GameElements.game_logic import Game
+from GameElements.player import Player
+
+
+# (phase, class, method) of every instrumented hot path
+PHASES = (
+    ("play_turn", Game, "play_turn"),
+    ("handle_position", Game, "handle_position"),
+    ("handle_property", Game, "handle_property"),
+    ("draw_card", CardDeck, "draw_card"),
+    ("bid_property", Bank, "bid_property"),
+    ("avoid_bankruptcy", Player, "avoid_bankruptcy"),
+    ("bot_trade", Game, "bot_propose_trade"),
+    ("bot_build", Game, "bot_build_houses"),
+)
+
+
+class PhaseStats:
+    """
+    Totals of one phase across a profiling run.
+
+    Attributes:
+        calls (int): Number of calls.
+        total (float): Seconds spent in the phase, including nested phases; a call nested in a call of
+            the same phase (e.g. a card moving the player to another tile) is only counted once.
+        own (float): Seconds spent in the phase outside nested phases.
+        sampled (int): Number of calls whose allocations were measured.
+        peak_bytes (int): Sum over the sampled calls of the most memory allocated above the level at the call.
+        net_bytes (int): Sum over the sampled calls of the memory still allocated when the call returned.
+    """
+    __slots__ = ("calls", "total", "own", "sampled", "peak_bytes", "net_bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.own = 0.0
+        self.sampled = 0
+        self.peak_bytes = 0
+        self.net_bytes = 0
+
+    def as_dict(self):
+        """
+        Returns the totals with per-call means.
+
+        Returns:
+            dict: Counts, times in seconds and allocations in bytes; the allocation means are None if no call was sampled.
+        """
+        calls, sampled = max(self.calls, 1), self.sampled
+        return {
+            "calls": self.calls,
+            "total_s": self.total,
+            "own_s": self.own,
+            "mean_s": self.total / calls,
+            "sampled": sampled,
+            "mean_peak_bytes": self.peak_bytes / sampled if sampled else None,
+            "mean_net_bytes": self.net_bytes / sampled if sampled else None,
+        }
+
+
+class TurnProfiler:
+    """
+    Aggregates call counts, time and allocations of the simulation's hot paths over a whole run.
+
+    The phases in `PHASES` are instrumented by replacing the methods on their classes with timing
+    wrappers while the profiler is running and putting the originals back when it stops, so the
+    game runs its unmodified code whenever no profiler is active. Time is recorded both including
+    nested phases (`total`) and excluding them (`own`), e.g. a card draw inside `handle_position`.
+    When `sample_every` is set, tracemalloc runs for the whole profile and one call in every
+    `sample_every` of each phase also has its allocations measured. Tracing memory slows every
+    allocation down, so times from a run with allocation sampling are inflated.
+
+    Usage:
+        with TurnProfiler() as profiler:
+            ... play games ...
+        print("\\n".join(profiler.report()))
+
+    Args:
+        sample_every (int): Measure allocations on every n-th call of a phase; 0 turns allocation sampling off (default: 0).
+
+    Attributes:
+        stats (dict[str, PhaseStats]): Totals by phase.
+        elapsed (float): Seconds the profiler has been running.
+    """
+
+    def __init__(self, sample_every=0):
+        """
+        Initializes a stopped profiler.
+
+        Args:
+            sample_every (int): Measure allocations on every n-th call of a phase; 0 turns allocation sampling off (default: 0).
+
+        Returns:
+            None
+        """
+        self.sample_every = sample_every
+        self.stats = {phase: PhaseStats() for phase, _, _ in PHASES}
+        self.elapsed = 0.0
+        self._originals = []
+        self._started = None
+        self._started_tracemalloc = False
+        self._frames = []
+
+    def start(self):
+        """
+        Instruments the hot paths.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If a profiler is already running.
+
+        Side Effects:
+            - Replaces the methods in `PHASES` on their classes and starts tracemalloc if sampling allocations.
+        """
+        for _, cls, method in PHASES:
+            if getattr(cls.__dict__[method], "__profiled__", False):
+                raise RuntimeError("A turn profiler is already running")
+        for phase, cls, method in PHASES:
+            original = cls.__dict__[method]
+            self._originals.append((cls, method, original))
+            setattr(cls, method, self._wrap(phase, original))
+        if self.sample_every and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._started = time.perf_counter()
+
+    def stop(self):
+        """
+        Puts the original methods back. The totals are kept, and `start` adds to them.
+
+        Returns:
+            None
+        """
+        if self._started is None:
+            return
+        self.elapsed += time.perf_counter() - self._started
+        self._started = None
+        for cls, method, original in self._originals:
+            setattr(cls, method, original)
+        self._originals = []
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _wrap(self, phase, function):
+        """Returns `function` wrapped to record its calls under `phase`."""
+        stats = self.stats[phase]
+        frames = self._frames  # one [child seconds, peak carried over a nested reset or None] per active call
+        depth = [0]  # active calls of this phase, so a recursive call's time is not added to `total` twice
+
+        @functools.wraps(function)
+        def profiled(*args, **kwargs):
+            stats.calls += 1
+            sample = self.sample_every and stats.calls % self.sample_every == 0 and tracemalloc.is_tracing()
+            if sample:
+                current, peak = tracemalloc.get_traced_memory()
+                for frame in frames:  # keep the peak of enclosing sampled calls before resetting it
+                    if frame[1] is not None:
+                        frame[1] = max(frame[1], peak)
+                tracemalloc.reset_peak()
+            frame = [0.0, current if sample else None]
+            frames.append(frame)
+            depth[0] += 1
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                frames.pop()
+                depth[0] -= 1
+                if not depth[0]:
+                    stats.total += elapsed
+                stats.own += elapsed - frame[0]
+                if frames:
+                    frames[-1][0] += elapsed
+                if sample:
+                    after, peak = tracemalloc.get_traced_memory()
+                    stats.sampled += 1
+                    stats.peak_bytes += max(frame[1], peak) - current
+                    stats.net_bytes += after - current
+
+        profiled.__profiled__ = True
+        return profiled
+
+    def as_dict(self):
+        """
+        Returns the profile as plain data.
+
+        Returns:
+            dict: The run's duration in seconds, the sampling rate and the totals of every phase that was called.
+        """
+        elapsed = self.elapsed + (time.perf_counter() - self._started if self._started is not None else 0.0)
+        return {
+            "elapsed_s": elapsed,
+            "sample_every": self.sample_every,
+            "phases": {phase: stats.as_dict() for phase, stats in self.stats.items() if stats.calls},
+        }
+
+    def report(self):
+        """
+        Formats the profile as a table, slowest phase (by own time) first.
+
+        Returns:
+            list[str]: The table's lines.
+        """
+        profile = self.as_dict()
+        lines = [f"Turn profile over {profile['elapsed_s']:.2f} s",
+                 f"{'phase':<17}{'calls':>9}{'total ms':>11}{'own ms':>10}{'mean us':>10}{'peak KB':>9}{'net KB':>8}"]
+        phases = sorted(profile["phases"].items(), key=lambda item: -item[1]["own_s"])
+        for phase, row in phases:
+            peak = f"{row['mean_peak_bytes'] / 1024:9.1f}" if row["sampled"] else f"{'-':>9}"
+            net = f"{row['mean_net_bytes'] / 1024:8.1f}" if row["sampled"] else f"{'-':>8}"
+            lines.append(f"{phase:<17}{row['calls']:>9}{row['total_s'] * 1000:11.1f}{row['own_s'] * 1000:10.1f}"
+                         f"{row['mean_s'] * 1e6:10.1f}{peak}{net}")
+        return lines
+
+    def dump_json(self, path="turn_profile.json"):
+        """
+        Writes the profile to a JSON file.
+
+        Args:
+            path (str): The file to write (default: "turn_profile.json").
+
+        Returns:
+            None
+        """
+        with open(path, "w") as file:
+            json.dump(self.as_dict(), file, indent=2)
@@ -1,3 +1,5 @@
+from GameElements.board import load_board
+
 
 class Property:
     """
@@ -18,10 +20,14 @@ class Property:
         owner (Player or None): The current owner of the property.
         mortgaged (bool): Whether the property is mortgaged.
         already_auctioned (bool): Whether the property has been auctioned in the current turn.
+        version (int): Increases whenever the owner, houses or mortgage change; each change also
+            increases the `version` of the owners involved.
+        changes (ChangeFeed | None): The game's change feed, which owner, houses and mortgage changes are
+            published to. Set by `Bank.attach`; None for a property outside a game.
 
     Class Attributes:
         color_group_sizes (dict): A static dictionary mapping property groups to the number of tiles required
-                                  for a complete set (used for completion checks).
+                                  for a complete set (used for completion checks), taken from the board model.
 
     Example:
         A station might have increasing rent depending on how many stations a player owns.
@@ -33,10 +39,8 @@ class Property:
         transfer_property(new_owner): Transfers ownership and checks for group completion.
         check_completion(): Checks if the owner owns all properties in the group.
     """
-    color_group_sizes = {  # Store it inside the class
-        "Brown": 2, "Blue": 3,"Station": 4, "Pink": 3, "Utilities": 2, "Orange": 3,
-        "Red": 3, "Yellow": 3, "Green": 3, "Deep blue": 2
-    }
+    color_group_sizes = load_board().group_size_map()  # Shared with the board model
+    changes = None
 
     def __init__(self, position, name, price, rent, house_cost, group):
         """
@@ -56,6 +60,7 @@ class Property:
             owner (Player or None): The player who owns the property (None if unowned).
             mortgaged (bool): Indicates if the property is mortgaged.
             already_auctioned (bool): Tracks if the property was auctioned during the current turn.
+            version (int): Change counter for the owner, houses and mortgage (starts at 0).
         """
         self.name = name
         self.price = price
@@ -64,18 +69,63 @@ class Property:
         self.house_cost = house_cost
         self.group = group
         self.completed = False
-        self.houses = 0
-        self.owner = None
-        self.mortgaged = False
+        self.version = 0
+        self._owner = None
+        self._houses = 0
+        self._mortgaged = False
         self.already_auctioned = False # Wether the property has been auctioned this turn or not
 
+    def _changed(self, kind, old, new):
+        """Increases the version of the property and of its owner, and publishes the change."""
+        self.version += 1
+        if self._owner is not None:
+            self._owner.version += 1
+        if self.changes is not None:
+            self.changes.publish(kind, self, old, new)
+
+    @property
+    def owner(self):
+        """Player | None: The current owner. Changing it increases the version of both owners and publishes an "owner" change."""
+        return self._owner
+
+    @owner.setter
+    def owner(self, value):
+        if value is not self._owner:
+            old = self._owner
+            if old is not None:
+                old.version += 1
+            self._owner = value
+            self._changed("owner", old, value)
+
+    @property
+    def houses(self):
+        """int: Number of houses (5 for a hotel). Changing it increases `version` and publishes a "houses" change."""
+        return self._houses
+
+    @houses.setter
+    def houses(self, value):
+        if value != self._houses:
+            old, self._houses = self._houses, value
+            self._changed("houses", old, value)
+
+    @property
+    def mortgaged(self):
+        """bool: Whether the property is mortgaged. Changing it increases `version` and publishes a "mortgaged" change."""
+        return self._mortgaged
+
+    @mortgaged.setter
+    def mortgaged(self, value):
+        if value != self._mortgaged:
+            old, self._mortgaged = self._mortgaged, value
+            self._changed("mortgaged", old, value)
+
     def calculate_rent(self, dice_roll=None):
         """
         Calculates the rent a player must pay when landing on this property.
 
         Rent calculation depends on the property's group:
-        - For 'Utilities': Based on a dice roll and number of utilities owned.
-        - For 'Station': Based on the number of stations owned.
+        - For 'Utilities': Based on a dice roll and the multiplier in `rent` for the number of utilities owned.
+        - For 'Station': The rent in `rent` for the number of stations owned.
         - For standard color groups: Rent increases with number of houses and doubles if the group is fully owned.
 
         Args:
@@ -87,7 +137,7 @@ class Property:
         if self.group == "Utilities":
             if self.owner:
                 utilities_count = sum(1 for p in self.owner.owned_properties if p.group == "Utilities")
-                multiplier = 4 if utilities_count == 1 else 10
+                multiplier = self._special_rent()[utilities_count - 1]
                 if dice_roll is not None:
                     return dice_roll * multiplier
                 else:
@@ -96,7 +146,7 @@ class Property:
         elif self.group == "Station":
             if self.owner:
                 station_count = sum(1 for p in self.owner.owned_properties if p.group == "Station")
-                return [25, 50, 100, 200][station_count - 1]
+                return self._special_rent()[station_count - 1]
 
         elif self.group in Property.color_group_sizes:
             if self.check_completion() and self.houses == 0:
@@ -106,6 +156,21 @@ class Property:
         return 0
 
 
+    def _special_rent(self):
+        """
+        Returns the rent tiers of a station or utility by number owned.
+
+        Properties made without their own tiers use those of their group on the board model.
+
+        Returns:
+            Sequence[int]: Station rents or utility dice multipliers for 1, 2, ... owned.
+        """
+        if self.rent:
+            return self.rent
+        board = load_board()
+        position = board.group_ids.tolist().index(board.groups.index(self.group))
+        return board.rents[position, :board.rent_tiers[position]].tolist()
+
     def property_details(self):
         """
         Returns a string summarizing the property's current status.
@@ -0,0 +1,252 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from GameElements.board import load_board
+from GameElements.ledger import CATEGORIES
+from GameElements.traces import MANIFEST, open_campaign
+
+
+# Game phases, as the turn (of the whole table, from 0) each one starts at
+PHASES = (("early", 0), ("middle", 80), ("late", 200))
+
+# The columns of a campaign the analysis reads
+COLUMNS = {
+    "games": ("game", "players", "turns", "winner"),
+    "turns": ("game", "turn", "moved", "position"),
+    "payments": ("game", "turn", "category", "tile", "payer", "amount"),
+    "owners": ("game", "turn", "tile", "owner"),
+}
+
+# Sums kept per (property or group, phase); every statistic is derived from these, so the sums of
+# separate chunks or shards of a campaign can simply be added together
+SUMS = ("landings", "rent", "invested", "acquired", "paid_back", "payback_turns",
+        "n", "x", "xx", "y", "xy")
+
+
+def _phase_of(turns, starts):
+    """Returns the index of the phase of each turn."""
+    return np.searchsorted(starts, turns, side="right") - 1
+
+
+def _game_ranges(campaign, first, last):
+    """Returns the rows of every table read that belong to the games numbered first to last - 1."""
+    ranges = {}
+    for table in COLUMNS:
+        games = campaign[table]["game"]
+        ranges[table] = slice(int(np.searchsorted(games, first)), int(np.searchsorted(games, last)))
+    return ranges
+
+
+def summarize(campaign, board, phases=PHASES, first=0, last=None):
+    """
+    Adds up the statistics of some of the games of a campaign, per property and per colour group.
+
+    Rows are selected by binary search on each table's game column, so only the rows of the games
+    asked for, and only the `COLUMNS` used, are read from a memory-mapped campaign.
+
+    Args:
+        campaign (dict): A campaign opened with `open_campaign`.
+        board (BoardModel): The board the campaign was played on.
+        phases (tuple[tuple[str, int], ...]): Names and first turns of the game phases (default: `PHASES`).
+        first (int): Number of the first game to include (default: 0).
+        last (int | None): Number of the game after the last one to include (default: None, to the end).
+
+    Returns:
+        tuple[pandas.DataFrame, pandas.DataFrame]: The `SUMS` per (tile, phase) and per (group, phase),
+        with a row for every property or group and phase.
+    """
+    starts = np.array([start for _, start in phases])
+    last = len(campaign["games"]["game"]) if last is None else last
+    rows = _game_ranges(campaign, first, last)
+    table = {name: pd.DataFrame({column: np.asarray(campaign[name][column][rows[name]]) for column in columns})
+             for name, columns in COLUMNS.items()}
+    games, turns, payments, owners = table["games"], table["turns"], table["payments"], table["owners"]
+    tiles = pd.Index(board.property_positions, name="tile")
+    group_of = pd.Series(np.asarray(board.group_ids)[list(tiles)], index=tiles, name="group")
+    index = pd.MultiIndex.from_product([tiles, range(len(phases))], names=["tile", "phase"])
+    sums = pd.DataFrame(0.0, index=index, columns=SUMS)
+
+    # Landings: where the player whose turn it was ended their turn
+    moved = turns[turns["moved"] == 1]
+    landings = moved.groupby([moved["position"].rename("tile"), _phase_of(moved["turn"].to_numpy(), starts)]).size()
+    sums["landings"] = landings.rename_axis(["tile", "phase"]).reindex(index, fill_value=0)
+
+    # Rent, money put into each property and the time the rent took to cover it
+    payments = payments.assign(phase=_phase_of(payments["turn"].to_numpy(), starts))
+    category = payments["category"].to_numpy()
+    rent = category == CATEGORIES.index("rent")
+    cost = np.isin(category, [CATEGORIES.index(name) for name in ("purchase", "auction", "build")]) & (payments["payer"] >= 0)
+    sums["rent"] = payments[rent].groupby(["tile", "phase"])["amount"].sum().reindex(index, fill_value=0)
+    sums["invested"] = payments[cost].groupby(["tile", "phase"])["amount"].sum().reindex(index, fill_value=0)
+
+    flows = payments[rent | cost].assign(net=np.where(rent, 1, -1)[rent | cost] * payments["amount"][rent | cost])
+    flows = flows.sort_values(["game", "tile"], kind="stable")
+    flows["balance"] = flows.groupby(["game", "tile"])["net"].cumsum()
+    bought = flows[flows["net"] < 0].groupby(["game", "tile"])[["turn", "phase"]].first()
+    repaid = flows[(flows["balance"] >= 0) & (flows["net"] > 0)].groupby(["game", "tile"])["turn"].first()
+    bought["payback"] = repaid.reindex(bought.index) - bought["turn"]
+    by_phase = bought.reset_index().groupby(["tile", "phase"])
+    sums["acquired"] = by_phase.size().reindex(index, fill_value=0)
+    sums["paid_back"] = by_phase["payback"].count().reindex(index, fill_value=0)
+    sums["payback_turns"] = by_phase["payback"].sum().reindex(index, fill_value=0)
+
+    # Moments of (owns the property at the end of the phase, won the game) over every player of
+    # every game that reached the phase, for the correlation with winning
+    group_sums = []
+    for phase, start in enumerate(starts):
+        end = starts[phase + 1] if phase + 1 < len(starts) else np.iinfo(np.int64).max
+        reached = games[games["turns"] > start].set_index("game")
+        held = owners[(owners["turn"] < end) & owners["game"].isin(reached.index)]
+        held = held.groupby(["game", "tile"])["owner"].last()
+        held = held[held >= 0].reset_index()
+        held["won"] = (held["owner"] == reached["winner"].reindex(held["game"]).to_numpy()).astype(int)
+        n, y = reached["players"].sum(), (reached["winner"] >= 0).sum()
+
+        per_tile = held.groupby("tile").agg(x=("owner", "size"), xy=("won", "sum")).reindex(tiles, fill_value=0)
+        sums.loc[(slice(None), phase), ["n", "y"]] = [n, y]
+        sums.loc[(slice(None), phase), "x"] = sums.loc[(slice(None), phase), "xx"] = per_tile["x"].to_numpy()
+        sums.loc[(slice(None), phase), "xy"] = per_tile["xy"].to_numpy()
+
+        held["group"] = group_of.reindex(held["tile"]).to_numpy()
+        counts = held.groupby(["game", "owner", "group"]).agg(count=("tile", "size"), won=("won", "first"))
+        counts["squared"] = counts["count"] ** 2
+        counts["count_won"] = counts["count"] * counts["won"]
+        moments = counts.groupby("group").agg(x=("count", "sum"), xx=("squared", "sum"), xy=("count_won", "sum"))
+        group_sums.append(moments.assign(n=n, y=y, phase=phase))
+
+    groups = sums.drop(columns=["n", "x", "xx", "y", "xy"]).join(group_of).groupby(["group", "phase"]).sum()
+    moments = pd.concat(group_sums).reset_index().set_index(["group", "phase"])
+    group_index = pd.MultiIndex.from_product([range(len(board.groups)), range(len(phases))], names=["group", "phase"])
+    groups = groups.join(moments).reindex(group_index).fillna(0)
+    groups["n"] = sums.groupby(level="phase")["n"].first().reindex(group_index.get_level_values("phase")).to_numpy()
+    groups["y"] = sums.groupby(level="phase")["y"].first().reindex(group_index.get_level_values("phase")).to_numpy()
+    return sums, groups[list(SUMS)]
+
+
+def finish(property_sums, group_sums, board, phases=PHASES):
+    """
+    Turns the sums of a campaign into the property and group tables.
+
+    Args:
+        property_sums (pandas.DataFrame): `SUMS` per (tile, phase), added up over the whole campaign.
+        group_sums (pandas.DataFrame): `SUMS` per (group, phase), added up over the whole campaign.
+        board (BoardModel): The board the campaign was played on.
+        phases (tuple[tuple[str, int], ...]): The phases the sums were taken over (default: `PHASES`).
+
+    Returns:
+        tuple[pandas.DataFrame, pandas.DataFrame]: Per property and per group, for each phase: landings
+        and their share of the landings on properties in the phase, rent, money invested (purchases, auctions and
+        houses), rent per pound invested, properties acquired and paid back, mean turns from the first
+        purchase until the rent first covered everything spent so far, and the correlation between
+        owning the property (the number of the group's properties owned) at the end of the phase and
+        winning the game.
+    """
+    tables = []
+    for sums, key, names in ((property_sums, "tile", None), (group_sums, "group", board.groups)):
+        table = sums.reset_index()
+        if names is None:
+            table.insert(1, "name", [board.names[tile] for tile in table["tile"]])
+            table.insert(2, "group", [board.groups[board.group_ids[tile]] for tile in table["tile"]])
+        else:
+            table["group"] = [names[group] for group in table["group"]]
+        table["phase"] = [phases[phase][0] for phase in table["phase"]]
+        table["landing_share"] = table["landings"] / table.groupby("phase")["landings"].transform("sum").replace(0, np.nan)
+        table["rent_per_pound"] = table["rent"] / table["invested"].replace(0, np.nan)
+        table["mean_payback_turns"] = table["payback_turns"] / table["paid_back"].replace(0, np.nan)
+        spread = (table["n"] * table["xx"] - table["x"] ** 2) * (table["n"] * table["y"] - table["y"] ** 2)
+        table["win_correlation"] = (table["n"] * table["xy"] - table["x"] * table["y"]) / np.sqrt(spread.where(spread > 0))
+        columns = [key, "name", "group"] if names is None else ["group"]
+        tables.append(table[columns + ["phase", "landings", "landing_share", "rent", "invested", "rent_per_pound",
+                                       "acquired", "paid_back", "mean_payback_turns", "win_correlation"]])
+    return tables[0], tables[1]
+
+
+def campaign_directories(paths):
+    """
+    Finds the campaigns under some paths.
+
+    Args:
+        paths (Iterable[str]): Campaign directories, or directories of campaigns (e.g. the shards of one campaign).
+
+    Returns:
+        list[str]: Every directory with a campaign manifest, in order.
+    """
+    found = []
+    for path in paths:
+        if os.path.exists(os.path.join(path, MANIFEST)):
+            found.append(path)
+        else:
+            found.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if os.path.exists(os.path.join(path, name, MANIFEST)))
+    return found
+
+
+def analyse(paths, phases=PHASES, chunk_games=100_000):
+    """
+    Builds the property and group tables of one or more campaigns played on the same board.
+
+    Each campaign is memory-mapped and summarised `chunk_games` games at a time, so memory use
+    depends on the chunk size rather than on the size of the campaign.
+
+    Args:
+        paths (Iterable[str]): Campaign directories or directories of campaigns.
+        phases (tuple[tuple[str, int], ...]): Names and first turns of the game phases (default: `PHASES`).
+        chunk_games (int): Games to summarise at a time (default: 100000).
+
+    Returns:
+        tuple[pandas.DataFrame, pandas.DataFrame]: The property and group tables (see `finish`).
+
+    Raises:
+        ValueError: If there is no campaign or the campaigns were played on different boards.
+    """
+    directories = campaign_directories(paths)
+    boards = set()
+    for directory in directories:
+        with open(os.path.join(directory, MANIFEST)) as file:
+            boards.add(json.load(file)["board"])
+    if len(boards) != 1:
+        raise ValueError(f"Expected campaigns played on one board, found {len(boards)}")
+    board = load_board(boards.pop())
+
+    property_sums = group_sums = None
+    for directory in directories:
+        campaign = open_campaign(directory)
+        games = len(campaign["games"]["game"])
+        for first in range(0, max(games, 1), chunk_games):
+            properties, groups = summarize(campaign, board, phases, first, first + chunk_games)
+            property_sums = properties if property_sums is None else property_sums + properties
+            group_sums = groups if group_sums is None else group_sums + groups
+    return finish(property_sums, group_sums, board, phases)
+
+
+def write_tables(properties, groups, directory, file_format="csv"):
+    """
+    Writes the property and group tables.
+
+    Args:
+        properties (pandas.DataFrame): The property table.
+        groups (pandas.DataFrame): The group table.
+        directory (str): Where to write `properties.<format>` and `groups.<format>`.
+        file_format (str): "csv", or "parquet" if pyarrow or fastparquet is installed (default: "csv").
+
+    Returns:
+        list[str]: The paths written.
+
+    Raises:
+        ValueError: If the format is not "csv" or "parquet".
+    """
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(f"Unknown format: {file_format!r}")
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for name, table in (("properties", properties), ("groups", groups)):
+        path = os.path.join(directory, f"{name}.{file_format}")
+        if file_format == "csv":
+            table.to_csv(path, index=False)
+        else:
+            table.to_parquet(path, index=False)
+        paths.append(path)
+    return paths
@@ -0,0 +1,475 @@
+import math
+
+import numpy as np
+
+from GameElements.ledger import CATEGORIES
+
+
+class RunningMoments:
+    """
+    Count, mean and variance of a stream of numbers, in constant memory (Welford's algorithm).
+
+    Two accumulators merge exactly (Chan et al.'s pairwise update), so workers can each summarise
+    their share of a stream and send only the summary.
+
+    Attributes:
+        count (int): Number of values seen.
+        mean (float): Their mean (0.0 if there are none).
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty accumulator.
+
+        Returns:
+            None
+        """
+        self.count = 0
+        self.mean = 0.0
+        self._squares = 0.0  # sum of squared differences from the mean
+
+    def add(self, value):
+        """
+        Adds a value.
+
+        Args:
+            value (float): The value.
+
+        Returns:
+            None
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._squares += delta * (value - self.mean)
+
+    def add_many(self, values):
+        """
+        Adds an array of values at once.
+
+        Args:
+            values (array-like): The values.
+
+        Returns:
+            None
+        """
+        values = np.asarray(values, dtype=float)
+        if len(values):
+            batch = RunningMoments()
+            batch.count, batch.mean = len(values), float(values.mean())
+            batch._squares = float(((values - batch.mean) ** 2).sum())
+            self.merge(batch)
+
+    def merge(self, other):
+        """
+        Adds everything another accumulator has seen.
+
+        Args:
+            other (RunningMoments): The other accumulator.
+
+        Returns:
+            RunningMoments: This accumulator.
+        """
+        count = self.count + other.count
+        if other.count:
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / count
+            self._squares += other._squares + delta * delta * self.count * other.count / count
+            self.count = count
+        return self
+
+    @property
+    def variance(self):
+        """float: The sample variance (0.0 with fewer than two values)."""
+        return self._squares / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        """float: The sample standard deviation."""
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """
+    Estimates quantiles of a stream of numbers to a relative accuracy, in memory that does not grow
+    with the number of values.
+
+    Values are counted in buckets whose bounds grow geometrically by `gamma` = (1 + a) / (1 - a),
+    one set for positive and one for negative values, plus a count of zeros (the DDSketch scheme).
+    Any quantile is then returned to within a relative error `a` of a value of the stream of that
+    rank. The number of buckets only depends on the range of the values (about 700 for values
+    between 1 and 1,000,000 at 1%), and sketches with the same accuracy merge by adding their counts.
+
+    Args:
+        accuracy (float): The relative accuracy `a` (default: 0.01).
+
+    Attributes:
+        accuracy (float): The relative accuracy.
+        count (int): Number of values seen.
+    """
+
+    def __init__(self, accuracy=0.01):
+        """
+        Initializes an empty sketch.
+
+        Args:
+            accuracy (float): The relative accuracy, between 0 and 1 (default: 0.01).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the accuracy is not between 0 and 1.
+        """
+        if not 0 < accuracy < 1:
+            raise ValueError(f"Accuracy must be between 0 and 1, not {accuracy}")
+        self.accuracy = accuracy
+        self.count = 0
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive = {}
+        self._negative = {}
+        self._zeros = 0
+
+    def add(self, value):
+        """
+        Adds a value.
+
+        Args:
+            value (float): The value.
+
+        Returns:
+            None
+        """
+        self.count += 1
+        if value == 0:
+            self._zeros += 1
+            return
+        buckets = self._positive if value > 0 else self._negative
+        key = math.ceil(math.log(abs(value)) / self._log_gamma)
+        buckets[key] = buckets.get(key, 0) + 1
+
+    def add_many(self, values):
+        """
+        Adds an array of values at once.
+
+        Args:
+            values (array-like): The values.
+
+        Returns:
+            None
+        """
+        values = np.asarray(values, dtype=float)
+        self.count += len(values)
+        self._zeros += int((values == 0).sum())
+        for buckets, side in ((self._positive, values[values > 0]), (self._negative, -values[values < 0])):
+            keys, counts = np.unique(np.ceil(np.log(side) / self._log_gamma).astype(np.int64), return_counts=True)
+            for key, count in zip(keys.tolist(), counts.tolist()):
+                buckets[key] = buckets.get(key, 0) + count
+
+    def merge(self, other):
+        """
+        Adds everything another sketch has seen.
+
+        Args:
+            other (QuantileSketch): A sketch with the same accuracy.
+
+        Returns:
+            QuantileSketch: This sketch.
+
+        Raises:
+            ValueError: If the sketches have different accuracies.
+        """
+        if other.accuracy != self.accuracy:
+            raise ValueError("Only sketches with the same accuracy can be merged")
+        for buckets, others in ((self._positive, other._positive), (self._negative, other._negative)):
+            for key, count in others.items():
+                buckets[key] = buckets.get(key, 0) + count
+        self._zeros += other._zeros
+        self.count += other.count
+        return self
+
+    def quantile(self, q):
+        """
+        Estimates a quantile.
+
+        Args:
+            q (float): The quantile, between 0 and 1 (e.g. 0.5 for the median).
+
+        Returns:
+            float: The estimate, or NaN if the sketch is empty.
+
+        Raises:
+            ValueError: If q is not between 0 and 1.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, not {q}")
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self._zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self._positive))
+
+    def _value(self, key):
+        """Returns the value a bucket stands for, the one within the accuracy of both of its bounds."""
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def __len__(self):
+        return len(self._positive) + len(self._negative)
+
+
+class WinRate:
+    """
+    Counts games and wins per competitor (e.g. seat or bot identity) and gives win rates with
+    Wilson score confidence intervals.
+
+    Attributes:
+        games (dict): Games played by each competitor.
+        wins (dict): Games won by each competitor.
+    """
+
+    def __init__(self):
+        """
+        Initializes empty counts.
+
+        Returns:
+            None
+        """
+        self.games = {}
+        self.wins = {}
+
+    def add(self, competitors, winner):
+        """
+        Records a game.
+
+        Args:
+            competitors (Iterable): Who played.
+            winner: Who won, or None for no single winner.
+
+        Returns:
+            None
+        """
+        for competitor in competitors:
+            self.games[competitor] = self.games.get(competitor, 0) + 1
+        if winner is not None:
+            self.wins[winner] = self.wins.get(winner, 0) + 1
+
+    def merge(self, other):
+        """
+        Adds another set of counts.
+
+        Args:
+            other (WinRate): The other counts.
+
+        Returns:
+            WinRate: These counts.
+        """
+        for mine, theirs in ((self.games, other.games), (self.wins, other.wins)):
+            for competitor, count in theirs.items():
+                mine[competitor] = mine.get(competitor, 0) + count
+        return self
+
+    def interval(self, competitor, z=1.96):
+        """
+        Returns a competitor's win rate with its Wilson score interval.
+
+        Args:
+            competitor: The competitor.
+            z (float): Standard normal quantile of the confidence level (default: 1.96, for 95%).
+
+        Returns:
+            tuple[float, float, float]: The win rate and the low and high ends of the interval;
+            NaN for a competitor with no games.
+        """
+        games = self.games.get(competitor, 0)
+        if not games:
+            return math.nan, math.nan, math.nan
+        rate = self.wins.get(competitor, 0) / games
+        centre = (rate + z * z / (2 * games)) / (1 + z * z / games)
+        spread = z * math.sqrt(rate * (1 - rate) / games + z * z / (4 * games * games)) / (1 + z * z / games)
+        return rate, centre - spread, centre + spread
+
+
+# What is counted for each property by `PropertyCounters`
+COUNTERS = ("landings", "rent", "purchases", "auctions", "built")
+
+
+class PropertyCounters:
+    """
+    Running totals per board position: landings, rent collected, purchases, auctions and money spent
+    on houses, in one (counters, positions) numpy array that merges by addition.
+
+    Args:
+        size (int): Number of board positions (default: 40).
+
+    Attributes:
+        totals (numpy.ndarray): The (len(COUNTERS), size + 1) totals, indexed by board position.
+    """
+
+    def __init__(self, size=40):
+        """
+        Initializes zero totals.
+
+        Args:
+            size (int): Number of board positions (default: 40).
+
+        Returns:
+            None
+        """
+        self.totals = np.zeros((len(COUNTERS), size + 1), np.int64)
+
+    def add_game(self, game):
+        """
+        Adds a game's landings, from its turn history, and payments for properties, from its ledger.
+
+        Args:
+            game (Game): The game.
+
+        Returns:
+            None
+        """
+        size = self.totals.shape[1]
+        history = game.history
+        movers = history.movers()
+        turns = np.flatnonzero(movers >= 0)
+        positions = history.series("position")[turns, movers[turns]]
+        self.totals[0] += np.bincount(positions, minlength=size)[:size]
+
+        entries = game.ledger.entries()
+        for row, category, weighted in ((1, "rent", True), (2, "purchase", False), (3, "auction", False),
+                                        (4, "build", True)):
+            chosen = entries[entries["category"] == CATEGORIES.index(category)]
+            weights = chosen["amount"] if weighted else None
+            self.totals[row] += np.bincount(chosen["tile"], weights, minlength=size)[:size].astype(np.int64)
+
+    def merge(self, other):
+        """
+        Adds another set of totals.
+
+        Args:
+            other (PropertyCounters): The other totals, for a board of the same size.
+
+        Returns:
+            PropertyCounters: These totals.
+        """
+        self.totals += other.totals
+        return self
+
+    def __getitem__(self, counter):
+        """Returns the totals of one of `COUNTERS` by board position."""
+        return self.totals[COUNTERS.index(counter)]
+
+
+class TournamentStats:
+    """
+    Summarises any number of finished games in constant memory: game length, bankruptcies and the
+    winner's net worth (moments and quantiles), win rates by seat and per-property counters.
+
+    Each worker of a tournament keeps its own and sends it, rather than its games' results, to be
+    merged; a `TournamentStats` pickles to a few kilobytes however many games it has seen.
+
+    Args:
+        accuracy (float): Relative accuracy of the quantile sketches (default: 0.01).
+
+    Attributes:
+        games (int): Number of games added.
+        turns (RunningMoments): Turns per game.
+        turn_quantiles (QuantileSketch): Turns per game.
+        bankruptcies (RunningMoments): Bankruptcies per game.
+        winning_worth (QuantileSketch): Net worth of the winner of each game with a single winner.
+        seats (WinRate): Wins by seat number.
+        properties (PropertyCounters): Per-property totals.
+    """
+
+    def __init__(self, accuracy=0.01):
+        """
+        Initializes empty statistics.
+
+        Args:
+            accuracy (float): Relative accuracy of the quantile sketches (default: 0.01).
+
+        Returns:
+            None
+        """
+        self.games = 0
+        self.turns = RunningMoments()
+        self.turn_quantiles = QuantileSketch(accuracy)
+        self.bankruptcies = RunningMoments()
+        self.winning_worth = QuantileSketch(accuracy)
+        self.seats = WinRate()
+        self.properties = PropertyCounters()
+
+    def add_game(self, game):
+        """
+        Adds a finished game.
+
+        The winner is the last player left or, in a game stopped early, the single richest player.
+
+        Args:
+            game (Game): The game, with its turn history and ledger.
+
+        Returns:
+            None
+        """
+        history = game.history
+        seats = history.seats
+        leaders = game.players if len(game.players) == 1 else game.net_worth.leaders()
+        winner = leaders[0] if len(leaders) == 1 else None
+
+        self.games += 1
+        self.turns.add(len(history))
+        self.turn_quantiles.add(len(history))
+        self.bankruptcies.add(len(history.left))
+        if winner is not None:
+            self.winning_worth.add(game.net_worth.net_worth(winner))
+        self.seats.add(range(len(seats)), seats.index(winner) if winner is not None else None)
+        self.properties.add_game(game)
+
+    def merge(self, other):
+        """
+        Adds another set of statistics.
+
+        Args:
+            other (TournamentStats): The other statistics, with the same accuracy.
+
+        Returns:
+            TournamentStats: These statistics.
+        """
+        self.games += other.games
+        self.turns.merge(other.turns)
+        self.turn_quantiles.merge(other.turn_quantiles)
+        self.bankruptcies.merge(other.bankruptcies)
+        self.winning_worth.merge(other.winning_worth)
+        self.seats.merge(other.seats)
+        self.properties.merge(other.properties)
+        return self
+
+    def report(self):
+        """
+        Describes the statistics.
+
+        Returns:
+            list[str]: Lines of text.
+        """
+        turns, quantiles = self.turns, self.turn_quantiles
+        lines = [f"{self.games} games",
+                 f"turns: mean {turns.mean:.1f} (sd {turns.std:.1f}), median {quantiles.quantile(0.5):.0f}, "
+                 f"p90 {quantiles.quantile(0.9):.0f}, p99 {quantiles.quantile(0.99):.0f}",
+                 f"bankruptcies per game: mean {self.bankruptcies.mean:.2f} (sd {self.bankruptcies.std:.2f})",
+                 f"winner's net worth: median £{self.winning_worth.quantile(0.5):.0f}, "
+                 f"p90 £{self.winning_worth.quantile(0.9):.0f}"]
+        for seat in sorted(self.seats.games):
+            rate, low, high = self.seats.interval(seat)
+            lines.append(f"seat {seat + 1} wins: {rate:.1%} (95% CI {low:.1%}-{high:.1%})")
+        return lines
@@ -0,0 +1,467 @@
+import asyncio
+import json
+import struct
+import time
+
+from GameElements.game_logic import Game
+from GameElements.host import DecisionRequest
+
+
+HEADER = struct.Struct("!I")
+PLAYER_FIELDS = ("b", "x", "j", "g", "a")  # balance, position, in jail, jail-free cards, still playing
+
+
+def encode(message):
+    """
+    Encodes a message as compact JSON behind a 4-byte length prefix.
+
+    Args:
+        message (dict): The message.
+
+    Returns:
+        bytes: The framed message.
+    """
+    body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    return HEADER.pack(len(body)) + body
+
+
+async def read_frame(reader):
+    """
+    Reads the body of one framed message from a stream.
+
+    Args:
+        reader (asyncio.StreamReader): The stream.
+
+    Returns:
+        bytes | None: The JSON body, or None once the stream is closed.
+    """
+    try:
+        header = await reader.readexactly(HEADER.size)
+        return await reader.readexactly(HEADER.unpack(header)[0])
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+
+
+async def read_message(reader):
+    """
+    Reads one framed message from a stream.
+
+    Args:
+        reader (asyncio.StreamReader): The stream.
+
+    Returns:
+        dict | None: The message, or None once the stream is closed.
+    """
+    body = await read_frame(reader)
+    return None if body is None else json.loads(body)
+
+
+def snapshot(game, seats):
+    """
+    Captures the synchronised state of a game.
+
+    Args:
+        game (Game): The game.
+        seats (list[Player]): The game's players in their original order; a player's seat is their index.
+
+    Returns:
+        tuple: (player rows, property rows, fines, current seat). Each player row holds the fields in
+        `PLAYER_FIELDS`; each property row is (owner seat or -1, houses, mortgaged), by board position.
+    """
+    seat_of = {id(player): seat for seat, player in enumerate(seats)}
+    players = tuple(
+        (p.balance, p.position, int(p.in_jail), p.get_out_of_jail_cards, int(p in game.players)) for p in seats
+    )
+    props = {
+        position: (seat_of.get(id(prop.owner), -1), prop.houses, int(prop.mortgaged))
+        for position, prop in game.bank.properties.items()
+    }
+    current = seat_of.get(id(game.players[game.current_player_index]), -1) if game.players else -1
+    return players, props, game.fines, current
+
+
+def diff(old, new):
+    """
+    Computes the compact delta between two snapshots.
+
+    Args:
+        old (tuple | None): The snapshot the client already has, or None to send everything.
+        new (tuple): The current snapshot.
+
+    Returns:
+        dict: The changed fields only: "p" maps a seat to its changed player fields, "o" maps a board
+        position to its new (owner, houses, mortgaged) row, "f" is the fines pool and "c" the current seat.
+    """
+    players, props, fines, current = new
+    old_players, old_props, old_fines, old_current = old or ((), {}, None, None)
+    delta = {}
+
+    changed = {}
+    for seat, row in enumerate(players):
+        before = old_players[seat] if seat < len(old_players) else ()
+        fields = {name: value for k, (name, value) in enumerate(zip(PLAYER_FIELDS, row))
+                  if k >= len(before) or before[k] != value}
+        if fields:
+            changed[seat] = fields
+    if changed:
+        delta["p"] = changed
+
+    owners = {position: row for position, row in props.items() if old_props.get(position) != row}
+    if owners:
+        delta["o"] = owners
+    if fines != old_fines:
+        delta["f"] = fines
+    if current != old_current:
+        delta["c"] = current
+    return delta
+
+
+def apply(game, seats, delta):
+    """
+    Applies a delta to a replica of the game, so it can be drawn by the existing GUI elements.
+
+    Args:
+        game (Game): The replica game.
+        seats (list[Player]): The replica's players in seat order.
+        delta (dict): A delta produced by `diff` (JSON object keys arrive as strings).
+
+    Side Effects:
+        - Updates balances, positions, jail state, ownership, houses, mortgages, fines and the current player.
+        - Removes players who left the game from `game.players`.
+    """
+    for seat, fields in delta.get("p", {}).items():
+        player = seats[int(seat)]
+        player.balance = fields.get("b", player.balance)
+        player.position = fields.get("x", player.position)
+        player.in_jail = bool(fields.get("j", player.in_jail))
+        player.get_out_of_jail_cards = fields.get("g", player.get_out_of_jail_cards)
+        if fields.get("a") == 0 and player in game.players:
+            game.players.remove(player)
+            game.changes.publish("removed", player, True, False)
+
+    for position, (owner_seat, houses, mortgaged) in delta.get("o", {}).items():
+        prop = game.bank.properties[int(position)]
+        owner = seats[owner_seat] if owner_seat >= 0 else None
+        if prop.owner is not owner:
+            if prop.owner is not None and prop in prop.owner.owned_properties:
+                prop.owner.owned_properties.remove(prop)
+            if owner is not None:
+                owner.owned_properties.append(prop)
+            prop.owner = owner
+        prop.houses, prop.mortgaged = houses, bool(mortgaged)
+
+    if "f" in delta:
+        game.fines = delta["f"]
+    if delta.get("c", -1) >= 0 and seats[delta["c"]] in game.players:
+        game.current_player_index = game.players.index(seats[delta["c"]])
+    elif game.current_player_index >= len(game.players):
+        game.current_player_index = 0
+
+
+class TableFeed:
+    """
+    The state stream of one hosted table.
+
+    Changes are not sent as they happen: the feed remembers the last snapshot it sent and, at each
+    flush, sends one message with the delta since then plus the events and decision requests that
+    arrived in between. Several changes within a frame are therefore coalesced into one message.
+
+    Attributes:
+        table (GameTable): The table being streamed.
+        seats (list[Player]): The table's players in seat order.
+        clients (dict[str, asyncio.StreamWriter]): Connected clients by player name.
+        sent (tuple | None): The last snapshot sent.
+        events (list[str]): Events logged since the last flush.
+        requests (dict[str, DecisionRequest]): Decision requests for remote seats not sent yet.
+        bytes_sent (int): Bytes written to all clients.
+        messages_sent (int): Messages written to all clients.
+    """
+
+    def __init__(self, table):
+        """
+        Initialises a feed and starts collecting the table's events.
+
+        Args:
+            table (GameTable): The table being streamed.
+        """
+        self.table = table
+        self.seats = list(table.game.players)
+        self.clients = {}
+        self.sent = None
+        self.events = []
+        self.requests = {}
+        self.bytes_sent = 0
+        self.messages_sent = 0
+        table.game.event_listeners.append(self.events.append)
+
+    def full_state(self):
+        """
+        Builds the message a client receives when it joins.
+
+        Returns:
+            tuple: The message, with the roster of the game and every synchronised field, and the snapshot it was built from.
+        """
+        seats = self.seats
+        state = snapshot(self.table.game, seats)
+        return {
+            "t": time.monotonic(),
+            "roster": [[p.name, p.token, p.identity] for p in seats],
+            "d": diff(None, state),
+        }, state
+
+    def flush(self):
+        """
+        Sends the coalesced changes since the last flush to every client.
+
+        Returns:
+            int: The number of bytes sent.
+        """
+        if not self.clients:
+            self.events.clear()
+            return 0
+        state = snapshot(self.table.game, self.seats)
+        delta = diff(self.sent, state)
+        if not delta and not self.events and not self.requests:
+            return 0
+
+        message = {"t": time.monotonic(), "d": delta}
+        if self.events:
+            message["e"] = self.events[:]
+            self.events.clear()
+        frame = encode(message)
+        sent = 0
+        for name, writer in self.clients.items():
+            request = self.requests.pop(name, None)
+            data = frame if request is None else encode(dict(message, r=[request.kind, request.context]))
+            writer.write(data)
+            sent += len(data)
+        self.requests.clear()
+        self.sent = state
+        self.bytes_sent += sent
+        self.messages_sent += len(self.clients)
+        return sent
+
+
+class SyncServer:
+    """
+    Serves the tables of a `GameHost` to remote clients over TCP.
+
+    The server holds the authoritative games. A client joins a table as one of its human seats,
+    receives the full state once, then one delta message per frame in which something changed.
+    The seat's decision requests are sent in the same messages and the client's answers are passed
+    to `GameHost.submit`. Messages are length-prefixed compact JSON.
+
+    Attributes:
+        host (GameHost): The host running the games.
+        frame_rate (float): Flushes per second.
+        feeds (dict[int, TableFeed]): The feeds of the tables being streamed, by table id.
+    """
+
+    def __init__(self, host, frame_rate=30):
+        """
+        Initialises the server and routes the host's decision requests through it.
+
+        Args:
+            host (GameHost): The host running the games.
+            frame_rate (float): Flushes per second. Defaults to 30.
+        """
+        self.host = host
+        self.frame_rate = frame_rate
+        self.feeds = {}
+        self._server = None
+        self._ticker = None
+        self._handlers = set()
+        host.on_request = self.route_request
+
+    def feed(self, table):
+        """
+        Returns the feed of a table, creating it on first use.
+
+        Args:
+            table (GameTable): The table.
+
+        Returns:
+            TableFeed: The table's feed.
+        """
+        if table.table_id not in self.feeds:
+            self.feeds[table.table_id] = TableFeed(table)
+        return self.feeds[table.table_id]
+
+    def route_request(self, request):
+        """
+        Queues a decision request for the seat's client and flushes the table straight away,
+        since the table cannot move until the seat answers.
+
+        Args:
+            request (DecisionRequest): The request.
+        """
+        feed = self.feeds.get(request.table_id)
+        if feed is not None:
+            feed.requests[request.player.name] = request
+            feed.flush()
+
+    async def start(self, address="127.0.0.1", port=0):
+        """
+        Starts listening and flushing feeds.
+
+        Args:
+            address (str): The address to listen on. Defaults to localhost.
+            port (int): The port to listen on. Defaults to any free port.
+
+        Returns:
+            int: The port the server is listening on.
+        """
+        self._server = await asyncio.start_server(self.handle_client, address, port)
+        self._ticker = asyncio.get_running_loop().create_task(self.tick())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def tick(self):
+        """Flushes every feed once per frame."""
+        while True:
+            await asyncio.sleep(1 / self.frame_rate)
+            for feed in list(self.feeds.values()):
+                feed.flush()
+
+    async def handle_client(self, reader, writer):
+        """
+        Serves one client: joins it to its seat, then forwards its answers to the host.
+
+        The first message must be {"table": id, "player": name}.
+        """
+        self._handlers.add(asyncio.current_task())
+        hello = await read_message(reader)
+        table = self.host.tables.get(hello.get("table")) if hello else None
+        if table is None or hello.get("player") not in [p.name for p in table.game.players]:
+            writer.close()
+            return
+
+        name = hello["player"]
+        feed = self.feed(table)
+        message, state = feed.full_state()
+        pending = table.pending[0] if table.pending and table.pending[0].player.name == name else None
+        if pending is not None:
+            message["r"] = [pending.kind, pending.context]
+        frame = encode(message)
+        writer.write(frame)
+        feed.bytes_sent += len(frame)
+        feed.messages_sent += 1
+        feed.sent = feed.sent or state
+        feed.clients[name] = writer
+
+        try:
+            while (message := await read_message(reader)) is not None:
+                if "a" in message:
+                    self.host.submit(table.table_id, name, message["a"])
+        finally:
+            feed.clients.pop(name, None)
+            writer.close()
+            self._handlers.discard(asyncio.current_task())
+
+    def finish(self, table):
+        """
+        Sends a finished table's last changes and disconnects its clients.
+
+        Args:
+            table (GameTable): The finished table.
+        """
+        feed = self.feeds.pop(table.table_id, None)
+        if feed is not None:
+            feed.flush()
+            for writer in feed.clients.values():
+                writer.close()
+
+    async def close(self):
+        """Disconnects every client and stops the server."""
+        if self._ticker:
+            self._ticker.cancel()
+        for feed in list(self.feeds.values()):
+            self.finish(feed.table)
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+
+class SyncClient:
+    """
+    A remote seat: keeps a replica `Game` in sync with the server and answers its decision requests.
+
+    The replica is a normal `Game`, so the existing GUI elements can draw it; events received from
+    the server are logged on it, which also shows them in the GUI's event log when a UI is attached.
+
+    Attributes:
+        game (Game | None): The replica game, created from the roster in the first message.
+        seats (list[Player]): The replica's players in seat order.
+        player_name (str): The seat this client plays.
+        answer (Callable[[DecisionRequest], Awaitable] | None): Answers decision requests.
+        latencies (list[float]): Seconds between each message being sent and applied.
+        bytes_received (int): Bytes received from the server.
+    """
+
+    def __init__(self, player_name, answer=None):
+        """
+        Initialises a client.
+
+        Args:
+            player_name (str): The seat this client plays.
+            answer (Callable[[DecisionRequest], Awaitable] | None): Answers decision requests, e.g. a
+                `BotAgent` or a coroutine fed by the GUI.
+        """
+        self.player_name = player_name
+        self.answer = answer
+        self.game = None
+        self.seats = []
+        self.latencies = []
+        self.bytes_received = 0
+        self.table_id = None
+        self._writer = None
+
+    async def connect(self, table_id, address="127.0.0.1", port=0):
+        """
+        Joins a table and keeps the replica in sync until the server closes the connection.
+
+        Args:
+            table_id (int): The table to join.
+            address (str): The server's address.
+            port (int): The server's port.
+        """
+        reader, self._writer = await asyncio.open_connection(address, port)
+        self.table_id = table_id
+        self._writer.write(encode({"table": table_id, "player": self.player_name}))
+        try:
+            while (body := await read_frame(reader)) is not None:
+                self.bytes_received += HEADER.size + len(body)
+                message = json.loads(body)
+                self.receive(message)
+                if "r" in message and self.answer is not None:
+                    kind, context = message["r"]
+                    player = next(p for p in self.seats if p.name == self.player_name)
+                    answer = await self.answer(DecisionRequest(table_id, player, kind, context))
+                    self.send_answer(answer)
+        finally:
+            self._writer.close()
+
+    def receive(self, message):
+        """
+        Applies a message from the server to the replica.
+
+        Args:
+            message (dict): The message.
+        """
+        if "roster" in message:
+            names, tokens, identities = zip(*message["roster"])
+            self.game = Game(list(names), list(tokens), list(identities))
+            self.seats = list(self.game.players)
+        apply(self.game, self.seats, message["d"])
+        for event in message.get("e", ()):
+            self.game.log_event(event)
+        self.latencies.append(time.monotonic() - message["t"])
+
+    def send_answer(self, answer):
+        """
+        Sends an answer to the seat's pending decision.
+
+        Args:
+            answer: The answer (it must be JSON serialisable).
+        """
+        self._writer.write(encode({"a": answer}))
@@ -0,0 +1,243 @@
+import json
+import os
+
+import numpy as np
+
+from GameElements.board import BOARD_PATH
+from GameElements.ledger import CATEGORIES
+
+
+MANIFEST = "manifest.json"
+
+# The tables of a campaign and their columns, as (name, numpy dtype)
+TABLES = {
+    "games": (("game", "<u4"), ("seed", "<i8"), ("players", "u1"), ("turns", "<u4"), ("winner", "i1"),
+              ("bankruptcies", "u1")),
+    "turns": (("game", "<u4"), ("turn", "<u4"), ("seat", "u1"), ("moved", "u1"), ("balance", "<i4"),
+              ("net_worth", "<i4"), ("position", "u1"), ("properties", "u1"), ("houses", "u1")),
+    "payments": (("game", "<u4"), ("turn", "<u4"), ("category", "u1"), ("tile", "u1"), ("payer", "i1"),
+                 ("payee", "i1"), ("amount", "<i4")),
+    "owners": (("game", "<u4"), ("turn", "<u4"), ("tile", "u1"), ("owner", "i1")),
+    "bankruptcies": (("game", "<u4"), ("turn", "<u4"), ("seat", "u1")),
+    "auctions": (("game", "<u4"), ("turn", "<u4"), ("tile", "u1"), ("price", "<i4"), ("winner", "u1")),
+}
+
+# Seats recorded for the accounts of the ledger that are not players
+BANK_SEAT, POOL_SEAT = -1, -2
+
+
+class TraceWriter:
+    """
+    Streams the results of many headless games to disk as fixed-width numpy column files.
+
+    Each column of each table in `TABLES` is one raw little-endian file, `<table>/<column>.bin`,
+    that only ever grows at the end, and `manifest.json` lists the tables with their row counts
+    and the dtype and file of every column, the board the games were played on and the ledger's
+    `CATEGORIES`. Since every row of a column has the same width, the
+    files can be opened with `np.memmap` (see `open_campaign`) and sliced without reading them,
+    however large the campaign.
+
+    Tables:
+        - "games": one row per game: its number, seed, number of players, turns played, winner's
+          seat (-1 for a tie) and number of bankruptcies.
+        - "turns": one row per player still in the game per turn, from `Game.history`; `moved` is 1
+          for the player whose turn it was.
+        - "payments": one row per payment for a property (rent, purchases, auctions, building,
+          sales and mortgages) from the game's ledger, with the index of its category in
+          `CATEGORIES` and the payer's and payee's seats (`BANK_SEAT` for the bank).
+        - "owners": one row per change of a property's owner (`BANK_SEAT` when it goes back to the bank).
+        - "bankruptcies": one row per player who went bankrupt, with the turn they left.
+        - "auctions": one row per property sold at auction, with the price and the winner's seat.
+
+    Turns are numbered from 0 and an event's turn is the turn it happened in.
+
+    Rows are kept in memory until `flush_rows` of them are waiting and then appended to the files;
+    the manifest is only rewritten after the files, so it never counts rows that are not on disk.
+    Opening a directory that already has a manifest carries on the campaign in it, dropping anything
+    written after the manifest.
+
+    Args:
+        directory (str): Where the campaign is written.
+        flush_rows (int): Rows to keep in memory before writing them (default: 65536).
+        board (str): Path of the board data CSV the games are played on (default: `BOARD_PATH`).
+
+    Attributes:
+        directory (str): Where the campaign is written.
+        board (str): Path of the board data CSV the games are played on.
+        games (int): Number of games recorded, including those of earlier runs.
+    """
+
+    def __init__(self, directory, flush_rows=65536, board=BOARD_PATH):
+        """
+        Opens a campaign for writing, creating it if needed.
+
+        Args:
+            directory (str): Where the campaign is written.
+            flush_rows (int): Rows to keep in memory before writing them (default: 65536).
+            board (str): Path of the board data CSV the games are played on (default: `BOARD_PATH`).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the directory holds a campaign played on another board.
+        """
+        self.directory = directory
+        self.flush_rows = flush_rows
+        self.board = os.path.abspath(board)
+        self._rows = {table: 0 for table in TABLES}
+        path = os.path.join(directory, MANIFEST)
+        if os.path.exists(path):
+            with open(path) as file:
+                manifest = json.load(file)
+            if manifest.get("board", self.board) != self.board:
+                raise ValueError(f"{directory} holds a campaign played on {manifest['board']}")
+            self._rows.update({table: info["rows"] for table, info in manifest["tables"].items()})
+        self.games = self._rows["games"]
+
+        self._files = {}
+        self._pending = {table: [] for table in TABLES}
+        self._waiting = 0
+        for table, columns in TABLES.items():
+            os.makedirs(os.path.join(directory, table), exist_ok=True)
+            for column, dtype in columns:
+                file = open(os.path.join(directory, table, f"{column}.bin"), "ab")
+                file.truncate(self._rows[table] * np.dtype(dtype).itemsize)
+                self._files[table, column] = file
+        self._write_manifest()
+
+    def record_game(self, game, seed=None):
+        """
+        Adds a finished game to the campaign.
+
+        Args:
+            game (Game): The game, with its turn history and ledger.
+            seed (int | None): The seed the game was played with, if any (recorded as -1 otherwise).
+
+        Returns:
+            int: The game's number in the campaign.
+        """
+        number = self.games
+        history = game.history
+        seats = history.seats
+        turns = len(history)
+
+        if len(game.players) == 1:
+            winner = seats.index(game.players[0])
+        else:
+            leaders = game.net_worth.leaders()
+            winner = seats.index(leaders[0]) if len(leaders) == 1 else -1
+        self._add("games", number, [-1 if seed is None else seed], [len(seats)], [turns], [winner],
+                  [len(history.left)])
+
+        turn = np.repeat(np.arange(turns), len(seats))
+        seat = np.tile(np.arange(len(seats)), turns)
+        playing = turn < np.array([history.left.get(player, turns) for player in seats])[seat]
+        moved = seat == np.repeat(history.movers(), len(seats))
+        self._add("turns", number, turn[playing], seat[playing], moved[playing],
+                  *(history.series(field).ravel()[playing] for field in ("balance", "net_worth", "position",
+                                                                        "properties", "houses")))
+
+        entries = game.ledger.entries()
+        entry_turns = np.searchsorted(history.ledger_marks(), np.arange(len(entries)), side="right")
+        seat_of = np.array([BANK_SEAT, POOL_SEAT] + [seats.index(account) if account in seats else BANK_SEAT
+                                                     for account in game.ledger.accounts[2:]])
+        tied = entries["tile"] > 0
+        payments = entries[tied]
+        self._add("payments", number, entry_turns[tied], payments["category"], payments["tile"],
+                  seat_of[payments["payer"]], seat_of[payments["payee"]], payments["amount"])
+
+        if history.owners:
+            owner_turns, tiles, owners = zip(*history.owners)
+            self._add("owners", number, owner_turns, tiles, owners)
+
+        self._add("bankruptcies", number, list(history.left.values()), [seats.index(p) for p in history.left])
+
+        auctions = payments["category"] == CATEGORIES.index("auction")
+        sold = payments[auctions]
+        self._add("auctions", number, entry_turns[tied][auctions], sold["tile"], sold["amount"],
+                  seat_of[sold["payer"]])
+
+        self.games += 1
+        if self._waiting >= self.flush_rows:
+            self.flush()
+        return number
+
+    def _add(self, table, game, *columns):
+        """Queues rows for a table, given every column but the game number."""
+        count = len(columns[0])
+        if count:
+            self._pending[table].append((np.full(count, game), *columns))
+            self._waiting += count
+
+    def flush(self):
+        """
+        Writes the queued rows to the column files and updates the manifest.
+
+        Returns:
+            None
+        """
+        for table, batches in self._pending.items():
+            if not batches:
+                continue
+            for i, (column, dtype) in enumerate(TABLES[table]):
+                values = np.concatenate([np.asarray(batch[i]) for batch in batches]).astype(dtype)
+                values.tofile(self._files[table, column])
+            self._rows[table] += sum(len(batch[0]) for batch in batches)
+            batches.clear()
+        self._waiting = 0
+        for file in self._files.values():
+            file.flush()
+        self._write_manifest()
+
+    def _write_manifest(self):
+        """Replaces the manifest with one describing the rows written so far."""
+        manifest = {"format": 1, "board": self.board, "categories": list(CATEGORIES), "tables": {
+            table: {"rows": self._rows[table],
+                    "columns": {column: {"dtype": np.dtype(dtype).str, "file": f"{table}/{column}.bin"}
+                                for column, dtype in columns}}
+            for table, columns in TABLES.items()}}
+        path = os.path.join(self.directory, MANIFEST)
+        with open(path + ".tmp", "w") as file:
+            json.dump(manifest, file, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def close(self):
+        """
+        Writes everything queued and closes the column files.
+
+        Returns:
+            None
+        """
+        self.flush()
+        for file in self._files.values():
+            file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_campaign(directory):
+    """
+    Opens a campaign written by a `TraceWriter` without reading it into memory.
+
+    Args:
+        directory (str): The campaign's directory.
+
+    Returns:
+        dict[str, dict[str, numpy.ndarray]]: Every table's columns by name, as read-only memory maps
+        of the rows listed in the manifest (empty arrays for empty tables).
+    """
+    with open(os.path.join(directory, MANIFEST)) as file:
+        manifest = json.load(file)
+    tables = {}
+    for table, info in manifest["tables"].items():
+        rows = info["rows"]
+        tables[table] = {
+            column: np.memmap(os.path.join(directory, spec["file"]), spec["dtype"], "r", shape=(rows,))
+            if rows else np.empty(0, spec["dtype"])
+            for column, spec in info["columns"].items()}
+    return tables
@@ -0,0 +1,427 @@
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+
+BOARD_SIZE = 40
+JAIL_POSITION = 11
+GO_TO_JAIL_POSITION = 31
+
+TradeOffer = namedtuple(
+    "TradeOffer",
+    ["proposer", "receiver", "offer_properties", "request_properties", "offer_money", "request_money", "surplus"],
+)
+TradeOffer.__doc__ = """
+A candidate trade found by the `TradeEngine`, in the same terms as `Game.execute_trade`.
+
+The proposer hands over `offer_properties` and `offer_money` and receives `request_properties`
+and `request_money`. `surplus` is the combined gain in equity for both players; the cash leg
+is chosen so that each side gets half of it.
+"""
+
+
+@lru_cache(maxsize=1)
+def landing_probabilities():
+    """
+    Computes the long-run probability of a turn ending on each board position.
+
+    The board is modelled as a Markov chain over the 40 tiles, moved by the sum of two dice.
+    Landing on "Go to Jail" sends the token to Jail, as does rolling three doubles in a row
+    (a 1 in 216 chance every turn). Card effects are not modelled. The stationary distribution
+    is computed once and cached.
+
+    Returns:
+        numpy.ndarray: Array of 41 probabilities indexed by board position (index 0 is unused).
+    """
+    rolls = np.array([d1 + d2 for d1 in range(1, 7) for d2 in range(1, 7)])
+    roll_probability = np.bincount(rolls, minlength=13) / 36.0
+
+    tiles = np.arange(BOARD_SIZE)
+    transition = np.zeros((BOARD_SIZE, BOARD_SIZE))
+    for roll in range(2, 13):
+        destination = (tiles + roll) % BOARD_SIZE
+        destination[destination == GO_TO_JAIL_POSITION - 1] = JAIL_POSITION - 1
+        np.add.at(transition, (tiles, destination), roll_probability[roll])
+
+    speeding = 1 / 216
+    transition *= 1 - speeding
+    transition[:, JAIL_POSITION - 1] += speeding
+
+    eigenvalues, eigenvectors = np.linalg.eig(transition.T)
+    stationary = np.real(eigenvectors[:, np.argmin(np.abs(eigenvalues - 1))])
+    stationary /= stationary.sum()
+    return np.concatenate(([0.0], stationary))
+
+
+class EquityTable:
+    """
+    Precomputed per-property equity used to value any bundle of properties.
+
+    For every property the table stores the expected rent collected per opponent turn, as a
+    function of how many properties of its group the owner holds. Colour groups earn their base
+    rent until the set is complete. A complete set is worth the best of double rent or renting
+    with houses at each level, net of the cost of building them over the valuation horizon.
+    Stations and utilities follow the usual count-based rent (utilities assume an average roll of 7).
+
+    Attributes:
+        positions (numpy.ndarray): Board position of each property, in table order.
+        index (dict[int, int]): Maps a board position to its row in the table.
+        prices (numpy.ndarray): Purchase price of each property.
+        group_ids (numpy.ndarray): Group number of each property.
+        group_sizes (numpy.ndarray): Number of properties in each group.
+        rent_by_count (numpy.ndarray): (properties x 5) expected rent per landing, by group count owned.
+        landing (numpy.ndarray): Probability of an opponent turn ending on each property.
+    """
+    STATION_RENT = [0, 25, 50, 100, 200]
+    UTILITY_MULTIPLIER = [0, 4, 10]
+    AVERAGE_ROLL = 7
+    STEPS = np.array([-1, 0, 1])[:, None, None]  # one fewer, as many and one more of a group owned
+
+    def __init__(self, properties, horizon=40):
+        """
+        Builds the equity table for a set of board properties.
+
+        Args:
+            properties (Iterable[Property]): The properties on the board.
+            horizon (int): Number of opponent turns the rent equity is counted over. Defaults to 40.
+        """
+        props = sorted(properties, key=lambda p: p.position)
+        self.horizon = horizon
+        self.positions = np.array([p.position for p in props])
+        self.index = {p.position: i for i, p in enumerate(props)}
+        self.prices = np.array([p.price for p in props], dtype=float)
+
+        groups = list(dict.fromkeys(p.group for p in props))
+        self.group_ids = np.array([groups.index(p.group) for p in props])
+        self.group_sizes = np.bincount(self.group_ids)
+        self.group_matrix = np.eye(len(groups))[self.group_ids]
+        self.landing = landing_probabilities()[self.positions]
+
+        self.rent_by_count = np.zeros((len(props), 5))
+        for i, p in enumerate(props):
+            if p.group == "Station":
+                self.rent_by_count[i] = self.STATION_RENT
+            elif p.group == "Utilities":
+                self.rent_by_count[i, :3] = np.array(self.UTILITY_MULTIPLIER) * self.AVERAGE_ROLL
+            else:
+                size = self.group_sizes[self.group_ids[i]]
+                self.rent_by_count[i, 1:size] = p.rent[0]
+                self.rent_by_count[i, size] = self.complete_set_rent(p, self.landing[i])
+        self._padded_rent = self.rent_by_count[:, [0, *range(5), 4]]
+
+    def complete_set_rent(self, property, landing):
+        """
+        Returns the per-landing rent a complete colour set is worth, allowing for building houses.
+
+        Each house level is scored as its rent minus the cost of the houses spread over the expected
+        number of landings in the horizon, and the best level is kept.
+
+        Args:
+            property (Property): A property from a colour group.
+            landing (float): Probability of an opponent turn ending on the property.
+
+        Returns:
+            float: The effective rent per landing once the set is complete.
+        """
+        landings = max(landing * self.horizon, 1e-9)
+        levels = [property.rent[0] * 2] + [
+            property.rent[h] - h * property.house_cost / landings for h in range(1, len(property.rent))
+        ]
+        return max(levels)
+
+    def values(self, masks, opponents, mortgaged=None):
+        """
+        Values many property bundles in one pass.
+
+        A mortgaged property only counts its rent: lifting the mortgage costs the mortgage value it
+        would otherwise add.
+
+        Args:
+            masks (numpy.ndarray): (bundles x properties) boolean ownership matrix.
+            opponents (int): Number of opponents who can land on the bundle's properties.
+            mortgaged (numpy.ndarray | None): Boolean vector of the properties that are mortgaged.
+
+        Returns:
+            numpy.ndarray: The equity of each bundle in pounds: rent expected over the horizon plus mortgage value.
+        """
+        masks = np.asarray(masks, dtype=float)
+        counts = (masks @ self.group_matrix).astype(int)[:, self.group_ids]
+        rent = self.rent_by_count[np.arange(len(self.positions)), counts]
+        mortgage_value = self.prices / 2 if mortgaged is None else np.where(mortgaged, 0.0, self.prices / 2)
+        equity = rent * self.landing * (self.horizon * opponents) + mortgage_value
+        return (masks * equity).sum(axis=1)
+
+    def deltas(self, masks, opponents, mortgaged=None):
+        """
+        Computes how each player's equity changes if they give away or receive any single property.
+
+        Only the property's own group is revalued, at one fewer or one more property owned, so every
+        one-property change for every player is found at once without valuing whole bundles.
+
+        Args:
+            masks (numpy.ndarray): (players x properties) boolean ownership matrix.
+            opponents (int): Number of opponents who can land on the properties.
+            mortgaged (numpy.ndarray | None): Boolean vector of the properties that are mortgaged.
+
+        Returns:
+            tuple[numpy.ndarray]: (give, receive, held), each (players x properties): the change in
+                equity from giving away each owned property, from receiving each property not owned,
+                and each property's equity at the number of its group the player owns now.
+        """
+        masks = np.asarray(masks, dtype=bool)
+        mortgage_value = self.prices / 2 if mortgaged is None else np.where(mortgaged, 0.0, self.prices / 2)
+        worth = self._padded_rent * (self.landing * (self.horizon * opponents))[:, None] + mortgage_value[:, None]
+        owned = (masks @ self.group_matrix).astype(int)[:, self.group_ids]
+
+        # Each property's equity at one fewer, as many and one more of its group owned (an unused
+        # count of -1 or one past a full group reads the nearest real one), then summed per group
+        equity = worth[np.arange(len(self.positions)), owned + self.STEPS + 1]
+        group = ((masks * equity) @ self.group_matrix)[:, :, self.group_ids]
+        give = group[0] - equity[0] - group[1]
+        receive = group[2] + equity[2] - group[1]
+        return give, receive, equity[1]
+
+
+@lru_cache(maxsize=None)
+def board_equity_table(board, horizon=40):
+    """
+    Returns the equity table of a board model, building it once per model and horizon.
+
+    The table only depends on the board's static data, so every game on the same board shares it.
+
+    Args:
+        board (BoardModel): The board model.
+        horizon (int): Number of opponent turns the rent equity is counted over. Defaults to 40.
+
+    Returns:
+        EquityTable: The shared equity table.
+    """
+    return EquityTable(board.new_properties().values(), horizon)
+
+
+class TradeEngine:
+    """
+    Values trades between players and searches for mutually beneficial ones.
+
+    Properties in a group that has houses built on it are never traded. Scored candidates are kept
+    until a property changes owner, is mortgaged or redeemed, or gets its first house or loses its
+    last, so while the board stays as it was a search only redoes the cash checks.
+
+    Attributes:
+        bank (Bank): The bank holding the board's properties.
+        table (EquityTable): The equity table of the bank's board, shared by every game on that board.
+        reserve (int): Cash a player must keep after paying for a trade.
+        min_surplus (float): Smallest combined gain a candidate trade must produce.
+    """
+
+    def __init__(self, bank, horizon=40, reserve=200, min_surplus=20):
+        """
+        Initialises the trade engine with the equity table of the bank's board.
+
+        Args:
+            bank (Bank): The bank holding the board's properties.
+            horizon (int): Number of opponent turns the rent equity is counted over. Defaults to 40.
+            reserve (int): Cash a player must keep after paying for a trade. Defaults to 200.
+            min_surplus (float): Smallest combined gain a candidate trade must produce. Defaults to 20.
+        """
+        self.bank = bank
+        self.table = board_equity_table(bank.board, horizon)
+        self.reserve = reserve
+        self.min_surplus = min_surplus
+        self._properties = [bank.properties[position] for position in self.table.positions.tolist()]
+        self._group_list = self.table.group_ids.tolist()
+        self._group_ids = np.append(self.table.group_ids, -1)  # row -1 is no property, in no group
+        self._scored = {}
+
+    def ownership(self, player):
+        """
+        Returns the ownership mask of a player's properties.
+
+        Args:
+            player (Player): The player.
+
+        Returns:
+            numpy.ndarray: Boolean vector over the table's properties.
+        """
+        mask = np.zeros(len(self.table.positions), dtype=bool)
+        for prop in player.owned_properties:
+            if prop.position in self.table.index:
+                mask[self.table.index[prop.position]] = True
+        return mask
+
+    def mortgaged(self):
+        """
+        Returns which of the board's properties are mortgaged.
+
+        Returns:
+            numpy.ndarray: Boolean vector over the table's properties.
+        """
+        return np.array([prop.mortgaged for prop in self._properties])
+
+    def tradable(self, player):
+        """
+        Returns the properties a player may trade: those in groups without any houses.
+
+        Args:
+            player (Player): The player.
+
+        Returns:
+            list[Property]: The player's tradable properties.
+        """
+        built = {p.group for p in player.owned_properties if p.houses > 0}
+        return [p for p in player.owned_properties if p.group not in built and p.position in self.table.index]
+
+    def trade_gain(self, player, incoming, outgoing, money, opponents):
+        """
+        Computes how much a player's equity changes with a trade.
+
+        Args:
+            player (Player): The player being evaluated.
+            incoming (list[Property]): Properties the player receives.
+            outgoing (list[Property]): Properties the player gives away.
+            money (int): Net cash the player receives (negative if they pay).
+            opponents (int): Number of opponents in the game.
+
+        Returns:
+            float: The change in the player's equity.
+        """
+        before = self.ownership(player)
+        after = before.copy()
+        after[[self.table.index[p.position] for p in outgoing]] = False
+        after[[self.table.index[p.position] for p in incoming]] = True
+        old_value, new_value = self.table.values(np.stack([before, after]), opponents, self.mortgaged())
+        return new_value - old_value + money
+
+    def candidate_trades(self, players, proposer=None, opponents=None):
+        """
+        Scores every one-for-one swap and single-property sale between each pair of players in one vectorized pass.
+
+        The cash leg of each candidate splits its surplus evenly between both players. Candidates
+        that leave the paying player below the cash reserve, or that gain less than `min_surplus`,
+        are dropped.
+
+        Args:
+            players (list[Player]): The players who may trade.
+            proposer (Player | None): If given, only trades proposed by this player are returned.
+            opponents (int | None): Number of opponents in the game, who can land on the traded properties.
+                Defaults to the number of other players in `players`; pass it when some players of the
+                game cannot trade, so trades are valued as the receiver's `bot_trade` values them.
+
+        Returns:
+            list[TradeOffer]: The candidate trades, best surplus first.
+        """
+        scored, viable = self._viable(players, proposer, opponents)
+        return [self._offer(players, scored, k) for k in viable]
+
+    def _viable(self, players, proposer, opponents):
+        """Returns the scored candidates and the indices of the viable ones, best surplus first."""
+        if opponents is None:
+            opponents = max(len(players) - 1, 1)
+        key = (tuple(players), proposer, opponents)
+        state = [(prop.owner, prop.mortgaged, prop.houses > 0) for prop in self._properties]
+        cached = self._scored.get(key)
+        if cached is None or cached[0] != state:
+            cached = self._scored[key] = (state, self._score(players, proposer, opponents, state))
+        scored = cached[1]
+        pair_a, pair_b, _, _, surplus, cash = scored
+
+        balances = np.array([p.balance for p in players])
+        affordable = np.where(cash >= 0, balances[pair_a] - cash >= self.reserve, balances[pair_b] + cash >= self.reserve)
+        viable = np.flatnonzero((surplus >= self.min_surplus) & affordable)
+        return scored, viable[np.argsort(-surplus[viable], kind="stable")]
+
+    def _score(self, players, proposer, opponents, state):
+        """
+        Scores every candidate trade between the players, regardless of their cash.
+
+        `state` holds (owner, mortgaged, has houses) for each of the table's properties. Pairs of
+        players without a group in common are skipped while `min_surplus` is positive.
+
+        Returns:
+            tuple[numpy.ndarray]: (pair_a, pair_b, give_a, give_b, surplus, cash): the proposing and
+                receiving players' indices, the table rows they give (-1 for none), the combined gain
+                and the cash paid by a to b, one entry per candidate.
+        """
+        seats = {player: seat for seat, player in enumerate(players)}
+        owners = [seats.get(owner, -1) for owner, _, _ in state]
+        built = {(seat, group) for seat, group, (_, _, houses) in zip(owners, self._group_list, state) if houses}
+        tradable = [[-1] for _ in players]
+        for row, (seat, group) in enumerate(zip(owners, self._group_list)):
+            if seat >= 0 and (seat, group) not in built:
+                tradable[seat].insert(-1, row)
+        masks = np.array(owners) == np.arange(len(players))[:, None]
+        mortgaged = np.array([mortgaged for _, mortgaged, _ in state])
+
+        sharing = self._sharing_pairs(owners) if self.min_surplus > 0 else None
+        pair_a, pair_b, give_a, give_b = [], [], [], []
+        for a, player_a in enumerate(players):
+            if proposer is not None and player_a is not proposer:
+                continue
+            for b in range(len(players)):
+                if a == b or (sharing is not None and (a, b) not in sharing):
+                    continue
+                count = len(tradable[a]) * len(tradable[b]) - 1  # every pairing but nothing for nothing
+                give_a += [i for i in tradable[a] for _ in tradable[b]][:-1]
+                give_b += (tradable[b] * len(tradable[a]))[:-1]
+                pair_a += [a] * count
+                pair_b += [b] * count
+
+        give_a, give_b = np.array(give_a, dtype=int), np.array(give_b, dtype=int)
+        pair_a, pair_b = np.array(pair_a, dtype=int), np.array(pair_b, dtype=int)
+        if not len(give_a):
+            return pair_a, pair_b, give_a, give_b, np.zeros(0), np.zeros(0, dtype=int)
+
+        # A zero column at the end makes row -1 (giving nothing) count for nothing
+        deltas = np.zeros((3, len(players), len(self.table.positions) + 1))
+        deltas[:, :, :-1] = self.table.deltas(masks, opponents, mortgaged)
+        give, receive, held = deltas
+        gain_a = give[pair_a, give_a] + receive[pair_a, give_b]
+        gain_b = give[pair_b, give_b] + receive[pair_b, give_a]
+        # A swap within one group leaves both players' counts as they were
+        same = np.flatnonzero(self._group_ids[give_a] == self._group_ids[give_b])
+        if len(same):
+            a_row, b_row = give_a[same], give_b[same]
+            gain_a[same] = held[pair_a[same], b_row] - held[pair_a[same], a_row]
+            gain_b[same] = held[pair_b[same], a_row] - held[pair_b[same], b_row]
+        cash = np.round((gain_a - gain_b) / 2).astype(int)  # paid by a to b
+        return pair_a, pair_b, give_a, give_b, gain_a + gain_b, cash
+
+    def _sharing_pairs(self, owners):
+        """
+        Returns the pairs of seats that own properties in the same group, both ways round.
+
+        Rent never falls as more of a group is owned, so moving a property to a player who owns none
+        of its group cannot gain the two players anything: only pairs sharing a group can gain from a trade.
+        """
+        seats_by_group = {}
+        for seat, group in zip(owners, self._group_list):
+            if seat >= 0:
+                seats_by_group.setdefault(group, set()).add(seat)
+        return {(a, b) for seats in seats_by_group.values() for a in seats for b in seats if a != b}
+
+    def _offer(self, players, scored, k):
+        """Builds the `TradeOffer` of one scored candidate."""
+        pair_a, pair_b, give_a, give_b, surplus, cash = scored
+        props = self._properties
+        return TradeOffer(
+            players[pair_a[k]], players[pair_b[k]],
+            [props[give_a[k]]] if give_a[k] >= 0 else [],
+            [props[give_b[k]]] if give_b[k] >= 0 else [],
+            max(int(cash[k]), 0), max(-int(cash[k]), 0), float(surplus[k]),
+        )
+
+    def best_trade(self, proposer, players, opponents=None):
+        """
+        Finds the best trade a player can propose to the other players.
+
+        Args:
+            proposer (Player): The player proposing the trade.
+            players (list[Player]): The players who may trade, including the proposer.
+            opponents (int | None): Number of opponents in the game. Defaults to the number of other players in `players`.
+
+        Returns:
+            TradeOffer | None: The trade with the largest surplus, or None if there is no viable trade.
+        """
+        scored, viable = self._viable(players, proposer, opponents)
+        return self._offer(players, scored, viable[0]) if len(viable) else None
@@ -0,0 +1,83 @@
+import pygame
+
+
+class Backdrop:
+    """
+    The static layer of a menu screen: background image, dim overlay and fixed text, composited once.
+
+    Blending a full-window translucent overlay over the background costs a fresh multi-megabyte
+    surface and an alpha blend on every frame. The backdrop does that work once, into an opaque
+    surface in the display's pixel format, and each frame only copies it to the screen. It is
+    composited again only when its layout changes: a different screen size or a different `key`,
+    which the owning screen derives from whatever its static content depends on.
+
+    Args:
+        image (pygame.Surface): The background image; it is scaled to the screen.
+        dim (int): Opacity of the black overlay over the image, 0-255 (default: 150).
+
+    Attributes:
+        image (pygame.Surface): The background image.
+        dim (int): Opacity of the overlay.
+        layer (pygame.Surface | None): The composited backdrop, once drawn.
+        builds (int): Number of times the backdrop has been composited.
+    """
+
+    def __init__(self, image, dim=150):
+        """
+        Initializes the backdrop without compositing it.
+
+        Args:
+            image (pygame.Surface): The background image; it is scaled to the screen.
+            dim (int): Opacity of the black overlay over the image, 0-255 (default: 150).
+
+        Returns:
+            None
+        """
+        self.image = image
+        self.dim = dim
+        self.layer = None
+        self.key = None
+        self.builds = 0
+
+    def draw(self, screen, key=None, decorate=None):
+        """
+        Copies the backdrop to the screen, compositing it first if its layout has changed.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+            key (Hashable): Identifies the static content; a different key composites the backdrop again.
+            decorate (Callable[[pygame.Surface], None] | None): Draws the static content (e.g. titles and
+                labels) over the dimmed background when the backdrop is composited.
+
+        Returns:
+            None
+        """
+        layout = (screen.get_size(), key)
+        if self.layer is None or layout != self.key:
+            self.layer = self.compose(screen.get_size(), decorate)
+            self.key = layout
+        screen.blit(self.layer, (0, 0))
+
+    def compose(self, size, decorate=None):
+        """
+        Composites the background, overlay and static content.
+
+        Args:
+            size (tuple[int, int]): The screen size.
+            decorate (Callable[[pygame.Surface], None] | None): Draws the static content.
+
+        Returns:
+            pygame.Surface: The opaque backdrop.
+        """
+        layer = pygame.transform.scale(self.image, size).convert()
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, self.dim))
+        layer.blit(overlay, (0, 0))
+        if decorate:
+            decorate(layer)
+        self.builds += 1
+        return layer
+
+    def invalidate(self):
+        """Makes the next `draw` composite the backdrop again."""
+        self.layer = None
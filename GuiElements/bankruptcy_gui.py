@@ -22,6 +22,8 @@ class BankruptcyPopup:
         max_scroll (int): The maximum scroll value for the property list.
         buttons (dict): A dictionary mapping button actions to their screen Rects.
         colors (dict): Centralized color definitions for UI elements.
+        panel (pygame.Surface | None): The popup without its buttons, rendered again only when the
+            player's version (balance and properties), the selection or the scroll position changes.
     """
     def __init__(self, screen, player, amount_due, creditor=None):
         """
@@ -44,6 +46,10 @@ class BankruptcyPopup:
 
         self.font = pygame.font.Font(None, 30)
         self.small_font = pygame.font.Font(None, 24) 
+        self.button_font = pygame.font.Font(None, 24) # Keep button font consistent
+        self.popup_rect = pygame.Rect(200, 100, 800, 550)
+        self.panel = None
+        self.panel_key = None
         self.selected_property = None
         self.property_rects = []
 
@@ -80,72 +86,23 @@ class BankruptcyPopup:
             None
 
         Side Effects:
-            Updates the popup visuals on the screen.
+            Copies the cached panel to the screen, rendering it first if it is out of date, and
+            draws the action buttons with their hover state over it.
         """
         if not self.visible:
             return
 
         mouse_pos = pygame.mouse.get_pos()
 
-        popup_rect = pygame.Rect(200, 100, 800, 550)
-        pygame.draw.rect(self.screen, self.colors["popup_bg"], popup_rect)
-        pygame.draw.rect(self.screen, self.colors["border"], popup_rect, 3)
-
-        title = self.font.render("Bankruptcy: Raise Funds", True, self.colors["text_light"])
-        self.screen.blit(title, (popup_rect.x + 20, popup_rect.y + 10))
-
-        self.screen.blit(self.font.render(f"Amount Due: £{self.amount_due}", True, self.colors["text_error"]), (popup_rect.x + 20, popup_rect.y + 50))
-        self.screen.blit(self.font.render(f"Current Balance: £{self.player.balance}", True, self.colors["text_light"]), (popup_rect.x + 20, popup_rect.y + 80))
-        still_needed = max(0, self.amount_due - self.player.balance)
-        self.screen.blit(self.font.render(f"Still Needed: £{still_needed}", True, self.colors["text_warning"]), (popup_rect.x + 20, popup_rect.y + 110))
-
-        self.property_rects.clear()
-        list_area_rect = pygame.Rect(popup_rect.x + 10, popup_rect.y + 150, 420, 380)
-        start_y = list_area_rect.y + 10 - self.scroll_offset
-        max_y_in_list = start_y
-
-        original_clip = self.screen.get_clip()
-
-        for prop in self.player.owned_properties:
-            prop_rect = pygame.Rect(list_area_rect.x + 10, start_y, 400, 40)
-            self.property_rects.append((prop_rect, prop))
-
-            if prop == self.selected_property:
-                bg_color = self.colors["prop_selected_bg"]
-            else:
-                bg_color = self.colors["prop_default_bg"]
-
-            visible_rect = prop_rect.clip(list_area_rect)
-            if visible_rect.height > 0:
-
-                pygame.draw.rect(self.screen, bg_color, visible_rect)
-                pygame.draw.rect(self.screen, self.colors["border"], prop_rect, 2)
-
-                info = f"{prop.name} | {'MORTGAGED' if prop.mortgaged else 'Active'} | Houses: {prop.houses}"
-
-                # Choose font based on mortgaged status
-                current_font = self.small_font if prop.mortgaged else self.font
-
-                text_surface = current_font.render(info, True, self.colors["text_light"])
-                text_pos_rect = text_surface.get_rect(midleft = (prop_rect.x + 10, prop_rect.centery))
-
-                clip_rect_for_text = prop_rect.clip(list_area_rect)
-                self.screen.set_clip(clip_rect_for_text)
-
-                self.screen.blit(text_surface, text_pos_rect)
-
-                self.screen.set_clip(original_clip)
-
-            start_y += 50
-            max_y_in_list = max(max_y_in_list, prop_rect.bottom)
-
-        self.screen.set_clip(original_clip)
-
-        content_height = max_y_in_list - (list_area_rect.y + 10 - self.scroll_offset)
-        self.max_scroll = max(0, content_height - list_area_rect.height)
+        popup_rect = self.popup_rect
+        key = (self.player.version, self.selected_property, self.scroll_offset, self.amount_due)
+        if self.panel is None or key != self.panel_key:
+            self.render_panel()
+            self.panel_key = key
+        self.screen.blit(self.panel, popup_rect)
 
         self.buttons.clear()
-        button_font = pygame.font.Font(None, 24) # Keep button font consistent
+        button_font = self.button_font
         actions_x = popup_rect.x + 450
         actions_y = popup_rect.y + 160
 
@@ -216,6 +173,73 @@ class BankruptcyPopup:
             self.tip_logged = True
 
 
+    def render_panel(self):
+        """
+        Renders the popup's background, the amounts and the property list into the cached panel.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Side Effects:
+            - Updates the property rectangles used for clicks and the maximum scroll offset.
+        """
+        popup_rect = self.popup_rect
+        if self.panel is None:
+            self.panel = pygame.Surface(popup_rect.size)
+        panel = self.panel
+        local = popup_rect.move(-popup_rect.x, -popup_rect.y)  # the popup in the panel's coordinates
+        pygame.draw.rect(panel, self.colors["popup_bg"], local)
+        pygame.draw.rect(panel, self.colors["border"], local, 3)
+
+        title = self.font.render("Bankruptcy: Raise Funds", True, self.colors["text_light"])
+        panel.blit(title, (20, 10))
+
+        panel.blit(self.font.render(f"Amount Due: £{self.amount_due}", True, self.colors["text_error"]), (20, 50))
+        panel.blit(self.font.render(f"Current Balance: £{self.player.balance}", True, self.colors["text_light"]), (20, 80))
+        still_needed = max(0, self.amount_due - self.player.balance)
+        panel.blit(self.font.render(f"Still Needed: £{still_needed}", True, self.colors["text_warning"]), (20, 110))
+
+        self.property_rects.clear()
+        list_area_rect = pygame.Rect(10, 150, 420, 380)
+        start_y = list_area_rect.y + 10 - self.scroll_offset
+        max_y_in_list = start_y
+
+        for prop in self.player.owned_properties:
+            prop_rect = pygame.Rect(list_area_rect.x + 10, start_y, 400, 40)
+            self.property_rects.append((prop_rect.move(popup_rect.topleft), prop))
+
+            if prop == self.selected_property:
+                bg_color = self.colors["prop_selected_bg"]
+            else:
+                bg_color = self.colors["prop_default_bg"]
+
+            visible_rect = prop_rect.clip(list_area_rect)
+            if visible_rect.height > 0:
+
+                pygame.draw.rect(panel, bg_color, visible_rect)
+                pygame.draw.rect(panel, self.colors["border"], prop_rect, 2)
+
+                info = f"{prop.name} | {'MORTGAGED' if prop.mortgaged else 'Active'} | Houses: {prop.houses}"
+
+                # Choose font based on mortgaged status
+                current_font = self.small_font if prop.mortgaged else self.font
+
+                text_surface = current_font.render(info, True, self.colors["text_light"])
+                text_pos_rect = text_surface.get_rect(midleft = (prop_rect.x + 10, prop_rect.centery))
+
+                panel.set_clip(prop_rect.clip(list_area_rect))
+                panel.blit(text_surface, text_pos_rect)
+                panel.set_clip(None)
+
+            start_y += 50
+            max_y_in_list = max(max_y_in_list, prop_rect.bottom)
+
+        content_height = max_y_in_list - (list_area_rect.y + 10 - self.scroll_offset)
+        self.max_scroll = max(0, content_height - list_area_rect.height)
+
     def handle_event(self, event):
         """
         Handles user input and interaction with the popup interface.
@@ -315,15 +339,15 @@ class BankruptcyPopup:
                 log_event(f"{self.player.name} attempted to pay but doesn't have enough funds.")
                 return
 
-            self.player.balance -= self.amount_due
+            payee = game.bank
             debt_paid_to = "the Bank"
             if self.creditor:
                 if hasattr(self.creditor, 'balance'):
-                     self.creditor.balance += self.amount_due
+                     payee = self.creditor
                      debt_paid_to = self.creditor.name if hasattr(self.creditor, 'name') else 'Creditor'
                 else:
                     log_event(f"Creditor object invalid or missing 'balance' attribute.")
-
+            game.ledger.transfer(self.player, payee, self.amount_due, "debt")
 
             log_event(f"{self.player.name} paid £{self.amount_due} to {debt_paid_to}.")
             self.visible = False
@@ -1,32 +1,28 @@
 import pygame
-import pandas as pd
-import csv
-import os
 
+from GameElements.board import BOARD_PATH, load_board
 from GuiElements.spaces_gui import SpacesGUI
 
 
 
 def load_board_data_from_csv(csv_path):
-    df = pd.read_csv(csv_path, encoding="ISO-8859-1", skiprows=3)
-    df = df.rename(columns={
-        df.columns[0]: "Position",
-        df.columns[1]: "Name",
-        df.columns[3]: "Group",
-        df.columns[7]: "Price",
-    })
+    """
+    Returns the tile records of a board CSV from the shared board model.
+
+    Args:
+        csv_path (str): Path to the board CSV file.
 
-    df = df[["Position", "Name", "Group", "Price"]]
-    df["Price"] = pd.to_numeric(df["Price"], errors="coerce")  # Convert to int/NaN
-    df["Group"] = df["Group"].fillna(None)
-    return df.to_dict(orient="records")
+    Returns:
+        list[dict]: A list of dictionaries with keys "Position", "Name", "Group", and "Price".
+    """
+    return load_board(csv_path).tiles()
 
 
 class BoardGUI:
     """
     Manages the layout and rendering of the Monopoly-style game board.
 
-    This class handles the loading of board data from a CSV file, calculates the positions of all
+    This class takes the board data from the shared board model compiled from the CSV file, calculates the positions of all
     40 spaces (tiles), and handles drawing them onto the screen. It also handles user interaction 
     such as tile highlighting on hover and dynamic property information display.
 
@@ -42,6 +38,8 @@ class BoardGUI:
         board_offset_y (int): Y-offset for the board (usually 0).
         board_data (list): Parsed board space data loaded from CSV.
         spaces (list): List of `SpacesGUI` objects representing board tiles.
+        tile_info (dict[str, tuple]): The rent and owner name shown in each tile's popup, by tile name.
+        changes (ChangeFeed | None): The change feed of the game being drawn, once `watch` was called.
     """
 
     def __init__(self, board_size=750, window_width=1200, window_height=750, csv_path=None):
@@ -62,81 +60,20 @@ class BoardGUI:
         self.board_offset_y = 0
         self.board_data = self.load_board_data(csv_path)
         self.spaces = self.initialize_spaces()
+        self.tile_info = {}
+        self.changes = None
 
     def load_board_data(self, csv_path):
         """
-        Loads and processes board tile data from a CSV file.
+        Loads the board tile data from the shared board model of a CSV file.
 
         Args:
-            csv_path (str): Path to the board CSV file.
+            csv_path (str): Path to the board CSV file. Defaults to `data/PropertyTycoonBoardData.csv`.
 
         Returns:
             list[dict]: A list of dictionaries with keys "Position", "Name", "Group", and "Price".
         """
-        if not csv_path:
-            csv_path = os.path.join("data", "PropertyTycoonBoardData.csv")  
-        return load_board_data_from_csv(csv_path)
-
-class BoardGUI:
-    def __init__(self, board_size=750, window_width=1200, window_height=750, csv_path=None):
-        """
-        Initializes the board layout configuration and loads board data from a CSV file.
-
-        Args:
-            board_size (int): The width and height of the square board in pixels. Default is 750.
-            window_width (int): The width of the game window in pixels. Default is 1200.
-            window_height (int): The height of the game window in pixels. Default is 750.
-            csv_path (str, optional): Path to the CSV file containing the board space data. If not provided, default data is used.
-
-        Returns:
-            None
-
-        Raises:
-            FileNotFoundError: If the CSV file is not found at the provided path.
-            ValueError: If the CSV data is malformed.
-        """
-        self.board_size = board_size
-        self.window_width = window_width
-        self.window_height = window_height
-        self.tile_size = self.board_size // 11
-        self.board_offset_x = (self.window_width - self.board_size) // 2
-        self.board_offset_y = 0
-
-        self.board_data = self.load_board_data(csv_path) if csv_path else None
-        self.spaces = self.initialize_spaces()
-
-    def load_board_data(self, csv_path):
-        """
-        Loads and processes board tile data from a CSV file.
-
-        Args:
-            csv_path (str): The path to the board CSV file containing space data.
-
-        Returns:
-            list[dict]: A list of dictionaries containing data for each board space. Each dictionary contains:
-                - "Position": Integer representing the position of the tile on the board.
-                - "Name": Name of the property or space.
-                - "Group": The color group to which the property belongs (if applicable).
-                - "Price": Price of the property, or NaN if not a property.
-
-        Raises:
-            FileNotFoundError: If the specified CSV file does not exist at the given path.
-            ValueError: If there are errors parsing the CSV file.
-        """
-        df = pd.read_csv(csv_path, encoding="ISO-8859-1", skiprows=3)
-        df = df.rename(columns={
-            df.columns[0]: "Position",
-            df.columns[1]: "Name",
-            df.columns[3]: "Group",
-            df.columns[7]: "Price",
-        })
-
-        df = df[["Position", "Name", "Group", "Price"]]
-        df["Price"] = pd.to_numeric(df["Price"], errors="coerce")
-        df["Group"] = df["Group"].where(pd.notnull(df["Group"]), None)
-        return df.to_dict(orient="records")
-
-
+        return load_board_data_from_csv(csv_path or BOARD_PATH)
 
     def initialize_spaces(self):
         """
@@ -183,7 +120,54 @@ class BoardGUI:
         return spaces
 
 
-    # change here
+    def watch(self, changes):
+        """
+        Keeps the tiles' popup information for a game, refreshing only the tiles whose property changes.
+
+        Without a feed to watch, the information is looked up again on every draw.
+
+        Args:
+            changes (ChangeFeed): The change feed of the game being drawn.
+
+        Returns:
+            None
+        """
+        if self.changes is not None:
+            self.changes.unsubscribe(self.forget_tile)
+        self.changes = changes
+        self.tile_info = {}
+        changes.subscribe(self.forget_tile, ("owner", "houses"))
+
+    def forget_tile(self, change):
+        """
+        Drops the popup information of a property whose owner or houses changed.
+
+        Args:
+            change (Change): The change to the property.
+
+        Returns:
+            None
+        """
+        self.tile_info.pop(change.subject.name, None)
+
+    @staticmethod
+    def describe(prop):
+        """
+        Returns what a tile's popup shows about its property.
+
+        Args:
+            prop (Property | None): The property on the tile, or None for other tiles.
+
+        Returns:
+            tuple: The rent at the property's current number of houses and the owner's name (None if unowned).
+        """
+        if prop is None:
+            return None, None
+        rent, owner = prop.rent, prop.owner
+        if rent:
+            rent = rent[prop.houses]
+        return rent, owner.name if owner else None
+
     def draw(self, screen, prop_data):
         """
         Draws the board and all its spaces onto the screen, including tooltips for hovered tiles.
@@ -198,22 +182,22 @@ class BoardGUI:
         Raises:
             ValueError: If the property data is not in the expected format or contains invalid information.
         """
-
         # These button values should match your DiceGUI logic
         dice_button_x = self.window_width // 2 - 75
         dice_button_y = self.window_height - 100
         dice_button_width = 150
 
-        prop_data = [p[1] for p in prop_data]
+        if self.changes is None:
+            self.tile_info = {}
+        by_name = None
         for space in self.spaces:
             space.draw(screen)
-            rent = next((prop.rent for prop in prop_data if prop.name == space.name), None)
-            owner = next((prop.owner for prop in prop_data if prop.name == space.name), None)
-            houses = next((prop.houses for prop in prop_data if prop.name == space.name), None)
-            if rent:
-                rent = rent[houses]
-            if owner:
-                owner = owner.name
+            info = self.tile_info.get(space.name)
+            if info is None:
+                if by_name is None:
+                    by_name = {prop.name: prop for _, prop in prop_data}
+                info = self.tile_info[space.name] = self.describe(by_name.get(space.name))
+            rent, owner = info
             space.draw_popup(screen, dice_button_x, dice_button_y, dice_button_width, rent, owner)
 
     def handle_hover(self, mouse_pos):
@@ -1,16 +1,26 @@
 import pygame
 import sys
 
+import numpy as np
+
+
+# Line colours of the players in the balance chart, by seat
+CHART_COLOURS = [(255, 215, 0), (0, 200, 255), (255, 90, 90), (120, 230, 120), (230, 130, 255), (255, 160, 60)]
+
+
 class EndGamePopup:
     """
     Handles the display of the end game popup, showing the winner and providing an option to quit the game.
 
     This class is responsible for rendering the end game popup window on the screen when the game is over.
     It displays the winner's name, a message indicating the game is over, and provides a "Quit" button to close the game.
+    Given the game's turn history, it also shows every player's balance over the game, as a chart drawn once
+    when the popup opens.
 
     Args:
         screen (pygame.Surface): The Pygame surface where the popup will be drawn.
         winner_name (str): The name of the player who won the game.
+        history (TurnHistory | None): The game's turn history, to chart the balances from.
 
     Attributes:
         width (int): Width of the game window.
@@ -22,6 +32,7 @@ class EndGamePopup:
         font_body (pygame.font.Font): The font used for the body text (winner's name).
         font_button (pygame.font.Font): The font used for the button text.
         quit_button (pygame.Rect): The rectangle defining the "Quit" button's position and size.
+        chart (pygame.Surface | None): The balance chart, or None without a history of at least two turns.
 
     Methods:
         draw():
@@ -30,13 +41,14 @@ class EndGamePopup:
         handle_event(event):
             Handles events such as mouse clicks. If the "Quit" button is clicked, the game is exited.
     """
-    def __init__(self, screen, winner_name):
+    def __init__(self, screen, winner_name, history=None):
         """
         Initializes the end game popup with the winner's name and necessary parameters for drawing.
 
         Args:
             screen (pygame.Surface): The Pygame surface where the popup will be drawn.
             winner_name (str): The name of the player who won the game.
+            history (TurnHistory | None): The game's turn history, to chart the balances from (default: None).
 
         Returns:
             None
@@ -46,14 +58,21 @@ class EndGamePopup:
 
         Side Effects:
             Initializes the popup's position, size, and fonts. Creates a button for quitting the game.
+            Draws the balance chart if there is a history to draw it from.
         """    
         self.screen = screen
         self.winner_name = winner_name
         self.visible = True
 
+        self.font_title = pygame.font.Font(None, 48)
+        self.font_body = pygame.font.Font(None, 32)
+        self.font_button = pygame.font.Font(None, 30)
+        self.font_legend = pygame.font.Font(None, 20)
+        self.chart = self.draw_chart(history, 520, 240) if history is not None and len(history) > 1 else None
+
         self.width, self.height = self.screen.get_size()
-        self.popup_width = 400
-        self.popup_height = 220
+        self.popup_width = 560 if self.chart else 400
+        self.popup_height = 220 + (self.chart.get_height() + 10 if self.chart else 0)
         self.popup_rect = pygame.Rect(
             self.width // 2 - self.popup_width // 2,
             self.height // 2 - self.popup_height // 2,
@@ -61,11 +80,52 @@ class EndGamePopup:
             self.popup_height
         )
 
-        self.font_title = pygame.font.Font(None, 48)
-        self.font_body = pygame.font.Font(None, 32)
-        self.font_button = pygame.font.Font(None, 30)
+        self.quit_button = pygame.Rect(self.popup_rect.centerx - 60, self.popup_rect.bottom - 70, 120, 40)
 
-        self.quit_button = pygame.Rect(self.popup_rect.centerx - 60, self.popup_rect.y + 150, 120, 40)
+    def draw_chart(self, history, width, height):
+        """
+        Draws every player's balance over the game as a line chart.
+
+        Args:
+            history (TurnHistory): The game's turn history.
+            width (int): Width of the chart.
+            height (int): Height of the chart.
+
+        Returns:
+            pygame.Surface: The chart, with a legend of the players' names.
+        """
+        chart = pygame.Surface((width, height))
+        chart.fill((25, 25, 25))
+        pygame.draw.rect(chart, (90, 90, 90), chart.get_rect(), 1)
+        balances = history.series("balance")
+        turns = len(balances)
+        plot = pygame.Rect(50, 10, width - 60, height - 50)
+
+        # One point per pixel at most
+        samples = np.unique(np.linspace(0, turns - 1, min(turns, plot.width)).astype(int))
+        low, high = min(int(balances.min()), 0), max(int(balances.max()), 1)
+        xs = plot.x + samples * (plot.width - 1) // (turns - 1)
+        ys = plot.bottom - 1 - (balances[samples] - low) * (plot.height - 1) // (high - low)
+
+        axis = pygame.font.Font(None, 18)
+        for value in (low, high):
+            label = axis.render(f"\u00a3{value}", True, (200, 200, 200))
+            y = plot.bottom - 1 - (value - low) * (plot.height - 1) // (high - low)
+            chart.blit(label, (plot.x - 4 - label.get_width(), y - label.get_height() // 2))
+        pygame.draw.line(chart, (120, 120, 120), plot.bottomleft, plot.topleft)
+        pygame.draw.line(chart, (120, 120, 120), (plot.x, plot.bottom - 1), (plot.right, plot.bottom - 1))
+        turns_label = axis.render(f"{turns} turns", True, (200, 200, 200))
+        chart.blit(turns_label, (plot.right - turns_label.get_width(), plot.bottom + 2))
+
+        x = plot.x
+        for seat, player in enumerate(history.seats):
+            colour = CHART_COLOURS[seat % len(CHART_COLOURS)]
+            if len(samples) > 1:
+                pygame.draw.lines(chart, colour, False, list(zip(xs.tolist(), ys[:, seat].tolist())), 2)
+            name = self.font_legend.render(player.name, True, colour)
+            chart.blit(name, (x, height - 22))
+            x += name.get_width() + 15
+        return chart
 
     def draw(self):
         """
@@ -97,6 +157,9 @@ class EndGamePopup:
         winner_surf = self.font_body.render(winner_msg, True, (255, 215, 0))
         self.screen.blit(winner_surf, (self.popup_rect.centerx - winner_surf.get_width() // 2, self.popup_rect.y + 80))
 
+        if self.chart:
+            self.screen.blit(self.chart, (self.popup_rect.centerx - self.chart.get_width() // 2, self.popup_rect.y + 130))
+
         pygame.draw.rect(self.screen, (200, 0, 0), self.quit_button, border_radius=6)
         quit_surf = self.font_button.render("Quit", True, (255, 255, 255))
         self.screen.blit(quit_surf, (self.quit_button.centerx - quit_surf.get_width() // 2, self.quit_button.y + 8))
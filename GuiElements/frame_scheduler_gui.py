@@ -0,0 +1,99 @@
+import asyncio
+
+
+class FrameScheduler:
+    """
+    Drives a frame function from an asyncio event loop, so other coroutines can share the thread.
+
+    Frames are scheduled against absolute deadlines on the event loop's clock rather than by sleeping
+    a fixed time after each frame, so the frame rate does not drift with the time a frame takes.
+    A frame that runs late moves the schedule on instead of being followed by a burst of catch-up
+    frames. The event loop's timers wake up a little late (epoll rounds timeouts up to whole
+    milliseconds), so the scheduler learns how late it wakes and goes to sleep that much earlier.
+    Between frames the loop is free to run background coroutines such as network sync,
+    autosaves or bot decisions.
+
+    Args:
+        frame_rate (float): Frames per second (default: 30).
+
+    Attributes:
+        frame_rate (float): Frames per second.
+        period (float): Seconds between frame deadlines.
+        late_frames (int): Number of frames that ran past the deadline of the next frame.
+        wake_lead (float): Seconds the scheduler currently wakes up ahead of a deadline to make up for timer lag.
+        tasks (set[asyncio.Task]): The background tasks started with `spawn` that are still running.
+    """
+
+    WAKE_GAIN = 0.2
+
+    def __init__(self, frame_rate=30):
+        """
+        Initializes the scheduler.
+
+        Args:
+            frame_rate (float): Frames per second (default: 30).
+
+        Returns:
+            None
+        """
+        self.frame_rate = frame_rate
+        self.period = 1 / frame_rate
+        self.late_frames = 0
+        self.wake_lead = 0.0
+        self.tasks = set()
+
+    def spawn(self, coroutine):
+        """
+        Runs a coroutine in the background while frames are being drawn.
+
+        Args:
+            coroutine (Coroutine): The coroutine to run.
+
+        Returns:
+            asyncio.Task: The task running the coroutine.
+
+        Side Effects:
+            - Keeps the task in `tasks` until it finishes, so `close` can cancel it.
+        """
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    async def run(self, step, running):
+        """
+        Calls `step` once per frame until `running` returns False.
+
+        Args:
+            step (Callable[[], None]): Runs one frame.
+            running (Callable[[], bool]): Whether to keep going.
+
+        Returns:
+            None
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while running():
+            step()
+            deadline += self.period
+            delay = deadline - loop.time()
+            if delay < 0:
+                self.late_frames += 1
+                deadline -= delay
+                await asyncio.sleep(0)
+                continue
+            await asyncio.sleep(max(delay - self.wake_lead, 0))
+            error = loop.time() - deadline
+            self.wake_lead = min(max(self.wake_lead + self.WAKE_GAIN * error, 0), self.period / 4)
+
+    async def close(self):
+        """
+        Cancels the background tasks and waits for them to stop.
+
+        Returns:
+            None
+        """
+        tasks = list(self.tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,184 @@
+import logging
+import logging.handlers
+import os
+from collections import deque
+import sys
+import threading
+import time
+import traceback
+
+
+STALL_LOG = os.path.join("logs", "stalls.log")
+
+
+class FrameWatchdog:
+    """
+    Watches the frame loop from a background thread and reports frames that go over budget.
+
+    The frame loop calls `heartbeat` at the start of every frame. The watchdog thread wakes up four
+    times per budget and, once a frame has run longer than the budget, samples the frame thread's
+    stack on every wake-up until the frame ends, so blocking waits, `input()` calls and slow drawing
+    are caught where they happen. `heartbeat` also measures every frame, so frames that overran by
+    less than one wake-up are still reported, without a stack. Each report holds the frame's
+    duration, the game state when the stall was detected and the distinct stacks sampled (most
+    frequent first), and goes to a rotating log. A frame that is still stalled after `hang_after`
+    seconds is reported straight away as ongoing, so a loop that never comes back still leaves a trace.
+
+    Args:
+        budget (float): Longest acceptable frame in seconds (default: 0.05).
+        path (str): The stall log (default: logs/stalls.log).
+        describe (Callable[[], str] | None): Returns a description of the game state for reports.
+        max_bytes (int): Size at which the log is rotated (default: 1 MB).
+        backups (int): Number of rotated logs kept (default: 3).
+        hang_after (float): Seconds after which a stall is reported before it ends (default: 5).
+
+    Attributes:
+        budget (float): Longest acceptable frame in seconds.
+        stalls (int): Number of stalls reported.
+        frame (int): Number of heartbeats so far.
+    """
+
+    def __init__(self, budget=0.05, path=STALL_LOG, describe=None, max_bytes=1_000_000, backups=3, hang_after=5.0):
+        """
+        Initializes the watchdog without starting it.
+
+        Args:
+            budget (float): Longest acceptable frame in seconds (default: 0.05).
+            path (str): The stall log (default: logs/stalls.log).
+            describe (Callable[[], str] | None): Returns a description of the game state for reports.
+            max_bytes (int): Size at which the log is rotated (default: 1 MB).
+            backups (int): Number of rotated logs kept (default: 3).
+            hang_after (float): Seconds after which a stall is reported before it ends (default: 5).
+
+        Returns:
+            None
+        """
+        self.budget = budget
+        self.path = path
+        self.describe = describe
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.hang_after = hang_after
+        self.stalls = 0
+        self.frame = 0
+        self.last_beat = time.perf_counter()
+        self.logger = None
+        self._stall = None
+        self._finished = deque()
+        self._thread = None
+        self._target = None
+        self._stop = threading.Event()
+
+    def start(self):
+        """
+        Starts watching the calling thread, which must be the thread running the frame loop.
+
+        Returns:
+            None
+
+        Side Effects:
+            - Creates the log directory and starts a daemon thread.
+        """
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(self.path, maxBytes=self.max_bytes,
+                                                       backupCount=self.backups, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        self.logger = logging.Logger("property_tycoon.stalls")
+        self.logger.addHandler(handler)
+        self._target = threading.get_ident()
+        self.last_beat = time.perf_counter()
+        self._thread = threading.Thread(target=self._watch, name="frame-watchdog", daemon=True)
+        self._thread.start()
+
+    def heartbeat(self):
+        """Marks the end of the previous frame and the start of a new one."""
+        now = time.perf_counter()
+        if now - self.last_beat > self.budget:
+            self._finished.append((self.frame, now - self.last_beat))
+        self.last_beat = now
+        self.frame += 1
+
+    def stop(self):
+        """
+        Stops the watchdog thread, reporting a stall still in progress, and closes the log.
+
+        Returns:
+            None
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._report_finished()
+        if self._stall is not None:
+            self._report(self._stall, time.perf_counter() - self._stall["start"], ongoing=True)
+            self._stall = None
+        for handler in self.logger.handlers:
+            handler.close()
+
+    def _watch(self):
+        """Thread body: checks the frame loop four times per budget."""
+        while not self._stop.wait(self.budget / 4):
+            self._report_finished()
+            beat, frame, now = self.last_beat, self.frame, time.perf_counter()
+            if now - beat <= self.budget:
+                if self._stall is not None and self._stall["frame"] != frame:
+                    self._stall = None  # its frame ended while it was being recorded and has been reported
+                continue
+
+            stall = self._stall
+            if stall is None or stall["frame"] != frame:
+                stall = self._stall = self._new_stall(frame, beat, self._state())
+            self._sample(stall, now)
+            if not stall["reported"] and now - beat >= self.hang_after:
+                self._report(stall, now - beat, ongoing=True)
+                stall["reported"] = True
+
+    @staticmethod
+    def _new_stall(frame, start, state):
+        """Returns the record of a stalled frame."""
+        return {"frame": frame, "start": start, "stacks": {}, "state": state, "reported": False}
+
+    def _report_finished(self):
+        """Reports the frames that have ended over budget, with the stacks sampled while they ran."""
+        while self._finished:
+            frame, duration = self._finished.popleft()
+            stall = self._stall
+            if stall is not None and stall["frame"] == frame:
+                self._stall = None
+            else:
+                stall = self._new_stall(frame, 0.0, "not sampled")
+            self._report(stall, duration)
+
+    def _sample(self, stall, now):
+        """Adds the frame thread's current stack to a stall."""
+        frame = sys._current_frames().get(self._target)
+        if frame is None:
+            return
+        stack = "".join(traceback.format_stack(frame))
+        count, first = stall["stacks"].get(stack, (0, now - stall["start"]))
+        stall["stacks"][stack] = (count + 1, first)
+
+    def _state(self):
+        """Returns the game state description, or the error raised while building it."""
+        if self.describe is None:
+            return "unknown"
+        try:
+            return self.describe()
+        except Exception as e:  # the game may be mid-update on the frame thread
+            return f"unavailable ({e!r})"
+
+    def _report(self, stall, duration, ongoing=False):
+        """Writes one stall report to the log."""
+        if not stall["reported"]:
+            self.stalls += 1
+        status = "still running after" if ongoing else "lasted"
+        lines = [f"Frame {stall['frame']} {status} {duration * 1000:.0f} ms (budget {self.budget * 1000:.0f} ms)",
+                 f"Game state: {stall['state']}"]
+        stacks = sorted(stall["stacks"].items(), key=lambda item: -item[1][0])
+        for stack, (count, first) in stacks:
+            lines.append(f"Stack seen {count}x, first at +{first * 1000:.0f} ms:")
+            lines.append(stack.rstrip())
+        self.logger.warning("\n".join(lines))
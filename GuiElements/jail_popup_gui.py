@@ -1,5 +1,8 @@
 import pygame
 
+from GameElements.ledger import PARKING
+
+
 class JailPopup:
     """
     Manages the Jail popup in the game, allowing players to interact with options while in jail.
@@ -188,8 +191,7 @@ class JailPopup:
 
         elif choice == "pay":
             if player.balance >= 50:
-                player.balance -= 50
-                game.fines += 50
+                game.ledger.transfer(player, PARKING, 50, "jail")
                 player.jail_turns = 0
                 player.in_jail = False
                 player.skip_turn = True  
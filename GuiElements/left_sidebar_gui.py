@@ -24,6 +24,7 @@ class LeftSidebar(PropertyTycoon):
         bank_section (pygame.Rect): The rectangle for the bank section of the sidebar.
         player_info_section (pygame.Rect): The rectangle for displaying the selected player’s information.
         manage_property_button (pygame.Rect): The button for managing properties.
+        leaderboard_section (pygame.Rect): The top of the net worth standings, shown while the property popup is closed.
         selected_property_name (str): The name of the currently selected property.
         property_buttons (list): A list of button rectangles for managing properties.
         active_popup (str): The currently active popup, if any.
@@ -31,6 +32,8 @@ class LeftSidebar(PropertyTycoon):
         popup_buttons (dict): A dictionary of action buttons (e.g., build house, mortgage) in the popup.
         just_scrolled (bool): A flag to indicate if the user has scrolled.
         log_event (function): Function to log game events.
+        surface (pygame.Surface | None): The sidebar as last rendered, redrawn only when what it shows changes.
+        hover_overlays (list): (rect, surface) pairs drawn over the sidebar while the mouse is over `rect`.
     """
 
     def __init__(self, screen, game, event_logger=None):
@@ -63,6 +66,7 @@ class LeftSidebar(PropertyTycoon):
         self.bank_section = pygame.Rect(10, 10, self.sidebar_width - 20, 80)
         self.player_info_section = pygame.Rect(10, self.bank_section.bottom + 10, self.sidebar_width - 20, 100)
         self.manage_property_button = pygame.Rect(10, self.player_info_section.bottom + 10, self.sidebar_width - 20, 40)
+        self.leaderboard_section = pygame.Rect(10, self.manage_property_button.bottom + 10, self.sidebar_width - 20, 30)
 
         self.game = game
 
@@ -88,6 +92,15 @@ class LeftSidebar(PropertyTycoon):
 
         self.log_event = event_logger if event_logger else print  
 
+        # Cached rendering
+        self.font = pygame.font.Font(None, 24)
+        self.prop_font = pygame.font.Font(None, 18)
+        self.action_font = pygame.font.Font(None, 20)
+        self.button_font = pygame.font.Font(None, 26)
+        self.surface = None
+        self.surface_key = None
+        self.hover_overlays = []
+
     def draw(self):
         """
         Draws the entire left sidebar and its components, including player info and property management options.
@@ -102,39 +115,98 @@ class LeftSidebar(PropertyTycoon):
             None
 
         Side Effects:
-            - Renders the sidebar, player information, and the properties management popup if active.
-            - Dynamically updates button highlight based on mouse hover.
+            - Copies the cached sidebar to the screen, rendering it again first if the current player,
+              their version (balance and properties), the standings, the popup, the scroll position or the
+              selection changed.
+            - Draws the hovered button or property over it.
+        """
+        player = self.game.players[self.game.current_player_index]
+        key = (player, player.version, self.game.net_worth.version, self.active_popup, self.scroll_offset,
+               self.selected_property_name)
+        if self.surface is None or key != self.surface_key:
+            self.render(player)
+            self.surface_key = key
+        self.screen.blit(self.surface, (0, 0))
+
+        mouse_pos = pygame.mouse.get_pos()
+        for rect, overlay in self.hover_overlays:
+            if rect.collidepoint(mouse_pos):
+                self.screen.blit(overlay, rect)
+
+    def render(self, player):
         """
-        pygame.draw.rect(self.screen, (50, 50, 50), self.sidebar_rect)
-        pygame.draw.rect(self.screen, (0, 0, 0), self.sidebar_rect, 2)
+        Renders the sidebar into its cached surface, with the hover state of every button and property
+        row rendered separately as overlays.
+
+        Args:
+            player (Player): The player whose information is shown.
+
+        Returns:
+            None
+        """
+        if self.surface is None:
+            self.surface = pygame.Surface(self.sidebar_rect.size)
+        surface = self.surface
+        self.hover_overlays = []
+
+        pygame.draw.rect(surface, (50, 50, 50), self.sidebar_rect)
+        pygame.draw.rect(surface, (0, 0, 0), self.sidebar_rect, 2)
 
         # Bank section
         # pygame.draw.rect(self.screen, (0, 100, 0), self.bank_section)
         # pygame.draw.rect(self.screen, (0, 0, 0), self.bank_section, 2)
-        font = pygame.font.Font(None, 24)
+        font = self.font
         # self.screen.blit(font.render("Bank", True, (255, 255, 255)), (self.bank_section.x + 10, self.bank_section.y + 10))
         # self.screen.blit(font.render(f"\u00a3{self.game.bank.balance}", True, (255, 255, 255)), (self.bank_section.x + 10, self.bank_section.y + 40))
 
         # Player section
-        pygame.draw.rect(self.screen, (0, 0, 128), self.player_info_section)
-        pygame.draw.rect(self.screen, (0, 0, 0), self.player_info_section, 2)
-        token, balance = self.game.players[self.game.current_player_index].token, self.game.players[self.game.current_player_index].balance
-        player_name = self.game.players[self.game.current_player_index].name
-        self.screen.blit(font.render(player_name, True, (255, 255, 255)), (self.player_info_section.x + 10, self.player_info_section.y + 10))
-        self.screen.blit(font.render(f"Token: {token}", True, (255, 255, 255)), (self.player_info_section.x + 10, self.player_info_section.y + 40))
-        self.screen.blit(font.render(f"\u00a3{balance}", True, (255, 255, 255)), (self.player_info_section.x + 10, self.player_info_section.y + 65))
+        pygame.draw.rect(surface, (0, 0, 128), self.player_info_section)
+        pygame.draw.rect(surface, (0, 0, 0), self.player_info_section, 2)
+        surface.blit(font.render(player.name, True, (255, 255, 255)), (self.player_info_section.x + 10, self.player_info_section.y + 10))
+        surface.blit(font.render(f"Token: {player.token}", True, (255, 255, 255)), (self.player_info_section.x + 10, self.player_info_section.y + 40))
+        surface.blit(font.render(f"\u00a3{player.balance}", True, (255, 255, 255)), (self.player_info_section.x + 10, self.player_info_section.y + 65))
 
-        self.highlight_button(self.manage_property_button, (204, 204, 0), "Manage Property")
+        self.highlight_button(surface, self.manage_property_button, (204, 204, 0), "Manage Property")
 
         if self.active_popup == "manage_properties":
-            self.draw_manage_properties_popup()
+            self.draw_manage_properties_popup(surface, player)
+        else:
+            self.draw_leaderboard(surface, player)
 
-    def draw_manage_properties_popup(self):
+    def draw_leaderboard(self, surface, player):
         """
-        Renders the scrollable list of properties and action buttons in the manage property popup.
+        Renders the players' net worth standings below the manage property button.
 
         Args:
+            surface (pygame.Surface): The sidebar surface being rendered.
+            player (Player): The current player, whose row is highlighted.
+
+        Returns:
             None
+        """
+        standings = self.game.net_worth.leaderboard()
+        row_height = 22
+        section = self.leaderboard_section.copy()
+        section.height = 35 + row_height * len(standings)
+        pygame.draw.rect(surface, (0, 100, 0), section)
+        pygame.draw.rect(surface, (0, 0, 0), section, 2)
+        surface.blit(self.font.render("Net Worth", True, (255, 255, 255)), (section.x + 10, section.y + 8))
+
+        y = section.y + 32
+        for rank, (other, worth) in enumerate(standings, start=1):
+            color = (255, 255, 0) if other is player else (255, 255, 255)
+            surface.blit(self.action_font.render(f"{rank}. {other.name}", True, color), (section.x + 10, y))
+            amount = self.action_font.render(f"\u00a3{worth}", True, color)
+            surface.blit(amount, (section.right - 10 - amount.get_width(), y))
+            y += row_height
+
+    def draw_manage_properties_popup(self, surface, player):
+        """
+        Renders the scrollable list of properties and action buttons in the manage property popup.
+
+        Args:
+            surface (pygame.Surface): The sidebar surface being rendered.
+            player (Player): The player whose properties are listed.
 
         Returns:
             None
@@ -148,18 +220,15 @@ class LeftSidebar(PropertyTycoon):
             - Renders action buttons (build, mortgage, etc.) at the bottom of the popup.
         """
 
-        properties = [prop_object.name if not prop_object.mortgaged else "M - "+prop_object.name for prop_object in self.game.players[self.game.current_player_index].owned_properties]
         properties = [
             ("HOTEL" if prop_object.houses > 4 else "H" * prop_object.houses) + ("M" if prop_object.mortgaged else "") + (" - " if prop_object.houses > 0 or prop_object.mortgaged else "") + prop_object.name
-            for prop_object in self.game.players[self.game.current_player_index].owned_properties
+            for prop_object in player.owned_properties
         ]
 
-        pygame.draw.rect(self.screen, (200, 200, 200), self.popup_rect)
-        pygame.draw.rect(self.screen, (0, 0, 0), self.popup_rect, 2)
+        pygame.draw.rect(surface, (200, 200, 200), self.popup_rect)
+        pygame.draw.rect(surface, (0, 0, 0), self.popup_rect, 2)
 
         self.property_buttons = []
-        prop_font = pygame.font.Font(None, 18)
-        mouse_x, mouse_y = pygame.mouse.get_pos()
 
         visible_count = 8
         item_height = 26
@@ -173,16 +242,15 @@ class LeftSidebar(PropertyTycoon):
             if 0 <= display_index < visible_count:
                 y = start_y + display_index * item_height
                 prop_rect = pygame.Rect(self.popup_rect.x + 10, y, self.popup_rect.width - 30, 22)
-                is_hovered = prop_rect.collidepoint(mouse_x, mouse_y)
                 is_selected = (prop == self.selected_property_name)
 
-                bg_color = (0, 100, 255) if is_selected else (240, 240, 240) if is_hovered else (220, 220, 220)
+                bg_color = (0, 100, 255) if is_selected else (220, 220, 220)
                 text_color = (255, 255, 255) if is_selected else (0, 0, 0)
-
-                pygame.draw.rect(self.screen, bg_color, prop_rect, border_radius=3)
-                pygame.draw.rect(self.screen, (0, 0, 0), prop_rect, 1, border_radius=3)
-                label = prop_font.render(prop, True, text_color)
-                self.screen.blit(label, (prop_rect.x + 5, prop_rect.y + 3))
+                self.draw_property_row(surface, prop_rect, prop, bg_color, text_color)
+                if not is_selected:
+                    overlay = surface.subsurface(prop_rect).copy()
+                    self.draw_property_row(overlay, overlay.get_rect(), prop, (240, 240, 240), text_color)
+                    self.hover_overlays.append((prop_rect, overlay))
                 self.property_buttons.append((prop_rect, prop))
 
         # Draw scrollbar if needed
@@ -193,11 +261,10 @@ class LeftSidebar(PropertyTycoon):
             scroll_ratio = self.scroll_offset / max_offset if max_offset > 0 else 0
             bar_y = scrollbar_y + int((scroll_area_height - bar_height) * scroll_ratio)
 
-            pygame.draw.rect(self.screen, (180, 180, 180), (scrollbar_x, scrollbar_y, 8, scroll_area_height), border_radius=4)
-            pygame.draw.rect(self.screen, (100, 100, 100), (scrollbar_x, bar_y, 8, bar_height), border_radius=4)
+            pygame.draw.rect(surface, (180, 180, 180), (scrollbar_x, scrollbar_y, 8, scroll_area_height), border_radius=4)
+            pygame.draw.rect(surface, (100, 100, 100), (scrollbar_x, bar_y, 8, bar_height), border_radius=4)
 
         # Action buttons (build, mortgage, etc.)
-        font = pygame.font.Font(None, 20)
         start_y = self.popup_rect.bottom - (len(self.popup_buttons) * 30 + 20)
         spacing = 30
 
@@ -207,22 +274,59 @@ class LeftSidebar(PropertyTycoon):
             rect.y = start_y + i * spacing
             rect.width = self.popup_rect.width - 20
 
-            is_hovered = rect.collidepoint(pygame.mouse.get_pos())
             base_color = (0, 180, 0) if key in ["build_house", "build_hotel"] else (0, 120, 255)
-            base_color = base_color if not is_hovered else [min(c + 30, 255) for c in base_color]
+            hover_color = [min(c + 30, 255) for c in base_color]
+            label = self.action_font.render(key.replace("_", " ").title(), True, (255, 255, 255))
+
+            self.draw_action_button(surface, rect, base_color, label)
+            overlay = surface.subsurface(rect).copy()
+            self.draw_action_button(overlay, overlay.get_rect(), hover_color, label)
+            self.hover_overlays.append((rect, overlay))
+
+    def draw_property_row(self, surface, rect, text, bg_color, text_color):
+        """
+        Draws one row of the property list.
 
-            pygame.draw.rect(self.screen, base_color, rect, border_radius=5)
-            pygame.draw.rect(self.screen, (0, 0, 0), rect, 1, border_radius=5)
-            label = font.render(key.replace("_", " ").title(), True, (255, 255, 255))
-            self.screen.blit(label, (rect.x + 10, rect.y + 5))
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            rect (pygame.Rect): The row's rectangle on that surface.
+            text (str): The property label.
+            bg_color (tuple): The row's background colour.
+            text_color (tuple): The label's colour.
+
+        Returns:
+            None
+        """
+        pygame.draw.rect(surface, bg_color, rect, border_radius=3)
+        pygame.draw.rect(surface, (0, 0, 0), rect, 1, border_radius=3)
+        surface.blit(self.prop_font.render(text, True, text_color), (rect.x + 5, rect.y + 3))
 
-    def highlight_button(self, button_rect, color, text):
+    @staticmethod
+    def draw_action_button(surface, rect, color, label):
         """
-        Renders a button with a hover effect.
+        Draws one of the property action buttons.
 
         Args:
+            surface (pygame.Surface): The surface to draw on.
+            rect (pygame.Rect): The button's rectangle on that surface.
+            color (tuple): The button's colour.
+            label (pygame.Surface): The rendered label.
+
+        Returns:
+            None
+        """
+        pygame.draw.rect(surface, color, rect, border_radius=5)
+        pygame.draw.rect(surface, (0, 0, 0), rect, 1, border_radius=5)
+        surface.blit(label, (rect.x + 10, rect.y + 5))
+
+    def highlight_button(self, surface, button_rect, color, text):
+        """
+        Renders a button, with its hovered look added to the hover overlays.
+
+        Args:
+            surface (pygame.Surface): The sidebar surface being rendered.
             button_rect (pygame.Rect): The rectangle representing the button's area.
-            color (tuple): The color of the button when not hovered.
+            color (tuple): The color of the button when hovered.
             text (str): The label to display on the button.
 
         Returns:
@@ -232,16 +336,29 @@ class LeftSidebar(PropertyTycoon):
             None
 
         Side Effects:
-            - Draws the button with hover effects based on the mouse position.
+            - Draws the button and records its hovered version as an overlay.
+        """
+        self.draw_button(surface, button_rect, (100, 100, 100), (0, 0, 0), text)
+        overlay = surface.subsurface(button_rect).copy()
+        self.draw_button(overlay, overlay.get_rect(), color, (255, 255, 255), text)
+        self.hover_overlays.append((button_rect, overlay))
+
+    def draw_button(self, surface, rect, bg, fg, text):
+        """
+        Draws a sidebar button.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            rect (pygame.Rect): The button's rectangle on that surface.
+            bg (tuple): The button's colour.
+            fg (tuple): The label's colour.
+            text (str): The label.
+
+        Returns:
+            None
         """
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        hovered = button_rect.collidepoint(mouse_x, mouse_y)
-        bg = color if hovered else (100, 100, 100)
-        fg = (255, 255, 255) if hovered else (0, 0, 0)
-
-        pygame.draw.rect(self.screen, bg, button_rect)
-        label = pygame.font.Font(None, 26).render(text, True, fg)
-        self.screen.blit(label, (button_rect.x + 10, button_rect.y + 10))
+        pygame.draw.rect(surface, bg, rect)
+        surface.blit(self.button_font.render(text, True, fg), (rect.x + 10, rect.y + 10))
 
     def handle_event(self, event):
         """
@@ -0,0 +1,79 @@
+import pygame
+
+
+class ModalLayer:
+    """
+    Freezes the scene under a popup, so that only the popup is drawn while it is open.
+
+    When a popup opens, the board, sidebars, dice and tokens are drawn one last time and captured,
+    dimmed, into a snapshot. Each later frame copies the snapshot to the screen instead of drawing
+    the scene again, and the popup is drawn on top. The snapshot is taken again when its `key`
+    changes, e.g. when something the popup did (a house sold, a bid placed) was logged, so the
+    frozen scene does not fall behind the game.
+
+    Args:
+        screen (pygame.Surface): The surface the scene is drawn on.
+        dim (int): Opacity of the black overlay over the frozen scene, 0-255 (default: 120).
+
+    Attributes:
+        snapshot (pygame.Surface | None): The dimmed scene while a popup is open.
+        captures (int): Number of snapshots taken.
+    """
+
+    def __init__(self, screen, dim=120):
+        """
+        Initializes the layer with no popup open.
+
+        Args:
+            screen (pygame.Surface): The surface the scene is drawn on.
+            dim (int): Opacity of the black overlay over the frozen scene, 0-255 (default: 120).
+
+        Returns:
+            None
+        """
+        self.screen = screen
+        self.dim = dim
+        self.snapshot = None
+        self.key = None
+        self.overlay = None
+        self.captures = 0
+
+    def is_current(self, key=None):
+        """
+        Checks whether the snapshot can be drawn instead of the scene.
+
+        Args:
+            key (Hashable): Identifies the state of the scene; a different key needs a new snapshot.
+
+        Returns:
+            bool: True if there is a snapshot taken with the same key.
+        """
+        return self.snapshot is not None and self.key == key
+
+    def capture(self, key=None):
+        """
+        Takes a dimmed snapshot of the scene currently on the screen.
+
+        Args:
+            key (Hashable): Identifies the state of the scene.
+
+        Returns:
+            None
+        """
+        size = self.screen.get_size()
+        if self.overlay is None or self.overlay.get_size() != size:
+            self.overlay = pygame.Surface(size, pygame.SRCALPHA)
+            self.overlay.fill((0, 0, 0, self.dim))
+        self.snapshot = self.screen.copy()
+        self.snapshot.blit(self.overlay, (0, 0))
+        self.key = key
+        self.captures += 1
+
+    def draw(self):
+        """Copies the frozen scene to the screen."""
+        self.screen.blit(self.snapshot, (0, 0))
+
+    def release(self):
+        """Drops the snapshot once no popup is open, so the scene is drawn live again."""
+        self.snapshot = None
+        self.key = None
@@ -1,4 +1,5 @@
 import pygame
+from GuiElements.backdrop_gui import Backdrop
 
 class PreGameScreen:
     """
@@ -20,8 +21,10 @@ class PreGameScreen:
         start_disabled (bool): Whether the start button is disabled based on player count.
         input_active (bool): Flag for whether the time input box is active.
         background (pygame.Surface): The background image for the pre-game screen.
+        backdrop (Backdrop): The background, overlay and fixed text, composited once per layout.
         font (pygame.font.Font): The font used for general text rendering.
         button_font (pygame.font.Font): The font used for button text rendering.
+        note_font (pygame.font.Font): The font used for the time limit note.
         click_sound (pygame.mixer.Sound): The sound played when a button is clicked.
         start_button_rect (pygame.Rect): The rectangle for the "Start" button.
         normal_button_rect (pygame.Rect): The rectangle for the "Normal" mode button.
@@ -58,10 +61,12 @@ class PreGameScreen:
         # Load and scale background image to fill the screen
         self.background = pygame.image.load("assets/background.png")
         self.background = pygame.transform.scale(self.background, (self.width, self.height))
+        self.backdrop = Backdrop(self.background)
 
-        # Fonts for general and button text
+        # Fonts for general, button and note text
         self.font = pygame.font.Font(None, 38)
         self.button_font = pygame.font.Font(None, 32)
+        self.note_font = pygame.font.Font(None, 24)
 
         # Game state options
         self.selected_mode = "Normal"
@@ -108,18 +113,10 @@ class PreGameScreen:
 
         Side Effects:
             - Draws the pre-game UI components including buttons, input fields, and player counts.
-            - Renders the background and overlay.
+            - Copies the backdrop (background, overlay and fixed text) to the screen, compositing it
+              again only when the mode changes which fixed text is shown.
         """
-        self.screen.blit(self.background, (0, 0))
-
-        # Overlay for better text readability
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))  # Dark transparent layer
-        self.screen.blit(overlay, (0, 0))
-
-        # Game title
-        title_text = self.font.render("Welcome to Property Tycoon: Select Your Game Options", True, (255, 255, 255))
-        self.screen.blit(title_text, (self.width // 2 - title_text.get_width() // 2, 50))
+        self.backdrop.draw(self.screen, self.selected_mode, self.draw_static_text)
 
         # Game mode buttons
         self.draw_hover_button(self.normal_button_rect, "Normal", selected=self.selected_mode == "Normal")
@@ -127,9 +124,6 @@ class PreGameScreen:
 
         # Show time input for abridged mode
         if self.selected_mode == "Abridged":
-            time_label = self.font.render("Time Limit (mins):", True, (255, 255, 255))
-            self.screen.blit(time_label, (100, 230))
-
             pygame.draw.rect(self.screen, (200, 200, 200), self.input_box, border_radius=5)
             pygame.draw.rect(self.screen, (255, 255, 255), self.input_box, 2, border_radius=5)
 
@@ -138,11 +132,6 @@ class PreGameScreen:
             text_rect = time_text.get_rect(midleft=(self.input_box.x + 10, self.input_box.centery))
             self.screen.blit(time_text, text_rect)
 
-            # Draw (Max: 180 mins) note
-            note_font = pygame.font.Font(None, 24)
-            note_text = note_font.render("(Max: 180 mins)", True, (220, 220, 220))
-            self.screen.blit(note_text, (self.input_box.right + 15, self.input_box.y + 10))
-
         # Player count controls
         human_text = self.font.render(f"Human Players: {self.num_human_players}", True, (255, 255, 255))
         self.screen.blit(human_text, (100, 300))
@@ -159,7 +148,27 @@ class PreGameScreen:
         # Draw Start button (enabled/disabled)
         self.draw_hover_button(self.start_button_rect, "Start", disabled=self.start_disabled)
 
-        pygame.display.flip()
+    def draw_static_text(self, surface):
+        """
+        Draws the text that does not change while a mode is selected: the title, and in Abridged mode
+        the time limit label and its note.
+
+        Args:
+            surface (pygame.Surface): The backdrop being composited.
+
+        Returns:
+            None
+        """
+        title_text = self.font.render("Welcome to Property Tycoon: Select Your Game Options", True, (255, 255, 255))
+        surface.blit(title_text, (self.width // 2 - title_text.get_width() // 2, 50))
+
+        if self.selected_mode == "Abridged":
+            time_label = self.font.render("Time Limit (mins):", True, (255, 255, 255))
+            surface.blit(time_label, (100, 230))
+
+            # Draw (Max: 180 mins) note
+            note_text = self.note_font.render("(Max: 180 mins)", True, (220, 220, 220))
+            surface.blit(note_text, (self.input_box.right + 15, self.input_box.y + 10))
 
 
     def handle_event(self, event):
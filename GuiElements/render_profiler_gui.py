@@ -0,0 +1,211 @@
+import csv
+import time
+
+import numpy as np
+import pygame
+
+
+class _Stage:
+    """Times one stage of a frame; the time is added to the stage's total for the frame."""
+    __slots__ = ("totals", "index", "start")
+
+    def __init__(self, totals, index):
+        self.totals = totals
+        self.index = index
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.totals[self.index] += time.perf_counter() - self.start
+
+
+class _Untimed:
+    """Stands in for a stage while profiling is off."""
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+_UNTIMED = _Untimed()
+
+
+class RenderProfiler:
+    """
+    Times each stage of every frame and shows rolling percentiles in an overlay.
+
+    Stages are timed with `measure`, which returns a shared do-nothing context manager while the
+    profiler is off, so a disabled profiler costs one attribute check per stage. When on, the last
+    `WINDOW` frames are kept in a numpy ring buffer (one row per stage, in seconds), from which the
+    overlay shows p50/p95/p99 per stage and the actual frame rate, and `dump_csv` writes one row per frame.
+
+    Args:
+        screen (pygame.Surface): The surface the overlay is drawn on.
+
+    Attributes:
+        enabled (bool): Whether frames are being timed and the overlay drawn.
+        samples (numpy.ndarray): (stages x WINDOW) stage times in seconds; NaN where no frame was recorded.
+        frame_starts (numpy.ndarray): Start time of each recorded frame.
+        frames (int): Number of frames recorded since the profiler was last enabled.
+    """
+    STAGES = ("events", "logic", "board", "elements", "left_sidebar", "right_sidebar", "dice",
+              "tokens", "hud", "popups", "flip", "frame")
+    WINDOW = 300
+    REFRESH_FRAMES = 15
+
+    def __init__(self, screen):
+        """
+        Initializes a disabled profiler.
+
+        Args:
+            screen (pygame.Surface): The surface the overlay is drawn on.
+
+        Returns:
+            None
+        """
+        self.screen = screen
+        self.enabled = False
+        self.totals = np.zeros(len(self.STAGES))
+        self.stages = {name: _Stage(self.totals, i) for i, name in enumerate(self.STAGES)}
+        self.samples = np.full((len(self.STAGES), self.WINDOW), np.nan)
+        self.frame_starts = np.full(self.WINDOW, np.nan)
+        self.frames = 0
+        self.frame_start = None
+        self.font = None
+        self.lines = []
+        self.panel = None
+
+    def toggle(self):
+        """
+        Turns profiling and the overlay on or off. Turning it on starts a fresh window.
+
+        Returns:
+            bool: Whether the profiler is now enabled.
+        """
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.samples.fill(np.nan)
+            self.frame_starts.fill(np.nan)
+            self.frames = 0
+            self.frame_start = None  # the frame being drawn when the profiler is turned on is not recorded
+            self.lines = []
+        return self.enabled
+
+    def measure(self, stage):
+        """
+        Returns a context manager timing a stage of the current frame.
+
+        Args:
+            stage (str): One of `STAGES`.
+
+        Returns:
+            A context manager; it does nothing while the profiler is disabled.
+        """
+        return self.stages[stage] if self.enabled else _UNTIMED
+
+    def begin_frame(self):
+        """Starts timing a frame."""
+        if self.enabled:
+            self.totals.fill(0.0)
+            self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """
+        Records the frame that has just finished into the ring buffer.
+
+        Side Effects:
+            - Refreshes the overlay text every `REFRESH_FRAMES` frames.
+        """
+        if not self.enabled or self.frame_start is None:
+            return
+        slot = self.frames % self.WINDOW
+        self.totals[-1] = time.perf_counter() - self.frame_start
+        self.samples[:, slot] = self.totals
+        self.frame_starts[slot] = self.frame_start
+        self.frames += 1
+        if self.frames % self.REFRESH_FRAMES == 0:
+            self.lines = self.summary_lines()
+            self.panel = None
+
+    def fps(self):
+        """
+        Returns the frame rate over the recorded window.
+
+        Returns:
+            float: Frames per second, or 0 if fewer than two frames were recorded.
+        """
+        starts = self.frame_starts[~np.isnan(self.frame_starts)]
+        if len(starts) < 2:
+            return 0.0
+        return (len(starts) - 1) / (starts.max() - starts.min())
+
+    def percentiles(self):
+        """
+        Returns the rolling p50/p95/p99 of every stage.
+
+        Returns:
+            dict[str, tuple[float, float, float]]: Milliseconds by stage, for the stages that took any time.
+        """
+        recorded = min(self.frames, self.WINDOW)
+        if recorded == 0:
+            return {}
+        table = np.percentile(self.samples[:, :recorded], (50, 95, 99), axis=1).T * 1000
+        return {name: tuple(row) for name, row, total in zip(self.STAGES, table, self.samples[:, :recorded].sum(axis=1))
+                if total > 0}
+
+    def summary_lines(self):
+        """
+        Formats the overlay text.
+
+        Returns:
+            list[str]: One line for the frame rate, then one per stage.
+        """
+        lines = [f"FPS {self.fps():5.1f}   p50 / p95 / p99 ms"]
+        for name, (p50, p95, p99) in self.percentiles().items():
+            lines.append(f"{name:<13}{p50:6.2f}{p95:7.2f}{p99:7.2f}")
+        return lines
+
+    def draw(self):
+        """
+        Draws the overlay in the top-left corner of the screen.
+
+        Side Effects:
+            - Blits a translucent panel with the last computed statistics, rendering it again only
+              when the statistics have been refreshed.
+        """
+        if not self.enabled or not self.lines:
+            return
+        if self.panel is None:
+            if self.font is None:
+                self.font = pygame.font.SysFont("monospace", 13)
+            line_height = self.font.get_linesize()
+            self.panel = pygame.Surface((270, line_height * len(self.lines) + 10), pygame.SRCALPHA)
+            self.panel.fill((0, 0, 0, 180))
+            for i, line in enumerate(self.lines):
+                self.panel.blit(self.font.render(line, True, (255, 255, 255)), (6, 5 + i * line_height))
+        self.screen.blit(self.panel, (5, 5))
+
+    def dump_csv(self, path="render_profile.csv"):
+        """
+        Writes the recorded window to a CSV file, oldest frame first, with stage times in milliseconds.
+
+        Args:
+            path (str): The file to write (default: "render_profile.csv").
+
+        Returns:
+            int: The number of frames written.
+        """
+        recorded = min(self.frames, self.WINDOW)
+        order = np.arange(self.frames - recorded, self.frames) % self.WINDOW
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(("frame", "start") + self.STAGES)
+            for k, slot in enumerate(order.tolist()):
+                times = (self.samples[:, slot] * 1000).round(3).tolist()
+                writer.writerow([self.frames - recorded + k, round(float(self.frame_starts[slot]), 6)] + times)
+        return recorded
@@ -1,6 +1,7 @@
 import pygame
 import os
 import random
+from GuiElements.backdrop_gui import Backdrop
 
 class TokenSelectionScreen:
     """
@@ -17,6 +18,7 @@ class TokenSelectionScreen:
         width (int): Width of the screen.
         height (int): Height of the screen.
         font (pygame.font.Font): Font used for text rendering.
+        button_font (pygame.font.Font): Font used for button labels.
         allowed_tokens (list): List of token names allowed in the game.
         assets_folder (str): Folder path where token images are stored.
         token_images (dict): A dictionary of token names mapped to their respective images.
@@ -31,6 +33,7 @@ class TokenSelectionScreen:
         confirm_button_rect (pygame.Rect): Rectangle for the confirm/start button.
         click_sound (pygame.mixer.Sound): Sound played when a button is clicked.
         background (pygame.Surface): The background image for the screen.
+        backdrop (Backdrop): The background, overlay and fixed text, composited once per player.
         player_names (dict): A dictionary mapping player numbers to player names.
         name_input_active (bool): Flag indicating if the name input field is active.
         name_input_text (str): Text entered by the player in the name input field.
@@ -61,6 +64,7 @@ class TokenSelectionScreen:
         self.screen = screen
         self.width, self.height = screen.get_size()
         self.font = pygame.font.Font(None, 36)
+        self.button_font = pygame.font.Font(None, 28)
 
         # Allowed token names (must match filenames in assets folder)
         self.allowed_tokens = ["boot", "cat", "hatstand", "iron", "smartphone"]
@@ -90,6 +94,7 @@ class TokenSelectionScreen:
         # Background
         self.background = pygame.image.load("assets/background.png")
         self.background = pygame.transform.scale(self.background, (self.width, self.height))
+        self.backdrop = Backdrop(self.background)
 
         self.player_names = {}  
         self.name_input_active = False
@@ -144,19 +149,13 @@ class TokenSelectionScreen:
             None
 
         Side Effects:
-            - Draws the background, overlay, and UI components on the screen.
+            - Copies the backdrop (background, overlay and fixed text) to the screen, compositing it
+              again only when the next player starts choosing.
             - Renders each available token with hover and selection effects.
-            - Updates the display for player name input and selected tokens.
+            - Draws the player name input and selected tokens.
         """
 
-        self.screen.blit(self.background, (0, 0))
-
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
-
-        title = self.font.render(f"Player {self.current_player}, select your token and enter your name:", True, (255, 255, 255))
-        self.screen.blit(title, (self.width // 2 - title.get_width() // 2, 50))
+        self.backdrop.draw(self.screen, self.current_player, self.draw_static_text)
 
         x_start, y_start = 100, 150
         x_offset = 120
@@ -175,9 +174,6 @@ class TokenSelectionScreen:
             if self.selected_tokens.get(self.current_player) == token:
                 pygame.draw.rect(self.screen, (255, 0, 0), token_rect, 3)
 
-        input_label = self.font.render("Enter name:", True, (255, 255, 255))
-        self.screen.blit(input_label, (100, 270))
-
         name_text = self.player_names.get(self.current_player, f"Player {self.current_player}")
         box_border_color = (255, 255, 255) if self.name_input_active else (200, 200, 200)
         box_fill_color = (240, 240, 240)  
@@ -191,7 +187,6 @@ class TokenSelectionScreen:
 
 
         y_selected = 350
-        self.screen.blit(self.font.render("Selected Players:", True, (255, 255, 255)), (100, y_selected))
 
         for player, token in self.selected_tokens.items():
             name = self.player_names.get(player, "Unknown")
@@ -204,7 +199,20 @@ class TokenSelectionScreen:
         elif len(self.confirmed_players) == self.total_players:
             self.highlight_button(self.confirm_button_rect, (0, 200, 0), "Start Game")
 
-        pygame.display.flip()
+    def draw_static_text(self, surface):
+        """
+        Draws the text that does not change while a player is choosing: the title and the labels.
+
+        Args:
+            surface (pygame.Surface): The backdrop being composited.
+
+        Returns:
+            None
+        """
+        title = self.font.render(f"Player {self.current_player}, select your token and enter your name:", True, (255, 255, 255))
+        surface.blit(title, (self.width // 2 - title.get_width() // 2, 50))
+        surface.blit(self.font.render("Enter name:", True, (255, 255, 255)), (100, 270))
+        surface.blit(self.font.render("Selected Players:", True, (255, 255, 255)), (100, 350))
 
 
     def handle_event(self, event):
@@ -408,6 +416,6 @@ class TokenSelectionScreen:
 
         pygame.draw.rect(self.screen, hover_color, button_rect, border_radius=10)
 
-        text_surf = pygame.font.Font(None, 28).render(text, True, (255, 255, 255))
+        text_surf = self.button_font.render(text, True, (255, 255, 255))
         text_rect = text_surf.get_rect(center=button_rect.center)
         self.screen.blit(text_surf, text_rect)
@@ -0,0 +1,209 @@
+import asyncio
+import unittest
+from collections import deque
+from unittest.mock import MagicMock, patch
+from GameElements.auction import Auction, AuctionResolver, bid_ladder
+from GameElements.bank import Bank
+from GameElements.player import Player
+
+
+def play_out(bidders, prop, highest_bid=0):
+    """Reference auction: every bot bids one round at a time via bot_bid."""
+    queue = deque(bidders)
+    while len(queue) > 1:
+        player = queue.popleft()
+        bid = player.bot_bid(highest_bid, prop)
+        if bid == "exit" or int(bid) > player.balance or int(bid) <= highest_bid:
+            continue
+        highest_bid = int(bid)
+        queue.append(player)
+    return queue[0], highest_bid
+
+
+class TestAuctionResolver(unittest.TestCase):
+    def setUp(self):
+        self.resolver = AuctionResolver()
+        self.game = MagicMock()
+        self.prop = MagicMock()
+        self.prop.name = "Turing Heights"
+        self.prop.price = 400
+
+    def make_bot(self, name, balance, identity="Basic Bot"):
+        bot = Player(name, "boot", identity, self.game)
+        bot.balance = balance
+        return bot
+
+    # bid_ladder(price, start_bid)
+    def test_bid_ladder_is_strictly_increasing_and_capped(self):
+        ladder = bid_ladder(400, 0)
+        self.assertEqual(ladder[0], 0)
+        self.assertTrue(all(a < b for a, b in zip(ladder, ladder[1:])))
+        self.assertLessEqual(ladder[-1], 600)
+        self.assertEqual(ladder[1], Player.basic_bot_raise(0, 400))
+
+    # can_resolve(self, bidders)
+    def test_cannot_resolve_with_human_bidders(self):
+        human = self.make_bot("Alice", 1500, identity="Human")
+        bot = self.make_bot("Bot", 1500)
+        self.assertFalse(self.resolver.can_resolve([human, bot]))
+        self.assertTrue(self.resolver.can_resolve([bot]))
+
+    # resolve(self, bidders, property, highest_bid=0, highest_bidder=None)
+    def test_resolve_matches_round_by_round_auction(self):
+        for balances in ([1500, 1500], [300, 450, 1000], [120, 130, 140, 150, 160], [50, 1500, 700, 700]):
+            for start in (0, 37, 400):
+                bots = [self.make_bot(f"Bot {i}", b) for i, b in enumerate(balances)]
+                expected = play_out(list(bots), self.prop, start)
+                survivor, highest_bid, _, _ = self.resolver.resolve(list(bots), self.prop, start)
+                self.assertEqual((survivor, highest_bid), expected)
+
+    def test_resolve_richest_bot_wins_at_policy_cap(self):
+        bots = [self.make_bot("Poor", 100), self.make_bot("Rich", 5000), self.make_bot("Richer", 6000)]
+        survivor, highest_bid, highest_bidder, bids = self.resolver.resolve(bots, self.prop)
+        self.assertIn(survivor, bots[1:])
+        self.assertIs(highest_bidder, survivor)
+        self.assertLessEqual(highest_bid, 600)
+        self.assertGreater(bids, 0)
+
+    def test_resolve_bots_that_never_bid(self):
+        bots = [self.make_bot("Lazy", 1500, identity="Lazy Bot"), self.make_bot("Bot", 1500)]
+        survivor, highest_bid, highest_bidder, bids = self.resolver.resolve(bots, self.prop)
+        self.assertIs(survivor, bots[1])
+        self.assertEqual(highest_bid, 0)
+        self.assertIsNone(highest_bidder)
+        self.assertEqual(bids, 0)
+
+    # Bank.bid_property with only bots left
+    @patch("builtins.print")
+    def test_bank_bid_property_fast_forwards_bots(self, mock_print):
+        bank = Bank()
+        bots = [self.make_bot("Bot A", 500), self.make_bot("Bot B", 800)]
+        with patch.object(Player, "bot_bid", wraps=bots[0].bot_bid) as mock_bot_bid:
+            winner, final_bid = bank.bid_property(bots, self.prop)
+            mock_bot_bid.assert_not_called()
+        self.assertEqual((winner, final_bid), play_out(list(bots), self.prop))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAuction(unittest.TestCase):
+    def setUp(self):
+        self.bank = Bank()
+        self.game = MagicMock()
+        self.prop = MagicMock()
+        self.prop.name = "Turing Heights"
+        self.prop.price = 400
+        self.log = MagicMock()
+        self.clock = FakeClock()
+        self.alice = self.make_player("Alice", 1500, "Human")
+        self.bob = self.make_player("Bob", 1500, "Human")
+
+    def make_player(self, name, balance, identity="Basic Bot"):
+        player = Player(name, "boot", identity, self.game)
+        player.balance = balance
+        return player
+
+    def open(self, bidders, **kwargs):
+        return Auction(self.bank, self.prop, bidders, log=self.log, clock=self.clock, **kwargs)
+
+    # submit_bid(self, player, amount) / pass_turn(self, player)
+    def test_highest_bidder_wins_and_pays_the_bank(self):
+        auction = self.open([self.alice, self.bob])
+        auction.submit_bid(self.alice, 200)
+        auction.submit_bid(self.bob, 250)
+        auction.pass_turn(self.alice)
+        self.assertTrue(auction.finished)
+        self.assertIs(auction.winner, self.bob)
+        self.assertEqual(self.bob.balance, 1250)
+        self.assertEqual(self.bank.balance, 50250)
+        self.prop.transfer_property.assert_called_once_with(self.bob)
+
+    def test_moves_out_of_turn_are_ignored(self):
+        auction = self.open([self.alice, self.bob])
+        auction.submit_bid(self.bob, 300)
+        auction.pass_turn(self.bob)
+        self.assertIs(auction.current_bidder, self.alice)
+        self.assertEqual(auction.highest_bid, 0)
+        self.assertEqual(auction.exited, [])
+
+    def test_invalid_human_bid_keeps_the_turn(self):
+        auction = self.open([self.alice, self.bob])
+        auction.submit_bid(self.alice, 2000)
+        auction.submit_bid(self.alice, "abc")
+        self.assertIs(auction.current_bidder, self.alice)
+        auction.submit_bid(self.alice, 100)
+        self.assertIs(auction.current_bidder, self.bob)
+
+    def test_no_bids_leaves_property_unsold(self):
+        auction = self.open([self.alice, self.bob])
+        auction.pass_turn(self.alice)
+        self.assertIs(auction.current_bidder, self.bob)
+        auction.pass_turn(self.bob)
+        self.assertTrue(auction.finished)
+        self.assertIsNone(auction.winner)
+        self.prop.transfer_property.assert_not_called()
+
+    # check_timeout(self, now=None)
+    def test_check_timeout_drops_the_current_bidder(self):
+        auction = self.open([self.alice, self.bob], turn_timeout=10)
+        auction.submit_bid(self.alice, 100)
+        self.clock.now = 5
+        self.assertFalse(auction.check_timeout())
+        self.assertEqual(auction.time_left(), 5)
+        self.clock.now = 10
+        self.assertTrue(auction.check_timeout())
+        self.assertIs(auction.winner, self.alice)
+        self.assertEqual(auction.exited, [self.bob])
+
+    # bots act on their own
+    def test_bots_play_their_turns_without_a_driver(self):
+        bot = self.make_player("Bot", 1500)
+        auction = self.open([bot, self.alice])
+        self.assertGreater(auction.highest_bid, 0)
+        self.assertIs(auction.highest_bidder, bot)
+        self.assertIs(auction.current_bidder, self.alice)
+        auction.pass_turn(self.alice)
+        self.assertIs(auction.winner, bot)
+
+    def test_listeners_are_notified(self):
+        auction = self.open([self.alice, self.bob])
+        events = []
+        auction.listeners.append(lambda a, event: events.append(event))
+        auction.submit_bid(self.alice, 100)
+        auction.pass_turn(self.bob)
+        self.assertEqual(events, ["bid", "turn", "pass", "finished"])
+
+    # run(self, get_bid) / wait(self)
+    def test_run_times_out_slow_bidders(self):
+        auction = Auction(self.bank, self.prop, [self.alice, self.bob], turn_timeout=0.01, log=self.log)
+
+        async def get_bid(player, auction):
+            if player is self.alice:
+                return 100
+            await asyncio.sleep(1)
+
+        async def main():
+            waiter = asyncio.ensure_future(auction.wait())
+            result = await auction.run(get_bid)
+            self.assertEqual(await waiter, result)
+            return result
+
+        self.assertEqual(asyncio.run(main()), (self.alice, 100))
+        self.assertEqual(auction.exited, [self.bob])
+
+    # Bank.open_auction(self, property, bidders, highest_bid=0, turn_timeout=None, log=print)
+    def test_bank_open_auction(self):
+        auction = self.bank.open_auction(self.prop, [self.alice, self.bob], turn_timeout=30, log=self.log)
+        self.assertIsInstance(auction, Auction)
+        self.assertIs(auction.current_bidder, self.alice)
+        self.assertIsNotNone(auction.deadline)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -333,6 +333,44 @@ class TestBank(unittest.TestCase):
         self.assertEqual(self.property.houses, 4)  # House count should not exceed 5
         self.assertEqual(self.bank.balance, initial_bank_balance)
 
+    # build_houses(self, plr, allocation)
+    @patch("builtins.print")
+    def test_build_houses_applies_whole_allocation(self, mock_print):
+        """Test that a batched build adds every house and charges once."""
+        second = MagicMock(houses=0, house_cost=100, group="Blue")
+        self.player1.owned_properties = [self.property, second]
+        self.property.check_completion = MagicMock(return_value=True)
+        initial_bank_balance = self.bank.balance
+
+        self.bank.build_houses(self.player1, {self.property: 2, second: 1})
+
+        self.assertEqual((self.property.houses, second.houses), (2, 1))
+        self.assertEqual(self.player1.balance, 700)
+        self.assertEqual(self.bank.balance, initial_bank_balance + 300)
+
+    @patch("builtins.print")
+    def test_build_houses_rejects_uneven_allocation(self, mock_print):
+        """Test that nothing is built if the group would become uneven."""
+        second = MagicMock(houses=0, house_cost=100, group="Blue")
+        self.player1.owned_properties = [self.property, second]
+        self.property.check_completion = MagicMock(return_value=True)
+
+        self.bank.build_houses(self.player1, {self.property: 2})
+
+        self.assertEqual((self.property.houses, second.houses), (0, 0))
+        self.assertEqual(self.player1.balance, 1000)
+
+    @patch("builtins.print")
+    def test_build_houses_insufficient_funds(self, mock_print):
+        """Test that nothing is built if the player cannot pay for the whole allocation."""
+        self.property.check_completion = MagicMock(return_value=True)
+        self.player1.balance = 150
+
+        self.bank.build_houses(self.player1, {self.property: 2})
+
+        self.assertEqual(self.property.houses, 0)
+        self.assertEqual(self.player1.balance, 150)
+
     # pay_player(self, player, amount)
     def test_pay_player_success(self):
         """Test successful payment from bank to player."""
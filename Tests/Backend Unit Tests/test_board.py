@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+from GameElements.bank import Bank
+from GameElements.board import load_board
+from GameElements.property import Property
+
+
+class TestBoardModel(unittest.TestCase):
+    def setUp(self):
+        self.board = load_board()
+
+    # load_board(path)
+    def test_board_is_compiled_once(self):
+        self.assertIs(load_board(), self.board)
+        self.assertIs(Bank().board, self.board)
+
+    def test_tables_are_read_only(self):
+        with self.assertRaises(ValueError):
+            self.board.prices[2] = 0
+
+    def test_tiles_are_parsed_from_csv(self):
+        self.assertEqual(self.board.size, 40)
+        self.assertEqual(len(self.board.property_positions), 28)
+        self.assertEqual(self.board.kind(31), "go_to_jail")
+        self.assertEqual(self.board.kind(37), "opportunity_knocks")
+        self.assertEqual(self.board.taxes[[5, 39]].tolist(), [200, 75])
+        self.assertEqual(self.board.rents[6, :4].tolist(), [25, 50, 100, 200])
+        self.assertEqual(self.board.rents[13, :2].tolist(), [4, 10])
+        self.assertEqual(self.board.house_costs[[2, 12, 22, 40]].tolist(), [50, 100, 150, 200])
+
+    # group_size_map(self)
+    def test_group_sizes_match_properties(self):
+        sizes = self.board.group_size_map()
+        self.assertEqual(sizes, Property.color_group_sizes)
+        self.assertEqual(sum(sizes.values()), 28)
+        self.assertEqual(sizes["Blue"], 3)
+
+    # new_properties(self)
+    def test_new_properties_are_independent(self):
+        first, second = self.board.new_properties(), self.board.new_properties()
+        first[2].houses = 3
+        self.assertEqual(second[2].houses, 0)
+        self.assertIs(first[2].rent, second[2].rent)
+        self.assertEqual(first[40].group, "Deep blue")
+
+    # tiles(self)
+    def test_tiles_for_gui(self):
+        tiles = self.board.tiles()
+        self.assertEqual(tiles[1], {"Position": 2, "Name": "The Old Creek", "Group": "Brown", "Price": 60})
+        self.assertTrue(np.isnan(tiles[0]["Price"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from itertools import product
+from unittest.mock import patch
+from GameElements.game_logic import Game
+
+
+class TestBuildPlanner(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(["Alice", "Bob"], ["Car", "Hat"], ["Basic Bot", "Basic Bot"])
+        self.alice = self.game.players[0]
+        self.planner = self.game.build_planner
+        self.props = self.game.bank.properties
+        with patch("builtins.print"):
+            for position in (2, 4, 17, 19, 20, 6, 16, 26, 36):  # Brown, Orange and every station
+                self.props[position].transfer_property(self.alice)
+        self.brown = [self.props[2], self.props[4]]
+        self.orange = [self.props[17], self.props[19], self.props[20]]
+
+    # buildable_groups(self, player)
+    def test_buildable_groups_skip_stations_and_mortgages(self):
+        groups = self.planner.buildable_groups(self.alice)
+        self.assertEqual(sorted(g[0].group for g in groups), ["Brown", "Orange"])
+        self.props[2].mortgaged = True
+        self.assertEqual([g[0].group for g in self.planner.buildable_groups(self.alice)], ["Orange"])
+
+    # group_options(self, props, opponents)
+    def test_group_options_keep_houses_even(self):
+        options = self.planner.group_options(self.orange, 1)
+        self.assertEqual(len(options), 16)
+        for cost, income, allocation in options:
+            houses = [p.houses + allocation.get(p, 0) for p in self.orange]
+            self.assertLessEqual(max(houses) - min(houses), 1)
+            self.assertEqual(cost, 100 * sum(allocation.values()))
+
+    # plan(self, player, budget, opponents)
+    def test_plan_is_optimal_within_budget(self):
+        brown = self.planner.group_options(self.brown, 1)
+        orange = self.planner.group_options(self.orange, 1)
+        for budget in (0, 49, 100, 350, 900, 2000):
+            plan = self.planner.plan(self.alice, budget, 1)
+            self.assertLessEqual(plan.cost, budget)
+            best = max(b[1] + o[1] for b, o in product(brown, orange) if b[0] + o[0] <= budget)
+            self.assertAlmostEqual(plan.income, best)
+
+    def test_plan_is_empty_without_budget(self):
+        self.assertEqual(self.planner.plan(self.alice, -50, 1).allocation, {})
+
+    # Game.handle_position builds the plan for bots
+    @patch("builtins.print")
+    def test_bot_builds_plan_and_keeps_reserve(self, mock_print):
+        self.alice.balance = 700
+        self.alice.position = 1
+        self.game.handle_position(self.alice)
+        self.assertGreaterEqual(self.alice.balance, 200)
+        self.assertGreater(sum(p.houses for p in self.brown + self.orange), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
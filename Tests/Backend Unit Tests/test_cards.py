@@ -1,6 +1,8 @@
+import pickle
 import unittest
 from unittest.mock import MagicMock, patch
-from GameElements.cards import Card, Cards, CardDeck
+from GameElements.cards import Card, Cards, CardDeck, compile_effect
+from GameElements.game_logic import Game
 
 class TestCard(unittest.TestCase):
 
@@ -103,6 +105,8 @@ class TestCards(unittest.TestCase):
         self.cards = Cards()
         self.mock_player = MagicMock()
         self.mock_game = MagicMock()
+        self.mock_player.balance = 1500
+        self.mock_player.position = 1
         self.cards.pot_luck_deck.draw_card = MagicMock()
         self.cards.opportunity_knocks_deck.draw_card = MagicMock()
 
@@ -126,5 +130,65 @@ class TestCards(unittest.TestCase):
         self.cards.draw_opportunity_knocks_card(self.mock_player, self.mock_game)
         self.cards.opportunity_knocks_deck.draw_card.assert_called_once_with(self.mock_player, self.mock_game)
 
+    # load_card_data(path)
+    def test_decks_are_loaded_from_data(self):
+        descriptions = [card.description for card in self.cards.pot_luck_deck.pool]
+        self.assertIn("You inherit £200", descriptions)
+        self.assertEqual(pickle.loads(pickle.dumps(self.cards.pot_luck_deck.pool))[0].description,
+                         self.cards.pot_luck_deck.pool[0].description)
+
+    # compile_effect(record)
+    def test_compile_effect_rejects_bad_records(self):
+        self.assertEqual(compile_effect({"effect": "charge", "amount": 15, "reason": "speeding"}).args, (15, "speeding"))
+        with self.assertRaises(ValueError):
+            compile_effect({"effect": "teleport"})
+        with self.assertRaises(ValueError):
+            compile_effect({"effect": "reward", "amount": 10})
+
+    # return_jail_card_to_bottom(self, deck=None)
+    @patch("builtins.print")
+    def test_jail_card_is_kept_until_returned(self, mock_print):
+        deck = Cards().pot_luck_deck
+        jail_free = next(i for i, card in enumerate(deck.pool) if card.kept_by_player)
+        while int(deck.order[deck.head]) != jail_free:
+            deck.draw_card(self.mock_player, self.mock_game)
+        self.mock_player.get_out_of_jail_cards = 0
+        deck.draw_card(self.mock_player, self.mock_game)
+        self.assertEqual(self.mock_player.get_out_of_jail_cards, 1)
+        self.assertEqual(len(deck), 8)
+        self.assertNotIn(deck.pool[jail_free], deck.cards)
+
+        self.cards.pot_luck_deck = deck
+        self.cards.return_jail_card_to_bottom()
+        self.assertEqual(len(deck), 9)
+        self.assertIs(deck.cards[-1], deck.pool[jail_free])
+
+    # Game.remove_player(self, player)
+    @patch("builtins.print")
+    def test_kept_jail_cards_return_when_their_holder_leaves(self, mock_print):
+        game = Game(["Ann", "Bob"], ["Boot", "Cat"], ["Basic Bot", "Basic Bot"])
+        ann = game.players[0]
+        for deck in (game.cards.pot_luck_deck, game.cards.opportunity_knocks_deck):
+            jail_free = next(i for i, card in enumerate(deck.pool) if card.kept_by_player)
+            while int(deck.order[deck.head]) != jail_free:
+                deck.draw_card(self.mock_player, self.mock_game)
+            deck.draw_card(ann, game)
+        self.assertEqual(ann.get_out_of_jail_cards, 2)
+
+        game.remove_player(ann)
+        self.assertEqual(ann.get_out_of_jail_cards, 0)
+        self.assertEqual((len(game.cards.pot_luck_deck), len(game.cards.opportunity_knocks_deck)), (9, 11))
+
+    # snapshot(self) / restore(self, state)
+    @patch("builtins.print")
+    def test_snapshot_restores_deck_order(self, mock_print):
+        deck = Cards().opportunity_knocks_deck
+        state = deck.snapshot()
+        before = deck.cards
+        for _ in range(5):
+            deck.draw_card(self.mock_player, self.mock_game)
+        deck.restore(state)
+        self.assertEqual(deck.cards, before)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
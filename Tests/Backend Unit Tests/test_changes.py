@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import patch
+from GameElements.changes import ChangeFeed
+from GameElements.game_logic import Game
+
+
+class TestChangeFeed(unittest.TestCase):
+    def setUp(self):
+        with patch("builtins.print"):
+            self.game = Game(["Ann", "Bob"], ["Boot", "Cat"], ["Basic Bot", "Basic Bot"])
+        self.ann, self.bob = self.game.players
+        self.received = []
+
+    # ChangeFeed.subscribe(self, listener, kinds=None) / ChangeFeed.publish(self, kind, subject, old, new)
+    def test_listeners_only_receive_their_kinds(self):
+        feed = ChangeFeed()
+        feed.subscribe(self.received.append, ["balance"])
+        feed.publish("position", self.ann, 1, 5)
+        feed.publish("balance", self.ann, 1500, 1400)
+
+        self.assertEqual(feed.version, 2)
+        self.assertEqual([(c.version, c.kind, c.old, c.new) for c in self.received], [(2, "balance", 1500, 1400)])
+        with self.assertRaises(ValueError):
+            feed.subscribe(self.received.append, ["colour"])
+
+    # ChangeFeed.unsubscribe(self, listener)
+    def test_unsubscribed_listeners_are_not_called(self):
+        self.game.changes.subscribe(self.received.append)
+        self.game.changes.unsubscribe(self.received.append)
+        self.ann.balance -= 100
+
+        self.assertEqual(self.received, [])
+        self.assertEqual(self.game.version, 1)
+
+    # Player.balance / Player.position
+    def test_player_changes_are_published_once_per_change(self):
+        self.game.changes.subscribe(self.received.append)
+        self.ann.balance = 1500  # unchanged
+        self.ann.balance -= 200
+        self.ann.position = 8
+
+        self.assertEqual([(c.kind, c.subject, c.old, c.new) for c in self.received],
+                         [("balance", self.ann, 1500, 1300), ("position", self.ann, 1, 8)])
+
+    # Property.owner / Property.houses / Property.mortgaged
+    def test_property_changes_are_published(self):
+        prop = self.game.bank.properties[2]
+        self.game.changes.subscribe(self.received.append, ["owner", "houses", "mortgaged"])
+        with patch("builtins.print"):
+            prop.transfer_property(self.ann)
+        prop.houses = 2
+        prop.mortgaged = True
+
+        self.assertEqual([(c.kind, c.subject, c.old, c.new) for c in self.received],
+                         [("owner", prop, None, self.ann), ("houses", prop, 0, 2), ("mortgaged", prop, False, True)])
+
+    # Game.remove_player(self, player)
+    def test_removing_a_player_publishes_the_returned_properties(self):
+        prop = self.game.bank.properties[2]
+        with patch("builtins.print"):
+            prop.transfer_property(self.bob)
+        self.game.changes.subscribe(self.received.append)
+        with patch("builtins.print"):
+            self.game.remove_player(self.bob)
+
+        kinds = [(c.kind, c.subject) for c in self.received]
+        self.assertIn(("owner", prop), kinds)
+        self.assertEqual(kinds[-1], ("removed", self.bob))
+
+
+if __name__ == "__main__":
+    unittest.main()
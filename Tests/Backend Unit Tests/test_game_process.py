@@ -0,0 +1,73 @@
+import time
+import unittest
+from unittest.mock import patch
+from GameElements.game_logic import Game
+from GameElements.game_process import GameProcess, SharedGameState
+
+
+class TestSharedGameState(unittest.TestCase):
+    def setUp(self):
+        with patch("builtins.print"):
+            self.game = Game(["Ann", "Bob"], ["Boot", "Cat"], ["Human", "Basic Bot"])
+            self.replica = Game(["Ann", "Bob"], ["Boot", "Cat"], ["Human", "Basic Bot"])
+        self.state = SharedGameState(2)
+        self.reader = SharedGameState(2, self.state.name)
+
+    def tearDown(self):
+        self.reader.close()
+        self.state.close()
+
+    # SharedGameState.read_into(self, game, seats, version)
+    def test_published_state_is_read_into_a_replica(self):
+        ann, bob = self.game.players
+        self.game.bank.properties[2].transfer_property(ann)
+        self.game.bank.properties[6].transfer_property(bob)
+        self.game.bank.properties[6].mortgaged = True
+        bob.position, bob.in_jail, bob.turns_taken = 11, True, 4
+        self.game.fines = 100
+        self.game.current_player_index = 1
+
+        self.assertEqual(self.reader.read_into(self.replica, self.replica.players, 0), 0)
+        self.state.publish(self.game, self.game.players, turns=8)
+        version = self.reader.read_into(self.replica, self.replica.players, 0)
+
+        self.assertEqual(version, 2)
+        r_ann, r_bob = self.replica.players
+        self.assertEqual((r_bob.position, r_bob.in_jail, r_bob.turns_taken), (11, True, 4))
+        self.assertIs(self.replica.bank.properties[2].owner, r_ann)
+        self.assertTrue(self.replica.bank.properties[6].mortgaged)
+        self.assertEqual((self.replica.fines, self.replica.current_player_index), (100, 1))
+        self.assertEqual(self.reader.header[1], 8)
+
+    # SharedGameState.read_into(self, game, seats, version)
+    def test_reader_skips_a_state_being_written(self):
+        self.state.publish(self.game, self.game.players)
+        self.state.header[0] += 1
+        self.assertEqual(self.reader.read_into(self.replica, self.replica.players, 2), 2)
+
+
+class TestGameProcess(unittest.TestCase):
+    # GameProcess.sync(self)
+    def test_worker_plays_while_the_replica_follows(self):
+        with patch("builtins.print"):
+            process = GameProcess(["Ann", "Bob", "Cy"], ["Boot", "Cat", "Iron"], ["Human", "Basic Bot", "Basic Bot"],
+                                  seed=2, turn_delay=0)
+            answers = 0
+            deadline = time.monotonic() + 30
+            try:
+                while answers < 20 and not process.finished and time.monotonic() < deadline:
+                    process.sync()
+                    if process.pending is not None:
+                        self.assertTrue(process.answer())
+                        answers += 1
+                    time.sleep(0.002)
+            finally:
+                process.stop()
+
+        self.assertTrue(answers == 20 or process.finished)
+        self.assertFalse(process.process.is_alive())
+        self.assertGreater(sum(p.turns_taken for p in process.seats), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
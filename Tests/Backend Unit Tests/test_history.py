@@ -0,0 +1,62 @@
+import asyncio
+import random
+import unittest
+from unittest.mock import patch
+from GameElements.game_logic import Game
+from GameElements.history import FIELDS, TurnHistory
+from GameElements.host import GameHost
+
+
+class TestTurnHistory(unittest.TestCase):
+    def setUp(self):
+        with patch("builtins.print"):
+            self.game = Game(["Ann", "Bob"], ["Boot", "Cat"], ["Basic Bot", "Basic Bot"])
+        self.ann, self.bob = self.game.players
+        self.history = self.game.history
+
+    # TurnHistory.record(self, player=None)
+    def test_records_every_field_of_every_player(self):
+        prop = self.game.bank.properties[2]  # The Old Creek: £60, houses £50
+        with patch("builtins.print"):
+            self.ann.buy_property(prop)
+        prop.houses = 2
+        self.ann.position = 2
+        self.history.record(self.ann)
+
+        self.assertEqual(len(self.history), 1)
+        self.assertEqual([int(self.history.series(field, self.ann)[0]) for field in FIELDS], [1440, 1600, 2, 1, 2])
+        self.assertEqual(self.history.series("balance").tolist(), [[1440, 1500]])
+        self.assertEqual(self.history.movers().tolist(), [0])
+        with self.assertRaises(ValueError):
+            self.history.series("jail")
+
+    def test_buffers_grow_and_players_who_left_are_zero(self):
+        history = TurnHistory(self.game, capacity=4)
+        for _ in range(600):
+            self.ann.balance += 1
+            history.record(self.bob)
+        with patch("builtins.print"):
+            self.game.remove_player(self.bob)
+        history.record()
+
+        self.assertEqual(len(history), 601)
+        self.assertEqual(history.series("balance", self.ann)[-2:].tolist(), [2100, 2100])
+        self.assertEqual(history.series("balance", self.bob)[-2:].tolist(), [1500, 0])
+        self.assertEqual(history.movers()[-2:].tolist(), [1, -1])
+
+    # Game.play_turn(self, die1, die2)
+    def test_every_turn_of_a_game_is_recorded(self):
+        random.seed(5)
+        table = GameHost().create_table(["A", "B", "C"], ["Boot", "Cat", "Iron"], ["Basic Bot"] * 3, seed=5)
+        with patch("builtins.print"):
+            asyncio.run(table.run(200))
+
+        history = table.game.history
+        self.assertEqual(len(history), table.turns)
+        for player in table.game.players:
+            self.assertEqual(history.series("houses", player)[-1], sum(p.houses for p in player.owned_properties))
+            self.assertEqual(history.series("net_worth", player)[-1], table.game.net_worth.net_worth(player))
+
+
+if __name__ == "__main__":
+    unittest.main()
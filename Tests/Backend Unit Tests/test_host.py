@@ -0,0 +1,84 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+from GameElements.host import BotAgent, GameHost
+
+
+class TestGameHost(unittest.TestCase):
+    def setUp(self):
+        self.requests = []
+        self.host = GameHost(on_request=self.requests.append)
+
+    def run_async(self, coroutine):
+        with patch("builtins.print"):
+            return asyncio.run(coroutine)
+
+    # GameTable.run(self, max_turns=None)
+    def test_tables_with_local_agents_play_to_the_turn_limit(self):
+        async def play():
+            tables = [self.host.create_table(["Ann", "Bot"], ["Boot", "Cat"], ["Human", "Basic Bot"],
+                                             agents={"Ann": BotAgent()}, seed=i) for i in range(5)]
+            await asyncio.gather(*(self.host.start(table, 60) for table in tables))
+            return tables
+
+        tables = self.run_async(play())
+        self.assertTrue(all(table.turns == 60 or len(table.game.players) == 1 for table in tables))
+        self.assertEqual(self.host.tables, {})
+        self.assertEqual(self.requests, [])
+
+    # GameHost.submit(self, table_id, player_name, answer)
+    def test_remote_seat_waits_for_submitted_answers(self):
+        async def play():
+            table = self.host.create_table(["Ann", "Bot"], ["Boot", "Cat"], ["Human", "Basic Bot"], seed=3)
+            task = self.host.start(table, 4)
+            await asyncio.sleep(0)
+            self.assertEqual([r.kind for r in self.host.waiting()], ["roll"])
+            self.assertFalse(self.host.submit(table.table_id, "Bot", True))
+            agent = BotAgent()
+            while not task.done():
+                await asyncio.sleep(0)
+                for request in self.host.waiting():
+                    self.assertTrue(self.host.submit(request.table_id, request.player.name, await agent(request)))
+            return table
+
+        table = self.run_async(play())
+        self.assertEqual(table.turns, 4)
+        self.assertTrue(self.requests)
+
+    # GameTable.settle_debt(self, player, amount, creditor)
+    def test_human_debt_is_settled_by_the_seat(self):
+        async def play():
+            table = self.host.create_table(["Ann", "Bob"], ["Boot", "Cat"], ["Human", "Human"],
+                                           agents={"Ann": BotAgent()})
+            ann, bob = table.game.players
+            table.game.bank.properties[6].transfer_property(ann)
+            ann.balance = 10
+            ann.avoid_bankruptcy(100, bob)
+            self.assertEqual(table.game.deferred, [("debt", ann, 100, bob)])
+            await table.settle_deferred()
+            return ann, bob, table.game.bank.properties[6]
+
+        ann, bob, station = self.run_async(play())
+        self.assertTrue(station.mortgaged)
+        self.assertEqual((ann.balance, bob.balance), (10, 1600))
+
+    # GameTable.run_auction(self, prop, players)
+    def test_auctions_with_humans_are_deferred_and_awaited(self):
+        async def play():
+            table = self.host.create_table(["Ann", "Bot"], ["Boot", "Cat"], ["Human", "Basic Bot"],
+                                           agents={"Ann": BotAgent()})
+            for player in table.game.players:
+                player.passed = True
+            bot = table.game.players[1]
+            bot.position = 2
+            table.game.start_auction(bot)
+            self.assertEqual(table.game.deferred[0][0], "auction")
+            await table.settle_deferred()
+            return table.game.bank.properties[2]
+
+        prop = self.run_async(play())
+        self.assertIsNotNone(prop.owner)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import asyncio
+import random
+import unittest
+from unittest.mock import patch
+from GameElements.game_logic import Game
+from GameElements.host import GameHost
+from GameElements.ledger import JOURNAL_DTYPE, PARKING, Ledger
+
+
+class TestLedger(unittest.TestCase):
+    def setUp(self):
+        with patch("builtins.print"):
+            self.game = Game(["Ann", "Bob"], ["Boot", "Cat"], ["Basic Bot", "Basic Bot"])
+        self.ann, self.bob = self.game.players
+        self.bank = self.game.bank
+        self.ledger = self.game.ledger
+
+    # Ledger.transfer(self, payer, payee, amount, category)
+    def test_transfers_update_balances_and_running_totals(self):
+        self.ledger.transfer(self.ann, self.bob, 100, "rent")
+        self.ledger.transfer(self.ann, self.bank, 60, "purchase")
+        self.ledger.transfer(self.bank, PARKING, 200, "parking")
+        self.ledger.transfer(self.bank, self.bob, 200, "go")
+
+        self.assertEqual((self.ann.balance, self.bob.balance, self.game.fines), (1340, 1800, 200))
+        self.assertEqual(self.bank.balance, 50000 + 60 - 200 - 200)
+        self.assertEqual(self.ledger.received(self.bob), 300)
+        self.assertEqual(self.ledger.received(self.bob, "rent"), 100)
+        self.assertEqual(self.ledger.paid(self.ann, "purchase"), 60)
+        self.assertEqual(self.ledger.volume("go"), 200)
+        self.assertEqual(self.ledger.supply, self.ann.balance + self.bob.balance + self.game.fines)
+
+    def test_tax_is_booked_once(self):
+        self.ann.position = 5
+        with patch("builtins.print"):
+            self.game.handle_position(self.ann)
+        self.assertEqual((self.ann.balance, self.game.fines), (1300, 200))
+        self.assertEqual(self.ledger.volume("tax"), 200)
+        self.assertEqual(self.ledger.received(self.bank, "tax"), 200)
+        self.assertEqual(self.ledger.paid(self.bank, "tax"), 0)
+
+    # Ledger.post(self, transfers, category, require_funds=False)
+    def test_a_batch_is_refused_whole_if_a_payer_cannot_cover_it(self):
+        self.bob.balance = 50
+        payments = [(self.ann, self.bob, 300), (self.bob, self.ann, 100)]
+
+        self.assertFalse(self.ledger.post(payments, "trade", require_funds=True))
+        self.assertEqual((self.ann.balance, self.bob.balance, len(self.ledger)), (1500, 50, 0))
+        self.assertTrue(self.ledger.post(payments, "trade"))
+        self.assertEqual((self.ann.balance, self.bob.balance), (1300, 250))
+        self.assertEqual(set(self.ledger.entries()["batch"]), {1})
+
+    def test_invalid_transfers_raise(self):
+        with self.assertRaises(ValueError):
+            self.ledger.transfer(self.ann, self.bob, 10, "gift")
+        with self.assertRaises(ValueError):
+            self.ledger.post([(self.ann, self.bob, 10), (self.bob, self.ann, -5)], "trade")
+        self.assertEqual((self.ann.balance, len(self.ledger)), (1500, 0))
+
+    # Ledger.entries(self)
+    def test_journal_grows_and_is_read_only(self):
+        for _ in range(300):
+            self.ledger.transfer(self.ann, self.bob, 1, "other")
+        entries = self.ledger.entries()
+
+        self.assertEqual((len(entries), entries.dtype), (300, JOURNAL_DTYPE))
+        self.assertEqual(int(entries["amount"].sum()), 300)
+        with self.assertRaises(ValueError):
+            entries["amount"][0] = 5
+        received, _ = self.ledger.totals()
+        self.assertEqual(int(received[self.ledger.register(self.bob)].sum()), 300)
+
+    # Ledger.of(game)
+    def test_games_without_a_ledger_get_one_over_their_bank(self):
+        class Stub:
+            fines = 0
+        stub = Stub()
+        stub.bank = self.bank
+        Ledger.of(stub).transfer(self.ann, PARKING, 50, "jail")
+
+        self.assertIs(Ledger.of(self.game), self.ledger)
+        self.assertEqual((self.ann.balance, stub.fines), (1450, 50))
+
+    def test_money_is_conserved_over_whole_games(self):
+        random.seed(11)
+        table = GameHost().create_table(["A", "B", "C", "D"], ["Boot", "Cat", "Iron", "Hatstand"], ["Basic Bot"] * 4, seed=11)
+        game = table.game
+        start = game.bank.balance + 4 * 1500
+        with patch("builtins.print"):
+            asyncio.run(table.run(150))
+
+        ledger = game.ledger
+        self.assertGreater(len(ledger), 0)
+        self.assertEqual(ledger.supply, start - game.bank.balance)
+        self.assertEqual(ledger.supply, sum(player.balance for player in game.players) + game.fines)
+        received, paid = ledger.totals()
+        self.assertEqual(int(received.sum()), int(paid.sum()))
+        for player in game.players:
+            number = ledger.register(player)
+            self.assertEqual(player.balance, 1500 + int(received[number].sum()) - int(paid[number].sum()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import timeit
+import unittest
+from itertools import product
+from unittest.mock import MagicMock, patch
+from GameElements.game_logic import Game
+
+
+class TestLiquidationPlanner(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(["Alice", "Bob"], ["Car", "Hat"], ["Basic Bot", "Basic Bot"])
+        self.alice, self.bob = self.game.players
+        self.planner = self.game.liquidation_planner
+        self.props = self.game.bank.properties
+        with patch("builtins.print"):
+            for position in (2, 4, 6, 16, 17, 19, 20, 13):  # Brown, two stations, Orange, a utility
+                self.props[position].transfer_property(self.alice)
+        for position, houses in ((2, 2), (4, 1), (17, 3), (19, 3), (20, 2)):
+            self.props[position].houses = houses
+        self.alice.balance = 0
+
+    def brute_force(self, amount):
+        groups = {}
+        for prop in self.alice.owned_properties:
+            groups.setdefault(prop.group, []).append(prop)
+        best = None
+        for choice in product(*(self.planner.group_options(props, 1) for props in groups.values())):
+            cash = sum(option[0] for option in choice)
+            loss = sum(option[1] for option in choice)
+            if cash >= amount and (best is None or loss < best):
+                best = loss
+        return best
+
+    # plan(self, player, amount, opponents)
+    def test_plan_matches_brute_force(self):
+        for amount in (1, 25, 90, 260, 500, 900, 1400):
+            plan = self.planner.plan(self.alice, amount, 1)
+            self.assertIsNotNone(plan)
+            self.assertGreaterEqual(plan.cash, amount)
+            self.assertAlmostEqual(plan.loss, self.brute_force(amount), places=6)
+
+    def test_plan_is_empty_when_nothing_is_owed(self):
+        plan = self.planner.plan(self.alice, 0, 1)
+        self.assertEqual(plan.steps, [])
+
+    def test_plan_returns_none_when_assets_are_insufficient(self):
+        self.assertIsNone(self.planner.plan(self.alice, 100000, 1))
+
+    def test_plan_prefers_mortgage_over_selling_houses(self):
+        plan = self.planner.plan(self.alice, 100, 1)
+        self.assertEqual(len(plan.steps), 1)
+        action, prop = plan.steps[0]
+        self.assertEqual((action, prop.group), ("mortgage", "Station"))
+
+    def test_plan_for_the_whole_board_takes_well_under_a_millisecond(self):
+        with patch("builtins.print"):
+            for prop in self.props.values():
+                prop.houses = 0
+                prop.transfer_property(self.bob)
+        total = sum(prop.price for prop in self.bob.owned_properties)
+        slowest = 0
+        for amount in range(100, total, 250):
+            self.assertIsNotNone(self.planner.plan(self.bob, amount, 3))  # also caches the group options
+            timing = timeit.repeat(lambda: self.planner.plan(self.bob, amount, 3), number=1, repeat=5)
+            slowest = max(slowest, min(timing))
+        self.assertLess(slowest, 0.001)
+
+    # group_options(self, props, opponents)
+    def test_group_options_are_cached_and_undominated(self):
+        orange = [self.props[17], self.props[19], self.props[20]]
+        options = self.planner.group_options(orange, 1)
+        self.assertIs(self.planner.group_options(orange, 1), options)
+        cash = [option[0] for option in options]
+        loss = [option[1] for option in options]
+        self.assertEqual(cash, sorted(cash))
+        self.assertTrue(all(a < b for a, b in zip(loss, loss[1:])))
+
+    # execute(self, player, plan)
+    @patch("builtins.print")
+    def test_execute_follows_bank_rules(self, mock_print):
+        self.game.log_event = MagicMock()
+        plan = self.planner.plan(self.alice, 700, 1)
+        self.planner.execute(self.alice, plan)
+        self.assertEqual(self.alice.balance, plan.cash)
+        for position in (17, 19, 20):
+            houses = [self.props[p].houses for p in (17, 19, 20)]
+            self.assertLessEqual(max(houses) - min(houses), 1)
+
+    # Player.avoid_bankruptcy(self, amount_due, creditor)
+    @patch("builtins.print")
+    def test_bot_avoid_bankruptcy_pays_creditor(self, mock_print):
+        self.game.log_event = MagicMock()
+        self.alice.balance = 50
+        self.alice.avoid_bankruptcy(300, self.bob)
+        self.assertEqual(self.bob.balance, 1800)
+        self.assertGreaterEqual(self.alice.balance, 0)
+        self.assertIn(self.props[17], self.alice.owned_properties)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import asyncio
+import random
+import unittest
+from unittest.mock import patch
+from GameElements.game_logic import Game
+from GameElements.host import GameHost
+from GameElements.net_worth import NetWorthTracker, property_value
+
+
+class TestNetWorthTracker(unittest.TestCase):
+    def setUp(self):
+        with patch("builtins.print"):
+            self.game = Game(["Ann", "Bob", "Cat"], ["Boot", "Cat", "Iron"], ["Basic Bot"] * 3)
+        self.ann, self.bob, self.cat = self.game.players
+        self.tracker = self.game.net_worth
+
+    # property_value(prop, valuation="face")
+    def test_valuations(self):
+        prop = self.game.bank.properties[2]  # The Old Creek: £60, houses £50
+        prop.houses = 2
+        self.assertEqual([property_value(prop, v) for v in ("face", "equity", "liquidation")], [160, 160, 110])
+        prop.houses, prop.mortgaged = 0, True
+        self.assertEqual([property_value(prop, v) for v in ("face", "equity", "liquidation")], [60, 30, 30])
+        with self.assertRaises(ValueError):
+            NetWorthTracker(self.game, "market")
+
+    # NetWorthTracker.on_change(self, change)
+    def test_cash_moves_purchases_and_builds_update_the_standings(self):
+        prop = self.game.bank.properties[2]
+        with patch("builtins.print"):
+            self.bob.buy_property(prop)
+        prop.houses = 1
+        self.cat.balance -= 100
+
+        self.assertEqual(self.tracker.net_worth(self.bob), 1500 - 60 + 60 + 50)
+        self.assertEqual([(p.name, worth) for p, worth in self.tracker.leaderboard()],
+                         [("Bob", 1550), ("Ann", 1500), ("Cat", 1400)])
+        self.assertEqual(self.tracker.leaders(), [self.bob])
+
+    def test_ties_are_shared_in_seat_order_and_removed_players_leave(self):
+        self.assertEqual(self.tracker.leaders(), [self.ann, self.bob, self.cat])
+        prop = self.game.bank.properties[2]
+        with patch("builtins.print"):
+            prop.transfer_property(self.cat)
+            self.game.remove_player(self.cat)
+
+        self.assertEqual([p for p, _ in self.tracker.leaderboard()], [self.ann, self.bob])
+        with patch("builtins.print"):
+            self.assertEqual(self.game.determine_winner_abridged(), "Ann & Bob")
+
+    # NetWorthTracker.recompute(self)
+    def test_running_totals_match_a_recount_after_whole_games(self):
+        random.seed(7)
+        table = GameHost().create_table(["A", "B", "C", "D"], ["Boot", "Cat", "Iron", "Hatstand"], ["Basic Bot"] * 4, seed=7)
+        equity = NetWorthTracker(table.game, "equity")
+        with patch("builtins.print"):
+            asyncio.run(table.run(150))
+
+        for tracker in (table.game.net_worth, equity):
+            running = tracker.leaderboard()
+            tracker.recompute()
+            self.assertEqual(running, tracker.leaderboard())
+        for player in table.game.players:
+            face = player.balance + sum(p.price + p.house_cost * p.houses for p in player.owned_properties)
+            self.assertEqual(table.game.net_worth.net_worth(player), face)
+
+
+if __name__ == "__main__":
+    unittest.main()
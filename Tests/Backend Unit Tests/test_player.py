@@ -23,6 +23,12 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(self.player.consecutive_doubles, 0)
         self.assertEqual(self.player.owned_properties, [])
 
+    # balance / version
+    def test_balance_changes_increase_the_version(self):
+        self.player.balance -= 100
+        self.player.balance = 1400
+        self.assertEqual((self.player.balance, self.player.version), (1400, 1))
+
     # roll_dice(self)
     @patch("random.randint")
     def test_roll_dice(self, mock_randint):
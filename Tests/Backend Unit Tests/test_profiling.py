@@ -0,0 +1,65 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from GameElements.game_logic import Game
+from GameElements.profiling import TurnProfiler
+
+
+class TestTurnProfiler(unittest.TestCase):
+    def setUp(self):
+        with patch("builtins.print"):
+            self.game = Game(["Ann", "Bob"], ["Boot", "Cat"], ["Basic Bot", "Basic Bot"])
+        self.original = Game.__dict__["play_turn"]
+
+    def play(self, rolls):
+        with patch("builtins.print"):
+            for die1, die2 in rolls:
+                self.game.play_turn(die1, die2)
+                self.game.current_player_index = (self.game.current_player_index + 1) % len(self.game.players)
+
+    # TurnProfiler.start(self) / TurnProfiler.stop(self)
+    def test_methods_are_only_replaced_while_running(self):
+        with TurnProfiler() as profiler:
+            self.assertIsNot(Game.__dict__["play_turn"], self.original)
+            with self.assertRaises(RuntimeError):
+                TurnProfiler().start()
+        self.assertIs(Game.__dict__["play_turn"], self.original)
+
+        self.play([(1, 2)])
+        self.assertEqual(profiler.stats["play_turn"].calls, 0)
+
+    # TurnProfiler._wrap(self, phase, function)
+    def test_calls_and_nested_time_are_recorded(self):
+        with TurnProfiler() as profiler:
+            self.play([(1, 2), (2, 5), (3, 4), (1, 1)])
+
+        turns, position = profiler.stats["play_turn"], profiler.stats["handle_position"]
+        self.assertEqual(turns.calls, 4)
+        self.assertGreaterEqual(position.calls, 4)
+        self.assertGreaterEqual(profiler.stats["draw_card"].calls, 1)  # (2, 5) lands Bob on Opportunity Knocks
+        self.assertLessEqual(turns.own, turns.total)
+        self.assertGreaterEqual(turns.total, position.total)
+        self.assertEqual(turns.sampled, 0)
+
+    # TurnProfiler.dump_json(self, path)
+    def test_allocation_samples_are_exported(self):
+        with TurnProfiler(sample_every=1) as profiler:
+            self.play([(1, 2), (2, 5)])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            profiler.dump_json(path)
+            with open(path) as file:
+                profile = json.load(file)
+
+        turns = profile["phases"]["play_turn"]
+        self.assertEqual((turns["calls"], turns["sampled"]), (2, 2))
+        self.assertGreaterEqual(turns["mean_peak_bytes"], 0)
+        self.assertNotIn("bid_property", profile["phases"])
+        self.assertEqual(len(profiler.report()), 2 + len(profile["phases"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -49,6 +49,14 @@ class TestProperty(unittest.TestCase):
         self.mock_owner.owned_properties = [self.station, station2]
         self.assertEqual(self.station.calculate_rent(), 50)
 
+    def test_calculate_rent_uses_the_property_rent_tiers(self):
+        station = Property(5, "Reading Railroad", 200, (30, 60, 120, 240), 0, "Station")
+        utility = Property(12, "Electric Company", 150, (5, 12), 0, "Utilities")
+        station.owner = utility.owner = self.mock_owner
+        self.mock_owner.owned_properties = [station, utility]
+        self.assertEqual(station.calculate_rent(), 30)
+        self.assertEqual(utility.calculate_rent(7), 35)
+
     def test_calculate_rent_utilities_single(self):
         self.utility.owner = self.mock_owner
         self.mock_owner.owned_properties = [self.utility]
@@ -79,5 +87,19 @@ class TestProperty(unittest.TestCase):
         self.assertTrue(self.property1.check_completion())
         self.assertTrue(self.property2.check_completion())
 
+    # version
+    def test_changes_increase_the_version_of_the_property_and_its_owners(self):
+        first, second = MagicMock(version=0, owned_properties=[]), MagicMock(version=0, owned_properties=[])
+        self.property1.transfer_property(first)
+        self.assertEqual((self.property1.version, first.version), (1, 1))
+
+        self.property1.houses = 2
+        self.property1.houses = 2  # unchanged
+        self.property1.mortgaged = True
+        self.assertEqual((self.property1.version, first.version), (3, 3))
+
+        self.property1.transfer_property(second)
+        self.assertEqual((first.version, second.version), (4, 1))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,76 @@
+import asyncio
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from GameElements.host import GameHost
+from GameElements.roi import PHASES, analyse, campaign_directories, write_tables
+from GameElements.traces import TraceWriter, open_campaign
+
+
+class TestRoi(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.games = []
+        for shard, seeds in (("shard-00", (1, 2, 3)), ("shard-01", (4, 5))):
+            with TraceWriter(os.path.join(cls.directory.name, shard)) as writer:
+                for seed in seeds:
+                    random.seed(seed)
+                    table = GameHost().create_table(["A", "B", "C", "D"], ["Boot", "Cat", "Iron", "Hatstand"],
+                                                    ["Basic Bot"] * 4, seed=seed)
+                    with patch("builtins.print"):
+                        asyncio.run(table.run(250))
+                    writer.record_game(table.game, seed)
+                    cls.games.append(table.game)
+        cls.properties, cls.groups = analyse([cls.directory.name], chunk_games=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    # analyse(paths, phases=PHASES, chunk_games=100000)
+    def test_totals_match_the_games(self):
+        rent = sum(game.ledger.volume("rent") for game in self.games)
+        self.assertEqual(self.properties["rent"].sum(), rent)
+        self.assertEqual(self.groups["rent"].sum(), rent)
+        self.assertEqual(self.properties["acquired"].sum(), self.groups["acquired"].sum())
+        self.assertEqual(len(self.properties), 28 * 3)
+        self.assertTrue(np.allclose(self.properties.groupby("phase")["landing_share"].sum(), 1))
+
+    def test_chunks_do_not_change_the_results(self):
+        properties, groups = analyse([self.directory.name], chunk_games=1000)
+        pd.testing.assert_frame_equal(properties, self.properties)
+        pd.testing.assert_frame_equal(groups, self.groups)
+
+    def test_win_correlation_is_pearson_over_players(self):
+        owns, won = [], []
+        for shard in campaign_directories([self.directory.name]):
+            campaign = open_campaign(shard)
+            games, owners = campaign["games"], campaign["owners"]
+            for game, players, winner, played in zip(games["game"], games["players"], games["winner"], games["turns"]):
+                if played <= dict(PHASES)["late"]:
+                    continue  # only games that reached the phase count
+                changes = owners["owner"][(owners["game"] == game) & (owners["tile"] == 2)]
+                owner = changes[-1] if len(changes) else -1
+                owns += [seat == owner for seat in range(players)]
+                won += [seat == winner for seat in range(players)]
+
+        late = self.properties[(self.properties["tile"] == 2) & (self.properties["phase"] == "late")]
+        self.assertAlmostEqual(late["win_correlation"].item(), np.corrcoef(owns, won)[0, 1])
+
+    # write_tables(properties, groups, directory, file_format="csv")
+    def test_tables_are_written_as_csv(self):
+        with tempfile.TemporaryDirectory() as out:
+            paths = write_tables(self.properties, self.groups, out)
+            self.assertEqual([os.path.basename(path) for path in paths], ["properties.csv", "groups.csv"])
+            self.assertEqual(len(pd.read_csv(paths[1])), len(self.groups))
+            with self.assertRaises(ValueError):
+                write_tables(self.properties, self.groups, out, "xlsx")
+
+
+if __name__ == "__main__":
+    unittest.main()
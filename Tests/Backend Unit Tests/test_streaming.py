@@ -0,0 +1,90 @@
+import asyncio
+import pickle
+import random
+import unittest
+from unittest.mock import patch
+import numpy as np
+from GameElements.host import GameHost
+from GameElements.streaming import PropertyCounters, QuantileSketch, RunningMoments, TournamentStats, WinRate
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self.values = np.random.default_rng(7).lognormal(5, 1, 10_000) * np.where(np.arange(10_000) % 5, 1, -1)
+
+    # RunningMoments.add(value), add_many(values), merge(other)
+    def test_moments_merge_to_the_whole_stream(self):
+        whole, parts = RunningMoments(), [RunningMoments() for _ in range(3)]
+        for value in self.values[:100]:
+            whole.add(value)
+        whole.add_many(self.values[100:])
+        for part, chunk in zip(parts, np.array_split(self.values, 3)):
+            part.add_many(chunk)
+        merged = parts[0].merge(parts[1]).merge(parts[2]).merge(RunningMoments())
+
+        for moments in (whole, merged):
+            self.assertEqual(moments.count, len(self.values))
+            self.assertAlmostEqual(moments.mean, self.values.mean(), places=6)
+            self.assertAlmostEqual(moments.variance, self.values.var(ddof=1), delta=1e-6 * self.values.var())
+
+    # QuantileSketch.quantile(q)
+    def test_quantiles_are_within_the_accuracy(self):
+        sketch, halves = QuantileSketch(0.01), [QuantileSketch(0.01), QuantileSketch(0.01)]
+        sketch.add_many(self.values)
+        for value in self.values[:5000]:
+            halves[0].add(value)
+        halves[1].add_many(np.append(self.values[5000:], [0.0]))
+        merged = halves[0].merge(halves[1])
+        ranked = np.sort(np.append(self.values, [0.0]))
+
+        for q in (0, 0.01, 0.1, 0.5, 0.9, 0.99, 1):
+            exact = ranked[int(q * (len(ranked) - 1))]
+            self.assertLessEqual(abs(merged.quantile(q) - exact), 0.01 * abs(exact))
+        self.assertLess(len(sketch), 1000)
+        with self.assertRaises(ValueError):
+            sketch.merge(QuantileSketch(0.05))
+
+    # WinRate.interval(competitor, z=1.96)
+    def test_win_rate_has_a_wilson_interval(self):
+        rates, other = WinRate(), WinRate()
+        for game in range(100):
+            (rates if game % 2 else other).add(["A", "B"], "A" if game < 30 else "B")
+        rates.merge(other)
+
+        self.assertEqual(rates.games, {"A": 100, "B": 100})
+        rate, low, high = rates.interval("A")
+        self.assertAlmostEqual(rate, 0.3)
+        self.assertAlmostEqual(low, 0.2189, places=4)
+        self.assertAlmostEqual(high, 0.3959, places=4)
+        self.assertTrue(np.isnan(rates.interval("C")[0]))
+
+    # TournamentStats.add_game(game), merge(other)
+    def test_tournament_stats_merge_and_pickle(self):
+        games = []
+        for seed in (1, 2, 3):
+            random.seed(seed)
+            table = GameHost().create_table(["A", "B", "C"], ["Boot", "Cat", "Iron"], ["Basic Bot"] * 3, seed=seed)
+            with patch("builtins.print"):
+                asyncio.run(table.run(150))
+            games.append(table.game)
+
+        whole, first, rest = TournamentStats(), TournamentStats(), TournamentStats()
+        for game in games:
+            whole.add_game(game)
+        first.add_game(games[0])
+        rest.add_game(games[1])
+        rest.add_game(games[2])
+        merged = pickle.loads(pickle.dumps(first)).merge(pickle.loads(pickle.dumps(rest)))
+
+        self.assertEqual(merged.games, 3)
+        self.assertEqual(merged.seats.games, {0: 3, 1: 3, 2: 3})
+        self.assertAlmostEqual(merged.turns.mean, np.mean([len(game.history) for game in games]))
+        np.testing.assert_array_equal(merged.properties.totals, whole.properties.totals)
+        self.assertEqual(merged.properties["rent"].sum(), sum(game.ledger.volume("rent") for game in games))
+        self.assertEqual(merged.properties["landings"].sum(), sum(len(game.history) for game in games))
+        self.assertEqual(len(merged.report()), 4 + 3)
+        self.assertIsInstance(PropertyCounters().merge(merged.properties), PropertyCounters)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+from GameElements.game_logic import Game
+from GameElements.host import BotAgent, GameHost
+from GameElements.sync import SyncClient, SyncServer, apply, diff, snapshot
+
+
+class TestStateSync(unittest.TestCase):
+    def setUp(self):
+        with patch("builtins.print"):
+            self.game = Game(["Ann", "Bob"], ["Boot", "Cat"], ["Human", "Basic Bot"])
+            self.replica = Game(["Ann", "Bob"], ["Boot", "Cat"], ["Human", "Basic Bot"])
+
+    # diff(old, new)
+    def test_diff_only_holds_changed_fields(self):
+        before = snapshot(self.game, self.game.players)
+        ann = self.game.players[0]
+        ann.balance -= 60
+        self.game.bank.properties[2].owner = ann
+
+        delta = diff(before, snapshot(self.game, self.game.players))
+        self.assertEqual(delta, {"p": {0: {"b": 1440}}, "o": {2: (0, 0, 0)}})
+        self.assertEqual(diff(before, before), {})
+
+    # apply(game, seats, delta)
+    def test_apply_brings_a_replica_in_line(self):
+        seats = list(self.game.players)
+        ann, bob = seats
+        self.game.bank.properties[2].transfer_property(ann)
+        self.game.bank.properties[2].houses = 2
+        bob.position, bob.in_jail = 11, True
+        self.game.fines = 50
+        self.game.current_player_index = 1
+
+        delta = json.loads(json.dumps(diff(None, snapshot(self.game, seats))))
+        apply(self.replica, self.replica.players, delta)
+        self.assertEqual(snapshot(self.replica, self.replica.players), snapshot(self.game, seats))
+        self.assertEqual(self.replica.players[0].owned_properties, [self.replica.bank.properties[2]])
+
+    # SyncClient.connect(self, table_id, address, port)
+    def test_remote_seat_plays_over_tcp(self):
+        async def play():
+            host = GameHost()
+            server = SyncServer(host, frame_rate=60)
+            port = await server.start()
+            table = host.create_table(["Ann", "Bob"], ["Boot", "Cat"], ["Human", "Basic Bot"], seed=7)
+            feed = server.feed(table)
+            client = SyncClient("Ann", BotAgent())
+            connection = asyncio.create_task(client.connect(table.table_id, port=port))
+            while "Ann" not in feed.clients:
+                await asyncio.sleep(0.001)
+            await host.start(table, 10)
+            server.finish(table)
+            await connection
+            await server.close()
+            return table, feed, client
+
+        with patch("builtins.print"):
+            table, feed, client = asyncio.run(play())
+        self.assertEqual(table.turns, 10)
+        self.assertEqual(snapshot(client.game, client.seats), snapshot(table.game, feed.seats))
+        self.assertEqual(client.bytes_received, feed.bytes_sent)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import asyncio
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from GameElements.host import GameHost
+from GameElements.ledger import CATEGORIES
+from GameElements.traces import TABLES, TraceWriter, open_campaign
+
+
+def play(seed, turns=200):
+    random.seed(seed)
+    table = GameHost().create_table(["A", "B", "C", "D"], ["Boot", "Cat", "Iron", "Hatstand"], ["Basic Bot"] * 4, seed=seed)
+    with patch("builtins.print"):
+        asyncio.run(table.run(turns))
+    return table.game
+
+
+class TestTraceWriter(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+        self.games = [play(seed) for seed in (3, 4)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    # TraceWriter.record_game(self, game, seed=None) / open_campaign(directory)
+    def test_games_read_back_as_memory_maps(self):
+        with TraceWriter(self.path) as writer:
+            for seed, game in zip((3, 4), self.games):
+                writer.record_game(game, seed)
+        campaign = open_campaign(self.path)
+
+        self.assertEqual(set(campaign), set(TABLES))
+        self.assertIsInstance(campaign["turns"]["balance"], np.memmap)
+        self.assertEqual(campaign["games"]["seed"].tolist(), [3, 4])
+        self.assertEqual(campaign["games"]["turns"].tolist(), [len(game.history) for game in self.games])
+
+        game = self.games[0]
+        turns = campaign["turns"]
+        first = turns["game"] == 0
+        for seat, player in enumerate(game.history.seats):
+            rows = first & (turns["seat"] == seat)
+            self.assertEqual(turns["balance"][rows].tolist(), game.history.series("balance", player)[:rows.sum()].tolist())
+
+        payments = campaign["payments"]
+        rent = (payments["game"] == 0) & (payments["category"] == CATEGORIES.index("rent"))
+        self.assertEqual(int(payments["amount"][rent].sum()), game.ledger.volume("rent"))
+        # A player who goes bankrupt on their own turn is no longer in the game at the end of it
+        movers = game.history.movers()
+        bankrupt_movers = sum(turn < len(movers) and movers[turn] == game.history.seats.index(player)
+                              for player, turn in game.history.left.items())
+        self.assertEqual(int(turns["moved"][first].sum()), len(game.history) - bankrupt_movers)
+        owners = campaign["owners"]
+        for prop in game.bank.properties.values():
+            changes = owners["owner"][(owners["game"] == 0) & (owners["tile"] == prop.position)]
+            final = game.history.seats.index(prop.owner) if prop.owner else -1
+            self.assertEqual(changes[-1] if len(changes) else -1, final)
+        auctions = campaign["auctions"]
+        self.assertEqual(int(auctions["price"][auctions["game"] == 0].sum()), game.ledger.volume("auction"))
+        self.assertEqual(int(campaign["games"]["bankruptcies"].sum()), len(campaign["bankruptcies"]["seat"]))
+
+    def test_rows_are_written_in_batches_and_campaigns_can_be_continued(self):
+        writer = TraceWriter(self.path, flush_rows=10 ** 9)
+        writer.record_game(self.games[0])
+        self.assertEqual(os.path.getsize(os.path.join(self.path, "turns", "balance.bin")), 0)
+        self.assertEqual(len(open_campaign(self.path)["games"]["game"]), 0)
+        writer.close()
+
+        with TraceWriter(self.path) as writer:
+            self.assertEqual(writer.record_game(self.games[1], 4), 1)
+        games = open_campaign(self.path)["games"]
+        self.assertEqual((games["game"].tolist(), games["seed"].tolist()), ([0, 1], [-1, 4]))
+
+
+if __name__ == "__main__":
+    unittest.main()
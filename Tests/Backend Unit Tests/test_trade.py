@@ -0,0 +1,130 @@
+import unittest
+from unittest.mock import patch
+import numpy as np
+from GameElements.game_logic import Game
+from GameElements.trade import TradeEngine, landing_probabilities
+
+
+class TestTradeEngine(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(["Alice", "Bob", "Carol"], ["Car", "Hat", "Boot"], ["Basic Bot"] * 3)
+        self.alice, self.bob, self.carol = self.game.players
+        self.engine = self.game.trade_engine
+        self.props = self.game.bank.properties
+
+    def give(self, player, *positions):
+        with patch("builtins.print"):
+            for position in positions:
+                self.props[position].transfer_property(player)
+
+    # landing_probabilities()
+    def test_landing_probabilities(self):
+        probabilities = landing_probabilities()
+        self.assertEqual(len(probabilities), 41)
+        self.assertAlmostEqual(probabilities.sum(), 1.0)
+        self.assertEqual(probabilities[31], 0.0)
+        self.assertEqual(np.argmax(probabilities), 11)
+
+    # EquityTable.values(self, masks, opponents)
+    def test_complete_set_is_worth_more_than_its_parts(self):
+        table = self.engine.table
+        first, second, both = (np.zeros(len(table.positions), dtype=bool) for _ in range(3))
+        first[table.index[2]] = True
+        second[table.index[4]] = True
+        both[[table.index[2], table.index[4]]] = True
+        values = table.values(np.stack([first, second, both]), 2)
+        self.assertGreater(values[2], values[0] + values[1])
+
+    # trade_gain(self, player, incoming, outgoing, money, opponents)
+    def test_trade_gain_counts_cash_and_properties(self):
+        self.give(self.alice, 2)
+        self.assertEqual(self.engine.trade_gain(self.alice, [], [], 100, 2), 100)
+        self.assertGreater(self.engine.trade_gain(self.alice, [self.props[4]], [], 0, 2), 0)
+        self.assertLess(self.engine.trade_gain(self.alice, [], [self.props[2]], 0, 2), 0)
+
+    # candidate_trades(self, players, proposer=None)
+    def test_candidate_trades_complete_sets_and_split_surplus(self):
+        self.give(self.alice, 2, 17)
+        self.give(self.bob, 4, 19, 20)
+        candidates = self.engine.candidate_trades(self.game.players)
+        self.assertTrue(candidates)
+        self.assertEqual(candidates, sorted(candidates, key=lambda c: -c.surplus))
+
+        best = candidates[0]
+        proposer_gain = self.engine.trade_gain(best.proposer, best.request_properties, best.offer_properties,
+                                               best.request_money - best.offer_money, 2)
+        receiver_gain = self.engine.trade_gain(best.receiver, best.offer_properties, best.request_properties,
+                                               best.offer_money - best.request_money, 2)
+        self.assertAlmostEqual(proposer_gain, receiver_gain, delta=1)
+        self.assertAlmostEqual(proposer_gain + receiver_gain, best.surplus, delta=1e-6)
+
+    # best_trade(self, proposer, players, opponents=None)
+    def test_best_trade_splits_surplus_against_every_opponent(self):
+        self.give(self.alice, 2, 17)
+        self.give(self.bob, 4, 19, 20)
+        bots = [self.alice, self.bob]
+        offer = self.engine.best_trade(self.alice, bots, 2)
+        proposer_gain = self.engine.trade_gain(self.alice, offer.request_properties, offer.offer_properties,
+                                               offer.request_money - offer.offer_money, 2)
+        receiver_gain = self.engine.trade_gain(self.bob, offer.offer_properties, offer.request_properties,
+                                               offer.offer_money - offer.request_money, 2)
+        self.assertAlmostEqual(proposer_gain, receiver_gain, delta=1)
+        self.assertNotEqual(offer, self.engine.best_trade(self.alice, bots))
+
+    # EquityTable.values(self, masks, opponents, mortgaged=None)
+    def test_mortgaged_property_is_worth_its_rent_only(self):
+        gain = self.engine.trade_gain(self.alice, [self.props[4]], [], 0, 2)
+        self.props[4].mortgaged = True
+        self.assertAlmostEqual(self.engine.trade_gain(self.alice, [self.props[4]], [], 0, 2), gain - self.props[4].price / 2)
+
+    def test_candidate_trades_respect_cash_reserve_and_houses(self):
+        self.give(self.alice, 2)
+        self.give(self.bob, 4)
+        self.alice.balance = self.bob.balance = 200
+        self.assertEqual(self.engine.candidate_trades([self.alice, self.bob]), [])
+
+        self.alice.balance = self.bob.balance = 1500
+        self.props[4].houses = 1
+        self.assertEqual(self.engine.tradable(self.bob), [])
+
+    def test_candidates_are_rescored_only_when_properties_change(self):
+        self.give(self.alice, 2, 17)
+        self.give(self.bob, 4, 19)
+        with patch.object(self.engine, "_score", wraps=self.engine._score) as score:
+            first = self.engine.candidate_trades(self.game.players)
+            self.alice.balance = 250
+            self.assertLess(len(self.engine.candidate_trades(self.game.players)), len(first))
+            self.assertEqual(score.call_count, 1)
+
+            self.give(self.carol, 20)
+            self.props[19].mortgaged = True
+            rescored = self.engine.candidate_trades(self.game.players)
+            self.assertEqual(score.call_count, 2)
+        self.assertEqual(rescored, TradeEngine(self.game.bank).candidate_trades(self.game.players))
+
+    # Player.bot_trade(self, offer_properties, request_properties, offer_money, request_money)
+    def test_bot_trade_accepts_only_favourable_trades(self):
+        self.give(self.bob, 4)
+        self.assertEqual(self.bob.bot_trade([], [], 0, 0), "no")
+        self.assertEqual(self.bob.bot_trade([self.props[2]], [], 0, 0), "yes")
+        self.assertEqual(self.bob.bot_trade([], [self.props[4]], 1, 0), "no")
+        self.assertEqual(self.bob.bot_trade([], [], 0, 2000), "no")
+
+    # Game.bot_propose_trade(self, player)
+    @patch("builtins.print")
+    def test_bot_propose_trade_executes_best_trade(self, mock_print):
+        self.give(self.alice, 2)
+        self.give(self.bob, 4)
+        offer = self.game.bot_propose_trade(self.alice)
+        self.assertIsNotNone(offer)
+        owners = {self.props[2].owner, self.props[4].owner}
+        self.assertEqual(len(owners), 1)
+        self.assertEqual(self.alice.balance + self.bob.balance, 3000)
+
+    def test_engine_is_built_from_bank(self):
+        engine = TradeEngine(self.game.bank)
+        self.assertEqual(len(engine.table.positions), len(self.props))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from property_tycoon import PropertyTycoon
 import pygame
@@ -31,8 +32,15 @@ class Main:
             None
 
         Side Effects:
-            - Creates an instance of the `PropertyTycoon` class.
-            - Calls the `run()` method of the `PropertyTycoon` class, starting the game.
+            - Creates an instance of the `PropertyTycoon` class, running the game logic in a separate
+              process if `--game-process` is given and logging frames longer than 50 ms to
+              logs/stalls.log if `--watchdog` is given.
+            - Calls the `run()` method of the `PropertyTycoon` class, starting the game, or runs
+              `run_async()` in an asyncio event loop if `--asyncio` is given.
         """
-        property_tycoon = PropertyTycoon()
+        property_tycoon = PropertyTycoon(game_process="--game-process" in sys.argv,
+                                         stall_budget=0.05 if "--watchdog" in sys.argv else None)
+        if "--asyncio" in sys.argv:
+            asyncio.run(property_tycoon.run_async())
+            sys.exit()
         property_tycoon.run()
@@ -1,3 +1,4 @@
+import asyncio
 import pygame
 import sys
 import time
@@ -12,8 +13,13 @@ from GuiElements.dice_gui import DiceGUI
 from GuiElements.jail_popup_gui import JailPopup
 from GuiElements.auction_popup_gui import AuctionPopup
 from GuiElements.end_game_gui import EndGamePopup
+from GuiElements.frame_scheduler_gui import FrameScheduler
+from GuiElements.render_profiler_gui import RenderProfiler
+from GuiElements.frame_watchdog_gui import FrameWatchdog
+from GuiElements.modal_layer_gui import ModalLayer
 
 from GameElements.game_logic import Game
+from GameElements.game_process import GameProcess
 
 class PropertyTycoon:
     """
@@ -26,6 +32,8 @@ class PropertyTycoon:
     Args:
         width (int): The width of the game screen (default: 1200).
         height (int): The height of the game screen (default: 750).
+        game_process (bool): Run the game logic in a separate process (default: False).
+        stall_budget (float | None): Frames longer than this many seconds are logged (default: None, off).
 
     Attributes:
         screen (pygame.Surface): The Pygame screen where the game is drawn.
@@ -38,18 +46,24 @@ class PropertyTycoon:
         players (dict): Dictionary of players in the game.
         game (Game): The Game logic instance.
         dice (DiceGUI): Dice handling and rendering.
+        profiler (RenderProfiler): Per-stage frame timings, shown with F3 and saved with F4.
+        watchdog (FrameWatchdog | None): Logs stalled frames to logs/stalls.log.
         time_limit_seconds (int): Time limit for Abridged mode in seconds.
         etc. 
     """
 
 
-    def __init__(self, width=1200, height=750):
+    def __init__(self, width=1200, height=750, game_process=False, stall_budget=None):
         """
         Initialize the game, including setup for the screen, UI components, sounds, and game state.
 
         Args:
             width (int): Width of the game window (default: 1200).
             height (int): Height of the game window (default: 750).
+            game_process (bool): Run the game logic, bots and auctions in a worker process so they
+                never hold up rendering (default: False).
+            stall_budget (float | None): Frames taking longer than this many seconds are reported with
+                the stack they were stuck in to logs/stalls.log; None turns the watchdog off (default: None).
 
         Returns:
             None
@@ -112,9 +126,15 @@ class PropertyTycoon:
         self.time_limit_seconds = None
 
         self.game = None
+        self.use_game_process = game_process
+        self.game_process = None
         self.dice = DiceGUI(self.screen)
+        self.profiler = RenderProfiler(self.screen)
+        self.modal_layer = ModalLayer(self.screen)
+        self.watchdog = FrameWatchdog(stall_budget, describe=self.describe_state) if stall_budget else None
         
         self.first_turn_pending = False
+        self.first_turn_time = None
         self.pending_roll = None
         self.waiting_for_dice = False
 
@@ -177,70 +197,74 @@ class PropertyTycoon:
         Side Effects:
             - Renders the game screen, drawing the pregame, token selection, or game board.
             - Handles rendering for additional popups like Jail, Auction, Bankruptcy, End Game, and Leave Game.
+              While one is open, the scene under it is drawn once into a dimmed snapshot by the modal
+              layer and only the popup is drawn on top each frame.
             - If in Abridged mode, the remaining time is shown and updated.
         """
 
         if self.state == "pregame":
             self.pregame_screen.draw()
+            pygame.display.flip()
 
         elif self.state == "token_selection":
             self.token_selection_screen.draw()
+            pygame.display.flip()
 
         elif self.state == "board":
-            self.screen.fill((200, 200, 200))
-
-            self.board.draw(self.screen, self.game.bank.properties.items())
-            self.elements.draw()
-
-            self.left_sidebar.game = self.game
-            self.right_sidebar.game = self.game
-            self.left_sidebar.draw()
-            self.right_sidebar.draw()
-
-            if not self.right_sidebar.show_trade_menu:
-                self.dice.draw()
-
-            self.draw_tokens_on_board()
-
-            if self.time_limit_seconds:
-                if self.paused:
-                    elapsed_time = self.elapsed_time_at_pause  # Stay frozen
+            profiler = self.profiler
+            modal = self.modal_popup()
+            scene_key = (len(self.right_sidebar.event_log), self.game.version)  # what a popup did, logged or not
+            if modal and self.modal_layer.is_current(scene_key):
+                with profiler.measure("board"):
+                    self.modal_layer.draw()
+            else:
+                self.draw_scene()
+                if modal:
+                    self.modal_layer.capture(scene_key)
+                    self.modal_layer.draw()
                 else:
-                    elapsed_time = time.time() - self.start_time
+                    self.modal_layer.release()
 
-                remaining_time = max(0, self.time_limit_seconds - elapsed_time)
+            with profiler.measure("hud"):
+                if self.time_limit_seconds:
+                    if self.paused:
+                        elapsed_time = self.elapsed_time_at_pause  # Stay frozen
+                    else:
+                        elapsed_time = time.time() - self.start_time
 
-           
+                    remaining_time = max(0, self.time_limit_seconds - elapsed_time)
 
 
-                minutes = int(remaining_time // 60)
-                seconds = int(remaining_time % 60)
-                time_text = f"Time Left: {minutes:02}:{seconds:02}"
 
-                timer_render = pygame.font.Font(None, 30).render(time_text, True, (255, 255, 255))
-                timer_rect = timer_render.get_rect(bottomright=(self.width - 20, self.height - 20))
-                self.screen.blit(timer_render, timer_rect)
 
-                if remaining_time <= 0 and not hasattr(self, 'abridged_mode_active'):
-                    self.abridged_mode_active = True
-                    self.turns_target = max(p.turns_taken for p in self.game.players)
-                    self.right_sidebar.log_event("Time is up! Everyone will finish this round before the winner is determined.")
+                    minutes = int(remaining_time // 60)
+                    seconds = int(remaining_time % 60)
+                    time_text = f"Time Left: {minutes:02}:{seconds:02}"
 
+                    timer_render = pygame.font.Font(None, 30).render(time_text, True, (255, 255, 255))
+                    timer_rect = timer_render.get_rect(bottomright=(self.width - 20, self.height - 20))
+                    self.screen.blit(timer_render, timer_rect)
 
-            if self.jail_popup:
-                self.jail_popup.draw()
+                    if remaining_time <= 0 and not hasattr(self, 'abridged_mode_active'):
+                        self.abridged_mode_active = True
+                        self.turns_target = max(p.turns_taken for p in self.game.players)
+                        self.right_sidebar.log_event("Time is up! Everyone will finish this round before the winner is determined.")
 
-            if self.auction_popup:
-                self.auction_popup.draw()  
+            with profiler.measure("popups"):
+                if self.jail_popup:
+                    self.jail_popup.draw()
 
-            if self.bankruptcy_popup:
-                self.bankruptcy_popup.draw()
+                if self.auction_popup:
+                    self.auction_popup.draw()  
 
-            if self.end_game_popup:
-                self.end_game_popup.draw()
+                if self.bankruptcy_popup:
+                    self.bankruptcy_popup.draw()
 
-            if self.leave_game_popup:
-                self.leave_game_popup.draw()
+                if self.end_game_popup:
+                    self.end_game_popup.draw()
+
+                if self.leave_game_popup:
+                    self.leave_game_popup.draw()
 
 
             if self.inactivity_popup:
@@ -251,9 +275,59 @@ class PropertyTycoon:
                 pygame.draw.rect(self.screen, (255, 255, 255), msg_rect.inflate(20, 20), 2)
                 self.screen.blit(msg, msg_rect)
 
+            with profiler.measure("hud"):
+                profiler.draw()
 
+            with profiler.measure("flip"):
+                pygame.display.flip()
 
-            pygame.display.flip()
+    def draw_scene(self):
+        """
+        Draws everything under the popups: the board, its elements, the sidebars, the dice and the tokens.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        profiler = self.profiler
+        self.screen.fill((200, 200, 200))
+
+        with profiler.measure("board"):
+            self.board.draw(self.screen, self.game.bank.properties.items())
+        with profiler.measure("elements"):
+            self.elements.draw()
+
+        self.left_sidebar.game = self.game
+        self.right_sidebar.game = self.game
+        with profiler.measure("left_sidebar"):
+            self.left_sidebar.draw()
+        with profiler.measure("right_sidebar"):
+            self.right_sidebar.draw()
+
+        if not self.right_sidebar.show_trade_menu:
+            with profiler.measure("dice"):
+                self.dice.draw()
+
+        with profiler.measure("tokens"):
+            self.draw_tokens_on_board()
+
+    def modal_popup(self):
+        """
+        Returns the popup the scene is frozen under, if one is open.
+
+        Args:
+            None
+
+        Returns:
+            JailPopup | AuctionPopup | BankruptcyPopup | EndGamePopup | LeaveGamePopup | None: The open popup.
+        """
+        for popup in (self.jail_popup, self.auction_popup, self.bankruptcy_popup, self.end_game_popup,
+                      self.leave_game_popup):
+            if popup and popup.visible:
+                return popup
+        return None
 
     def handle_events(self):
         """
@@ -283,6 +357,15 @@ class PropertyTycoon:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            # F3 toggles the render profiler overlay, F4 saves its window to a CSV file
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle()
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and self.profiler.enabled:
+                frames = self.profiler.dump_csv()
+                print(f"Render profile of {frames} frames saved to render_profile.csv")
+                continue
+
             if self.state == "pregame":
                 result = self.pregame_screen.handle_event(event)
                 if result == "start":
@@ -295,6 +378,10 @@ class PropertyTycoon:
                         self.start_board_game()
 
             elif self.state == "board":
+                if self.game_process:
+                    self.handle_game_process_event(event)
+                    continue
+
                 if self.jail_popup and self.jail_popup.visible:
                     self.jail_popup.handle_event(event)
                     return
@@ -381,8 +468,12 @@ class PropertyTycoon:
 
         self.save_players_to_json(player_data)
         player_names, player_tokens, player_identities = self.load_players_from_file("players.json")
-        self.game = Game(player_names, player_tokens, player_identities)
-        self.game.ui = self
+        if self.use_game_process:
+            self.game_process = GameProcess(player_names, player_tokens, player_identities)
+            self.game = self.game_process.game  # a replica: drawn here, played in the worker
+        else:
+            self.game = Game(player_names, player_tokens, player_identities)
+            self.game.ui = self
         self.game.log_event = self.right_sidebar.get_event_logger()
 
         self.dice.start_roll_animation()
@@ -405,6 +496,7 @@ class PropertyTycoon:
             window_width=self.width,
             window_height=self.height
         )
+        self.board.watch(self.game.changes)
 
         self.elements = BoardElementsGUI(self.screen)
 
@@ -644,6 +736,93 @@ class PropertyTycoon:
         self.bankruptcy_popup = popup
         return popup
         
+    def handle_game_process_event(self, event):
+        """
+        Handles board input when the game logic runs in a worker process.
+
+        The replica game must not be played on directly, so the sidebar buttons and keys answer the
+        decision the worker is waiting on instead: Buy Property buys (or bids £10 over the highest
+        bid in an auction), End Turn gives the default answer (roll, decline, leave the auction or
+        raise the money owed), and P, C, R and W pay, use a card, roll or wait in jail.
+
+        Args:
+            event (pygame.event): The event object to process.
+
+        Returns:
+            None
+
+        Side Effects:
+            - Sends an answer to the worker process.
+            - Updates hover highlights and scrolls the event log.
+        """
+        self.handle_board_events(event)
+        if event.type == pygame.MOUSEWHEEL:
+            self.right_sidebar.handle_event(event)
+            return
+
+        if self.end_game_popup:
+            self.end_game_popup.handle_event(event)
+            return
+
+        pending = self.game_process.pending
+        if pending is None:
+            return
+
+        name, kind, context = pending
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.right_sidebar.buy_property_button.collidepoint(event.pos):
+                if kind == "buy":
+                    self.game_process.answer(True)
+                elif kind == "bid":
+                    self.game_process.answer(context["highest_bid"] + 10)
+            elif self.right_sidebar.end_turn_button.collidepoint(event.pos):
+                self.game_process.answer()
+        elif event.type == pygame.KEYDOWN and kind == "jail":
+            choice = {pygame.K_p: "pay", pygame.K_c: "card", pygame.K_r: "roll", pygame.K_w: "wait"}.get(event.key)
+            if choice:
+                self.game_process.answer(choice)
+
+    def update_game_process(self):
+        """
+        Brings the replica game up to date with the worker process once per frame.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Side Effects:
+            - Updates the replica game and logs the worker's events.
+            - Stops the worker and shows the end game popup once its game has finished.
+        """
+        self.game_process.sync()
+        if self.game_process.finished and not self.end_game_popup:
+            self.game_process.stop()
+            self.trigger_end_game_popup(", ".join(self.game_process.winners))
+
+    def describe_state(self):
+        """
+        Summarises the game state for stall reports.
+
+        Args:
+            None
+
+        Returns:
+            str: The screen, the open popups and, on the board, the current player and every
+            player's position, balance and jail status.
+        """
+
+        popups = [name for name in ("jail_popup", "auction_popup", "bankruptcy_popup", "end_game_popup", "leave_game_popup")
+                  if getattr(self, name, None)]
+        parts = [f"screen={self.state}", f"popups={popups or 'none'}", f"paused={self.paused}"]
+        if self.state == "board" and self.game and self.game.players:
+            current = self.game.players[self.game.current_player_index % len(self.game.players)]
+            parts.append(f"current={current.name}")
+            parts.append("players=" + "; ".join(
+                f"{p.name} @{p.position} £{p.balance}{' jailed' if p.in_jail else ''}" for p in list(self.game.players)))
+        return ", ".join(parts)
+
     def trigger_end_game_popup(self, winner_name):
         """
         Triggers the end game popup to show the winner's name.
@@ -655,20 +834,20 @@ class PropertyTycoon:
             None
 
         Side Effects:
-            - Displays the end game popup on the screen.
+            - Displays the end game popup on the screen, with a chart of the players' balances over the game.
             - Plays the win sound if available.
         """
 
-        self.end_game_popup = EndGamePopup(self.screen, winner_name)
+        self.end_game_popup = EndGamePopup(self.screen, winner_name, self.game.history)
 
         if self.win_sound:
             self.win_sound.play()
 
 
 
-    def run(self):
+    def update(self):
         """
-        The main game loop that keeps the game running and updating.
+        Runs one frame of the game: input, drawing and the turn logic that is due.
 
         Args:
             None
@@ -677,132 +856,210 @@ class PropertyTycoon:
             None
 
         Side Effects:
-            - Continuously handles events, updates the game state, and redraws the screen.
+            - Handles events, updates the game state, and redraws the screen.
             - Manages turn-based logic, time-based conditions (for Abridged mode), and player actions.
         """
 
-        while self.running:
+        if self.watchdog:
+            self.watchdog.heartbeat()
+        self.profiler.begin_frame()
+        with self.profiler.measure("events"):
             self.handle_events()
-            self.dice.update()
-            self.draw()
-
-            if not self.paused and (time.time() - self.last_input_time >= 300):
-                self.paused = True
-                self.pause_start_time = time.time()
-                self.elapsed_time_at_pause = time.time() - self.start_time  # Freeze here
-                self.inactivity_popup = "Game paused due to 5 minutes of inactivity."
+        self.dice.update()
+        self.draw()
 
+        if not self.paused and (time.time() - self.last_input_time >= 300):
+            self.paused = True
+            self.pause_start_time = time.time()
+            self.elapsed_time_at_pause = time.time() - self.start_time  # Freeze here
+            self.inactivity_popup = "Game paused due to 5 minutes of inactivity."
 
+        with self.profiler.measure("logic"):
+            self.update_game_logic()
+        self.profiler.end_frame()
 
+    def update_game_logic(self):
+        """
+        Advances the board game by whatever the current frame allows: skipped turns, jail rolls,
+        the first turn, popups waiting to open and the Abridged mode end condition.
 
-            if self.state == "board":
-                if self.paused:
-                    self.clock.tick(30)
-                    continue
-
-                player = self.game.players[self.game.current_player_index]
-
-                # Skip turn if flagged (after paying to leave jail)
-                if getattr(player, "skip_turn", False):
-                    self.game.log_event(f"{player.name} skips this turn after paying to leave jail.")
-                    player.skip_turn = False
-                    self.game.current_player_index = (self.game.current_player_index + 1) % len(self.game.players)
-                    continue
+        Args:
+            None
 
-                # Skip turn if waiting in jail
-                if getattr(player, "turns_skipped", 0) > 0:
-                    self.game.log_event(f"{player.name} is skipping turn ({3 - player.turns_skipped}/2) due to jail wait.")
-                    player.turns_skipped -= 1
-                    self.game.current_player_index = (self.game.current_player_index + 1) % len(self.game.players)
-                    continue
+        Returns:
+            None
 
-                # Jail logic - rolling for doubles
-                if getattr(player, "wants_to_roll_in_jail", False) and not self.dice.rolling:
-                    self.dice.start_roll_animation()
-                    player.awaiting_jail_roll_result = True
-                    player.wants_to_roll_in_jail = False
+        Side Effects:
+            - Updates the game state and the popups shown for it.
+        """
 
-                if getattr(player, "awaiting_jail_roll_result", False) and not self.dice.rolling:
-                    die1, die2 = self.dice.get_dice_result()
-                    is_double = die1 == die2
+        if self.state == "board":
+            if self.paused:
+                return
+
+            if self.game_process:
+                self.update_game_process()
+                return
+
+            player = self.game.players[self.game.current_player_index]
+
+            # Skip turn if flagged (after paying to leave jail)
+            if getattr(player, "skip_turn", False):
+                self.game.log_event(f"{player.name} skips this turn after paying to leave jail.")
+                player.skip_turn = False
+                self.game.current_player_index = (self.game.current_player_index + 1) % len(self.game.players)
+                return
+
+            # Skip turn if waiting in jail
+            if getattr(player, "turns_skipped", 0) > 0:
+                self.game.log_event(f"{player.name} is skipping turn ({3 - player.turns_skipped}/2) due to jail wait.")
+                player.turns_skipped -= 1
+                self.game.current_player_index = (self.game.current_player_index + 1) % len(self.game.players)
+                return
+
+            # Jail logic - rolling for doubles
+            if getattr(player, "wants_to_roll_in_jail", False) and not self.dice.rolling:
+                self.dice.start_roll_animation()
+                player.awaiting_jail_roll_result = True
+                player.wants_to_roll_in_jail = False
+
+            if getattr(player, "awaiting_jail_roll_result", False) and not self.dice.rolling:
+                die1, die2 = self.dice.get_dice_result()
+                is_double = die1 == die2
+
+                if is_double:
+                    player.jail_turns = 0
+                    player.in_jail = False
+                    self.game.log_event(f"{player.name} rolled a double ({die1}, {die2}) and escaped jail!")
+                    player.move(die1, die2, is_double)
+                else:
+                    player.jail_turns += 1
+                    self.game.log_event(f"{player.name} failed to roll a double ({die1}, {die2}).")
 
-                    if is_double:
+                    if player.jail_turns >= 3:
                         player.jail_turns = 0
                         player.in_jail = False
-                        self.game.log_event(f"{player.name} rolled a double ({die1}, {die2}) and escaped jail!")
-                        player.move(die1, die2, is_double)
-                    else:
-                        player.jail_turns += 1
-                        self.game.log_event(f"{player.name} failed to roll a double ({die1}, {die2}).")
-
-                        if player.jail_turns >= 3:
-                            player.jail_turns = 0
-                            player.in_jail = False
-                            self.game.log_event(f"{player.name} served 3 turns in jail and is now free.")
-
-                    player.awaiting_jail_roll_result = False
-
-                # Deprecated - no longer using this flag (paying jail skips turn instead)
-                if getattr(player, "wants_to_roll_after_paying_jail", False) and not self.dice.rolling:
-                    self.dice.start_roll_animation()
-                    player.awaiting_post_jail_roll = True
-                    player.wants_to_roll_after_paying_jail = False
+                        self.game.log_event(f"{player.name} served 3 turns in jail and is now free.")
+
+                player.awaiting_jail_roll_result = False
+
+            # Deprecated - no longer using this flag (paying jail skips turn instead)
+            if getattr(player, "wants_to_roll_after_paying_jail", False) and not self.dice.rolling:
+                self.dice.start_roll_animation()
+                player.awaiting_post_jail_roll = True
+                player.wants_to_roll_after_paying_jail = False
+
+            if getattr(player, "awaiting_post_jail_roll", False) and not self.dice.rolling:
+                die1, die2 = self.dice.get_dice_result()
+                is_double = die1 == die2
+                player.move(die1, die2, is_double)
+                self.game.log_event(f"{player.name} moved {die1 + die2} steps after paying to get out of jail.")
+                player.awaiting_post_jail_roll = False
+
+            # First turn of game (rolling to start)
+            if self.waiting_for_dice and not self.dice.rolling:
+                self.pending_roll = self.dice.get_dice_result()
+                self.waiting_for_dice = False
+                self.first_turn_pending = True
+                self.first_turn_time = time.time() + 1  # show the first roll for a second, without blocking the loop
+
+            elif self.first_turn_pending and time.time() >= self.first_turn_time:
+                die1, die2 = self.pending_roll
+                self.game.play_turn(die1, die2)
+                player.turns_taken += 1
+                self.first_turn_pending = False
+
+            # Jail popup for human players
+            if player.in_jail and player.identity == "Human" and not getattr(player, "just_sent_to_jail", False):
+                if not self.jail_popup or self.jail_popup.player != player:
+                    self.jail_popup = JailPopup(self.screen, player, self.game)
+            else:
+                self.jail_popup = None
+
+            # Delay reset until player turn moves
+            for p in self.game.players:
+                if p != self.game.players[self.game.current_player_index] and getattr(p, "just_sent_to_jail", False):
+                    p.just_sent_to_jail = False
+
+
+
+            # Auction popup management
+            if self.auction_popup:
+                self.auction_popup.update()
+                if not self.auction_popup.visible:
+                    self.auction_popup = None
+            elif hasattr(self.game, 'start_auction_popup'):
+                prop = self.game.bank.properties.get(player.position)
+                eligible_bidders = [p for p in self.game.players if p.passed]
+                if prop and prop.owner is None and len(eligible_bidders) > 1:
+                    self.auction_popup = AuctionPopup(self.screen, eligible_bidders, prop, self.game)
+                del self.game.start_auction_popup
+                if hasattr(self.game, 'auction_eligible_players'):
+                    del self.game.auction_eligible_players
+
+            # Abridged game mode end condition
+            if getattr(self, 'abridged_mode_active', False) and not getattr(self, 'abridged_mode_complete', False):
+                if all(p.turns_taken >= self.turns_target for p in self.game.players):
+                    winner_name = self.game.determine_winner_abridged()
+                    self.trigger_end_game_popup(winner_name)
+                    self.abridged_mode_complete = True
 
-                if getattr(player, "awaiting_post_jail_roll", False) and not self.dice.rolling:
-                    die1, die2 = self.dice.get_dice_result()
-                    is_double = die1 == die2
-                    player.move(die1, die2, is_double)
-                    self.game.log_event(f"{player.name} moved {die1 + die2} steps after paying to get out of jail.")
-                    player.awaiting_post_jail_roll = False
-
-                # First turn of game (rolling to start)
-                if self.waiting_for_dice and not self.dice.rolling:
-                    self.pending_roll = self.dice.get_dice_result()
-                    self.waiting_for_dice = False
-                    self.first_turn_pending = True
-
-                elif self.first_turn_pending:
-                    pygame.time.wait(1000)
-                    die1, die2 = self.pending_roll
-                    self.game.play_turn(die1, die2)
-                    player.turns_taken += 1
-                    self.first_turn_pending = False
-
-                # Jail popup for human players
-                if player.in_jail and player.identity == "Human" and not getattr(player, "just_sent_to_jail", False):
-                    if not self.jail_popup or self.jail_popup.player != player:
-                        self.jail_popup = JailPopup(self.screen, player, self.game)
-                else:
-                    self.jail_popup = None
+    def run(self):
+        """
+        The main game loop that keeps the game running and updating.
 
-                # Delay reset until player turn moves
-                for p in self.game.players:
-                    if p != self.game.players[self.game.current_player_index] and getattr(p, "just_sent_to_jail", False):
-                        p.just_sent_to_jail = False
+        Args:
+            None
 
+        Returns:
+            None
 
+        Side Effects:
+            - Runs `update` 30 times a second until the game is closed, then exits.
+        """
 
-                # Auction popup management
-                if self.auction_popup:
-                    if not self.auction_popup.visible:
-                        self.auction_popup = None
-                elif hasattr(self.game, 'start_auction_popup'):
-                    prop = self.game.bank.properties.get(player.position)
-                    eligible_bidders = [p for p in self.game.players if p.passed]
-                    if prop and prop.owner is None and len(eligible_bidders) > 1:
-                        self.auction_popup = AuctionPopup(self.screen, eligible_bidders, prop, self.game)
-                    del self.game.start_auction_popup
-                    if hasattr(self.game, 'auction_eligible_players'):
-                        del self.game.auction_eligible_players
-
-                # Abridged game mode end condition
-                if getattr(self, 'abridged_mode_active', False) and not getattr(self, 'abridged_mode_complete', False):
-                    if all(p.turns_taken >= self.turns_target for p in self.game.players):
-                        winner_name = self.game.determine_winner_abridged()
-                        self.trigger_end_game_popup(winner_name)
-                        self.abridged_mode_complete = True
+        if self.watchdog:
+            self.watchdog.start()
 
+        while self.running:
+            self.update()
             self.clock.tick(30)
 
+        if self.watchdog:
+            self.watchdog.stop()
+        if self.game_process:
+            self.game_process.stop()
         pygame.quit()
         sys.exit()
+
+    async def run_async(self, *coroutines, frame_rate=30):
+        """
+        The main game loop driven by asyncio, so other coroutines can run between frames.
+
+        Args:
+            *coroutines (Coroutine): Background work to run alongside the game, such as a network
+                sync server or an autosave loop. They are cancelled when the game is closed.
+            frame_rate (float): Frames per second (default: 30).
+
+        Returns:
+            None
+
+        Side Effects:
+            - Runs `update` on a `FrameScheduler` until the game is closed.
+            - Stops the game process, if any, and shuts down Pygame.
+        """
+
+        scheduler = FrameScheduler(frame_rate)
+        for coroutine in coroutines:
+            scheduler.spawn(coroutine)
+        if self.watchdog:
+            self.watchdog.start()
+        try:
+            await scheduler.run(self.update, lambda: self.running)
+        finally:
+            await scheduler.close()
+            if self.watchdog:
+                self.watchdog.stop()
+            if self.game_process:
+                self.game_process.stop()
+            pygame.quit()